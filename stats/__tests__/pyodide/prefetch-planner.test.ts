@@ -0,0 +1,91 @@
+/**
+ * Worker prefetch 계획 테스트 (prefetch-planner.ts)
+ *
+ * 목적: 카테고리 → Worker 예측(후속 Worker 포함), 공유 패키지 비용 제외,
+ * 메모리 상한 초과 Worker 건너뛰기(가벼운 후보는 계속 선택)를 검증
+ */
+
+import { describe, expect, it } from 'vitest'
+import {
+  BASE_HEAP_MB,
+  FOLLOW_UP_WEIGHT,
+  PACKAGE_HEAP_MB,
+  estimateWorkerCostMB,
+  planWorkerPrefetch,
+  predictWorkers
+} from '@/lib/services/pyodide/prefetch-planner'
+
+describe('predictWorkers', () => {
+  it('카테고리 Worker가 먼저, 후속 Worker는 낮은 가중치', () => {
+    expect(predictWorkers('t-test')).toEqual([
+      { worker: 2, weight: 1 },
+      { worker: 1, weight: FOLLOW_UP_WEIGHT },
+      { worker: 3, weight: FOLLOW_UP_WEIGHT }
+    ])
+  })
+
+  it('후속 Worker 제외 옵션, 알 수 없는 카테고리는 빈 목록', () => {
+    expect(predictWorkers('anova', false)).toEqual([{ worker: 3, weight: 1 }])
+    expect(predictWorkers('unknown-category')).toEqual([])
+  })
+})
+
+describe('estimateWorkerCostMB', () => {
+  it('이미 설치된 패키지는 비용에서 제외', () => {
+    const fresh = estimateWorkerCostMB(2, new Set())
+    const shared = estimateWorkerCostMB(2, new Set(['statsmodels', 'pandas']))
+
+    expect(fresh - shared).toBe(PACKAGE_HEAP_MB.statsmodels + PACKAGE_HEAP_MB.pandas)
+    expect(estimateWorkerCostMB(1, new Set())).toBe(shared)
+  })
+})
+
+describe('planWorkerPrefetch', () => {
+  it('상한이 충분하면 가중치 순으로 모두 로드, 패키지는 한 번만', () => {
+    const plan = planWorkerPrefetch({
+      candidates: predictWorkers('t-test'),
+      loadedWorkers: [],
+      memoryCeilingMB: 1024
+    })
+
+    expect(plan.workers).toEqual([2, 1, 3])
+    expect(plan.packages).toEqual(['statsmodels', 'pandas', 'scikit-learn'])
+    expect(plan.skipped).toEqual([])
+    expect(plan.estimatedMB).toBeGreaterThan(BASE_HEAP_MB)
+  })
+
+  it('이미 로드된 Worker는 제외하고 공유 패키지 비용은 0', () => {
+    const plan = planWorkerPrefetch({
+      candidates: predictWorkers('anova'),
+      loadedWorkers: [3],
+      memoryCeilingMB: 1024
+    })
+
+    expect(plan.workers).toEqual([1, 2])
+    expect(plan.packages).toEqual([])
+  })
+
+  it('상한을 넘는 Worker는 건너뛰고 가벼운 후속 Worker는 계속 선택', () => {
+    const plan = planWorkerPrefetch({
+      candidates: predictWorkers('anova'),
+      loadedWorkers: [],
+      memoryCeilingMB: BASE_HEAP_MB + 10
+    })
+
+    expect(plan.workers).toEqual([1])
+    expect(plan.skipped.map((entry) => entry.worker)).toEqual([3, 2])
+    expect(plan.estimatedMB).toBeLessThanOrEqual(BASE_HEAP_MB + 10)
+  })
+
+  it('측정한 현재 힙(usedMB)이 상한에 가까우면 아무것도 로드하지 않음', () => {
+    const plan = planWorkerPrefetch({
+      candidates: predictWorkers('regression'),
+      loadedWorkers: [],
+      memoryCeilingMB: 300,
+      usedMB: 299
+    })
+
+    expect(plan.workers).toEqual([])
+    expect(plan.skipped.map((entry) => entry.worker)).toEqual([4, 1])
+  })
+})
@@ -28,6 +28,7 @@ function createMockPyodide(): PyodideInterface {
     runPython: (_code: string) => null,
     runPythonAsync: async (_code: string) => null,
     globals: {},
+    pyimport: (_name: string) => ({}),
     loadedPackages: {},
     isPyProxy: (_obj: unknown) => false,
     FS: {
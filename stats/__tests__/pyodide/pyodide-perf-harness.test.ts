@@ -0,0 +1,162 @@
+// @vitest-environment node
+/**
+ * Pyodide 성능 측정 하네스 테스트 (scripts/pyodide-perf-harness.mjs)
+ *
+ * 목적: 성능 모드 인자 파싱, 앱과 같은 전송 인코딩/envelope 해제, 단계별 호출 시간 기록,
+ * 기준선 회귀 판정을 가짜 Pyodide 객체로 검증
+ */
+
+import { describe, expect, it } from 'vitest'
+import {
+  PERF_DEFAULT_REPORT,
+  PerfRecorder,
+  comparePerfReports,
+  createRng,
+  encodeTypedParams,
+  flattenPerfMetrics,
+  parsePerfArgs,
+  unpackEnvelope,
+  wasmHeapBytes
+} from '@/scripts/pyodide-perf-harness.mjs'
+
+/**
+ * 가짜 (meta_json, packed) envelope PyProxy
+ */
+function fakeEnvelope(meta: unknown, packed: number[] = []) {
+  const destroyed: string[] = []
+  const packedProxy = {
+    getBuffer: () => ({ data: Float64Array.from(packed), release: () => destroyed.push('view') }),
+    destroy: () => destroyed.push('packed')
+  }
+  const envelope = {
+    get: (index: number) => (index === 0 ? JSON.stringify(meta) : packedProxy),
+    destroy: () => destroyed.push('envelope')
+  }
+  return { envelope, destroyed }
+}
+
+function fakePyodide(heapBytes = 64 * 1024 * 1024) {
+  return {
+    _module: { HEAPU8: { buffer: { byteLength: heapBytes } } },
+    toPy: (value: unknown) => ({ value, destroy: () => undefined }),
+    loadPackage: async () => undefined
+  }
+}
+
+describe('parsePerfArgs', () => {
+  it('기본값은 비활성 + 기본 리포트 경로', () => {
+    const options = parsePerfArgs([])
+    expect(options.enabled).toBe(false)
+    expect(options.reportPath).toBe(PERF_DEFAULT_REPORT)
+  })
+
+  it('--flag value / --flag=value 모두 지원, 리포트/기준선 지정 시 활성화', () => {
+    const options = parsePerfArgs([
+      '--perf-report', 'out.json', '--perf-baseline=base.json', '--perf-sizes=100,1000', '--perf-fail-on-regression'
+    ])
+    expect(options.enabled).toBe(true)
+    expect(options.reportPath).toBe('out.json')
+    expect(options.baselinePath).toBe('base.json')
+    expect(options.sizes).toEqual([100, 1000])
+    expect(options.failOnRegression).toBe(true)
+  })
+})
+
+describe('전송 경로 재현', () => {
+  it('긴 숫자 배열과 행별 숫자 배열만 typed array로 변환', () => {
+    const encoded = encodeTypedParams(
+      { data: [1.5, 2, 3], groups: [[1, 2, 3], ['a']], label: 'x', short: [1] },
+      3
+    )
+    expect(encoded.data).toBeInstanceOf(Float64Array)
+    expect(encoded.groups[0]).toBeInstanceOf(Int32Array)
+    expect(encoded.groups[1]).toEqual(['a'])
+    expect(encoded.short).toEqual([1])
+    expect(encoded.label).toBe('x')
+  })
+
+  it('envelope 해제 후 모든 PyProxy destroy', () => {
+    const { envelope, destroyed } = fakeEnvelope({ mean: 1 }, [1, 2])
+    const { meta, bufferLength } = unpackEnvelope(envelope)
+    expect(meta).toEqual({ mean: 1 })
+    expect(bufferLength).toBe(2)
+    expect(destroyed).toEqual(['view', 'packed', 'envelope'])
+  })
+
+  it('WASM 힙 크기는 HEAPU8 버퍼 길이, 없으면 0', () => {
+    expect(wasmHeapBytes(fakePyodide(1024))).toBe(1024)
+    expect(wasmHeapBytes({})).toBe(0)
+  })
+})
+
+describe('PerfRecorder', () => {
+  it('호출을 encode/execute/decode로 나눠 기록 (첫 호출은 coldMs)', async () => {
+    const recorder = new PerfRecorder()
+    recorder.attach(fakePyodide(), 120)
+    const calls: unknown[] = []
+    const dispatch = (...args: unknown[]) => {
+      calls.push(args)
+      return fakeEnvelope({ ok: true }).envelope
+    }
+
+    const entry = await recorder.timeCall(dispatch, 1, 'descriptive_stats', { data: [1, 2, 3] }, 3, 2)
+
+    expect(calls).toHaveLength(3)
+    expect(entry.runs).toBe(2)
+    expect(entry.coldMs).toBeGreaterThanOrEqual(0)
+    expect(entry.totalMs).toBeCloseTo(entry.encodeMs + entry.executeMs + entry.decodeMs, 1)
+
+    const report = recorder.toReport()
+    expect(report.bootstrapMs).toBe(120)
+    expect(report.heap.highWaterBytes).toBe(64 * 1024 * 1024)
+    expect(report.calls).toHaveLength(1)
+  })
+
+  it('Python 오류는 리포트에 기록하고 예외를 던지지 않음', async () => {
+    const recorder = new PerfRecorder()
+    recorder.attach(fakePyodide(), 0)
+    const entry = await recorder.timeCall(() => {
+      throw new Error('Traceback...\nValueError: bad input')
+    }, 1, 'descriptive_stats', {}, 10)
+    expect(entry.error).toContain('ValueError: bad input')
+  })
+})
+
+describe('기준선 비교', () => {
+  const report = (executeMs: number, heapBytes: number) => ({
+    bootstrapMs: 1000,
+    calls: [{ worker: 1, method: 'descriptive_stats', n: 1000, executeMs, totalMs: executeMs + 1 }],
+    heap: { highWaterBytes: heapBytes }
+  })
+
+  it('호출/힙 지표를 평탄화', () => {
+    const metrics = flattenPerfMetrics(report(10, 1))
+    expect(Object.keys(metrics)).toEqual([
+      'bootstrap',
+      'call:worker1.descriptive_stats@1000:execute',
+      'call:worker1.descriptive_stats@1000:total',
+      'heap:highWater'
+    ])
+  })
+
+  it('임계값과 잡음 하한을 모두 넘는 변화만 보고', () => {
+    const mb = 1024 * 1024
+    const changes = comparePerfReports(report(10, 100 * mb), report(30, 200 * mb))
+    expect(changes.map((c: { key: string; status: string }) => [c.key, c.status])).toEqual([
+      ['call:worker1.descriptive_stats@1000:execute', 'regression'],
+      ['call:worker1.descriptive_stats@1000:total', 'regression'],
+      ['heap:highWater', 'regression']
+    ])
+
+    // 1ms → 1.9ms: 비율은 크지만 2ms 잡음 하한 미만
+    expect(comparePerfReports(report(1, mb), report(1.9, mb))).toEqual([])
+  })
+})
+
+describe('createRng', () => {
+  it('같은 seed면 같은 난수열', () => {
+    const a = createRng(7)
+    const b = createRng(7)
+    expect([a.uniform(), a.normal()]).toEqual([b.uniform(), b.normal()])
+  })
+})
@@ -0,0 +1,203 @@
+// @vitest-environment node
+/**
+ * 다중 Pyodide Worker 리샘플링 샤딩 테스트
+ *
+ * 목적: 블록 계획/병합 순수 함수 + Node worker_threads로 띄운 가짜 Pyodide Worker
+ * (pyodide-worker.ts와 같은 메시지 프로토콜)에서 샤드 풀의 병합/조기 정지/재현성 검증
+ */
+
+import { afterEach, describe, expect, it } from 'vitest'
+import { Worker } from 'node:worker_threads'
+import {
+  blockSeed,
+  defaultBlockSize,
+  defaultShardCount,
+  mergeBootstrapBlocks,
+  mergePermutationBlocks,
+  percentile,
+  planBlocks,
+  shouldStopEarly,
+  ShardedResamplingPool
+} from '@/lib/services/pyodide/core/pyodide-shard-pool'
+
+/**
+ * 가짜 Pyodide Worker: seed([기준, 블록])로 결정적인 U(0,1) 난수열 생성
+ * - fake_permutation_block: u >= threshold 횟수
+ * - fake_bootstrap_block: u 목록
+ */
+const FAKE_PYODIDE_WORKER = `
+const { parentPort } = require('node:worker_threads')
+
+function rng(seed) {
+  let state = (seed[0] * 7919 + seed[1] * 104729 + 1) >>> 0
+  return () => {
+    state = (state * 1664525 + 1013904223) >>> 0
+    return state / 4294967296
+  }
+}
+
+parentPort.on('message', (msg) => {
+  const reply = (result) => parentPort.postMessage({ id: msg.id, type: 'success', result })
+  if (msg.type === 'init' || msg.type === 'loadWorker') return reply({ status: 'ok' })
+
+  const { params } = msg
+  if (msg.method === 'fake_permutation_block') {
+    const next = rng(params.seed)
+    let exceedances = 0
+    for (let i = 0; i < params.permutations; i++) if (next() >= params.threshold) exceedances++
+    return reply({ observed: params.threshold, exceedances, permutations: params.permutations })
+  }
+  if (msg.method === 'fake_bootstrap_block') {
+    const next = rng(params.seed)
+    const replicates = Array.from({ length: params.nBootstrap }, next)
+    return reply({ replicates, nBootstrap: params.nBootstrap })
+  }
+  parentPort.postMessage({ id: msg.id, type: 'error', error: 'Unknown method: ' + msg.method })
+})
+`
+
+const pools: ShardedResamplingPool[] = []
+
+function createPool(size: number): ShardedResamplingPool {
+  const pool = new ShardedResamplingPool(() => new Worker(FAKE_PYODIDE_WORKER, { eval: true }), size)
+  pools.push(pool)
+  return pool
+}
+
+afterEach(() => {
+  pools.splice(0).forEach((pool) => pool.terminate())
+})
+
+describe('블록 계획', () => {
+  it('블록 크기는 요청 횟수만으로 결정 (샤드 수 무관)', () => {
+    expect(defaultBlockSize(99)).toBe(25)
+    expect(defaultBlockSize(9999)).toBe(625)
+    expect(planBlocks(99)).toEqual([25, 25, 25, 24])
+    expect(planBlocks(0)).toEqual([])
+  })
+
+  it('블록 seed는 [기준 seed, 블록 번호]', () => {
+    expect(blockSeed(42, 3)).toEqual([42, 3])
+  })
+
+  it('기본 샤드 수는 코어 수 - 1, 1~4', () => {
+    expect(defaultShardCount(1)).toBe(1)
+    expect(defaultShardCount(4)).toBe(3)
+    expect(defaultShardCount(16)).toBe(4)
+  })
+})
+
+describe('병합', () => {
+  it('순열 블록 초과 횟수 합산 + (e+1)/(n+1)', () => {
+    const merged = mergePermutationBlocks(
+      [
+        { observed: 2.5, exceedances: 3, permutations: 50 },
+        { observed: 2.5, exceedances: 1, permutations: 49 }
+      ],
+      'completed'
+    )
+
+    expect(merged.permutations).toBe(99)
+    expect(merged.exceedances).toBe(4)
+    expect(merged.pValue).toBeCloseTo(0.05)
+    expect(merged.mcStandardError).toBeCloseTo(Math.sqrt((0.05 * 0.95) / 99))
+  })
+
+  it('조기 정지면 Besag-Clifford p = e/n', () => {
+    const merged = mergePermutationBlocks([{ observed: 0, exceedances: 30, permutations: 60 }], 'early')
+    expect(merged.pValue).toBe(0.5)
+  })
+
+  it('조기 정지는 초과 h회 + p가 유의수준보다 명확히 클 때만', () => {
+    expect(shouldStopEarly(30, 60)).toBe(true)
+    expect(shouldStopEarly(19, 20)).toBe(false)
+    expect(shouldStopEarly(20, 400)).toBe(false)
+  })
+
+  it('백분위수는 np.percentile linear 보간과 같음', () => {
+    expect(percentile([1, 2, 3, 4], 25)).toBeCloseTo(1.75)
+    expect(percentile([1, 2, 3, 4], 97.5)).toBeCloseTo(3.925)
+  })
+
+  it('bootstrap 블록은 번호 순서로 연결 (미완료 블록 제외)', () => {
+    const merged = mergeBootstrapBlocks([{ replicates: [3, 1], nBootstrap: 2 }, undefined, { replicates: [2], nBootstrap: 1 }])
+    expect(merged.replicates).toEqual([3, 1, 2])
+    expect(merged.nBootstrap).toBe(3)
+    expect(merged.ci?.[0]).toBeCloseTo(1.05)
+  })
+})
+
+describe('ShardedResamplingPool (worker_threads)', () => {
+  it('같은 seed면 샤드 수와 관계없이 같은 순열 결과', async () => {
+    const options = { permutations: 999, seed: 7 }
+    const params = { threshold: 0.999 }
+
+    const single = await createPool(1).runPermutation(8, 'fake_permutation_block', params, options)
+    const sharded = await createPool(3).runPermutation(8, 'fake_permutation_block', params, options)
+
+    expect(sharded.stoppingRule).toBe('completed')
+    expect(sharded.permutations).toBe(999)
+    expect(sharded.exceedances).toBe(single.exceedances)
+    expect(sharded.pValue).toBe(single.pValue)
+    expect(sharded.shards).toBe(3)
+  })
+
+  it('명확히 비유의하면 남은 블록을 실행하지 않음', async () => {
+    const result = await createPool(2).runPermutation(
+      8, 'fake_permutation_block', { threshold: 0.3 }, { permutations: 9999, seed: 1 }
+    )
+
+    expect(result.stoppingRule).toBe('early')
+    expect(result.blocks).toBeLessThan(planBlocks(9999).length)
+    expect(result.pValue).toBeCloseTo(0.7, 1)
+    expect(result.requestedPermutations).toBe(9999)
+  })
+
+  it('조기 정지도 블록 번호 순서로 판정 → 샤드 수와 관계없이 같은 결과', async () => {
+    const options = { permutations: 9999, seed: 5 }
+    const params = { threshold: 0.3 }
+
+    const results = []
+    for (const size of [1, 2, 4]) {
+      results.push(await createPool(size).runPermutation(8, 'fake_permutation_block', params, options))
+    }
+
+    for (const result of results) {
+      expect(result.stoppingRule).toBe('early')
+      expect(result.blocks).toBe(results[0].blocks)
+      expect(result.permutations).toBe(results[0].permutations)
+      expect(result.exceedances).toBe(results[0].exceedances)
+      expect(result.pValue).toBe(results[0].pValue)
+    }
+  })
+
+  it('bootstrap replicate 병합 + CI, 샤드 수와 무관하게 재현', async () => {
+    const options = { replicates: 200, seed: 11 }
+    const single = await createPool(1).runBootstrap(9, 'fake_bootstrap_block', {}, options)
+    const sharded = await createPool(4).runBootstrap(9, 'fake_bootstrap_block', {}, options)
+
+    expect(sharded.nBootstrap).toBe(200)
+    expect(sharded.replicates).toEqual(single.replicates)
+    expect(sharded.ci).toEqual(single.ci)
+  })
+
+  it('abort되면 완료된 블록까지 병합', async () => {
+    const controller = new AbortController()
+    const result = await createPool(1).runPermutation(
+      8,
+      'fake_permutation_block',
+      { threshold: 0.999 },
+      { permutations: 999, seed: 3, onProgress: () => controller.abort(), signal: controller.signal }
+    )
+
+    expect(result.cancelled).toBe(true)
+    expect(result.stoppingRule).toBe('cancelled')
+    expect(result.blocks).toBe(1)
+  })
+
+  it('Python 오류는 reject로 전달', async () => {
+    await expect(
+      createPool(2).runPermutation(8, 'missing_block', {}, { permutations: 100 })
+    ).rejects.toThrow('Unknown method: missing_block')
+  })
+})
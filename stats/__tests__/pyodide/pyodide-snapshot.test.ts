@@ -0,0 +1,145 @@
+// @vitest-environment node
+/**
+ * Pyodide 메모리 스냅샷 저장소 테스트 (pyodide-snapshot.ts)
+ *
+ * 목적: 소스 해시 기반 키 무효화, Cache Storage 저장/조회(캐시당 최신 1개),
+ * 손상된 메타데이터 무시, 복원 후 loadedPackages 보정을 메모리 CacheStorage로 검증
+ */
+
+import { describe, expect, it } from 'vitest'
+import {
+  SNAPSHOT_URL_PREFIX,
+  computeSnapshotKey,
+  deleteSnapshots,
+  readSnapshot,
+  restoreLoadedPackages,
+  writeSnapshot,
+  type SnapshotMeta
+} from '@/lib/services/pyodide/core/pyodide-snapshot'
+
+const BASE_URL = 'https://example.test'
+
+/**
+ * 메모리 CacheStorage (URL 문자열 키, 응답 본문은 복제 가능하도록 바이트로 보관)
+ */
+function createCacheStorage() {
+  const stores = new Map<string, Map<string, { body: ArrayBuffer; headers: Headers }>>()
+
+  const open = async (name: string) => {
+    if (!stores.has(name)) stores.set(name, new Map())
+    const entries = stores.get(name)!
+    const toUrl = (request: RequestInfo | URL) =>
+      new URL(typeof request === 'string' ? request : request instanceof URL ? request.href : request.url, BASE_URL).href
+
+    return {
+      match: async (request: RequestInfo | URL) => {
+        const entry = entries.get(toUrl(request))
+        return entry ? new Response(entry.body.slice(0), { headers: entry.headers }) : undefined
+      },
+      put: async (request: RequestInfo | URL, response: Response) => {
+        entries.set(toUrl(request), { body: await response.arrayBuffer(), headers: response.headers })
+      },
+      keys: async () => [...entries.keys()].map((url) => new Request(url)),
+      delete: async (request: RequestInfo | URL) => entries.delete(toUrl(request))
+    } as unknown as Cache
+  }
+
+  const storage = {
+    open,
+    delete: async (name: string) => stores.delete(name),
+    has: async (name: string) => stores.has(name),
+    keys: async () => [...stores.keys()],
+    match: async () => undefined
+  } as unknown as CacheStorage
+
+  return { storage, stores }
+}
+
+function meta(key: string, overrides: Partial<SnapshotMeta> = {}): SnapshotMeta {
+  return {
+    key,
+    pyodideVersion: '0.29.3',
+    workers: [1, 2, 3],
+    loadedPackages: { numpy: 'default channel', scipy: 'default channel' },
+    createdAt: 0,
+    bytes: 4,
+    ...overrides
+  }
+}
+
+describe('computeSnapshotKey', () => {
+  const sources = [
+    { name: 'helpers', code: 'def dispatch(): pass' },
+    { name: 'worker1', code: 'def descriptive_stats(): pass' }
+  ]
+
+  it('같은 입력이면 같은 키 (패키지 순서 무관), SHA-256 hex', async () => {
+    const a = await computeSnapshotKey('/pyodide/', ['scipy', 'numpy'], sources)
+    const b = await computeSnapshotKey('/pyodide/', ['numpy', 'scipy'], sources)
+    expect(a).toBe(b)
+    expect(a).toMatch(/^[0-9a-f]{64}$/)
+  })
+
+  it('Worker 소스/Pyodide URL/패키지가 바뀌면 다른 키', async () => {
+    const base = await computeSnapshotKey('/pyodide/', ['numpy'], sources)
+    const editedSource = [sources[0], { name: 'worker1', code: 'def descriptive_stats(): return 1' }]
+
+    expect(await computeSnapshotKey('/pyodide/', ['numpy'], editedSource)).not.toBe(base)
+    expect(await computeSnapshotKey('/other/', ['numpy'], sources)).not.toBe(base)
+    expect(await computeSnapshotKey('/pyodide/', ['numpy', 'pandas'], sources)).not.toBe(base)
+  })
+})
+
+describe('스냅샷 저장소', () => {
+  it('저장 후 같은 키로 바이트 + 메타데이터 조회, 다른 키는 null', async () => {
+    const { storage } = createCacheStorage()
+    await writeSnapshot(storage, 'snap', meta('abc'), new Uint8Array([1, 2, 3, 4]))
+
+    const found = await readSnapshot(storage, 'snap', 'abc')
+    expect(Array.from(found!.bytes)).toEqual([1, 2, 3, 4])
+    expect(found!.meta.workers).toEqual([1, 2, 3])
+    expect(await readSnapshot(storage, 'snap', 'other')).toBeNull()
+  })
+
+  it('새 키 저장 시 이전 스냅샷 삭제 (캐시당 1개)', async () => {
+    const { storage, stores } = createCacheStorage()
+    await writeSnapshot(storage, 'snap', meta('old'), new Uint8Array([1]))
+    await writeSnapshot(storage, 'snap', meta('new'), new Uint8Array([2]))
+
+    expect([...stores.get('snap')!.keys()]).toEqual([`${BASE_URL}${SNAPSHOT_URL_PREFIX}new`])
+    expect(await readSnapshot(storage, 'snap', 'old')).toBeNull()
+  })
+
+  it('메타데이터가 손상되었거나 키가 다르면 무시', async () => {
+    const { storage } = createCacheStorage()
+    await writeSnapshot(storage, 'snap', meta('other'), new Uint8Array([1]))
+    const cache = await storage.open('snap')
+    await cache.put(`${SNAPSHOT_URL_PREFIX}broken`, new Response(new Uint8Array([1]), {
+      headers: { 'x-snapshot-meta': '{not json' }
+    }))
+    await cache.put(`${SNAPSHOT_URL_PREFIX}mismatch`, new Response(new Uint8Array([1]), {
+      headers: { 'x-snapshot-meta': JSON.stringify(meta('different')) }
+    }))
+
+    expect(await readSnapshot(storage, 'snap', 'broken')).toBeNull()
+    expect(await readSnapshot(storage, 'snap', 'mismatch')).toBeNull()
+  })
+
+  it('deleteSnapshots는 캐시 전체 삭제', async () => {
+    const { storage } = createCacheStorage()
+    await writeSnapshot(storage, 'snap', meta('abc'), new Uint8Array([1]))
+
+    expect(await deleteSnapshots(storage, 'snap')).toBe(true)
+    expect(await readSnapshot(storage, 'snap', 'abc')).toBeNull()
+  })
+})
+
+describe('restoreLoadedPackages', () => {
+  it('빠진 패키지만 채우고 기존 항목은 유지', () => {
+    const pyodide = { loadedPackages: { numpy: 'cdn' } as Record<string, string> }
+    const added = restoreLoadedPackages(pyodide, { numpy: 'default channel', scipy: 'default channel' })
+
+    expect(added).toEqual(['scipy'])
+    expect(pyodide.loadedPackages).toEqual({ numpy: 'cdn', scipy: 'default channel' })
+  })
+})
@@ -0,0 +1,200 @@
+/**
+ * Pyodide 파라미터 전송 인코딩 테스트
+ *
+ * 목적: 대용량 숫자 배열만 typed buffer로 바뀌고 나머지는 JSON 경로를 유지하는지 검증
+ * + 결과 envelope(packed float64)이 원래 결과 구조로 복원되는지 검증
+ * + 배치 요청(공유 배열 + 작업 파라미터) 인코딩 검증
+ */
+
+import { describe, it, expect, vi } from 'vitest'
+import {
+  datasetColumnRef,
+  datasetRowsRef,
+  decodeResultEnvelope,
+  encodeBatchRequest,
+  encodeTypedArrayParams,
+  sharedArrayRef,
+  toTypedNumericArray,
+  TYPED_ARRAY_MIN_LENGTH,
+  unpackResultEnvelope,
+  type PyProxyLike
+} from '@/lib/services/pyodide/core/pyodide-transport'
+
+const range = (n: number, f: (i: number) => number) => Array.from({ length: n }, (_, i) => f(i))
+
+describe('toTypedNumericArray', () => {
+  it('임계값 미만 배열은 변환하지 않음', () => {
+    expect(toTypedNumericArray([1.5, 2.5, 3.5])).toBeNull()
+  })
+
+  it('정수만 있으면 Int32Array, 실수가 있으면 Float64Array', () => {
+    const ints = toTypedNumericArray(range(TYPED_ARRAY_MIN_LENGTH, (i) => i))
+    const floats = toTypedNumericArray(range(TYPED_ARRAY_MIN_LENGTH, (i) => i + 0.5))
+
+    expect(ints).toBeInstanceOf(Int32Array)
+    expect(floats).toBeInstanceOf(Float64Array)
+    expect(floats?.[1]).toBe(1.5)
+  })
+
+  it('int32 범위를 넘는 정수는 Float64Array', () => {
+    const big = range(TYPED_ARRAY_MIN_LENGTH, (i) => i * 10_000_000)
+    expect(toTypedNumericArray(big)).toBeInstanceOf(Float64Array)
+  })
+
+  it('null/문자열이 섞이면 변환하지 않음', () => {
+    const withNull: unknown[] = range(TYPED_ARRAY_MIN_LENGTH, (i) => i)
+    withNull[10] = null
+    const withString: unknown[] = range(TYPED_ARRAY_MIN_LENGTH, (i) => i)
+    withString[10] = 'a'
+
+    expect(toTypedNumericArray(withNull)).toBeNull()
+    expect(toTypedNumericArray(withString)).toBeNull()
+  })
+})
+
+describe('encodeTypedArrayParams', () => {
+  it('대용량 배열만 인코딩하고 transfer 목록에 buffer 추가', () => {
+    const data = range(2000, (i) => i * 0.1)
+    const { params, transfer } = encodeTypedArrayParams({ data, alpha: 0.05, method: 'iqr' })
+
+    expect(params.data).toBeInstanceOf(Float64Array)
+    expect(params.alpha).toBe(0.05)
+    expect(params.method).toBe('iqr')
+    expect(transfer).toEqual([(params.data as Float64Array).buffer])
+  })
+
+  it('배열의 배열(groups)은 행별로 인코딩', () => {
+    const groups = [range(2000, (i) => i), [1, 2, 3]]
+    const { params, transfer } = encodeTypedArrayParams({ groups })
+    const encodedGroups = params.groups as unknown[]
+
+    expect(encodedGroups[0]).toBeInstanceOf(Int32Array)
+    expect(encodedGroups[1]).toEqual([1, 2, 3])
+    expect(transfer).toHaveLength(1)
+  })
+
+  it('작은 행렬은 원본 참조 유지', () => {
+    const X = [[1, 2], [3, 4]]
+    const { params, transfer } = encodeTypedArrayParams({ X })
+
+    expect(params.X).toBe(X)
+    expect(transfer).toHaveLength(0)
+  })
+
+  it('원본 배열은 변경하지 않음', () => {
+    const data = range(2000, (i) => i)
+    encodeTypedArrayParams({ data })
+    expect(Array.isArray(data)).toBe(true)
+    expect(data).toHaveLength(2000)
+  })
+})
+
+describe('decodeResultEnvelope', () => {
+  it('버퍼가 없으면 메타데이터를 그대로 반환', () => {
+    const meta = { pValue: 0.01, values: [1, 2] }
+    expect(decodeResultEnvelope(meta)).toBe(meta)
+  })
+
+  it('1D/2D 버퍼 참조와 레코드 참조를 원래 구조로 복원', () => {
+    // residuals [0.5, 1.5] | matrix [[1, 2], [3, 4]] | rocPoints fpr [0, 1], tpr [0.2, 1]
+    const buffer = new Float64Array([0.5, 1.5, 1, 2, 3, 4, 0, 1, 0.2, 1])
+    const meta = {
+      rSquared: 0.9,
+      residuals: { __buffer__: [0, 2], shape: [2] },
+      nested: { distanceMatrix: { __buffer__: [2, 4], shape: [2, 2] } },
+      rocPoints: { __records__: { fpr: [6, 2], tpr: [8, 2] }, length: 2 }
+    }
+
+    expect(decodeResultEnvelope(meta, buffer)).toEqual({
+      rSquared: 0.9,
+      residuals: [0.5, 1.5],
+      nested: { distanceMatrix: [[1, 2], [3, 4]] },
+      rocPoints: [{ fpr: 0, tpr: 0.2 }, { fpr: 1, tpr: 1 }]
+    })
+  })
+
+  it('복원된 배열은 일반 Array (JSON 저장 호환)', () => {
+    const decoded = decodeResultEnvelope(
+      { residuals: { __buffer__: [0, 3], shape: [3] } },
+      new Float64Array([1, 2, 3])
+    ) as { residuals: unknown }
+
+    expect(Array.isArray(decoded.residuals)).toBe(true)
+    expect(JSON.stringify(decoded)).toBe('{"residuals":[1,2,3]}')
+  })
+})
+
+describe('unpackResultEnvelope', () => {
+  function createEnvelope(metaJson: string, packed: number[]) {
+    const release = vi.fn()
+    const packedProxy: PyProxyLike = {
+      get: vi.fn(),
+      getBuffer: vi.fn(() => ({ data: new Float64Array(packed), release })),
+      destroy: vi.fn()
+    }
+    const envelope: PyProxyLike = {
+      get: vi.fn((key: unknown) => (key === 0 ? metaJson : packedProxy)),
+      getBuffer: vi.fn(),
+      destroy: vi.fn()
+    }
+    return { envelope, packedProxy, release }
+  }
+
+  it('메타데이터 파싱 + 버퍼 복사 후 PyProxy 해제', () => {
+    const { envelope, packedProxy, release } = createEnvelope('{"n": 2}', [1, 2])
+
+    const { meta, buffer } = unpackResultEnvelope(envelope)
+
+    expect(meta).toEqual({ n: 2 })
+    expect(Array.from(buffer ?? [])).toEqual([1, 2])
+    expect(release).toHaveBeenCalled()
+    expect(packedProxy.destroy).toHaveBeenCalled()
+    expect(envelope.destroy).toHaveBeenCalled()
+  })
+
+  it('빈 버퍼는 undefined', () => {
+    const { envelope } = createEnvelope('{}', [])
+    expect(unpackResultEnvelope(envelope).buffer).toBeUndefined()
+  })
+})
+
+describe('encodeBatchRequest', () => {
+  it('공유 숫자 배열도 callMethod 기준: 긴 배열만 typed buffer, 짧은 배열/문자열 배열은 유지', () => {
+    const big = range(TYPED_ARRAY_MIN_LENGTH, (i) => i + 0.5)
+    const { shared, transfer } = encodeBatchRequest([], {
+      big,
+      a: [1.5, 2.5],
+      labels: ['x', 'y']
+    })
+
+    expect(shared.big).toBeInstanceOf(Float64Array)
+    expect(shared.a).toEqual([1.5, 2.5])
+    expect(shared.labels).toEqual(['x', 'y'])
+    expect(transfer).toHaveLength(1)
+  })
+
+  it('작업 파라미터는 callMethod 기준으로 인코딩, 공유 참조는 그대로', () => {
+    const big = range(TYPED_ARRAY_MIN_LENGTH, (i) => i + 0.5)
+    const { jobs, transfer } = encodeBatchRequest(
+      [
+        { worker: 1, method: 'descriptive_stats', params: { data: sharedArrayRef('a') } },
+        { worker: 3, method: 'one_way_anova', params: { groups: [big, [1, 2]] } }
+      ],
+      { a: [1, 2, 3] }
+    )
+
+    expect(jobs[0].params.data).toEqual({ __shared__: 'a' })
+    const groups = jobs[1].params.groups as unknown[]
+    expect(groups[0]).toBeInstanceOf(Float64Array)
+    expect(groups[1]).toEqual([1, 2])
+    expect(transfer).toHaveLength(1)
+  })
+})
+
+describe('dataset refs', () => {
+  it('컬럼 참조 / 행 참조 (컬럼 생략 시 전체)', () => {
+    expect(datasetColumnRef('ds', 'score')).toEqual({ datasetId: 'ds', column: 'score' })
+    expect(datasetRowsRef('ds', ['a', 'b'])).toEqual({ datasetId: 'ds', columns: ['a', 'b'] })
+    expect(datasetRowsRef('ds')).toEqual({ datasetId: 'ds' })
+  })
+})
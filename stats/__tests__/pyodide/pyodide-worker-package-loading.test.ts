@@ -28,6 +28,7 @@ function createMockPyodide(): PyodideInterface {
     runPython: vi.fn() as Mock<(code: string) => unknown>,
     runPythonAsync: vi.fn() as Mock<RunPythonAsyncFn>,
     globals: {},
+    pyimport: vi.fn() as Mock<(name: string) => unknown>,
     loadedPackages: {},
     isPyProxy: (_obj: unknown) => false,
     FS: {
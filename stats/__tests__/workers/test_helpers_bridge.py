@@ -0,0 +1,436 @@
+"""
+helpers.py Bridge 함수 단위 테스트
+- typed buffer(memoryview) 파라미터 디코딩
+- load_worker_module / unload_worker_module / dispatch 상주 dispatcher
+- dispatch_batch 배치 호출 (공유 배열 참조)
+- register_dataset 상주 데이터셋 + 컬럼 참조
+- 결과 메모이제이션 (내용 해시 키, 바이트 예산 LRU, seed 없는 확률적 메서드 제외)
+- encode_result_envelope 결과 분리
+
+pytest __tests__/workers/test_helpers_bridge.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import (
+    RESULT_BUFFER_MIN_LENGTH,
+    clear_result_cache,
+    configure_result_cache,
+    decode_buffer_params,
+    dispatch,
+    dispatch_batch,
+    encode_result_envelope,
+    load_worker_module,
+    register_dataset,
+    result_cache_stats,
+    unload_idle_workers,
+    unload_worker_module,
+    unregister_dataset,
+)
+
+
+def test_decode_float_and_int_buffers():
+    """기본은 list 복원 (Int32 → Python int), @array_params 파라미터만 float64/int64 배열"""
+    params = {
+        'data': memoryview(np.array([1.5, 2.5])),
+        'counts': memoryview(np.array([1, 2, 3], dtype=np.int32)),
+        'alpha': 0.05,
+    }
+    decoded = decode_buffer_params(params)
+
+    assert decoded['data'] == [1.5, 2.5]
+    assert decoded['counts'] == [1, 2, 3] and all(type(v) is int for v in decoded['counts'])
+    assert decoded['alpha'] == 0.05
+
+    decoded = decode_buffer_params(params, frozenset({'data', 'counts'}))
+    assert decoded['data'].dtype == np.float64
+    np.testing.assert_array_equal(decoded['data'], [1.5, 2.5])
+    assert decoded['counts'].dtype == np.int64
+
+
+def test_decode_nested_groups():
+    """리스트 1단계(groups)의 버퍼도 변환, 일반 리스트는 유지"""
+    decoded = decode_buffer_params({'groups': [memoryview(np.array([1.0, 2.0])), [3, 4]]})
+    assert decoded['groups'] == [[1.0, 2.0], [3, 4]]
+
+    decoded = decode_buffer_params({'groups': [memoryview(np.array([1.0, 2.0])), [3, 4]]}, frozenset({'groups'}))
+    assert isinstance(decoded['groups'][0], np.ndarray)
+    assert decoded['groups'][1] == [3, 4]
+
+
+@pytest.fixture
+def worker1_module():
+    path = os.path.join(worker_dir, 'worker1-descriptive.py')
+    asyncio.run(load_worker_module(1, path))
+    yield sys.modules['worker1']
+    unload_worker_module(1)
+
+
+def test_large_buffer_reaches_list_style_method(worker1_module):
+    """1024개 이상 버퍼도 list로 전달: bonferroni_correction의 `if not pValues` 등 리스트 관용구 유지"""
+    from helpers import _invoke
+
+    p_values = np.linspace(0.0001, 0.9, 2000)
+    result = _invoke(1, 'bonferroni_correction', {'pValues': memoryview(p_values)})
+    expected = worker1_module.bonferroni_correction(p_values.tolist())
+
+    assert result == expected
+    assert result['nComparisons'] == 2000
+
+
+def test_array_params_method_receives_ndarray(worker1_module):
+    """@array_params 표시 파라미터는 NumPy 배열 그대로 (descriptive_stats data)"""
+    from helpers import _invoke
+
+    seen = []
+    original = worker1_module.clean_array
+    worker1_module.clean_array = lambda data: seen.append(type(data)) or original(data)
+    try:
+        data = np.arange(2000, dtype=float)
+        result = _invoke(1, 'descriptive_stats', {'data': memoryview(data)})
+    finally:
+        worker1_module.clean_array = original
+
+    assert seen == [np.ndarray]
+    assert result['n'] == 2000 and result['mean'] == pytest.approx(999.5)
+
+
+WORKER_SOURCE = """
+import numpy as np
+from helpers import array_params, clean_array, stochastic_method
+
+_CALLS = []
+
+def _private_helper(x):
+    return x
+
+def sum_values(data, scale=1.0):
+    _CALLS.append('sum_values')
+    return {'total': float(np.sum(clean_array(data)) * scale)}
+
+def append_total(data):
+    data.append(100)
+    return {'total': float(sum(data))}
+
+@array_params('data')
+def array_info(data):
+    return {'type': type(data).__name__, 'writeable': bool(data.flags.writeable), 'total': float(np.sum(data))}
+
+@stochastic_method
+def shuffle_sum(data, seed=None):
+    _CALLS.append('shuffle_sum')
+    return {'total': float(np.sum(data))}
+
+async def _warmup():
+    return None
+
+await _warmup()
+"""
+
+
+@pytest.fixture
+def test_worker(tmp_path):
+    path = tmp_path / 'worker99.py'
+    path.write_text(WORKER_SOURCE, encoding='utf-8')
+    names = asyncio.run(load_worker_module(99, str(path)))
+    yield names
+    unload_worker_module(99)
+
+
+def test_load_worker_module_registers_public_functions(test_worker):
+    """독립 모듈로 로드, 모듈이 정의한 public 함수만 등록 (import/_private 제외, top-level await 허용)"""
+    assert test_worker == ['append_total', 'array_info', 'shuffle_sum', 'sum_values']
+    assert 'worker99' in sys.modules
+    assert 'sum_values' not in globals()
+
+
+def test_unload_worker_module(test_worker):
+    """해제 후 sys.modules/dispatch 테이블에서 제거"""
+    assert unload_worker_module(99) is True
+    assert 'worker99' not in sys.modules
+    with pytest.raises(AttributeError):
+        dispatch(99, 'sum_values', {'data': [1.0]})
+    assert unload_worker_module(99) is False
+
+
+def test_unload_idle_workers(test_worker):
+    """유휴 기준 이내에 호출된 Worker는 유지, 기준 0이면 해제"""
+    assert unload_idle_workers(3600) == []
+    assert unload_idle_workers(0) == [99]
+    assert 'worker99' not in sys.modules
+
+
+def test_dispatch_calls_registered_function(test_worker):
+    """테이블의 함수를 호출하고 결과 envelope 반환"""
+    meta, packed = dispatch(99, 'sum_values', {'data': memoryview(np.array([1.0, 2.0])), 'scale': 2})
+
+    assert json.loads(meta) == {'total': 6.0}
+    assert packed.size == 0
+
+
+def test_dispatch_validates_parameter_names(test_worker):
+    """알 수 없는 파라미터/필수 파라미터 누락은 호출 전에 TypeError"""
+
+    with pytest.raises(TypeError, match='unexpected parameter'):
+        dispatch(99, 'sum_values', {'data': [1.0], 'scael': 2})
+    with pytest.raises(TypeError, match='missing required parameter'):
+        dispatch(99, 'sum_values', {'scale': 2})
+
+
+def test_dispatch_batch_shared_arrays(test_worker):
+    """공유 배열 참조(최상위/리스트 1단계)로 여러 작업을 한 번에 실행"""
+    jobs = [
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'__shared__': 'x'}}},
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'__shared__': 'x'}, 'scale': 2.0}},
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': [1, 2]}},
+    ]
+    shared = {'x': memoryview(np.array([1.0, np.nan, 2.0]))}
+
+    meta, packed = dispatch_batch(jobs, shared)
+
+    assert json.loads(meta) == [
+        {'ok': True, 'result': {'total': 3.0}},
+        {'ok': True, 'result': {'total': 6.0}},
+        {'ok': True, 'result': {'total': 3.0}},
+    ]
+    assert packed.size == 0
+
+
+def test_dispatch_batch_isolates_shared_mutation(test_worker):
+    """공유 배열을 제자리 수정해도 다음 작업은 원본을 받음, @array_params 파라미터는 읽기 전용 배열"""
+    jobs = [
+        {'worker': 99, 'method': 'append_total', 'params': {'data': {'__shared__': 'x'}}},
+        {'worker': 99, 'method': 'append_total', 'params': {'data': {'__shared__': 'x'}}},
+        {'worker': 99, 'method': 'array_info', 'params': {'data': {'__shared__': 'x'}}},
+        {'worker': 99, 'method': 'append_total', 'params': {'data': {'__shared__': 'big'}}},
+        {'worker': 99, 'method': 'append_total', 'params': {'data': {'__shared__': 'big'}}},
+    ]
+    shared = {'x': [1, 2], 'big': memoryview(np.ones(RESULT_BUFFER_MIN_LENGTH))}
+
+    results = json.loads(dispatch_batch(jobs, shared)[0])
+
+    assert [r['result']['total'] for r in results] == [103.0, 103.0, 3.0, 1124.0, 1124.0]
+    assert results[2]['result']['type'] == 'ndarray' and results[2]['result']['writeable'] is False
+    assert shared['x'] == [1, 2]
+
+
+def test_dispatch_batch_isolates_job_errors(test_worker):
+    """실패한 작업은 에러로 기록하고 나머지 작업은 계속 실행"""
+    jobs = [
+        {'worker': 99, 'method': 'missing', 'params': {}},
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'__shared__': 'nope'}}},
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'__shared__': 'x'}}},
+    ]
+
+    results = json.loads(dispatch_batch(jobs, {'x': [4, 5]})[0])
+
+    assert results[0]['ok'] is False and 'AttributeError' in results[0]['error']
+    assert results[1]['ok'] is False and 'nope' in results[1]['error']
+    assert results[2] == {'ok': True, 'result': {'total': 9.0}}
+
+
+@pytest.fixture
+def dataset():
+    summary = register_dataset('ds1', {
+        'score': memoryview(np.array([1.0, np.nan, 3.0, 4.0])),
+        'count': memoryview(np.array([1, 2, 3, 4], dtype=np.int32)),
+        'group': ['a', 'b', 'a', None],
+    })
+    yield json.loads(summary)
+    unregister_dataset('ds1')
+
+
+def test_register_dataset_summary(dataset):
+    """등록 요약: 행 수 + 컬럼 종류, 컬럼 길이가 다르면 ValueError"""
+    assert dataset == {
+        'datasetId': 'ds1',
+        'rowCount': 4,
+        'columns': {'score': 'numeric', 'count': 'numeric', 'group': 'categorical'},
+    }
+    with pytest.raises(ValueError):
+        register_dataset('bad', {'a': [1, 2], 'b': [1]})
+
+
+def test_dispatch_dataset_column_ref(test_worker, dataset):
+    """{datasetId, column} 참조로 등록 컬럼을 전달 (캐시된 마스크로 정제)"""
+    meta, _ = dispatch(99, 'sum_values', {'data': {'datasetId': 'ds1', 'column': 'score'}})
+    assert json.loads(meta) == {'total': 8.0}
+
+    results = json.loads(dispatch_batch([
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'datasetId': 'ds1', 'column': 'count'}}},
+        {'worker': 99, 'method': 'sum_values', 'params': {'data': {'datasetId': 'ds1', 'column': 'nope'}}},
+    ])[0])
+    assert results[0] == {'ok': True, 'result': {'total': 10.0}}
+    assert results[1]['ok'] is False and 'nope' in results[1]['error']
+
+
+def test_dataset_column_ref_list_or_array(test_worker, dataset):
+    """컬럼 참조: 일반 파라미터는 호출마다 새 list (NaN → None), @array_params는 읽기 전용 배열"""
+    meta, _ = dispatch(99, 'append_total', {'data': {'datasetId': 'ds1', 'column': 'count'}})
+    assert json.loads(meta) == {'total': 110.0}
+    meta, _ = dispatch(99, 'append_total', {'data': {'datasetId': 'ds1', 'column': 'count'}})
+    assert json.loads(meta) == {'total': 110.0}
+
+    from helpers import _resolve_refs
+    ref = {'data': {'datasetId': 'ds1', 'column': 'score'}}
+    assert _resolve_refs(ref, {})['data'] == [1.0, None, 3.0, 4.0]
+
+    info = json.loads(dispatch(99, 'array_info', {'data': {'datasetId': 'ds1', 'column': 'count'}})[0])
+    assert info == {'type': 'ndarray', 'writeable': False, 'total': 10.0}
+
+
+def test_dataset_ref_reaches_list_style_method(worker1_module, dataset):
+    """list 관용구를 쓰는 메서드(bonferroni_correction)도 컬럼 참조로 호출 가능"""
+    register_dataset('pvals', {'p': memoryview(np.linspace(0.001, 0.5, 2000))})
+    try:
+        meta, _ = dispatch(1, 'bonferroni_correction', {'pValues': {'datasetId': 'pvals', 'column': 'p'}})
+    finally:
+        unregister_dataset('pvals')
+
+    assert json.loads(meta)['nComparisons'] == 2000
+
+
+def test_dataset_rows_ref_matches_js_rows(test_worker, dataset):
+    """{datasetId, columns} 참조는 JS 행 데이터와 같은 행 dict 리스트 (NaN → None)"""
+    from helpers import _resolve_refs
+
+    rows = _resolve_refs({'data': {'datasetId': 'ds1', 'columns': ['score', 'group']}}, {})['data']
+
+    assert rows == [
+        {'score': 1.0, 'group': 'a'},
+        {'score': None, 'group': 'b'},
+        {'score': 3.0, 'group': 'a'},
+        {'score': 4.0, 'group': None},
+    ]
+
+
+def test_unregister_dataset(dataset):
+    """해제 후 참조하면 KeyError"""
+    from helpers import _resolve_refs
+
+    assert unregister_dataset('ds1') is True
+    assert unregister_dataset('ds1') is False
+    with pytest.raises(KeyError):
+        _resolve_refs({'data': {'datasetId': 'ds1', 'column': 'score'}}, {})
+
+
+@pytest.fixture
+def result_cache():
+    clear_result_cache()
+    yield sys.modules['worker99']._CALLS
+    configure_result_cache(32 * 1024 * 1024)
+    clear_result_cache()
+
+
+def test_memoize_reuses_result_for_same_content(test_worker, result_cache):
+    """같은 내용(리스트/typed buffer, dict 키 순서 무관)이면 재계산 없이 캐시 결과 반환"""
+    first = dispatch(99, 'sum_values', {'data': [1, 2, 3], 'scale': 2}, True)
+    second = dispatch(99, 'sum_values', {'scale': 2, 'data': memoryview(np.array([1, 2, 3], dtype=np.int32))}, True)
+    dispatch(99, 'sum_values', {'data': [1, 2, 4], 'scale': 2}, True)
+    dispatch(99, 'sum_values', {'data': [1, 2, 3], 'scale': 2})
+
+    assert second[0] == first[0]
+    assert result_cache == ['sum_values', 'sum_values', 'sum_values']
+    stats = json.loads(result_cache_stats())
+    assert (stats['hits'], stats['entries']) == (1, 2)
+
+
+def test_memoize_stochastic_requires_seed(test_worker, result_cache):
+    """@stochastic_method는 seed가 있을 때만 캐시"""
+    for _ in range(2):
+        dispatch(99, 'shuffle_sum', {'data': [1.0, 2.0]}, True)
+        dispatch(99, 'shuffle_sum', {'data': [1.0, 2.0], 'seed': 7}, True)
+
+    assert result_cache == ['shuffle_sum', 'shuffle_sum', 'shuffle_sum']
+
+
+def test_memoize_byte_budget_evicts_lru(test_worker, result_cache):
+    """예산 초과 시 가장 오래 사용되지 않은 결과부터 제거"""
+    meta, _ = dispatch(99, 'sum_values', {'data': [1.0]}, True)
+    configure_result_cache(len(meta) * 2)
+
+    dispatch(99, 'sum_values', {'data': [2.0]}, True)
+    dispatch(99, 'sum_values', {'data': [1.0]}, True)
+    dispatch(99, 'sum_values', {'data': [3.0]}, True)
+    dispatch(99, 'sum_values', {'data': [1.0]}, True)
+    dispatch(99, 'sum_values', {'data': [2.0]}, True)
+
+    dispatch(99, 'sum_values', {'data': [1.0]}, True)
+
+    # [1]은 계속 재사용되어 남고, [2]/[3]이 번갈아 제거됨: 1, 2, 3, 2 순서로 4번만 계산
+    stats = json.loads(result_cache_stats())
+    assert stats['entries'] == 2 and stats['bytes'] <= len(meta) * 2
+    assert len(result_cache) == 4
+
+
+def test_memoize_dataset_ref_keyed_by_registration(test_worker, dataset, result_cache):
+    """데이터셋 참조는 재등록하면 새 키 (이전 결과 재사용 안 함)"""
+    ref = {'data': {'datasetId': 'ds1', 'column': 'score'}}
+    dispatch(99, 'sum_values', ref, True)
+    dispatch(99, 'sum_values', ref, True)
+    register_dataset('ds1', {'score': [10.0, 20.0]})
+    meta, _ = dispatch(99, 'sum_values', ref, True)
+
+    assert json.loads(meta) == {'total': 30.0}
+    assert len(result_cache) == 2
+
+
+def test_dispatch_unknown_method():
+    with pytest.raises(AttributeError):
+        dispatch(99, 'no_such_method', {})
+    with pytest.raises(AttributeError):
+        dispatch(12345, 'sum_values', {})
+
+
+def test_encode_result_envelope_small_values_stay_json():
+    """임계값 미만 배열/스칼라/None은 JSON에 그대로"""
+    meta, packed = encode_result_envelope({'pValue': 0.01, 'values': [1.0, 2.0], 'note': None})
+
+    assert json.loads(meta) == {'pValue': 0.01, 'values': [1.0, 2.0], 'note': None}
+    assert packed.size == 0
+
+
+def test_encode_result_envelope_buffers():
+    """1D/2D 숫자 배열과 숫자 레코드 리스트는 packed 버퍼로 분리"""
+    n = RESULT_BUFFER_MIN_LENGTH
+    residuals = [float(i) * 0.5 for i in range(n)]
+    matrix = [[float(i + j) for j in range(32)] for i in range(32)]
+    roc = [{'fpr': i / n, 'tpr': (i + 1) / n} for i in range(n)]
+
+    meta, packed = encode_result_envelope({
+        'residuals': residuals,
+        'distanceMatrix': matrix,
+        'rocPoints': roc,
+        'labels': ['a'] * n,
+    })
+    decoded = json.loads(meta)
+
+    start, length = decoded['residuals']['__buffer__']
+    np.testing.assert_array_equal(packed[start:start + length], residuals)
+    assert decoded['distanceMatrix']['shape'] == [32, 32]
+    assert set(decoded['rocPoints']['__records__']) == {'fpr', 'tpr'}
+    assert decoded['rocPoints']['length'] == n
+    assert decoded['labels'] == ['a'] * n
+    assert packed.size == n + 32 * 32 + 2 * n
+
+
+def test_encode_result_envelope_mixed_lists_stay_json():
+    """None/bool 섞인 배열은 JSON 경로 유지"""
+    values = [1.0] * RESULT_BUFFER_MIN_LENGTH
+    values[3] = None
+    flags = [True] * RESULT_BUFFER_MIN_LENGTH
+
+    meta, packed = encode_result_envelope({'values': values, 'flags': flags})
+
+    assert json.loads(meta) == {'values': values, 'flags': flags}
+    assert packed.size == 0
@@ -0,0 +1,57 @@
+"""
+helpers.py 데이터 정제 함수 단위 테스트
+- NumPy fast path와 요소별 폴백 경로가 동일한 결과를 내는지 검증
+
+pytest __tests__/workers/test_helpers_cleaning.py -v
+"""
+
+import os
+import sys
+
+import numpy as np
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import clean_array, clean_paired_arrays, clean_multiple_regression
+
+
+def test_clean_array_numeric_fast_path():
+    """숫자 + None/NaN/Inf 리스트는 벡터화 경로로 정제"""
+    result = clean_array([1, 2, None, 3, np.nan, np.inf, 4])
+    np.testing.assert_array_equal(result, [1.0, 2.0, 3.0, 4.0])
+    assert result.dtype == np.float64
+
+
+def test_clean_array_typed_buffer():
+    """Pyodide typed buffer(memoryview)도 fast path로 처리"""
+    buf = memoryview(np.array([1.5, np.nan, 2.5]))
+    np.testing.assert_array_equal(clean_array(buf), [1.5, 2.5])
+
+
+def test_clean_array_mixed_strings_fallback():
+    """비숫자 문자열이 섞이면 요소별 변환으로 폴백 (숫자 문자열은 유지)"""
+    result = clean_array([1, 'abc', '2.5', None, True])
+    np.testing.assert_array_equal(result, [1.0, 2.5, 1.0])
+
+
+def test_clean_paired_arrays_mask_shared():
+    """한쪽이라도 무효면 쌍 전체 제거"""
+    a, b = clean_paired_arrays([1, 2, None, 4, 5], [5, np.inf, 7, None, 9])
+    np.testing.assert_array_equal(a, [1.0, 5.0])
+    np.testing.assert_array_equal(b, [5.0, 9.0])
+
+    a, b = clean_paired_arrays([1, 'x', 3], [4, 5, 6])
+    np.testing.assert_array_equal(a, [1.0, 3.0])
+    np.testing.assert_array_equal(b, [4.0, 6.0])
+
+
+def test_clean_multiple_regression_rows():
+    """X 행 또는 y 중 하나라도 무효면 행 제거, 모두 제거되면 빈 1차원 배열"""
+    X, y = clean_multiple_regression([[1, 2], [3, None], [5, 6]], [10, 20, 30])
+    np.testing.assert_array_equal(X, [[1.0, 2.0], [5.0, 6.0]])
+    np.testing.assert_array_equal(y, [10.0, 30.0])
+
+    X, y = clean_multiple_regression([[1, None], [np.nan, 2]], [1, 2])
+    assert X.shape == (0,) and y.shape == (0,)
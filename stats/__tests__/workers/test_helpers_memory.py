@@ -0,0 +1,186 @@
+"""
+helpers 메모리 governor 단위 테스트
+- 상주 비용: 측정값 우선, 없으면 헤더 추정치
+- clear_module_caches: *_CACHE 컨테이너 + lru_cache 비우기 (worker10 _AVAILABLE_TABLES_CACHE)
+- enforce_memory_budget: 상주 비용 합계 + 결과 캐시의 예산 초과분만큼 LRU 해제, incoming/protect 제외,
+  결과 캐시 우선 차감, 힙이 예산을 넘은 뒤 반복 로드해도 추가 해제 없음
+- memory_stats: 오래 안 쓴 순 Worker 목록
+
+pytest __tests__/workers/test_helpers_memory.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+import types
+
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+import helpers
+from helpers import (
+    clear_module_caches,
+    enforce_memory_budget,
+    load_worker_module,
+    memory_stats,
+    record_worker_resident_bytes,
+    unload_worker_module,
+    worker_resident_bytes,
+)
+
+MB = 1024 * 1024
+
+WORKER_SOURCE = """
+import functools
+
+_LOOKUP_CACHE = {}
+
+@functools.lru_cache(maxsize=None)
+def _table(n):
+    return list(range(n))
+
+def lookup(key):
+    _LOOKUP_CACHE[key] = len(_table(key))
+    return {'size': _LOOKUP_CACHE[key]}
+"""
+
+WORKERS = (91, 92, 93)
+
+
+@pytest.fixture
+def governed_workers(tmp_path, monkeypatch):
+    """91 → 92 → 93 순으로 로드 (91이 가장 오래 안 씀), 각 상주 비용 10MB — 다른 로드된 Worker는 제외"""
+    monkeypatch.setattr(helpers, '_WORKER_LAST_USED', {})
+    helpers.clear_result_cache()
+    for offset, worker_num in enumerate(WORKERS):
+        path = tmp_path / f'worker{worker_num}.py'
+        path.write_text(WORKER_SOURCE, encoding='utf-8')
+        asyncio.run(load_worker_module(worker_num, str(path)))
+        record_worker_resident_bytes(worker_num, 10 * MB)
+        helpers._WORKER_LAST_USED[worker_num] = -1000.0 + offset
+    yield
+    for worker_num in WORKERS:
+        unload_worker_module(worker_num)
+
+
+def test_resident_bytes_measured_or_estimate():
+    """측정값이 없거나 0 이하면 헤더 추정치(worker3 ~180MB)"""
+    record_worker_resident_bytes(3, 0)
+    assert worker_resident_bytes(3) == 180 * MB
+
+    record_worker_resident_bytes(3, 64 * MB)
+    assert worker_resident_bytes(3) == 64 * MB
+    helpers._WORKER_RESIDENT_BYTES.pop(3)
+
+
+def test_clear_module_caches():
+    """*_CACHE 컨테이너와 모듈 자체 lru_cache만 비움"""
+    import functools
+
+    module = types.ModuleType('cache_module')
+    module._AVAILABLE_TABLES_CACHE = [{'id': 1}]
+    module._SEEN_CACHE = {'a': 1}
+    module.KD_SCALE = {'A': 1.8}
+
+    @functools.lru_cache(maxsize=None)
+    def cached(x):
+        return x
+    cached.__module__ = 'cache_module'
+    module.cached = cached
+    cached(1)
+
+    assert clear_module_caches(module) == 3
+    assert module._AVAILABLE_TABLES_CACHE == [] and module._SEEN_CACHE == {}
+    assert module.KD_SCALE == {'A': 1.8}
+    assert cached.cache_info().currsize == 0
+
+
+def test_unload_clears_module_caches(governed_workers):
+    """해제 시 모듈 캐시를 먼저 비움 (함수가 외부에 남아 있어도 캐시는 해제)"""
+    module = sys.modules['worker91']
+    module.lookup(5)
+    cache = module._LOOKUP_CACHE
+
+    assert unload_worker_module(91) is True
+    assert cache == {}
+    assert module._table.cache_info().currsize == 0
+
+
+def test_budget_within_limit_evicts_nothing(governed_workers):
+    """상주 비용 합계(30MB)가 예산 이하면 해제 없음"""
+    assert enforce_memory_budget(30 * MB, incoming=None) == []
+    assert all(f'worker{n}' in sys.modules for n in WORKERS)
+
+
+def test_budget_evicts_least_recently_used(governed_workers):
+    """초과분(15MB)만큼 오래 안 쓴 순으로 해제 → 91, 92"""
+    evicted = enforce_memory_budget(15 * MB)
+
+    assert evicted == [91, 92]
+    assert 'worker91' not in sys.modules and 'worker92' not in sys.modules
+    assert 'worker93' in sys.modules
+    assert 91 not in helpers._WORKER_RESIDENT_BYTES
+
+
+def test_budget_counts_incoming_and_respects_protect(governed_workers):
+    """로드할 Worker의 상주 비용 반영, protect Worker는 건너뜀"""
+    record_worker_resident_bytes(94, 5 * MB)
+    try:
+        evicted = enforce_memory_budget(30 * MB, incoming=94, protect=[91])
+    finally:
+        helpers._WORKER_RESIDENT_BYTES.pop(94, None)
+
+    assert evicted == [92]
+    assert 'worker91' in sys.modules
+
+
+def test_budget_result_cache_freed_first(governed_workers):
+    """결과 캐시로 초과분을 메우면 Worker 해제 없음"""
+    helpers.clear_result_cache()
+    helpers.dispatch(93, 'lookup', {'key': 3}, memoize=True)
+    cached_bytes = helpers._RESULT_CACHE_STATS['bytes']
+    assert cached_bytes > 0
+
+    assert enforce_memory_budget(30 * MB) == []
+    assert json.loads(helpers.result_cache_stats())['entries'] == 0
+
+
+def test_budget_repeated_loads_after_heap_grew(governed_workers, tmp_path):
+    """
+    힙은 줄지 않아도 해제한 만큼 예산 여유가 생김 → 이후 로드는 필요한 만큼만 해제
+
+    예산 30MB, 상주 91/92/93(각 10MB): 94 로드 시 91만 해제, 다시 91 로드 시 92만 해제
+    """
+    record_worker_resident_bytes(94, 10 * MB)
+    path = tmp_path / 'worker94.py'
+    path.write_text(WORKER_SOURCE, encoding='utf-8')
+    try:
+        assert enforce_memory_budget(30 * MB, incoming=94) == [91]
+        asyncio.run(load_worker_module(94, str(path)))
+
+        # 같은 구성으로 다시 확인하면 해제 없음 (힙 크기와 무관)
+        assert enforce_memory_budget(30 * MB) == []
+        assert enforce_memory_budget(30 * MB, incoming=94) == []
+
+        # 해제된 91을 다시 로드 (측정값은 해제 시 지워지므로 다시 기록)
+        record_worker_resident_bytes(91, 10 * MB)
+        assert enforce_memory_budget(30 * MB, incoming=91) == [92]
+        assert 'worker93' in sys.modules and 'worker94' in sys.modules
+    finally:
+        unload_worker_module(94)
+        helpers._WORKER_RESIDENT_BYTES.pop(91, None)
+
+
+def test_memory_stats_orders_by_idle(governed_workers):
+    """Worker는 오래 안 쓴 순, 상주 비용 합계"""
+    stats = json.loads(memory_stats(256 * MB))
+
+    assert stats['heapBytes'] == 256 * MB
+    ours = [w for w in stats['workers'] if w['worker'] in WORKERS]
+    assert [w['worker'] for w in ours] == [91, 92, 93]
+    assert all(w['measured'] and w['residentBytes'] == 10 * MB for w in ours)
+    assert stats['residentBytes'] >= 30 * MB
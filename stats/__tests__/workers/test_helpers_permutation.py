@@ -0,0 +1,177 @@
+"""
+helpers.sequential_permutation_test / permutation_block 단위 테스트
+- Besag-Clifford 조기 정지, 경계 근처 연장, 시간 예산(seed 없을 때만), Monte Carlo 표준오차
+- 다중 Worker 샤딩용 순열 블록: 블록 seed별 재현성, 블록 간 독립 난수열
+- 호출별 난수 스트림: seed 재현성, 전역 np.random 상태 미사용, worker 메서드 seed
+
+pytest __tests__/workers/test_helpers_permutation.py -v
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import make_rng, permutation_block, sequential_permutation_test, spawn_rngs
+
+
+def _uniform_draw(rng):
+    """귀무가설 하 순열 통계량 대역: U(0, 1) — 관측값 q의 참 p-value는 1 - q"""
+    return float(rng.random())
+
+
+def test_clearly_non_significant_stops_early():
+    """p가 유의수준보다 명확히 크면 요청 횟수 전에 정지, p = 초과 / 순열 수"""
+    result = sequential_permutation_test(_uniform_draw, 0.5, permutations=999, seed=0)
+
+    assert result['stoppingRule'] == 'early'
+    assert result['permutations'] < 999
+    assert result['pValue'] == result['exceedances'] / result['permutations']
+    assert result['exceedances'] >= 20
+
+
+def test_clearly_significant_runs_requested_permutations():
+    """초과가 거의 없으면 요청 횟수까지 수행, p = (초과 + 1) / (순열 수 + 1)"""
+    result = sequential_permutation_test(_uniform_draw, 0.9999, permutations=499, seed=0)
+
+    assert result['stoppingRule'] == 'completed'
+    assert result['permutations'] == 499
+    assert result['pValue'] == (result['exceedances'] + 1) / 500
+
+
+def test_near_alpha_extends_beyond_requested():
+    """p가 유의수준 근처면 시간 예산 안에서 요청 횟수 이상으로 연장"""
+    result = sequential_permutation_test(
+        _uniform_draw, 0.95, permutations=199, seed=0, max_permutations=5000,
+    )
+
+    assert result['stoppingRule'] == 'extended'
+    assert 199 < result['permutations'] <= 5000
+    assert result['requestedPermutations'] == 199
+
+
+def test_time_budget_stops_after_minimum():
+    """seed가 없으면 시간 예산을 넘긴 뒤 최소 순열 수 이후 정지"""
+    result = sequential_permutation_test(
+        _uniform_draw, 0.9999, permutations=10_000, min_permutations=50, time_budget=0.0,
+    )
+
+    assert result['stoppingRule'] == 'time-budget'
+    assert result['permutations'] == 50
+
+
+def test_seed_ignores_time_budget():
+    """seed가 있으면 횟수 규칙으로만 정지 → 시간 예산과 무관하게 같은 결과"""
+    kwargs = dict(permutations=199, seed=0, max_permutations=5000)
+    fast = sequential_permutation_test(_uniform_draw, 0.95, time_budget=0.0, **kwargs)
+    slow = sequential_permutation_test(_uniform_draw, 0.95, time_budget=1e9, **kwargs)
+
+    assert fast == slow
+    assert fast['stoppingRule'] == 'extended'
+
+    completed = sequential_permutation_test(
+        _uniform_draw, 0.9999, permutations=500, seed=0, min_permutations=50, time_budget=0.0,
+    )
+    assert completed['stoppingRule'] == 'completed'
+    assert completed['permutations'] == 500
+
+
+def test_two_sided_uses_absolute_value():
+    """two_sided면 |통계량| >= |관측값|을 초과로 셈"""
+    draws = iter([-0.9, 0.1, 0.95, -0.2] * 10)
+    result = sequential_permutation_test(
+        lambda rng: next(draws), -0.8, permutations=40, two_sided=True, stop_exceedances=1000,
+    )
+
+    assert result['exceedances'] == 20
+
+
+def test_reports_monte_carlo_standard_error():
+    """모든 결과에 sqrt(p(1-p)/n) 표준오차 포함"""
+    result = sequential_permutation_test(_uniform_draw, 0.7, permutations=299, seed=1)
+
+    p, n = result['pValue'], result['permutations']
+    assert result['mcStandardError'] == pytest.approx(math.sqrt(p * (1 - p) / n))
+
+
+def test_permutation_block_reproducible_per_seed():
+    """같은 [기준 seed, 블록 번호]면 같은 결과, 블록 번호가 다르면 다른 난수열"""
+    def run(seed):
+        draws = []
+
+        def draw(rng):
+            draws.append(float(rng.random()))
+            return draws[-1]
+
+        return permutation_block(draw, 0.5, 200, seed), draws
+
+    first, first_draws = run([7, 0])
+    again, again_draws = run([7, 0])
+    _, other_draws = run([7, 1])
+
+    assert first == again and first_draws == again_draws
+    assert first['permutations'] == 200
+    assert first['exceedances'] == sum(d >= 0.5 for d in first_draws)
+    assert first_draws != other_draws
+
+
+def test_permutation_block_two_sided():
+    """two_sided면 |통계량| >= |관측값|을 초과로 셈"""
+    result = permutation_block(lambda rng: -1.0, 0.5, 10, [1, 0], two_sided=True)
+    assert result == {'observed': 0.5, 'exceedances': 10, 'permutations': 10}
+
+
+def test_same_seed_same_sequential_result():
+    """같은 seed면 같은 순열 결과, 전역 np.random 상태는 건드리지 않음"""
+    np.random.seed(123)
+    expected_global = np.random.random()
+
+    np.random.seed(123)
+    first = sequential_permutation_test(_uniform_draw, 0.97, permutations=199, seed=42)
+    second = sequential_permutation_test(_uniform_draw, 0.97, permutations=199, seed=42)
+
+    assert first == second
+    assert np.random.random() == expected_global
+
+
+def test_spawn_rngs_independent_streams():
+    """SeedSequence.spawn 하위 스트림은 seed별로 재현되고 서로 다름"""
+    a1, b1 = spawn_rngs(7, 2)
+    a2, b2 = spawn_rngs(7, 2)
+
+    assert a1.random() == a2.random()
+    assert b1.random() == b2.random()
+    assert spawn_rngs(7, 2)[0].random() != spawn_rngs(7, 2)[1].random()
+    assert isinstance(make_rng(None), np.random.Generator)
+
+
+def _load_worker(filename):
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace('-', '_'), os.path.join(worker_dir, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_worker_methods_reproducible_with_seed():
+    """permanova / mantel_test / fst는 seed가 같으면 같은 결과"""
+    worker8 = _load_worker('worker8-ecology.py')
+    worker9 = _load_worker('worker9-genetics.py')
+
+    points = np.random.default_rng(0).normal(size=(12, 2))
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).tolist()
+    grouping = ['a'] * 6 + ['b'] * 6
+    genotypes = [['A/A', 'A/B'], ['A/B', 'B/B'], ['A/A', 'A/A'], ['B/B', 'A/B'], ['A/B', 'B/B'], ['B/B', 'B/B']]
+    pops = ['p1', 'p1', 'p1', 'p2', 'p2', 'p2']
+
+    assert worker8.permanova(dm, grouping, 199, seed=5) == worker8.permanova(dm, grouping, 199, seed=5)
+    assert worker8.mantel_test(dm, dm, 99, seed=5) == worker8.mantel_test(dm, dm, 99, seed=5)
+    fst_a = worker9.fst(genotypes=genotypes, individualPopulations=pops, nPermutations=99, nBootstrap=50, seed=5)
+    fst_b = worker9.fst(genotypes=genotypes, individualPopulations=pops, nPermutations=99, nBootstrap=50, seed=5)
+    assert fst_a == fst_b
@@ -0,0 +1,152 @@
+"""
+helpers 구간 계측 단위 테스트 (_profile → _perf)
+- perf_span/instrumented: 계측 중이 아니면 기록 없음, 중첩 경로 집계, 입력 크기
+- dispatch(_profile): 결과 _perf 블록, 파라미터 검증 제외, 메모이제이션 우회, tracemalloc peak
+- Worker 핫패스: fst 순열 재집계(_recount_alleles) vs Hudson Fst 구간
+
+pytest __tests__/workers/test_helpers_profile.py -v
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+import helpers
+from helpers import (
+    clear_result_cache,
+    dispatch,
+    instrumented,
+    load_worker_module,
+    perf_span,
+    result_cache_stats,
+    unload_worker_module,
+)
+
+
+WORKER_SOURCE = """
+import numpy as np
+from helpers import instrumented, perf_span
+
+@instrumented(size_arg='values')
+def _square(values):
+    return values ** 2
+
+def sum_squares(data, repeat=3):
+    with perf_span('setup', size=data):
+        arr = np.asarray(data, dtype=float)
+    total = 0.0
+    for _ in range(repeat):
+        total += float(np.sum(_square(arr)))
+    return {'total': total}
+
+def allocate(n):
+    with perf_span('allocate'):
+        block = np.ones(n)
+    return {'n': int(block.size)}
+"""
+
+
+@pytest.fixture
+def profile_worker(tmp_path):
+    path = tmp_path / 'worker98.py'
+    path.write_text(WORKER_SOURCE, encoding='utf-8')
+    asyncio.run(load_worker_module(98, str(path)))
+    yield
+    unload_worker_module(98)
+
+
+def test_spans_are_noop_without_profiler():
+    """계측 중이 아니면 데코레이터/구간은 원래 결과만 반환"""
+    @instrumented()
+    def double(x):
+        return 2 * x
+
+    with perf_span('outside'):
+        assert double(3) == 6
+    assert helpers._ACTIVE_PROFILER is None
+
+
+def test_dispatch_profile_adds_perf_block(profile_worker):
+    """_profile=True: _perf에 총 시간, 입력 크기, 중첩 구간(호출 수/크기) 기록"""
+    meta, _ = dispatch(98, 'sum_squares', {'data': [1.0, 2.0, 3.0], 'repeat': 4, '_profile': True})
+    result = json.loads(meta)
+
+    assert result['total'] == pytest.approx(56.0)
+    perf = result['_perf']
+    assert perf['method'] == 'sum_squares'
+    assert perf['memory'] is False and 'peakBytes' not in perf
+    assert perf['inputSizes'] == {'data': 3}
+
+    stages = {stage['name']: stage for stage in perf['stages']}
+    assert list(stages) == ['sum_squares/setup', 'sum_squares/_square']
+    assert stages['sum_squares/_square']['calls'] == 4
+    assert stages['sum_squares/_square']['size'] == 3
+    assert stages['sum_squares/setup']['size'] == 3
+    assert perf['totalMs'] >= stages['sum_squares/_square']['totalMs']
+    assert helpers._ACTIVE_PROFILER is None
+
+
+def test_dispatch_without_profile_has_no_perf(profile_worker):
+    """기본 호출 결과는 그대로 (_perf 없음)"""
+    meta, _ = dispatch(98, 'sum_squares', {'data': [1.0, 2.0]})
+    assert '_perf' not in json.loads(meta)
+
+
+def test_profile_memory_records_allocation_peak(profile_worker):
+    """_profile='memory': 구간별 tracemalloc 할당 peak (구간 시작 대비)"""
+    import tracemalloc
+
+    meta, _ = dispatch(98, 'allocate', {'n': 200_000, '_profile': 'memory'})
+    perf = json.loads(meta)['_perf']
+
+    assert perf['memory'] is True
+    assert perf['stages'][0]['name'] == 'allocate/allocate'
+    assert perf['stages'][0]['peakBytes'] >= 200_000 * 8
+    assert perf['peakBytes'] >= perf['stages'][0]['peakBytes']
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_bypasses_result_cache(profile_worker):
+    """계측 호출은 캐시를 조회/저장하지 않음"""
+    clear_result_cache()
+    before = json.loads(result_cache_stats())
+    params = {'data': [1.0, 2.0], '_profile': True}
+    dispatch(98, 'sum_squares', params, memoize=True)
+    dispatch(98, 'sum_squares', params, memoize=True)
+
+    stats = json.loads(result_cache_stats())
+    assert stats['hits'] == before['hits'] and stats['misses'] == before['misses']
+    assert stats['entries'] == 0
+
+
+def test_fst_profile_separates_recount_and_hudson():
+    """fst 순열 구간: 재집계(_recount_alleles)와 Hudson Fst 계산을 따로 집계"""
+    spec = importlib.util.spec_from_file_location('worker9_genetics', os.path.join(worker_dir, 'worker9-genetics.py'))
+    worker9 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(worker9)
+
+    rng = np.random.default_rng(0)
+    genotypes = [[f"{rng.choice(['A', 'B'])}/{rng.choice(['A', 'B'])}" for _ in range(3)] for _ in range(40)]
+    pops = ['p1'] * 20 + ['p2'] * 20
+
+    result = helpers._profiled_call(
+        'fst', worker9.fst,
+        {'genotypes': genotypes, 'individualPopulations': pops, 'nPermutations': 49, 'nBootstrap': 0, 'seed': 1},
+        True,
+    )
+    stages = {stage['name']: stage for stage in result['_perf']['stages']}
+
+    assert stages['fst/_parse_genotypes']['size'] == 40
+    recount = stages['fst/sequential_permutation_test/_recount_alleles']
+    hudson = stages['fst/sequential_permutation_test/_multilocus_hudson_fst']
+    assert recount['calls'] == hudson['calls'] == result['nPermutations']
+    assert result['_perf']['inputSizes']['genotypes'] == 40
@@ -0,0 +1,158 @@
+"""
+helpers.py 진행률 보고 + 협력적 취소 단위 테스트
+- ProgressLoop 진행률 콜백 / 취소 신호(interrupt buffer) 처리
+- 취소 시 Worker 순열 검정의 부분 결과 (permanova, mantel_test, cluster_analysis)
+- 취소된 부분 결과는 결과 캐시(memoize)에 저장하지 않음
+
+pytest __tests__/workers/test_helpers_progress.py -v
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import (
+    OperationCancelled,
+    ProgressLoop,
+    clear_result_cache,
+    dispatch,
+    load_worker_module,
+    result_cache_stats,
+    set_interrupt_buffer,
+    set_progress_callback,
+    unload_worker_module,
+)
+
+
+def _load_worker(filename):
+    spec = importlib.util.spec_from_file_location(filename.replace('-', '_')[:-3], os.path.join(worker_dir, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def interrupt():
+    """첫 진행률 보고 시점에 취소 신호를 보내는 콜백 + 버퍼 (Int32Array 대역)"""
+    buffer = np.zeros(1, dtype=np.int32)
+    reports = []
+
+    def on_progress(fraction, label):
+        reports.append((fraction, label))
+        buffer[0] = 2
+
+    set_interrupt_buffer(buffer)
+    yield on_progress, reports
+    set_progress_callback(None)
+    set_interrupt_buffer(None)
+
+
+def test_progress_loop_reports_progress():
+    """every회마다 진행률 보고, 마지막은 1.0"""
+    reports = []
+    set_progress_callback(lambda fraction, label: reports.append((fraction, label)))
+    try:
+        with ProgressLoop(10, 'demo', every=4) as loop:
+            for _ in loop:
+                pass
+    finally:
+        set_progress_callback(None)
+
+    assert reports == [(0.4, 'demo'), (0.8, 'demo'), (1.0, 'demo')]
+    assert (loop.completed, loop.cancelled) == (10, False)
+
+
+def test_progress_loop_cancel_keeps_completed(interrupt):
+    """취소 신호는 반복 경계에서 소비되고 완료된 반복 수가 남음"""
+    on_progress, _ = interrupt
+    set_progress_callback(on_progress)
+    done = []
+
+    with ProgressLoop(100, 'demo', every=10) as loop:
+        for i in loop:
+            done.append(i)
+
+    assert (loop.completed, loop.cancelled) == (10, True)
+    assert len(done) == 10
+
+
+def test_progress_loop_cancel_before_any_iteration():
+    """완료된 반복이 없으면 OperationCancelled"""
+    with pytest.raises(OperationCancelled):
+        with ProgressLoop(5, 'demo') as loop:
+            for _ in loop:
+                raise KeyboardInterrupt
+
+
+def test_progress_loop_propagates_other_errors():
+    """KeyboardInterrupt 외 예외는 그대로 전파"""
+    with pytest.raises(ValueError):
+        with ProgressLoop(5) as loop:
+            for _ in loop:
+                raise ValueError('boom')
+
+
+def test_permanova_partial_result_on_cancel(interrupt):
+    """permanova 취소 시 완료된 순열까지의 p-value 반환"""
+    on_progress, reports = interrupt
+    worker8 = _load_worker('worker8-ecology.py')
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(12, 2))
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).tolist()
+
+    set_progress_callback(on_progress)
+    result = worker8.permanova(dm, ['a'] * 6 + ['b'] * 6, permutations=999)
+
+    assert result['cancelled'] is True
+    assert result['stoppingRule'] == 'cancelled'
+    assert result['requestedPermutations'] == 999
+    # 첫 진행률 보고(999 // 50회) 직후 취소 신호 확인
+    assert result['permutations'] == 999 // 50
+    assert reports[0][1] == 'permanova'
+    assert 0 < result['pValue'] <= 1
+
+
+def test_mantel_completes_without_cancel():
+    """취소가 없으면 기존 결과 구조 유지 (cancelled 키 없음)"""
+    worker8 = _load_worker('worker8-ecology.py')
+    dm = [[0, 1, 2], [1, 0, 1], [2, 1, 0]]
+
+    result = worker8.mantel_test(dm, dm, permutations=20)
+
+    assert result['requestedPermutations'] == 20
+    assert result['stoppingRule'] in ('early', 'completed', 'extended')
+    assert 'cancelled' not in result
+
+
+def test_cancelled_result_not_memoized(interrupt):
+    """취소로 잘린 permanova 결과는 캐시하지 않음 → 같은 입력의 다음 호출은 전체 실행"""
+    on_progress, _ = interrupt
+    asyncio.run(load_worker_module(88, os.path.join(worker_dir, 'worker8-ecology.py')))
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(12, 2))
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).tolist()
+    params = {'distance_matrix': dm, 'grouping': ['a'] * 6 + ['b'] * 6, 'permutations': 999, 'seed': 7}
+
+    try:
+        clear_result_cache()
+        set_progress_callback(on_progress)
+        meta, _ = dispatch(88, 'permanova', params, memoize=True)
+        assert json.loads(meta)['stoppingRule'] == 'cancelled'
+        assert json.loads(result_cache_stats())['entries'] == 0
+
+        set_progress_callback(None)
+        set_interrupt_buffer(None)
+        meta, _ = dispatch(88, 'permanova', params, memoize=True)
+        assert json.loads(meta)['stoppingRule'] != 'cancelled'
+        assert json.loads(result_cache_stats())['entries'] == 1
+    finally:
+        unload_worker_module(88)
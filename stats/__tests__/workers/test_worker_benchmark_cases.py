@@ -0,0 +1,95 @@
+"""
+scripts/benchmarks Worker 벤치마크 단위 테스트
+- 모든 Worker public 메서드에 벤치마크 케이스가 등록되어 있는지 (AST 기준, Worker import 없음)
+- 합성 데이터 재현성, 크기별 측정 중단 규칙, 기준선 회귀 판정
+
+pytest __tests__/workers/test_worker_benchmark_cases.py -v
+"""
+
+import os
+import sys
+
+import pytest
+
+bench_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'benchmarks')
+if bench_dir not in sys.path:
+    sys.path.insert(0, bench_dir)
+
+from synthetic_data import SyntheticData
+from worker_benchmark import benchmark_method, collect_public_methods, compare_reports, find_worker_file
+from worker_cases import CASES, BenchCase
+
+
+@pytest.mark.parametrize('worker_num', range(1, 11))
+def test_every_public_method_has_case(worker_num):
+    """Worker public 메서드와 CASES 등록 목록이 정확히 일치"""
+    source = find_worker_file(worker_num).read_text(encoding='utf-8')
+    assert set(collect_public_methods(source)) == set(CASES[worker_num])
+
+
+def test_synthetic_data_reproducible_per_size():
+    """같은 (seed, n)이면 같은 데이터, n이 다르면 독립 스트림"""
+    assert SyntheticData(100, seed=1).numeric() == SyntheticData(100, seed=1).numeric()
+    assert SyntheticData(100, seed=1).numeric()[:10] != SyntheticData(101, seed=1).numeric()[:10]
+
+
+def test_synthetic_domain_shapes():
+    """도메인별 생성기 형태: 풍부도 행, 거리 행렬, 유전자형, 정렬 서열"""
+    d = SyntheticData(20)
+    rows = d.abundance_rows(n_species=5)
+    assert len(rows) == 20 and set(rows[0]) == {'site', 'sp1', 'sp2', 'sp3', 'sp4', 'sp5'}
+
+    dist = d.distance_matrix()
+    assert len(dist) == 20 and dist[3][3] == 0.0 and dist[1][2] == pytest.approx(dist[2][1])
+
+    table = d.genotype_table(n_loci=4)
+    assert len(table['genotypes']) == 20 and len(set(table['populations'])) == 3
+    assert all('/' in cell for cell in table['genotypes'][0])
+
+    sequences = d.aligned_sequences(n_seq=3)
+    assert len(sequences) == 3 and {len(s) for s in sequences} == {20}
+    assert sum(map(sum, d.contingency(2, 2, n=50))) == 50
+
+
+def test_benchmark_stops_at_max_n_and_fixed_input():
+    """max_n 초과 크기는 측정하지 않고, 요약 입력 메서드는 첫 크기만 측정"""
+    case = BenchCase(lambda d: {'values': d.numeric()}, max_n=1_000)
+    result = benchmark_method(lambda values: sum(values), case, [100, 1_000, 10_000], 10.0, 1, 0, memory=False)
+    assert [p['n'] for p in result['points']] == [100, 1_000]
+    assert result['stopped'] == 'max-n'
+
+    fixed = BenchCase(lambda d: {'x': 1}, scalable=False)
+    result = benchmark_method(lambda x: x, fixed, [100, 1_000], 10.0, 1, 0)
+    assert len(result['points']) == 1 and result['stopped'] == 'fixed-input'
+    assert 'peakBytes' in result['points'][0]
+
+
+def test_benchmark_time_cap_and_error():
+    """다음 크기 예상 시간이 상한을 넘으면 중단, 메서드 오류는 기록 후 중단"""
+    import time
+
+    case = BenchCase(lambda d: {'n': d.n})
+    result = benchmark_method(lambda n: time.sleep(0.02), case, [100, 1_000, 10_000], 0.1, 1, 0, memory=False)
+    assert [p['n'] for p in result['points']] == [100]
+    assert result['stopped'] == 'time-cap'
+
+    def failing(n):
+        raise ValueError('bad input')
+
+    result = benchmark_method(failing, case, [100, 1_000], 10.0, 1, 0)
+    assert result['stopped'] == 'error' and 'ValueError: bad input' in result['error']
+
+
+def test_compare_reports_flags_regressions_above_noise():
+    """비율 임계값 + 잡음 하한을 모두 넘는 변화만 보고"""
+    def report(seconds, peak):
+        return {'methods': {'worker1.x': {'points': [{'n': 100, 'seconds': seconds, 'peakBytes': peak}]}}}
+
+    changes = compare_reports(report(0.10, 10_000_000), report(0.20, 10_000_000))
+    assert [(c['metric'], c['status'], c['ratio']) for c in changes] == [('seconds', 'regression', 2.0)]
+
+    changes = compare_reports(report(0.10, 10_000_000), report(0.05, 30_000_000))
+    assert {(c['metric'], c['status']) for c in changes} == {('seconds', 'improvement'), ('peakBytes', 'regression')}
+
+    # 0.5ms → 0.9ms: 비율은 크지만 잡음 하한(1ms) 미만 차이
+    assert compare_reports(report(0.0005, 1000), report(0.0009, 3000)) == []
@@ -0,0 +1,96 @@
+"""
+사전 컴파일 Worker 번들 단위 테스트 (scripts/build/worker_bundle.py + helpers.load_compiled_code)
+- 모든 Worker 소스가 top-level await 플래그로 컴파일되어 번들에 포함 (manifest 해시/magic)
+- .pyc 경로로 load_worker_module: 소스 컴파일 없이 같은 함수 테이블 등록
+- bytecode 버전(magic number)이 다르면 ImportError
+
+pytest __tests__/workers/test_worker_bundle.py -v
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import zipfile
+
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+build_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'build')
+for path in (worker_dir, build_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from helpers import load_worker_module, unload_worker_module
+from worker_bundle import build_bundle, compile_module
+
+
+def _bundle_modules():
+    """build-worker-bundle.js와 같은 대상: helpers + worker{N}-*.py → (모듈명, 파일명, 소스)"""
+    modules = [('helpers', 'helpers.py')]
+    for filename in sorted(os.listdir(worker_dir)):
+        match = re.match(r'^worker(\d+)-[\w-]+\.py$', filename)
+        if match:
+            modules.append((f'worker{match.group(1)}', filename))
+    return [
+        (name, filename, open(os.path.join(worker_dir, filename), encoding='utf-8').read())
+        for name, filename in modules
+    ]
+
+
+def test_bundle_contains_every_worker_with_manifest():
+    """모든 Worker(top-level await 포함 worker6)가 컴파일되고 manifest에 소스 해시 기록"""
+    import importlib.util
+
+    modules = _bundle_modules()
+    with zipfile.ZipFile(io.BytesIO(build_bundle(modules))) as archive:
+        names = set(archive.namelist())
+        manifest = json.loads(archive.read('manifest.json'))
+
+    assert names == {f'{name}.pyc' for name, _, _ in modules} | {'manifest.json'}
+    assert 'worker6' in manifest['modules'] and 'worker10' in manifest['modules']
+    assert manifest['magic'] == importlib.util.MAGIC_NUMBER.hex()
+    name, filename, source = modules[1]
+    assert manifest['modules'][name]['source'] == filename
+    assert manifest['modules'][name]['sha256'] == hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+TOY_SOURCE = """
+from helpers import clean_array
+
+async def _warmup():
+    return 2
+
+_SCALE = await _warmup()
+
+def scaled_sum(data):
+    return {'total': float(clean_array(data).sum() * _SCALE)}
+"""
+
+
+def test_load_worker_module_from_pyc(tmp_path):
+    """.pyc 경로로 로드: top-level await 실행 + public 함수 등록"""
+    import helpers
+
+    path = tmp_path / 'worker97.pyc'
+    path.write_bytes(compile_module('worker97', TOY_SOURCE))
+    try:
+        assert asyncio.run(load_worker_module(97, str(path))) == ['scaled_sum']
+        assert helpers._invoke(97, 'scaled_sum', {'data': [1.0, 2.0]}) == {'total': 6.0}
+    finally:
+        unload_worker_module(97)
+
+
+def test_pyc_magic_mismatch_raises_import_error(tmp_path):
+    """다른 Python 버전의 bytecode는 ImportError (JS는 소스 로드로 대체)"""
+    pyc = bytearray(compile_module('worker97', TOY_SOURCE))
+    pyc[0] ^= 0xFF
+    path = tmp_path / 'worker97.pyc'
+    path.write_bytes(bytes(pyc))
+
+    with pytest.raises(ImportError, match='magic mismatch'):
+        asyncio.run(load_worker_module(97, str(path)))
+    assert 'worker97' not in sys.modules
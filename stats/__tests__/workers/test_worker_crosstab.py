@@ -0,0 +1,157 @@
+"""
+worker1 crosstab_analysis / worker2 chi_square_independence_test 분할표 단위 테스트
+- bincount 집계가 범주 조합별 전수 비교와 일치 (dense / sparse COO)
+- 희소 입력 카이제곱이 scipy chi2_contingency와 일치, 2×2는 Yates 보정 유지
+- parse_sparse_table 검증 (중복 칸 합산, 범위/길이 오류)
+
+pytest __tests__/workers/test_worker_crosstab.py -v
+"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import encode_categories, parse_sparse_table
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(worker_dir, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+worker1 = _load('worker1_crosstab_test', 'worker1-descriptive.py')
+worker2 = _load('worker2_crosstab_test', 'worker2-hypothesis.py')
+
+
+def _brute_force(rows, cols):
+    row_cats, col_cats = np.unique(rows), np.unique(cols)
+    return [[int(np.sum((rows == r) & (cols == c))) for c in col_cats] for r in row_cats]
+
+
+@pytest.fixture
+def categorical():
+    rng = np.random.default_rng(7)
+    rows = np.array([f'R{v}' for v in rng.integers(0, 12, 3000)])
+    cols = rng.integers(0, 9, 3000)
+    return rows, cols
+
+
+def test_encode_categories():
+    """정렬된 고유 범주 + 인덱스 코드"""
+    categories, codes = encode_categories(['b', 'a', 'c', 'b'])
+    assert categories.tolist() == ['a', 'b', 'c']
+    assert codes.tolist() == [1, 0, 2, 1]
+
+
+def test_crosstab_matches_brute_force(categorical):
+    """dense 결과가 범주 조합별 np.sum 집계와 동일"""
+    rows, cols = categorical
+    result = worker1.crosstab_analysis(rows.tolist(), cols.tolist())
+
+    assert result['observedMatrix'] == _brute_force(rows, cols)
+    assert result['observedSparse'] is None
+    assert result['rowTotals'] == np.sum(result['observedMatrix'], axis=1).tolist()
+    assert result['colTotals'] == np.sum(result['observedMatrix'], axis=0).tolist()
+    assert result['grandTotal'] == len(rows)
+
+
+def test_crosstab_sparse_matches_dense():
+    """sparse=True는 0이 아닌 칸만 COO로 반환, 밀집 행렬로 되돌리면 dense 결과와 동일"""
+    rows = ['a', 'a', 'b', 'c', 'c', 'c']
+    cols = ['x', 'y', 'x', 'z', 'z', 'x']
+    dense = worker1.crosstab_analysis(rows, cols)
+    sparse = worker1.crosstab_analysis(rows, cols, sparse=True)
+
+    table = sparse['observedSparse']
+    assert sparse['observedMatrix'] is None
+    assert table['shape'] == [3, 3]
+    assert 0 not in table['counts']
+
+    rebuilt = np.zeros(table['shape'], dtype=int)
+    rebuilt[table['rowIndex'], table['colIndex']] = table['counts']
+    assert rebuilt.tolist() == dense['observedMatrix']
+    assert sparse['rowTotals'] == dense['rowTotals'] and sparse['colTotals'] == dense['colTotals']
+
+
+def test_crosstab_validation():
+    with pytest.raises(ValueError, match='same length'):
+        worker1.crosstab_analysis([1, 2], [1])
+    with pytest.raises(ValueError, match='Empty'):
+        worker1.crosstab_analysis([], [])
+
+
+def test_chi_square_sparse_matches_scipy(categorical):
+    """crosstab 희소 출력을 그대로 넘긴 결과가 밀집 입력(scipy) 결과와 일치"""
+    rows, cols = categorical
+    sparse = worker1.crosstab_analysis(rows.tolist(), cols.tolist(), sparse=True)['observedSparse']
+    dense = worker1.crosstab_analysis(rows.tolist(), cols.tolist())['observedMatrix']
+
+    expected = worker2.chi_square_independence_test(dense)
+    result = worker2.chi_square_independence_test(sparse)
+
+    for key in ('chiSquare', 'pValue', 'cramersV', 'criticalValue'):
+        assert result[key] == pytest.approx(expected[key], rel=1e-10)
+    assert result['degreesOfFreedom'] == expected['degreesOfFreedom']
+    assert result['reject'] == expected['reject']
+    assert result['observedMatrix'] is None and result['expectedMatrix'] is None
+
+
+def test_chi_square_sparse_zero_cells():
+    """0 도수 칸이 많은 표도 통계량 일치, 1행 표는 자유도 0"""
+    observed = np.array([[5, 0, 0, 2], [0, 3, 0, 0], [1, 0, 4, 0]])
+    rows, cols = np.nonzero(observed)
+    table = {'shape': [3, 4], 'rowIndex': rows.tolist(), 'colIndex': cols.tolist(), 'counts': observed[rows, cols].tolist()}
+
+    chi2, p_value, dof, _ = stats.chi2_contingency(observed, correction=False)
+    result = worker2.chi_square_independence_test(table)
+    assert result['chiSquare'] == pytest.approx(chi2)
+    assert result['pValue'] == pytest.approx(p_value)
+    assert result['degreesOfFreedom'] == dof
+
+    single = worker2.chi_square_independence_test({'shape': [1, 3], 'rowIndex': [0, 0, 0], 'colIndex': [0, 1, 2], 'counts': [4, 1, 6]})
+    assert single['chiSquare'] == 0.0 and single['pValue'] == 1.0 and single['degreesOfFreedom'] == 0
+
+
+def test_chi_square_sparse_2x2_keeps_yates():
+    """2×2 희소 입력은 밀집 경로로 Yates 보정 적용"""
+    table = {'shape': [2, 2], 'rowIndex': [0, 0, 1, 1], 'colIndex': [0, 1, 0, 1], 'counts': [12, 5, 3, 14]}
+    expected = worker2.chi_square_independence_test([[12, 5], [3, 14]], yatesCorrection=True)
+    result = worker2.chi_square_independence_test(table, yatesCorrection=True)
+
+    assert result['chiSquare'] == pytest.approx(expected['chiSquare'])
+    assert result['expectedMatrix'] == expected['expectedMatrix']
+
+
+def test_chi_square_sparse_empty_margin():
+    """빈 행/열이 있으면 기대도수 0 오류 (scipy와 동일한 실패)"""
+    table = {'shape': [3, 3], 'rowIndex': [0, 1], 'colIndex': [0, 1], 'counts': [3, 4]}
+    with pytest.raises(ValueError, match='zero element'):
+        worker2.chi_square_independence_test(table)
+
+
+def test_parse_sparse_table():
+    """중복 칸은 합산, 0 도수 칸 제외, 잘못된 입력은 ValueError"""
+    shape, rows, cols, counts = parse_sparse_table(
+        {'shape': [2, 3], 'rowIndex': [1, 0, 1, 0], 'colIndex': [2, 1, 2, 0], 'counts': [2, 3, 1, 0]}
+    )
+    assert shape == (2, 3)
+    assert rows.tolist() == [0, 1] and cols.tolist() == [1, 2] and counts.tolist() == [3, 3]
+
+    with pytest.raises(ValueError, match='out of range'):
+        parse_sparse_table({'shape': [2, 2], 'rowIndex': [2], 'colIndex': [0], 'counts': [1]})
+    with pytest.raises(ValueError, match='same length'):
+        parse_sparse_table({'shape': [2, 2], 'rowIndex': [0, 1], 'colIndex': [0], 'counts': [1]})
+    with pytest.raises(ValueError, match='non-negative'):
+        parse_sparse_table({'shape': [2, 2], 'rowIndex': [0], 'colIndex': [0], 'counts': [-1]})
+    with pytest.raises(ValueError, match='requires'):
+        parse_sparse_table({'rowIndex': [0]})
@@ -0,0 +1,106 @@
+"""
+worker1 스트리밍 기술통계 스케치 단위 테스트
+- 청크 update 결과의 적률/CI가 descriptive_stats와 일치 (청크 분할과 무관)
+- compaction 전에는 분위수도 정확, 이후에는 KLL 순위 오차 이내
+- 샤드 병합은 순서와 무관, 상태는 JSON 왕복 가능
+- 잘못된 상태 거부
+
+pytest __tests__/workers/test_worker_descriptive_sketch.py -v
+"""
+
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+_spec = importlib.util.spec_from_file_location('worker1_sketch_test', os.path.join(worker_dir, 'worker1-descriptive.py'))
+worker1 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker1)
+
+EXACT_KEYS = ('mean', 'std', 'variance', 'min', 'max', 'skewness', 'kurtosis', 'n', 'sem', 'ciLower', 'ciUpper')
+
+
+def _stream(chunks, state=None, k=worker1.DEFAULT_SKETCH_K):
+    for chunk in chunks:
+        # TS 쪽과 같이 매 호출 JSON 왕복
+        state = json.loads(json.dumps(worker1.descriptive_sketch_update(list(chunk), state, k)))
+    return state
+
+
+def test_small_stream_matches_descriptive_stats():
+    """compaction 전: 분위수까지 descriptive_stats와 동일"""
+    data = [3.0, None, 1.5, 8.0, 2.0, np.nan, 2.0, 9.5, 4.25]
+    state = _stream([data[:4], data[4:]])
+    result = worker1.descriptive_sketch_finalize(state, 0.9)
+    expected = worker1.descriptive_stats(data, 0.9)
+
+    assert result['exact'] is True
+    for key in EXACT_KEYS + ('q1', 'median', 'q3', 'iqr'):
+        assert result[key] == pytest.approx(expected[key], rel=1e-12), key
+    assert result['upperFence'] == pytest.approx(expected['q3'] + 1.5 * expected['iqr'])
+
+
+def test_large_stream_moments_exact_quantiles_bounded():
+    """청크 분할과 무관하게 적률은 정확, 분위수는 순위 오차 2% 이내, 상태 크기는 k에 비례"""
+    rng = np.random.default_rng(3)
+    data = rng.lognormal(size=50_000)
+    state = _stream(np.array_split(data, 23))
+    result = worker1.descriptive_sketch_finalize(state)
+    expected = worker1.descriptive_stats(data.tolist())
+
+    assert result['exact'] is False
+    for key in EXACT_KEYS:
+        assert result[key] == pytest.approx(expected[key], rel=1e-9), key
+
+    ordered = np.sort(data)
+    for key, p in (('q1', 0.25), ('median', 0.5), ('q3', 0.75)):
+        rank = np.searchsorted(ordered, result[key]) / data.size
+        assert abs(rank - p) < 0.02, key
+    assert sum(len(level) for level in state['levels']) < 4 * worker1.DEFAULT_SKETCH_K
+
+
+def test_merge_shards_order_independent():
+    """샤드 병합 = 전체 스트림 (적률), 병합 순서와 무관"""
+    rng = np.random.default_rng(5)
+    shards = [rng.normal(i, 1.0 + i, 3_000) for i in range(4)]
+    states = [_stream(np.array_split(shard, 3), k=64) for shard in shards]
+
+    merged = worker1.descriptive_sketch_finalize(worker1.descriptive_sketch_merge(states))
+    reversed_merge = worker1.descriptive_sketch_finalize(worker1.descriptive_sketch_merge(states[::-1]))
+    expected = worker1.descriptive_stats(np.concatenate(shards).tolist())
+
+    for key in EXACT_KEYS:
+        assert merged[key] == pytest.approx(expected[key], rel=1e-9), key
+        assert merged[key] == pytest.approx(reversed_merge[key], rel=1e-9), key
+    assert merged['k'] == 64
+
+
+def test_merge_uses_smaller_k_and_skips_empty():
+    small = worker1.descriptive_sketch_update([1, 2, 3], None, 16)
+    large = worker1.descriptive_sketch_update([4, 5], None, 400)
+
+    merged = worker1.descriptive_sketch_merge([None, large, small])
+    assert merged['k'] == 16 and merged['n'] == 5
+    assert merged['min'] == 1.0 and merged['max'] == 5.0
+
+
+def test_invalid_state_and_empty_input():
+    state = worker1.descriptive_sketch_update([1, 2, 3])
+
+    with pytest.raises(ValueError):
+        worker1.descriptive_sketch_finalize(dict(state, n=4))
+    with pytest.raises(ValueError):
+        worker1.descriptive_sketch_finalize({'k': 200})
+    with pytest.raises(ValueError):
+        worker1.descriptive_sketch_finalize(worker1.descriptive_sketch_update([None, np.nan]))
+    with pytest.raises(ValueError):
+        worker1.descriptive_sketch_update([1.0], None, 4)
+    with pytest.raises(ValueError):
+        worker1.descriptive_sketch_merge([])
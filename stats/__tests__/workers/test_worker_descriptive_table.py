@@ -0,0 +1,79 @@
+"""
+worker1 descriptive_stats_table 단위 테스트
+- 컬럼별 descriptive_stats 결과와 일치 (분위수, 최빈값, 적률, t 신뢰구간)
+- 길이가 다른 컬럼, 무효값, 유효값 0/1개 컬럼, 상수 컬럼 처리
+
+pytest __tests__/workers/test_worker_descriptive_table.py -v
+"""
+
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+from helpers import column_matrix
+
+_spec = importlib.util.spec_from_file_location('worker1_table_test', os.path.join(worker_dir, 'worker1-descriptive.py'))
+worker1 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker1)
+
+STAT_KEYS = (
+    'mean', 'median', 'mode', 'std', 'variance', 'min', 'max', 'q1', 'q3', 'iqr',
+    'skewness', 'kurtosis', 'n', 'se', 'sem', 'ciLower', 'ciUpper',
+)
+
+
+def test_column_matrix_pads_and_masks():
+    """짧은 컬럼/무효값은 NaN, 리스트 입력은 "0", "1", ... 이름"""
+    names, matrix = column_matrix({'a': [1, None, np.inf], 'b': [4], 'c': ['x', '2.5', 3]})
+    assert names == ['a', 'b', 'c']
+    np.testing.assert_array_equal(matrix, [[1, 4, 2.5], [np.nan, np.nan, 3], [np.nan, np.nan, np.nan]])
+
+    names, matrix = column_matrix([[1, 2], [3]])
+    assert names == ['0', '1'] and matrix.shape == (2, 2)
+
+
+def test_table_matches_single_column():
+    """모든 통계량이 컬럼별 descriptive_stats와 일치"""
+    rng = np.random.default_rng(7)
+    columns = {
+        'normal': rng.normal(10, 2, 200).tolist(),
+        'ties': rng.integers(0, 5, 57).astype(float).tolist(),
+        'gaps': [3.0, None, 1.0, 1.0, np.nan, 8.0, 3.0],
+        'skewed': rng.exponential(1.0, 31).tolist(),
+    }
+    table = worker1.descriptive_stats_table(columns, 0.9)
+
+    assert table['columns'] == list(columns)
+    assert table['confidenceLevel'] == 0.9
+    for j, values in enumerate(columns.values()):
+        single = worker1.descriptive_stats(values, 0.9)
+        for key in STAT_KEYS:
+            assert table[key][j] == pytest.approx(single[key], rel=1e-10, abs=1e-12), key
+
+
+def test_table_degenerate_columns():
+    """유효값 0개 → 모두 None, 1개/상수 → 분산·왜도 None, CI는 평균"""
+    table = worker1.descriptive_stats_table([[None, np.nan], [5.0], [2.0, 2.0, 2.0]])
+
+    assert table['n'] == [0, 1, 3]
+    assert table['mean'] == [None, 5.0, 2.0]
+    assert table['min'][0] is None and table['mode'][0] is None
+    assert table['std'][1] is None and table['sem'][1] == 0.0
+    assert table['skewness'][2] is None and table['kurtosis'][2] is None
+    assert table['ciLower'][1:] == [5.0, 2.0] and table['ciUpper'][1:] == [5.0, 2.0]
+    json.dumps(table, allow_nan=False)
+
+
+def test_table_validates_input():
+    with pytest.raises(ValueError):
+        worker1.descriptive_stats_table({'a': [1, 2]}, 1.5)
+    with pytest.raises(ValueError):
+        worker1.descriptive_stats_table({})
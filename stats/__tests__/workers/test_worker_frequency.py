@@ -0,0 +1,84 @@
+"""
+worker1 frequency_analysis 단위 테스트
+- 기본 모드: 전체 범주를 범주 순으로 (기존 동작)
+- topK 모드: 상위 k개 빈도 내림차순 + 기타 합산 행, 전체 기준 total/uniqueCount/누적 백분율
+
+pytest __tests__/workers/test_worker_frequency.py -v
+"""
+
+import importlib.util
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+_spec = importlib.util.spec_from_file_location('worker1_frequency_test', os.path.join(worker_dir, 'worker1-descriptive.py'))
+worker1 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker1)
+
+
+@pytest.fixture
+def free_text():
+    rng = np.random.default_rng(3)
+    return [f'w{v}' for v in rng.zipf(1.5, 5000) % 700]
+
+
+def test_default_mode_unchanged():
+    """topK 없으면 범주 순 전체 목록, 합산 행 없음"""
+    result = worker1.frequency_analysis(['b', 'a', 'b', 'c', 'b'])
+
+    assert result['categories'] == ['a', 'b', 'c']
+    assert result['frequencies'] == [1, 3, 1]
+    assert result['cumulativePercentages'][-1] == pytest.approx(100.0)
+    assert result['uniqueCount'] == 3 and result['otherCount'] == 0
+
+
+def test_top_k_matches_full_counts(free_text):
+    """상위 k개는 전체 계수 기준 상위 빈도, 기타 행은 나머지 합"""
+    k = 10
+    result = worker1.frequency_analysis(free_text, topK=k)
+    counts = Counter(free_text)
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    assert result['categories'][:k] == [label for label, _ in ranked[:k]]
+    assert result['frequencies'][:k] == [count for _, count in ranked[:k]]
+    assert result['categories'][-1] == 'Other'
+    assert result['frequencies'][-1] == sum(count for _, count in ranked[k:])
+
+    assert result['total'] == len(free_text)
+    assert result['uniqueCount'] == len(counts)
+    assert result['otherCount'] == len(counts) - k
+    assert sum(result['frequencies']) == len(free_text)
+    np.testing.assert_allclose(np.cumsum(result['percentages']), result['cumulativePercentages'])
+    assert result['cumulativePercentages'][-1] == pytest.approx(100.0)
+
+
+def test_top_k_covers_all_categories():
+    """k가 고유값 수 이상이면 합산 행 없음, 동률은 범주 문자열 순"""
+    result = worker1.frequency_analysis(['x', 'y', 'z', 'y', 'x'], topK=5, otherLabel='기타')
+
+    assert result['categories'] == ['x', 'y', 'z']
+    assert result['frequencies'] == [2, 2, 1]
+    assert result['otherCount'] == 0 and '기타' not in result['categories']
+
+
+def test_top_k_merges_same_label():
+    """출력 문자열이 같은 값(1과 '1')은 한 범주로 합산"""
+    result = worker1.frequency_analysis([1, '1', 2, 3], topK=1)
+
+    assert result['categories'] == ['1', 'Other']
+    assert result['frequencies'] == [2, 2]
+    assert result['uniqueCount'] == 3
+
+
+def test_top_k_validation():
+    with pytest.raises(ValueError, match='topK'):
+        worker1.frequency_analysis(['a'], topK=0)
+    with pytest.raises(ValueError, match='Empty'):
+        worker1.frequency_analysis([], topK=3)
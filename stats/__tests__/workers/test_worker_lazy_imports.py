@@ -0,0 +1,44 @@
+"""
+Worker 지연 import 회귀 테스트
+- worker3/worker4 모듈 로드만으로 scikit-learn/statsmodels/pandas가 import되지 않는지 검증
+- 다른 테스트가 이미 import했을 수 있으므로 새 프로세스에서 확인
+
+pytest __tests__/workers/test_worker_lazy_imports.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+
+HEAVY_ROOTS = ('sklearn', 'statsmodels', 'pandas')
+
+CHECK_SOURCE = """
+import importlib.util, sys
+sys.path.insert(0, {worker_dir!r})
+spec = importlib.util.spec_from_file_location('worker', {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(','.join(root for root in {roots!r} if root in sys.modules))
+"""
+
+
+@pytest.mark.parametrize('filename', [
+    'worker3-nonparametric-anova.py',
+    'worker4-regression-advanced.py',
+])
+def test_worker_module_load_skips_heavy_imports(filename):
+    """모듈 로드 시점에는 무거운 패키지를 import하지 않음"""
+    code = CHECK_SOURCE.format(
+        worker_dir=worker_dir,
+        path=os.path.join(worker_dir, filename),
+        roots=HEAVY_ROOTS,
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+    assert output == ''
@@ -0,0 +1,127 @@
+"""
+worker1 Mann-Kendall 추세 검정 단위 테스트
+- 병합 정렬 S와 무작위 선택 Sen's slope가 전체 쌍 계산(O(n²))과 일치 (동률, 정수 자료 포함)
+- 계절/지역 변형: 그룹 안 쌍만 합산, 결측은 시간 간격 유지
+
+pytest __tests__/workers/test_worker_mann_kendall.py -v
+"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+worker_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'workers', 'python')
+if worker_dir not in sys.path:
+    sys.path.insert(0, worker_dir)
+
+_spec = importlib.util.spec_from_file_location('worker1_mk_test', os.path.join(worker_dir, 'worker1-descriptive.py'))
+worker1 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker1)
+
+
+def _all_pairs(series):
+    """계열별 (S, 기울기 목록) 전체 쌍 계산 (결측은 시간 위치 유지)"""
+    s, slopes = 0, []
+    for values in series:
+        values = np.array([np.nan if v is None else v for v in values], dtype=float)
+        t = np.flatnonzero(np.isfinite(values))
+        i, j = np.triu_indices(t.size, 1)
+        dx = values[t[j]] - values[t[i]]
+        s += int(np.sign(dx).sum())
+        slopes.extend(dx / (t[j] - t[i]))
+    return s, float(np.median(slopes))
+
+
+def _series(kind, n, rng):
+    if kind == 'normal':
+        return rng.normal(size=n)
+    if kind == 'ties':
+        return rng.integers(0, 4, n).astype(float)
+    return np.round(np.cumsum(rng.normal(size=n)))
+
+
+@pytest.mark.parametrize('kind', ['normal', 'ties', 'rounded-walk'])
+@pytest.mark.parametrize('force_sampling', [False, True])
+def test_mann_kendall_matches_all_pairs(monkeypatch, kind, force_sampling):
+    """S, tau, Sen's slope가 전체 쌍 계산과 일치 (표본 구간 축소 경로 포함)"""
+    if force_sampling:
+        monkeypatch.setattr(worker1, '_MK_ENUMERATE_FACTOR', 0)
+        monkeypatch.setattr(worker1, '_MK_SAMPLE_SIZE', 64)
+
+    rng = np.random.default_rng(11)
+    for n in (3, 4, 37, 250):
+        data = _series(kind, n, rng)
+        result = worker1.mann_kendall_test(data.tolist())
+        s, slope = _all_pairs([data])
+
+        ties = np.unique(data, return_counts=True)[1]
+        pairs = n * (n - 1) / 2
+        denominator = np.sqrt(pairs * (pairs - (ties * (ties - 1) / 2).sum()))
+        if denominator > 0:
+            assert result['tau'] == pytest.approx(s / denominator, rel=1e-12)
+        assert result['senSlope'] == pytest.approx(slope, rel=1e-12, abs=1e-12)
+        assert result['n'] == n
+
+
+def test_mann_kendall_long_series():
+    """2만 점 계열: tau는 scipy kendalltau(Knight)와 일치"""
+    from scipy import stats
+
+    rng = np.random.default_rng(2)
+    data = np.cumsum(rng.normal(size=20_000)) + 0.01 * np.arange(20_000)
+    result = worker1.mann_kendall_test(data.tolist())
+
+    assert result['tau'] == pytest.approx(stats.kendalltau(np.arange(data.size), data)[0], rel=1e-12)
+    assert result['trend'] == 'increasing'
+
+
+def test_seasonal_mann_kendall_matches_per_season_pairs():
+    """계절 안 쌍만 합산, 결측 칸은 연도 간격 유지"""
+    rng = np.random.default_rng(4)
+    years, period = 15, 4
+    data = (np.tile([0.0, 3.0, -1.0, 5.0], years) + 0.2 * np.repeat(np.arange(years), period)
+            + rng.normal(0, 0.5, years * period)).tolist()
+    data[6] = None
+    data[-1] = None
+
+    result = worker1.seasonal_mann_kendall_test(data, period)
+    s, slope = _all_pairs([data[season::period] for season in range(period)])
+
+    assert result['s'] == s
+    assert sum(season['s'] for season in result['seasons']) == s
+    assert result['senSlope'] == pytest.approx(slope, rel=1e-12)
+    assert result['n'] == years * period - 2
+    assert result['trend'] == 'increasing'
+
+
+def test_regional_mann_kendall_stations():
+    """지역 S = 지점 S의 합, 지점 결과는 단일 계열 검정과 같음, 짧은 지점은 None"""
+    rng = np.random.default_rng(9)
+    stations = {
+        'A': (0.05 * np.arange(60) + rng.normal(size=60)).tolist(),
+        'B': np.round(rng.normal(size=45) * 3).tolist(),
+        'C': [1.0, None],
+    }
+    result = worker1.regional_mann_kendall_test(stations)
+    s, slope = _all_pairs(stations.values())
+
+    assert result['s'] == s and result['nStations'] == 3
+    assert result['senSlope'] == pytest.approx(slope, rel=1e-12)
+    assert [station['station'] for station in result['stations']] == ['A', 'B', 'C']
+    assert result['stations'][2]['s'] is None
+
+    single = worker1.mann_kendall_test(stations['A'])
+    assert result['stations'][0]['zScore'] == pytest.approx(single['zScore'])
+    assert result['stations'][0]['senSlope'] == pytest.approx(single['senSlope'])
+
+
+def test_variants_validate_input():
+    with pytest.raises(ValueError):
+        worker1.seasonal_mann_kendall_test([1, 2, 3, 4], 1)
+    with pytest.raises(ValueError):
+        worker1.seasonal_mann_kendall_test([1, 2, 3, 4], 12)
+    with pytest.raises(ValueError):
+        worker1.regional_mann_kendall_test([])
@@ -348,6 +348,14 @@ export function VariableSelectionStep({ onComplete, onBack }: VariableSelectionS
     setPreviewDraftMapping(null)
   }, [canonicalSelectedMethod?.id, selectorType, existingMapping, initialSelection])
 
+  // 변수 선택 중에 분석/가정 검정에 쓸 Worker를 미리 로드 (메모리 상한 내, 실패는 무시)
+  useEffect(() => {
+    if (!selectedMethod) return
+    import('@/lib/services/pyodide/prefetch-worker')
+      .then(({ prefetchWorkerForMethod }) => { prefetchWorkerForMethod(selectedMethod) })
+      .catch((error: unknown) => logger.warn('[VariableSelection] Worker prefetch skipped', { error }))
+  }, [selectedMethod])
+
   const previewSlots = useMemo(
     () => getLocalizedSlotConfigs(resolveMethodSlots(selectorType, methodRequirements), t),
     [selectorType, methodRequirements, t]
@@ -216,7 +216,7 @@ const FstTool = memo(function FstTool({ tool, meta, initialEntry }: ToolComponen
           <BioResultSummary
             metrics={[
               { label: 'Global Fst', value: results.globalFst.toFixed(6), tooltip: fstLevel?.label },
-              ...(results.permutationPValue != null ? [{ label: 'p-value', value: results.permutationPValue.toFixed(4), tooltip: `${results.nPermutations ?? 0} 순열 검정` }] : []),
+              ...(results.permutationPValue != null ? [{ label: 'p-value', value: results.permutationPValue.toFixed(4), tooltip: `${results.nPermutations ?? 0} 순열 검정${results.mcStandardError != null ? ` (MC SE ${results.mcStandardError.toFixed(4)})` : ''}` }] : []),
               { label: '집단 수', value: String(results.nPopulations) },
               ...(results.nLoci != null ? [{ label: '유전자좌', value: String(results.nLoci) }] : []),
             ] satisfies MetricItem[]}
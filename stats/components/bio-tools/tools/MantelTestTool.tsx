@@ -275,7 +275,10 @@ const MantelTestTool = memo(function MantelTestTool({ tool, meta, initialEntry }
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>Mantel r</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.r}</td></tr>
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>p-value (양측)</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.pValue}</td></tr>
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>방법</td><td className={`text-right ${BIO_TABLE.bodyCell}`}>{results.method === 'pearson' ? 'Pearson' : 'Spearman'}</td></tr>
-                <tr><td className={BIO_TABLE.bodyCell}>순열 수</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.permutations}</td></tr>
+                <tr className={results.mcStandardError != null ? 'border-b' : undefined}><td className={BIO_TABLE.bodyCell}>순열 수</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.permutations}</td></tr>
+                {results.mcStandardError != null && (
+                  <tr><td className={BIO_TABLE.bodyCell}>p-value MC 표준오차</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.mcStandardError}</td></tr>
+                )}
               </tbody>
             </table>
           </div>
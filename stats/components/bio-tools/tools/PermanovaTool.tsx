@@ -113,6 +113,9 @@ const PermanovaTool = memo(function PermanovaTool({ tool, meta, initialEntry }:
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>p-value</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.pValue}</td></tr>
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>R²</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.rSquared}</td></tr>
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>순열 수</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.permutations}</td></tr>
+                {results.mcStandardError != null && (
+                  <tr className="border-b"><td className={BIO_TABLE.bodyCell}>p-value MC 표준오차</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.mcStandardError}</td></tr>
+                )}
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>SS (between)</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.ssBetween}</td></tr>
                 <tr className="border-b"><td className={BIO_TABLE.bodyCell}>SS (within)</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.ssWithin}</td></tr>
                 <tr><td className={BIO_TABLE.bodyCell}>SS (total)</td><td className={`text-right ${BIO_TABLE.bodyCell} font-mono`}>{results.ssTotal}</td></tr>
@@ -51,6 +51,50 @@ export const PYODIDE = {
   TIMEOUT: {
     LOAD_SCRIPT: 30000,
     LOAD_PACKAGES: 60000
+  },
+
+  // 메모리 스냅샷 (Web Worker warm start, pyodide-snapshot.ts)
+  // - 첫 세션: numpy/scipy + helpers + WORKERS 로드 후 스냅샷을 Cache Storage에 저장
+  // - 이후 세션: 스냅샷에서 복원 (helpers/Worker 파일이 바뀌면 키가 달라져 재생성)
+  // 비활성화: NEXT_PUBLIC_PYODIDE_SNAPSHOT=false
+  SNAPSHOT: {
+    ENABLED: !(typeof process !== 'undefined' && process.env?.NEXT_PUBLIC_PYODIDE_SNAPSHOT === 'false'),
+    // sw.js의 버전별 정리 대상(pyodide-cache-*, app-cache-*)과 겹치지 않는 이름
+    CACHE_NAME: 'pyodide-snapshot-v1',
+    WORKERS: [1, 2, 3]
+  },
+
+  // 사전 컴파일 Worker 번들 (helpers + worker{N} .pyc zip, scripts/build/build-worker-bundle.js)
+  // - prebuild에서 생성되므로 production 빌드에서만 사용 (dev는 수정한 .py를 바로 반영)
+  // - 번들이 없거나 bytecode 버전이 다르면 파일별 fetch + 컴파일로 동작
+  WORKER_BUNDLE: {
+    ENABLED: typeof process !== 'undefined' && process.env?.NODE_ENV === 'production',
+    URL: '/workers/python/worker-bundle.zip'
+  },
+
+  // Worker prefetch (prefetch-planner.ts)
+  // - 분석 메서드 선택 시 다음에 쓸 Worker(카테고리 + 후속 검정)를 변수 선택 중에 미리 로드
+  // - MEMORY_CEILING_MB: 이미 로드된 Worker 포함 추정 WASM 힙 상한 (넘는 Worker는 실행 시 로드)
+  // 조정: NEXT_PUBLIC_PYODIDE_PREFETCH_MEMORY_MB=512, 후속 Worker 제외: NEXT_PUBLIC_PYODIDE_PREFETCH_FOLLOW_UPS=false
+  PREFETCH: {
+    MEMORY_CEILING_MB: Number(
+      (typeof process !== 'undefined' && process.env?.NEXT_PUBLIC_PYODIDE_PREFETCH_MEMORY_MB) || 320
+    ),
+    FOLLOW_UPS: !(typeof process !== 'undefined' && process.env?.NEXT_PUBLIC_PYODIDE_PREFETCH_FOLLOW_UPS === 'false')
+  },
+
+  // 메모리 예산 (helpers.enforce_memory_budget)
+  // - 로드된 Worker 상주 비용 + 로드할 Worker 상주 비용 + 결과 캐시가 예산을 넘으면 오래 안 쓴 Worker 모듈부터 해제
+  //   (WASM 힙은 줄지 않으므로 힙 크기는 판단에 쓰지 않음)
+  //   (모듈 캐시 비우기 + gc.collect, 해제된 Worker는 다시 호출될 때 자동 재로드)
+  // - BUDGET_MB 0: 기기 메모리(navigator.deviceMemory)의 AUTO_FRACTION, 최대 AUTO_MAX_MB
+  // 고정: NEXT_PUBLIC_PYODIDE_MEMORY_BUDGET_MB=768
+  MEMORY: {
+    BUDGET_MB: Number(
+      (typeof process !== 'undefined' && process.env?.NEXT_PUBLIC_PYODIDE_MEMORY_BUDGET_MB) || 0
+    ),
+    AUTO_FRACTION: 0.25,
+    AUTO_MAX_MB: 1536
   }
 } as const
 
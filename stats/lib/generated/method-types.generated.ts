@@ -80,6 +80,78 @@ export interface DescriptiveStatsResult {
   ciUpper: number
 }
 
+export interface DescriptiveStatsTableResult {
+  columns: string[]
+  mean: (number | null)[]
+  median: (number | null)[]
+  mode: (number | null)[]
+  std: (number | null)[]
+  variance: (number | null)[]
+  min: (number | null)[]
+  max: (number | null)[]
+  q1: (number | null)[]
+  q3: (number | null)[]
+  iqr: (number | null)[]
+  skewness: (number | null)[]
+  kurtosis: (number | null)[]
+  n: number[]
+  se: (number | null)[]
+  sem: (number | null)[]
+  confidenceLevel: number
+  ciLower: (number | null)[]
+  ciUpper: (number | null)[]
+}
+
+export interface DescriptiveSketchUpdateResult {
+  n: number
+  mean: number
+  m2: number
+  m3: number
+  m4: number
+  min: number | null
+  max: number | null
+  k: number
+  levels: number[][]
+  parity: number[]
+}
+
+export interface DescriptiveSketchMergeResult {
+  n: number
+  mean: number
+  m2: number
+  m3: number
+  m4: number
+  min: number | null
+  max: number | null
+  k: number
+  levels: number[][]
+  parity: number[]
+}
+
+export interface DescriptiveSketchFinalizeResult {
+  mean: number
+  median: number
+  std: number | null
+  variance: number | null
+  min: number
+  max: number
+  q1: number
+  q3: number
+  iqr: number
+  lowerFence: number
+  upperFence: number
+  skewness: number | null
+  kurtosis: number | null
+  n: number
+  se: number
+  sem: number
+  confidenceLevel: number
+  ciLower: number
+  ciUpper: number
+  exact: boolean
+  k: number
+}
+
 export interface NormalityTestResult {
   statistic: number
   pValue: number
@@ -100,12 +172,14 @@ export interface FrequencyAnalysisResult {
   cumulativePercentages: number[]
   total: number
   uniqueCount: number
+  otherCount: number
 }
 
 export interface CrosstabAnalysisResult {
   rowCategories: string[]
   colCategories: string[]
-  observedMatrix: number[][]
+  observedMatrix: number[][] | null
+  observedSparse: { shape: [number, number]; rowIndex: number[]; colIndex: number[]; counts: number[] } | null
   rowTotals: number[]
   colTotals: number[]
   grandTotal: number
@@ -169,6 +243,32 @@ export interface MannKendallTestResult {
   n: number
 }
 
+export interface SeasonalMannKendallTestResult {
+  trend: string
+  tau: number
+  s: number
+  varS: number
+  zScore: number
+  pValue: number
+  senSlope: number
+  n: number
+  seasonalPeriods: number
+  seasons: Array<{ season: number; n: number; s: number; varS: number }>
+}
+
+export interface RegionalMannKendallTestResult {
+  trend: string
+  tau: number
+  s: number
+  varS: number
+  zScore: number
+  pValue: number
+  senSlope: number
+  n: number
+  nStations: number
+  stations: Array<{ station: string; n: number; s: number | null; zScore: number | null; pValue: number | null; senSlope: number | null; trend: string | null }>
+}
+
 export interface BonferroniCorrectionResult {
   originalPValues: number[]
   correctedPValues: number[]
@@ -192,6 +292,38 @@ export async function descriptiveStats(data: number[] | number[][], confidenceLe
   return callWorkerMethod<DescriptiveStatsResult>(1, 'descriptive_stats', { data, confidenceLevel })
 }
 
+/**
+ * 여러 컬럼 기술통계량 일괄 계산 (컬럼별 1회 정렬, 벡터화)
+ * @worker Worker 1
+ */
+export async function descriptiveStatsTable(columns: Record<string, number[]> | number[][], confidenceLevel?: number): Promise<DescriptiveStatsTableResult> {
+  return callWorkerMethod<DescriptiveStatsTableResult>(1, 'descriptive_stats_table', { columns, confidenceLevel })
+}
+
+/**
+ * 스트리밍 기술통계 스케치에 청크 반영
+ * @worker Worker 1
+ */
+export async function descriptiveSketchUpdate(data: number[] | number[][], state?: DescriptiveSketchUpdateResult | null, k?: number): Promise<DescriptiveSketchUpdateResult> {
+  return callWorkerMethod<DescriptiveSketchUpdateResult>(1, 'descriptive_sketch_update', { data, state, k })
+}
+
+/**
+ * 샤드별 기술통계 스케치 상태 병합
+ * @worker Worker 1
+ */
+export async function descriptiveSketchMerge(states: Array<DescriptiveSketchUpdateResult | null>): Promise<DescriptiveSketchMergeResult> {
+  return callWorkerMethod<DescriptiveSketchMergeResult>(1, 'descriptive_sketch_merge', { states })
+}
+
+/**
+ * 기술통계 스케치 상태 → 요약 통계
+ * @worker Worker 1
+ */
+export async function descriptiveSketchFinalize(state: DescriptiveSketchUpdateResult, confidenceLevel?: number): Promise<DescriptiveSketchFinalizeResult> {
+  return callWorkerMethod<DescriptiveSketchFinalizeResult>(1, 'descriptive_sketch_finalize', { state, confidenceLevel })
+}
+
 /**
  * Shapiro-Wilk 정규성 검정
  * @worker Worker 1
@@ -212,16 +344,16 @@ export async function outlierDetection(data: number[] | number[][], method?: str
  * 빈도분석
  * @worker Worker 1
  */
-export async function frequencyAnalysis(values: (string | number)[]): Promise<FrequencyAnalysisResult> {
-  return callWorkerMethod<FrequencyAnalysisResult>(1, 'frequency_analysis', { values })
+export async function frequencyAnalysis(values: (string | number)[], topK?: number, otherLabel?: string): Promise<FrequencyAnalysisResult> {
+  return callWorkerMethod<FrequencyAnalysisResult>(1, 'frequency_analysis', { values, topK, otherLabel })
 }
 
 /**
  * 교차분석
  * @worker Worker 1
  */
-export async function crosstabAnalysis(rowValues: (string | number)[], colValues: (string | number)[]): Promise<CrosstabAnalysisResult> {
-  return callWorkerMethod<CrosstabAnalysisResult>(1, 'crosstab_analysis', { rowValues, colValues })
+export async function crosstabAnalysis(rowValues: (string | number)[], colValues: (string | number)[], sparse?: boolean): Promise<CrosstabAnalysisResult> {
+  return callWorkerMethod<CrosstabAnalysisResult>(1, 'crosstab_analysis', { rowValues, colValues, sparse })
 }
 
 /**
@@ -272,6 +404,22 @@ export async function mannKendallTest(data: number[] | number[][]): Promise<Mann
   return callWorkerMethod<MannKendallTestResult>(1, 'mann_kendall_test', { data })
 }
 
+/**
+ * 계절 Mann-Kendall 추세 검정 (Hirsch)
+ * @worker Worker 1
+ */
+export async function seasonalMannKendallTest(data: number[] | number[][], seasonalPeriods?: number): Promise<SeasonalMannKendallTestResult> {
+  return callWorkerMethod<SeasonalMannKendallTestResult>(1, 'seasonal_mann_kendall_test', { data, seasonalPeriods })
+}
+
+/**
+ * 지역(다지점) Mann-Kendall 추세 검정 (Regional Kendall)
+ * @worker Worker 1
+ */
+export async function regionalMannKendallTest(series: Record<string, number[]> | number[][]): Promise<RegionalMannKendallTestResult> {
+  return callWorkerMethod<RegionalMannKendallTestResult>(1, 'regional_mann_kendall_test', { series })
+}
+
 /**
  * Bonferroni 다중비교 보정
  * @worker Worker 1
@@ -429,8 +577,8 @@ export interface ChiSquareIndependenceTestResult {
   criticalValue: number
   reject: boolean
   cramersV: number
-  observedMatrix: number[][]
-  expectedMatrix: number[][]
+  observedMatrix: number[][] | null
+  expectedMatrix: number[][] | null
 }
 
 export interface FisherExactTestResult {
@@ -588,7 +736,7 @@ export async function chiSquareGoodnessTest(observed: number[], expected?: numbe
  * 카이제곱 독립성 검정
  * @worker Worker 2
  */
-export async function chiSquareIndependenceTest(observedMatrix: number[][], yatesCorrection?: boolean, alpha?: number): Promise<ChiSquareIndependenceTestResult> {
+export async function chiSquareIndependenceTest(observedMatrix: number[][] | NonNullable<CrosstabAnalysisResult['observedSparse']>, yatesCorrection?: boolean, alpha?: number): Promise<ChiSquareIndependenceTestResult> {
   return callWorkerMethod<ChiSquareIndependenceTestResult>(2, 'chi_square_independence_test', { observedMatrix, yatesCorrection, alpha })
 }
 
@@ -1531,6 +1679,10 @@ export interface PermanovaResult {
   ssBetween: number
   ssWithin: number
   ssTotal: number
+  mcStandardError: number
+  stoppingRule: 'early' | 'completed' | 'extended' | 'time-budget' | 'cancelled'
+  requestedPermutations: number
+  cancelled?: boolean
 }
 
 export interface MantelTestResult {
@@ -1538,6 +1690,10 @@ export interface MantelTestResult {
   pValue: number
   permutations: number
   method: string
+  mcStandardError: number
+  stoppingRule: 'early' | 'completed' | 'extended' | 'time-budget' | 'cancelled'
+  requestedPermutations: number
+  cancelled?: boolean
 }
 
 
@@ -1577,16 +1733,16 @@ export async function nmds(distance_matrix: number[][], site_labels?: string[],
  * PERMANOVA 순열 다변량 분산분석 (Anderson 2001)
  * @worker Worker 8
  */
-export async function permanova(distance_matrix: number[][], grouping: (string | number)[], permutations?: number): Promise<PermanovaResult> {
-  return callWorkerMethod<PermanovaResult>(8, 'permanova', { distance_matrix, grouping, permutations })
+export async function permanova(distance_matrix: number[][], grouping: (string | number)[], permutations?: number, seed?: number): Promise<PermanovaResult> {
+  return callWorkerMethod<PermanovaResult>(8, 'permanova', { distance_matrix, grouping, permutations, seed })
 }
 
 /**
  * Mantel 검정 — 두 거리행렬 간 상관
  * @worker Worker 8
  */
-export async function mantelTest(matrix_x: number[][], matrix_y: number[][], permutations?: number, method?: string): Promise<MantelTestResult> {
-  return callWorkerMethod<MantelTestResult>(8, 'mantel_test', { matrix_x, matrix_y, permutations, method })
+export async function mantelTest(matrix_x: number[][], matrix_y: number[][], permutations?: number, method?: string, seed?: number): Promise<MantelTestResult> {
+  return callWorkerMethod<MantelTestResult>(8, 'mantel_test', { matrix_x, matrix_y, permutations, method, seed })
 }
 
 // ========================================
@@ -1640,8 +1796,8 @@ export async function hardyWeinberg(rows: number[][], locusLabels?: string[]): P
  * Fst 집단 분화 지수 — v1: allele count, v2: 개체별 유전자형 (Hudson 1992 + Bhatia 2013)
  * @worker Worker 9
  */
-export async function fst(populations?: number[][], populationLabels?: string[], genotypes?: Array<Record<string, [string, string]>>, individualPopulations?: string[], locusNames?: string[], nPermutations?: number, nBootstrap?: number): Promise<FstResult> {
-  return callWorkerMethod<FstResult>(9, 'fst', { populations, populationLabels, genotypes, individualPopulations, locusNames, nPermutations, nBootstrap })
+export async function fst(populations?: number[][], populationLabels?: string[], genotypes?: Array<Record<string, [string, string]>>, individualPopulations?: string[], locusNames?: string[], nPermutations?: number, nBootstrap?: number, seed?: number): Promise<FstResult> {
+  return callWorkerMethod<FstResult>(9, 'fst', { populations, populationLabels, genotypes, individualPopulations, locusNames, nPermutations, nBootstrap, seed })
 }
 
 // ========================================
@@ -1718,7 +1874,7 @@ export async function proteinProperties(proteinSeq: string): Promise<ProteinProp
 // 메서드 이름 유니온 타입
 // ========================================
 
-export type Worker1Method = 'descriptive_stats' | 'normality_test' | 'outlier_detection' | 'frequency_analysis' | 'crosstab_analysis' | 'one_sample_proportion_test' | 'cronbach_alpha' | 'kolmogorov_smirnov_test' | 'ks_test_one_sample' | 'ks_test_two_sample' | 'mann_kendall_test' | 'bonferroni_correction' | 'means_plot_data'
+export type Worker1Method = 'descriptive_stats' | 'descriptive_stats_table' | 'descriptive_sketch_update' | 'descriptive_sketch_merge' | 'descriptive_sketch_finalize' | 'normality_test' | 'outlier_detection' | 'frequency_analysis' | 'crosstab_analysis' | 'one_sample_proportion_test' | 'cronbach_alpha' | 'kolmogorov_smirnov_test' | 'ks_test_one_sample' | 'ks_test_two_sample' | 'mann_kendall_test' | 'seasonal_mann_kendall_test' | 'regional_mann_kendall_test' | 'bonferroni_correction' | 'means_plot_data'
 export type Worker2Method = 't_test_two_sample' | 't_test_paired' | 't_test_one_sample' | 't_test_one_sample_summary' | 't_test_two_sample_summary' | 't_test_paired_summary' | 'z_test' | 'chi_square_test' | 'binomial_test' | 'correlation_test' | 'partial_correlation' | 'levene_test' | 'bartlett_test' | 'chi_square_goodness_test' | 'chi_square_independence_test' | 'fisher_exact_test' | 'power_analysis' | 'response_surface_analysis'
 export type Worker3Method = 'mann_whitney_test' | 'wilcoxon_test' | 'kruskal_wallis_test' | 'friedman_test' | 'one_way_anova' | 'two_way_anova' | 'tukey_hsd' | 'sign_test' | 'runs_test' | 'mcnemar_test' | 'cochran_q_test' | 'mood_median_test' | 'repeated_measures_anova' | 'ancova' | 'manova' | 'scheffe_test' | 'dunn_test' | 'games_howell_test'
 export type Worker4Method = 'linear_regression' | 'multiple_regression' | 'logistic_regression' | 'pca_analysis' | 'curve_estimation' | 'nonlinear_regression' | 'stepwise_regression' | 'binary_logistic' | 'multinomial_logistic' | 'ordinal_logistic' | 'probit_regression' | 'poisson_regression' | 'negative_binomial_regression' | 'factor_analysis' | 'cluster_analysis' | 'time_series_analysis' | 'arima_forecast' | 'durbin_watson_test' | 'discriminant_analysis' | 'kaplan_meier_survival' | 'cox_regression' | 'dose_response_analysis'
@@ -7,5 +7,11 @@ export * from './pyodide-core.service';
 /** Pyodide 초기화 로직 (패키지 로딩, 진행률) */
 export * from './pyodide-init-logic';
 
+/** Pyodide 파라미터 전송 인코딩 (대용량 숫자 배열 → typed buffer) */
+export * from './pyodide-transport';
+
+/** 다중 Pyodide Worker 리샘플링 샤딩 (순열/bootstrap 블록 병합) */
+export * from './pyodide-shard-pool';
+
 /** Pyodide Web Worker 타입 (side-effect 방지: Worker 파일은 type-only re-export) */
 export type { WorkerRequest, WorkerResponse } from './pyodide-worker';
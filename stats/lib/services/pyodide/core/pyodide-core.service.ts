@@ -26,9 +26,27 @@
 
 import type { PyodideInterface } from '@/types/pyodide'
 import type { WorkerNumber } from '@/lib/constants/methods-registry.types'
-import { getPyodideCDNUrls } from '@/lib/constants'
+import { PYODIDE, getPyodideCDNUrls } from '@/lib/constants'
 import type { WorkerRequest, WorkerResponse } from './pyodide-worker'
 import { registerHelpersModule } from './pyodide-init-logic'
+import {
+  defaultShardCount,
+  ShardedResamplingPool,
+  type ShardedBootstrapOptions,
+  type ShardedBootstrapResult,
+  type ShardedPermutationOptions,
+  type ShardedPermutationResult
+} from './pyodide-shard-pool'
+import {
+  decodeResultEnvelope,
+  encodeBatchRequest,
+  encodeTypedArrayParams,
+  unpackResultEnvelope,
+  type BatchJob,
+  type BatchJobResult,
+  type DatasetSummary,
+  type PyProxyLike
+} from './pyodide-transport'
 
 // ========================================
 // 타입 정의
@@ -58,6 +76,74 @@ export type WorkerMethodParam =
 export interface WorkerMethodOptions {
   errorMessage?: string
   skipValidation?: boolean
+  /**
+   * 결과 메모이제이션 사용 (opt-in)
+   * - 키: 메서드명 + 정규화된 입력 내용 해시 (Python helpers.dispatch)
+   * - 바이트 예산 LRU (helpers.RESULT_CACHE_MAX_BYTES)
+   * - 확률적 메서드(permanova, mantel_test, fst)는 seed를 지정한 호출만 캐시
+   */
+  memoize?: boolean
+  /**
+   * 긴 반복(순열/부트스트랩/재시작) 진행률 콜백 (Web Worker 모드 전용)
+   * - progress: 0-100, message: 작업 라벨 (예: 'permanova')
+   */
+  onProgress?: (progress: number, message?: string) => void
+  /**
+   * 협력적 취소 (Web Worker 모드 + SharedArrayBuffer(crossOriginIsolated) 필요)
+   * - abort 시 Python이 다음 반복 경계에서 중단하고 완료된 반복까지의 부분 결과를 반환
+   *   (예: permanova → { cancelled: true, permutations: 완료 수, requestedPermutations })
+   * - 이미 대기열에 있던 요청은 시작 시 취소 신호가 초기화되어 끝까지 실행될 수 있음
+   * - 메인 스레드 모드에서는 호출 전 abort 여부만 확인
+   */
+  signal?: AbortSignal
+  /**
+   * 구간 계측 (opt-in, 개발/성능 분석용)
+   * - true: 구간별 시간/호출 수/입력 크기, 'memory': tracemalloc 할당 peak 포함 (느려짐)
+   * - 결과 객체에 _perf: WorkerPerfReport 가 추가됨 (memoize 캐시 미사용)
+   */
+  profile?: boolean | 'memory'
+}
+
+/**
+ * 구간 계측 결과 (profile 옵션 사용 시 결과의 _perf)
+ */
+export interface WorkerPerfReport {
+  method: string
+  totalMs: number
+  memory: boolean
+  /** 파라미터별 입력 크기 (배열 길이/행 수, 문자열 길이) */
+  inputSizes: Record<string, number>
+  /** 중첩 경로('fst/sequential_permutation_test/_recount_alleles')별 누적 */
+  stages: Array<{
+    name: string
+    calls: number
+    totalMs: number
+    maxMs: number
+    size?: number
+    peakBytes?: number
+  }>
+  peakBytes?: number
+}
+
+/**
+ * Pyodide Worker 메모리 통계 (getMemoryStats, helpers.memory_stats)
+ */
+export interface WorkerMemoryStats {
+  /** 현재 WASM 힙 크기 (줄어들지 않음) */
+  heapBytes: number
+  /** 예산 (null이면 governor 미사용) */
+  budgetBytes: number | null
+  /** 로드된 Worker 상주 비용 합계 */
+  residentBytes: number
+  resultCacheBytes: number
+  /** 오래 안 쓴 순 (앞쪽부터 해제 대상) */
+  workers: Array<{
+    worker: number
+    residentBytes: number
+    /** false면 헤더 추정치 (로드 시 힙이 늘지 않았거나 스냅샷에서 복원) */
+    measured: boolean
+    idleSeconds: number
+  }>
 }
 
 /**
@@ -188,6 +274,7 @@ export interface StatisticsResult {
  * - Worker 2: statsmodels + pandas (partial correlation 등)
  * - Worker 3: statsmodels + pandas + scikit-learn (ANOVA, post-hoc, clustering, PCA 등)
  * - Worker 4: statsmodels + scikit-learn (회귀, PCA 등)
+ * - Worker 5: statsmodels + scikit-learn (Kaplan-Meier SurvfuncRight, ROC)
  * - Worker 6: matplotlib + micropip (논문용 export, SciencePlots)
  */
 export const WORKER_EXTRA_PACKAGES = Object.freeze<Record<WorkerNumber, readonly string[]>>({
@@ -195,7 +282,7 @@ export const WORKER_EXTRA_PACKAGES = Object.freeze<Record<WorkerNumber, readonly
   2: ['statsmodels', 'pandas'],
   3: ['statsmodels', 'pandas', 'scikit-learn'],
   4: ['statsmodels', 'scikit-learn'],
-  5: ['scikit-learn'],
+  5: ['statsmodels', 'scikit-learn'],
   6: ['matplotlib', 'micropip'],
   7: [],
   8: ['scikit-learn'],
@@ -219,14 +306,55 @@ const SHOULD_USE_WEB_WORKER =
   process.env?.NEXT_PUBLIC_PYODIDE_USE_WORKER === 'true'
 
 const WORKER_INIT_TIMEOUT_MS = 30000
+// 스냅샷 사용 init: 첫 세션은 Worker 1-3 패키지(statsmodels, pandas, scikit-learn)까지 로드 후 스냅샷 저장
+const WORKER_SNAPSHOT_INIT_TIMEOUT_MS = 120000
 const WORKER_METHOD_TIMEOUT_MS = 60000
 
+/**
+ * helpers 모듈의 상주 dispatcher (메인 스레드 모드)
+ */
+interface PythonBridge {
+  dispatch: (workerNum: number, method: string, params: Record<string, unknown>, memoize: boolean) => PyProxyLike
+  dispatchBatch: (jobs: BatchJob[], shared: Record<string, unknown>) => PyProxyLike
+  registerDataset: (datasetId: string, columns: Record<string, unknown>) => string
+  unregisterDataset: (datasetId: string) => boolean
+  clearResultCache: () => number
+  loadWorkerModule: (workerNum: number, path: string) => Promise<PyProxyLike>
+  unloadWorkerModule: (workerNum: number) => boolean
+  unloadIdleWorkers: (maxIdleSeconds: number) => PyProxyLike & { toJs(): number[] }
+  memoryStats: (heapBytes: number) => string
+  destroy: () => void
+}
+
+/**
+ * Web Worker에 전달할 WASM 힙 예산 (MB)
+ *
+ * PYODIDE.MEMORY.BUDGET_MB가 0이면 기기 메모리(navigator.deviceMemory, GB)의 AUTO_FRACTION,
+ * 기기 메모리를 알 수 없으면 AUTO_MAX_MB
+ */
+export function resolveMemoryBudgetMB(deviceMemoryGB?: number): number {
+  if (PYODIDE.MEMORY.BUDGET_MB > 0) {
+    return PYODIDE.MEMORY.BUDGET_MB
+  }
+  if (!deviceMemoryGB) {
+    return PYODIDE.MEMORY.AUTO_MAX_MB
+  }
+  return Math.min(PYODIDE.MEMORY.AUTO_MAX_MB, Math.round(deviceMemoryGB * 1024 * PYODIDE.MEMORY.AUTO_FRACTION))
+}
+
+/** Worker 모듈 파일 위치 (helpers.py와 같은 sys.path 디렉터리) */
+const WORKER_MODULE_DIR = '/home/pyodide'
+
 interface PendingWorkerRequest {
   resolve: (value: unknown) => void
   reject: (reason: Error) => void
   timeout: ReturnType<typeof setTimeout>
+  onProgress?: (progress: number, message?: string) => void
 }
 
+/** helpers.check_cancelled가 확인하는 취소 신호 값 (SIGINT) */
+const INTERRUPT_SIGNAL = 2
+
 /**
  * 로딩 진행률 이벤트
  */
@@ -257,12 +385,20 @@ export class PyodideCoreService {
   private isLoading = false
   private loadPromise: Promise<void> | null = null
   private packagesLoaded = false
+  private pythonBridge: PythonBridge | null = null
   private loadedWorkers: Set<number> = new Set()
+  private workerLoadPromises: Map<number, Promise<void>> = new Map()
   private worker: Worker | null = null
   private workerInitialized = false
   private workerInitPromise: Promise<void> | null = null
   private workerRequests: Map<string, PendingWorkerRequest> = new Map()
   private workerRequestCounter = 0
+  // Web Worker와 공유하는 취소 신호 버퍼 (SharedArrayBuffer 미지원 환경에서는 null)
+  private interruptBuffer: Int32Array | null = null
+  // Web Worker가 실행 중이라고 알린 요청 id ('started' 응답, 공유 버퍼 취소 신호 대상)
+  private runningRequestId: string | null = null
+  // 리샘플링 샤딩용 Pyodide Worker 풀 (첫 샤딩 호출 시 생성)
+  private shardPool: ShardedResamplingPool | null = null
   private workerFallbackLogged = false
 
   // 진행률 추적
@@ -448,19 +584,23 @@ export class PyodideCoreService {
    * @returns 초기화 완료 여부
    */
   isInitialized(): boolean {
-    return this.pyodide !== null
+    // Web Worker 모드에서는 메인 스레드에 pyodide 인스턴스가 없음
+    return this.pyodide !== null || this.workerInitialized
   }
 
   /**
    * Pyodide 인스턴스 및 리소스 정리
    */
   dispose(): void {
+    this.pythonBridge?.destroy()
+    this.pythonBridge = null
     this.pyodide = null
     this.isLoading = false
     this.loadPromise = null
     this.packagesLoaded = false
     this.loadedWorkers.clear()
     this.terminateWorker()
+    this.disposeShardPool()
     this.workerFallbackLogged = false
     this.progressListeners.clear()
   }
@@ -509,17 +649,43 @@ export class PyodideCoreService {
    */
 
   async ensureWorkerLoaded(workerNumber: WorkerNumber): Promise<void> {
+    if (this.loadedWorkers.has(workerNumber)) {
+      return
+    }
+
+    // prefetch와 실제 호출이 겹치면 진행 중인 로드를 공유 (loadWorker 중복 요청 방지)
+    const pending = this.workerLoadPromises.get(workerNumber)
+    if (pending) {
+      return pending
+    }
+
+    const loading = this.loadWorker(workerNumber).finally(() => {
+      this.workerLoadPromises.delete(workerNumber)
+    })
+    this.workerLoadPromises.set(workerNumber, loading)
+    return loading
+  }
+
+  /**
+   * 로드된 Worker 번호 (prefetch 계획용)
+   */
+  getLoadedWorkers(): WorkerNumber[] {
+    return [...this.loadedWorkers] as WorkerNumber[]
+  }
+
+  private async loadWorker(workerNumber: WorkerNumber): Promise<void> {
     if (this.isWebWorkerMode()) {
+      await this.initializeWorkerBridge()
       if (this.loadedWorkers.has(workerNumber)) {
-        return
+        return // 스냅샷 복원으로 이미 로드됨
       }
-
-      await this.initializeWorkerBridge()
-      await this.sendWorkerRequest(
+      const response = await this.sendWorkerRequest(
         'loadWorker',
         { workerNum: workerNumber },
         WORKER_INIT_TIMEOUT_MS
-      )
+      ) as { evicted?: WorkerNumber[] } | undefined
+      // 메모리 예산으로 해제된 Worker (다시 호출되면 Web Worker가 자동 재로드)
+      response?.evicted?.forEach((evicted) => this.loadedWorkers.delete(evicted))
       this.loadedWorkers.add(workerNumber)
       return
     }
@@ -528,27 +694,85 @@ export class PyodideCoreService {
       throw new Error('Pyodide�� �ʱ�ȭ���� �ʾҽ��ϴ�. initialize()�� ���� ȣ���ϼ���.')
     }
 
-    if (this.loadedWorkers.has(workerNumber)) {
-      return // �̹� �ε��
-    }
-
     const workerName = this.getWorkerFileName(workerNumber)
-    const response = await fetch(`/workers/python/${workerName}.py`)
-    if (!response.ok) {
-      throw new Error(`Worker ${workerNumber} ���� �ε� ����: ${response.statusText}`)
-    }
 
-    const workerCode = await response.text()
+    // 소스 fetch와 추가 패키지 다운로드를 동시에 진행
+    // ⚠️ CRITICAL: Worker 코드 실행은 둘 다 끝난 뒤 (Worker 3/4는 sklearn/statsmodels를 첫 줄에서 import)
+    const [workerCode] = await Promise.all([
+      (async () => {
+        const response = await fetch(`/workers/python/${workerName}.py`)
+        if (!response.ok) {
+          throw new Error(`Worker ${workerNumber} ���� �ε� ����: ${response.statusText}`)
+        }
+        return response.text()
+      })(),
+      this.loadAdditionalPackages(workerNumber)
+    ])
 
-    // ⚠️ CRITICAL: Load additional packages BEFORE executing worker code
-    // Worker 3/4 import sklearn/statsmodels at the top, so packages must be loaded first
-    await this.loadAdditionalPackages(workerNumber)
-    await this.pyodide.runPythonAsync(workerCode)
+    // 독립 모듈(worker{N})로 FS에 쓰고 import (Worker 간 전역 이름 충돌 없음)
+    const modulePath = `${WORKER_MODULE_DIR}/worker${workerNumber}.py`
+    this.pyodide.FS.writeFile(modulePath, workerCode)
+    const registered = await this.getPythonBridge().loadWorkerModule(workerNumber, modulePath)
+    registered.destroy()
 
     this.loadedWorkers.add(workerNumber)
     console.log(`? Worker ${workerNumber} �ε� �Ϸ�: ${workerName}`)
   }
 
+  /**
+   * Worker 모듈 해제 (sys.modules에서 제거 → WASM 힙 회수)
+   *
+   * 다음 호출 시 ensureWorkerLoaded가 다시 로드한다.
+   * 추가 패키지(statsmodels 등)는 Pyodide에 남아 재로드가 빠르다.
+   *
+   * @param workerNumber Worker 번호
+   */
+  async unloadWorker(workerNumber: WorkerNumber): Promise<void> {
+    if (!this.loadedWorkers.has(workerNumber)) {
+      return
+    }
+
+    if (this.isWebWorkerMode()) {
+      await this.sendWorkerRequest('unloadWorker', { workerNum: workerNumber }, WORKER_INIT_TIMEOUT_MS)
+    } else if (this.pyodide) {
+      this.getPythonBridge().unloadWorkerModule(workerNumber)
+    }
+
+    this.loadedWorkers.delete(workerNumber)
+  }
+
+  /**
+   * 최근 호출되지 않은 Worker 모듈 일괄 해제
+   *
+   * @param maxIdleMs 마지막 호출 이후 경과 시간 기준 (ms)
+   * @returns 해제된 Worker 번호 목록
+   */
+  async unloadIdleWorkers(maxIdleMs: number): Promise<WorkerNumber[]> {
+    let unloaded: WorkerNumber[] = []
+
+    if (this.isWebWorkerMode()) {
+      if (!this.workerInitialized) {
+        return []
+      }
+      const response = await this.sendWorkerRequest(
+        'unloadIdleWorkers',
+        { maxIdleMs },
+        WORKER_INIT_TIMEOUT_MS
+      ) as { workerNums: WorkerNumber[] }
+      unloaded = response.workerNums
+    } else if (this.pyodide) {
+      const idleProxy = this.getPythonBridge().unloadIdleWorkers(maxIdleMs / 1000)
+      try {
+        unloaded = idleProxy.toJs() as WorkerNumber[]
+      } finally {
+        idleProxy.destroy()
+      }
+    }
+
+    unloaded.forEach((workerNumber) => this.loadedWorkers.delete(workerNumber))
+    return unloaded
+  }
+
   /**
    * Worker 1 (Descriptive) 로드
    */
@@ -619,6 +843,10 @@ export class PyodideCoreService {
         this.validateWorkerParam(value, key)
       }
     }
+    if (options.profile) {
+      // Python dispatcher가 _profile을 꺼내 계측 후 결과에 _perf 블록을 붙임
+      params = { ...params, _profile: options.profile }
+    }
 
     if (this.isWebWorkerMode()) {
       await this.ensureWorkerLoaded(workerNum)
@@ -627,35 +855,319 @@ export class PyodideCoreService {
 
     await this.initialize()
     await this.ensureWorkerLoaded(workerNum)
+    // 메인 스레드 모드: Python 실행 중에는 이벤트 루프가 멈추므로 호출 전 취소만 반영
+    options.signal?.throwIfAborted()
 
     if (!this.pyodide) {
       throw new Error('Pyodide�� �ʱ�ȭ���� �ʾҽ��ϴ�')
     }
 
-    const paramsList: string[] = []
-    for (const [key, value] of Object.entries(params)) {
-      const jsonValue = JSON.stringify(value)
-      paramsList.push(`${key}=json.loads('${jsonValue.replace(/'/g, "\'")}')`)
+    try {
+      // 상주 dispatcher를 PyProxy로 직접 호출 (호출마다 Python 소스 생성/컴파일 없음)
+      const { params: encodedParams } = encodeTypedArrayParams(params)
+      const envelope = this.getPythonBridge().dispatch(
+        workerNum,
+        methodName,
+        encodedParams,
+        options.memoize ?? false
+      )
+      const { meta, buffer } = unpackResultEnvelope(envelope)
+
+      return decodeResultEnvelope(meta, buffer) as T
+    } catch (error) {
+      const errorMessage = options.errorMessage || `Worker ${workerNum} �޼��� ${methodName} ���� ����`
+      const errorDetail = error instanceof Error ? error.message : String(error)
+      throw new Error(`${errorMessage}: ${errorDetail}`)
     }
+  }
 
-    const pythonCode = `
-import json
-result = ${methodName}(${paramsList.join(', ')})
-json.dumps(result)
-    `.trim()
+  /**
+   * 여러 Worker 메서드를 한 번의 왕복으로 실행 (배치 호출)
+   *
+   * 같은 컬럼으로 여러 분석(기술통계, 정규성, 등분산, ANOVA, 사후검정 등)을 실행할 때
+   * 공유 배열은 한 번만 전송/변환/정제하고 결과는 하나의 응답으로 받는다.
+   * 작업별 성공/실패는 독립적이다 (한 작업 실패가 배치 전체를 중단하지 않음).
+   *
+   * @param jobs 작업 목록 (파라미터에서 sharedArrayRef(name)으로 공유 배열 참조)
+   * @param shared 공유 입력 배열 (키: 참조 이름)
+   * @param options 추가 옵션
+   * @returns 작업 순서대로의 결과 ({ ok, result } | { ok: false, error })
+   *
+   * @example
+   * ```typescript
+   * const [desc, anova] = await core.callBatch(
+   *   [
+   *     { worker: 1, method: 'descriptive_stats', params: { data: sharedArrayRef('all') } },
+   *     { worker: 3, method: 'one_way_anova', params: { groups: [sharedArrayRef('a'), sharedArrayRef('b')] } }
+   *   ],
+   *   { all, a, b }
+   * )
+   * ```
+   */
+  async callBatch(
+    jobs: BatchJob[],
+    shared: Record<string, WorkerMethodParam> = {},
+    options: WorkerMethodOptions = {}
+  ): Promise<BatchJobResult[]> {
+    if (jobs.length === 0) {
+      return []
+    }
+
+    if (!options.skipValidation) {
+      for (const [key, value] of Object.entries(shared)) {
+        this.validateWorkerParam(value, key)
+      }
+      jobs.forEach((job) => {
+        for (const [key, value] of Object.entries(job.params)) {
+          this.validateWorkerParam(value, `${job.method}.${key}`)
+        }
+      })
+    }
+
+    const workerNums = [...new Set(jobs.map((job) => job.worker))] as WorkerNumber[]
+    const encoded = encodeBatchRequest(jobs, shared)
+
+    if (this.isWebWorkerMode()) {
+      for (const workerNum of workerNums) {
+        await this.ensureWorkerLoaded(workerNum)
+      }
+      await this.initializeWorkerBridge()
+
+      try {
+        const result = await this.sendWorkerRequest(
+          'callBatch',
+          { jobs: encoded.jobs, shared: encoded.shared },
+          WORKER_METHOD_TIMEOUT_MS,
+          encoded.transfer,
+          options
+        )
+        return result as BatchJobResult[]
+      } catch (error) {
+        const errorMessage = options.errorMessage || '배치 실행 실패'
+        const errorDetail = error instanceof Error ? error.message : String(error)
+        throw new Error(`${errorMessage}: ${errorDetail}`)
+      }
+    }
+
+    await this.initialize()
+    for (const workerNum of workerNums) {
+      await this.ensureWorkerLoaded(workerNum)
+    }
+    options.signal?.throwIfAborted()
 
     try {
-      const rawResult = await this.pyodide.runPythonAsync(pythonCode)
-      const parsed = this.parsePythonResult<T>(rawResult)
+      const envelope = this.getPythonBridge().dispatchBatch(encoded.jobs, encoded.shared)
+      const { meta, buffer } = unpackResultEnvelope(envelope)
 
-      return parsed
+      return decodeResultEnvelope(meta, buffer) as BatchJobResult[]
     } catch (error) {
-      const errorMessage = options.errorMessage || `Worker ${workerNum} �޼��� ${methodName} ���� ����`
+      const errorMessage = options.errorMessage || '배치 실행 실패'
       const errorDetail = error instanceof Error ? error.message : String(error)
       throw new Error(`${errorMessage}: ${errorDetail}`)
     }
   }
 
+  /**
+   * 데이터셋을 Pyodide에 상주 등록 (한 번 업로드 → 이후 컬럼 참조로 분석)
+   *
+   * 숫자 컬럼은 typed buffer로 전송되어 NumPy 배열 + 유효성 마스크로 저장된다.
+   * 이후 callWorkerMethod/callBatch 파라미터에 datasetColumnRef/datasetRowsRef를 넘기면
+   * 데이터를 다시 전송하지 않는다. 같은 id로 다시 등록하면 교체된다.
+   *
+   * @param datasetId 데이터셋 식별자
+   * @param columns 컬럼형 데이터 (키: 컬럼명, 값: 열 배열)
+   * @returns 등록 요약 (행 수, 컬럼 종류)
+   *
+   * @example
+   * ```typescript
+   * await core.registerDataset('upload-1', { score, group })
+   * const result = await core.callWorkerMethod(1, 'descriptive_stats', {
+   *   data: datasetColumnRef('upload-1', 'score')
+   * })
+   * ```
+   */
+  async registerDataset(
+    datasetId: string,
+    columns: Record<string, WorkerMethodParam>
+  ): Promise<DatasetSummary> {
+    // 숫자 컬럼은 길이와 관계없이 typed buffer로 전송 (재사용되므로 변환 이득이 항상 큼)
+    const encoded = encodeTypedArrayParams(columns, 1)
+
+    if (this.isWebWorkerMode()) {
+      await this.initializeWorkerBridge()
+      const summary = await this.sendWorkerRequest(
+        'registerDataset',
+        { datasetId, columns: encoded.params },
+        WORKER_METHOD_TIMEOUT_MS,
+        encoded.transfer
+      )
+      return summary as DatasetSummary
+    }
+
+    await this.initialize()
+    return JSON.parse(this.getPythonBridge().registerDataset(datasetId, encoded.params)) as DatasetSummary
+  }
+
+  /**
+   * 상주 데이터셋 해제
+   *
+   * @param datasetId 데이터셋 식별자
+   * @returns 실제로 등록되어 있었는지 여부
+   */
+  async unregisterDataset(datasetId: string): Promise<boolean> {
+    if (this.isWebWorkerMode()) {
+      if (!this.workerInitialized) {
+        return false
+      }
+      const response = await this.sendWorkerRequest(
+        'unregisterDataset',
+        { datasetId },
+        WORKER_INIT_TIMEOUT_MS
+      ) as { removed: boolean }
+      return response.removed
+    }
+
+    if (!this.pyodide) {
+      return false
+    }
+    return this.getPythonBridge().unregisterDataset(datasetId)
+  }
+
+  /**
+   * 결과 메모이제이션 캐시 비우기 (memoize 옵션으로 저장된 결과 전체)
+   *
+   * @returns 제거된 항목 수
+   */
+  async clearResultCache(): Promise<number> {
+    if (this.isWebWorkerMode()) {
+      if (!this.workerInitialized) {
+        return 0
+      }
+      const response = await this.sendWorkerRequest(
+        'clearResultCache',
+        {},
+        WORKER_INIT_TIMEOUT_MS
+      ) as { cleared: number }
+      return response.cleared
+    }
+
+    if (!this.pyodide) {
+      return 0
+    }
+    return this.getPythonBridge().clearResultCache()
+  }
+
+  /**
+   * WASM 힙 크기 + Worker별 상주 비용 (메모리 governor 상태)
+   *
+   * @returns 초기화 전이면 null
+   */
+  async getMemoryStats(): Promise<WorkerMemoryStats | null> {
+    if (this.isWebWorkerMode()) {
+      if (!this.workerInitialized) {
+        return null
+      }
+      return await this.sendWorkerRequest('memoryStats', {}, WORKER_INIT_TIMEOUT_MS) as WorkerMemoryStats
+    }
+
+    if (!this.pyodide) {
+      return null
+    }
+    // 메인 스레드 모드는 governor 미사용 (예산 없음)
+    const heapBytes = (this.pyodide as { _module?: { HEAPU8: Uint8Array } })._module?.HEAPU8.byteLength ?? 0
+    const stats = JSON.parse(this.getPythonBridge().memoryStats(heapBytes)) as Omit<WorkerMemoryStats, 'budgetBytes'>
+    return { ...stats, budgetBytes: null }
+  }
+
+  // ========================================
+  // Public API - 리샘플링 샤딩 (다중 Pyodide Worker)
+  // ========================================
+
+  /**
+   * 순열 검정을 여러 Pyodide Worker에 나눠 실행
+   *
+   * 블록 메서드(permanova_permutation_block, mantel_permutation_block, fst_permutation_block)를
+   * 블록마다 독립 seed로 실행하고 초과 횟수를 병합한다. Besag-Clifford 조건이 충족되면
+   * 남은 블록은 실행하지 않는다. 관측 통계량 외 결과(SS, R² 등)는 일반 메서드로 구한다.
+   *
+   * 샤드 Worker는 메인 Pyodide와 별개의 인스턴스이므로 NEXT_PUBLIC_PYODIDE_USE_WORKER와
+   * 관계없이 브라우저 Web Worker를 생성한다 (인스턴스마다 Pyodide 메모리 사용).
+   *
+   * @param workerNum Python Worker 번호
+   * @param method 블록 메서드명
+   * @param params 블록 공통 파라미터 (데이터)
+   * @param options 요청 순열 수, 샤드 수(기본: 코어 수 - 1, 최대 4), seed 등
+   * @returns 병합된 p-value + Monte Carlo 표준오차
+   *
+   * @example
+   * ```typescript
+   * const perm = await core.callShardedPermutation(8, 'permanova_permutation_block',
+   *   { distance_matrix, grouping }, { permutations: 9999 })
+   * ```
+   */
+  async callShardedPermutation(
+    workerNum: WorkerNumber,
+    method: string,
+    params: Record<string, WorkerMethodParam>,
+    options: ShardedPermutationOptions & { shards?: number }
+  ): Promise<ShardedPermutationResult> {
+    for (const [key, value] of Object.entries(params)) {
+      this.validateWorkerParam(value, key)
+    }
+    return this.getShardPool(options.shards).runPermutation(workerNum, method, params, options)
+  }
+
+  /**
+   * bootstrap을 여러 Pyodide Worker에 나눠 실행
+   *
+   * 블록 메서드(fst_bootstrap_block)의 replicate를 블록 순서대로 합쳐 백분위수 CI를 계산한다.
+   * 같은 seed와 블록 크기면 샤드 수와 관계없이 같은 결과가 나온다.
+   *
+   * @param workerNum Python Worker 번호
+   * @param method 블록 메서드명
+   * @param params 블록 공통 파라미터 (데이터)
+   * @param options 요청 반복 수, 샤드 수, seed, 신뢰수준 등
+   * @returns 병합된 replicate + CI
+   */
+  async callShardedBootstrap(
+    workerNum: WorkerNumber,
+    method: string,
+    params: Record<string, WorkerMethodParam>,
+    options: ShardedBootstrapOptions & { shards?: number }
+  ): Promise<ShardedBootstrapResult> {
+    for (const [key, value] of Object.entries(params)) {
+      this.validateWorkerParam(value, key)
+    }
+    return this.getShardPool(options.shards).runBootstrap(workerNum, method, params, options)
+  }
+
+  /**
+   * 샤딩 Worker 풀 종료 (Pyodide 인스턴스 메모리 해제)
+   */
+  disposeShardPool(): void {
+    this.shardPool?.terminate()
+    this.shardPool = null
+  }
+
+  private getShardPool(shards?: number): ShardedResamplingPool {
+    const size = shards ?? defaultShardCount(
+      typeof navigator !== 'undefined' ? navigator.hardwareConcurrency : undefined
+    )
+    if (this.shardPool && this.shardPool.size !== size) {
+      this.disposeShardPool()
+    }
+
+    if (!this.shardPool) {
+      const { scriptURL, indexURL } = getPyodideCDNUrls()
+      this.shardPool = new ShardedResamplingPool(
+        () => new Worker(new URL('./pyodide-worker.ts', import.meta.url), { type: 'module' }),
+        size,
+        { pyodideUrl: indexURL, scriptUrl: scriptURL }
+      )
+    }
+    return this.shardPool
+  }
+
   /**
    * Python 에러 응답 타입 가드
    *
@@ -915,25 +1427,58 @@ json.dumps(result)
   }
 
   /**
-   * Python 실행 결과 파싱
+   * helpers 모듈의 상주 dispatcher 획득 (최초 1회 pyimport 후 재사용)
    *
-   * @template T 반환 타입
-   * @param result Python 실행 결과 (JSON 문자열 또는 객체)
-   * @returns 파싱된 결과
+   * @returns dispatch / loadWorkerSource PyProxy 래퍼
+   * @throws {Error} Pyodide가 초기화되지 않은 경우
    */
-  private parsePythonResult<T>(result: unknown): T {
-    // 문자열인 경우 JSON 파싱 시도
-    if (typeof result === 'string') {
-      try {
-        return JSON.parse(result) as T
-      } catch {
-        // JSON 파싱 실패 시 문자열 그대로 반환
-        return result as T
+  private getPythonBridge(): PythonBridge {
+    if (this.pythonBridge) {
+      return this.pythonBridge
+    }
+
+    if (!this.pyodide) {
+      throw new Error('Pyodide가 초기화되지 않았습니다')
+    }
+
+    const helpersModule = this.pyodide.pyimport('helpers')
+    try {
+      const dispatch = helpersModule.dispatch
+      const dispatchBatch = helpersModule.dispatch_batch
+      const registerDataset = helpersModule.register_dataset
+      const unregisterDataset = helpersModule.unregister_dataset
+      const clearResultCache = helpersModule.clear_result_cache
+      const loadWorkerModule = helpersModule.load_worker_module
+      const unloadWorkerModule = helpersModule.unload_worker_module
+      const unloadIdleWorkers = helpersModule.unload_idle_workers
+      const memoryStats = helpersModule.memory_stats
+      this.pythonBridge = {
+        dispatch,
+        dispatchBatch,
+        registerDataset,
+        unregisterDataset,
+        clearResultCache,
+        loadWorkerModule,
+        unloadWorkerModule,
+        unloadIdleWorkers,
+        memoryStats,
+        destroy: () => {
+          dispatch.destroy()
+          dispatchBatch.destroy()
+          registerDataset.destroy()
+          unregisterDataset.destroy()
+          clearResultCache.destroy()
+          loadWorkerModule.destroy()
+          unloadWorkerModule.destroy()
+          unloadIdleWorkers.destroy()
+          memoryStats.destroy()
+        }
       }
+    } finally {
+      helpersModule.destroy()
     }
 
-    // 이미 객체인 경우 그대로 반환
-    return result as T
+    return this.pythonBridge
   }
 
 
@@ -988,14 +1533,34 @@ json.dumps(result)
         // Get environment-specific Pyodide URLs
         const { scriptURL, indexURL } = getPyodideCDNUrls()
 
-        await this.sendWorkerRequest(
+        // 협력적 취소 신호: SharedArrayBuffer는 cross-origin isolation(COOP/COEP)에서만 사용 가능
+        this.interruptBuffer =
+          typeof SharedArrayBuffer !== 'undefined' && globalThis.crossOriginIsolated
+            ? new Int32Array(new SharedArrayBuffer(4))
+            : null
+
+        const initResult = await this.sendWorkerRequest(
           'init',
           {
             pyodideUrl: indexURL,
-            scriptUrl: scriptURL
+            scriptUrl: scriptURL,
+            interruptBuffer: this.interruptBuffer ?? undefined,
+            snapshot: PYODIDE.SNAPSHOT.ENABLED
+              ? { cacheName: PYODIDE.SNAPSHOT.CACHE_NAME, workers: [...PYODIDE.SNAPSHOT.WORKERS] }
+              : undefined,
+            workerBundleUrl: PYODIDE.WORKER_BUNDLE.ENABLED ? PYODIDE.WORKER_BUNDLE.URL : undefined,
+            memoryBudgetMB: resolveMemoryBudgetMB(
+              (navigator as Navigator & { deviceMemory?: number }).deviceMemory
+            )
           },
-          WORKER_INIT_TIMEOUT_MS
-        )
+          PYODIDE.SNAPSHOT.ENABLED ? WORKER_SNAPSHOT_INIT_TIMEOUT_MS : WORKER_INIT_TIMEOUT_MS
+        ) as { snapshot?: string; workers?: WorkerNumber[] } | undefined
+
+        // 스냅샷 생성/복원 시 Worker 모듈(1-3)은 이미 로드됨 → loadWorker 왕복 생략
+        initResult?.workers?.forEach((workerNum) => this.loadedWorkers.add(workerNum))
+        if (initResult?.snapshot && initResult.snapshot !== 'disabled') {
+          console.log(`[PyodideCore] Memory snapshot: ${initResult.snapshot}`)
+        }
         this.workerInitialized = true
       } catch (error) {
         this.terminateWorker()
@@ -1019,10 +1584,14 @@ json.dumps(result)
     await this.initializeWorkerBridge()
 
     try {
+      // 대용량 숫자 배열은 typed buffer로 인코딩 후 transfer (JSON 복사 없음)
+      const encoded = encodeTypedArrayParams(params)
       const result = await this.sendWorkerRequest(
         'callMethod',
-        { workerNum, method: methodName, params },
-        WORKER_METHOD_TIMEOUT_MS
+        { workerNum, method: methodName, params: encoded.params, memoize: options.memoize ?? false },
+        WORKER_METHOD_TIMEOUT_MS,
+        encoded.transfer,
+        options
       )
 
       return result as T
@@ -1036,24 +1605,36 @@ json.dumps(result)
   private async sendWorkerRequest(
     type: WorkerRequest['type'],
     data: Partial<WorkerRequest>,
-    timeout: number
+    timeout: number,
+    transfer: Transferable[] = [],
+    { onProgress, signal }: Pick<WorkerMethodOptions, 'onProgress' | 'signal'> = {}
   ): Promise<unknown> {
     if (!this.worker) {
       throw new Error('Pyodide Web Worker가 초기화되지 않았습니다.')
     }
+    signal?.throwIfAborted()
 
     const requestId = this.generateWorkerRequestId()
+    const onAbort = (): void => this.signalWorkerInterrupt(requestId)
+    signal?.addEventListener('abort', onAbort, { once: true })
 
     return new Promise((resolve, reject) => {
+      // 성공/실패/timeout/종료 어느 쪽으로 끝나든 abort 리스너 제거
+      const settle = <V>(finish: (value: V) => void) => (value: V): void => {
+        signal?.removeEventListener('abort', onAbort)
+        finish(value)
+      }
+
       const timeoutHandle = window.setTimeout(() => {
         this.workerRequests.delete(requestId)
-        reject(new Error(`Pyodide worker request timeout (${timeout}ms)`))
+        settle(reject)(new Error(`Pyodide worker request timeout (${timeout}ms)`))
       }, timeout) as unknown as NodeJS.Timeout
 
       this.workerRequests.set(requestId, {
-        resolve,
-        reject,
-        timeout: timeoutHandle
+        resolve: settle(resolve),
+        reject: settle(reject),
+        timeout: timeoutHandle,
+        onProgress
       })
 
       const message: WorkerRequest = {
@@ -1063,15 +1644,25 @@ json.dumps(result)
       }
 
       if (!this.worker) {
-        reject(new Error('Worker not initialized'))
+        clearTimeout(timeoutHandle)
+        this.workerRequests.delete(requestId)
+        settle(reject)(new Error('Worker not initialized'))
         return
       }
 
-      this.worker.postMessage(message)
+      this.worker.postMessage(message, transfer)
     })
   }
 
   private handleWorkerMessage(response: WorkerResponse): void {
+    if (response.type === 'started') {
+      this.runningRequestId = response.id
+      return
+    }
+    if (response.type !== 'progress' && this.runningRequestId === response.id) {
+      this.runningRequestId = null
+    }
+
     const pending = this.workerRequests.get(response.id)
 
     if (!pending) {
@@ -1082,7 +1673,8 @@ json.dumps(result)
     }
 
     if (response.type === 'progress') {
-      // Progress 이벤트는 timeout을 유지한 채로 무시
+      // Progress 이벤트는 timeout을 유지한 채로 콜백에만 전달
+      pending.onProgress?.(response.progress ?? 0, response.message)
       return
     }
 
@@ -1090,12 +1682,41 @@ json.dumps(result)
     this.workerRequests.delete(response.id)
 
     if (response.type === 'success') {
-      pending.resolve(response.result)
+      pending.resolve(decodeResultEnvelope(response.result, response.buffer))
     } else if (response.type === 'error') {
       pending.reject(new Error(response.error ?? 'Unknown worker error'))
     }
   }
 
+  /**
+   * 요청 취소
+   *
+   * - 실행 중(Web Worker가 'started'로 알린 요청) + 공유 버퍼: Python이 반복 경계에서 중단하고 부분 결과를 응답한다.
+   * - 대기 중: 공유 버퍼는 실행 중인 다른 요청을 취소하므로 건드리지 않고, 즉시 reject + 'cancel' 메시지로
+   *   Web Worker가 차례가 와도 실행하지 않게 한다.
+   * - 공유 버퍼 없음: Python 실행은 멈출 수 없으므로 요청만 즉시 reject한다 (결과는 버림).
+   */
+  private signalWorkerInterrupt(requestId: string): void {
+    const pending = this.workerRequests.get(requestId)
+    if (!pending) {
+      return
+    }
+
+    const running = this.runningRequestId === requestId
+    if (running && this.interruptBuffer) {
+      Atomics.store(this.interruptBuffer, 0, INTERRUPT_SIGNAL)
+      return
+    }
+
+    clearTimeout(pending.timeout)
+    this.workerRequests.delete(requestId)
+    if (!running) {
+      const message: WorkerRequest = { id: requestId, type: 'cancel' }
+      this.worker?.postMessage(message)
+    }
+    pending.reject(new Error('Pyodide worker request aborted'))
+  }
+
   private generateWorkerRequestId(): string {
     this.workerRequestCounter += 1
     return `pyodide_worker_req_${this.workerRequestCounter}_${Date.now()}`
@@ -1109,6 +1730,8 @@ json.dumps(result)
 
     this.workerInitialized = false
     this.workerInitPromise = null
+    this.interruptBuffer = null
+    this.runningRequestId = null
 
     for (const { reject, timeout } of this.workerRequests.values()) {
       clearTimeout(timeout)
@@ -0,0 +1,573 @@
+/**
+ * 다중 Pyodide Worker 리샘플링 샤딩
+ *
+ * 목적: 순열 검정/bootstrap을 여러 Pyodide Worker에 나눠 실행 (단일 인스턴스는 코어 1개만 사용)
+ * - 작업은 고정 크기 블록으로 나누고 블록마다 독립 seed([기준 seed, 블록 번호])를 부여
+ * - 각 Worker는 같은 데이터로 서로 다른 블록을 실행 (Python *_permutation_block / *_bootstrap_block)
+ * - 순열: 블록 초과 횟수를 합산해 p-value + Monte Carlo 표준오차 계산,
+ *   블록 번호 순서의 연속 구간이 Besag-Clifford 조건을 충족하면 남은 블록은 배정하지 않음
+ *   (조기 정지 여부와 관계없이 같은 seed → 같은 결과)
+ * - bootstrap: 블록 번호 순서로 replicate를 이어 붙여 백분위수 CI 계산
+ *   (블록 크기가 같으면 Worker 수와 관계없이 같은 seed → 같은 결과)
+ *
+ * Worker는 팩토리로 주입 → 브라우저 Web Worker와 Node worker_threads 모두 사용 가능
+ * (메시지 프로토콜은 pyodide-worker.ts와 동일: init → loadWorker → callMethod)
+ */
+
+import type { WorkerRequest, WorkerResponse } from './pyodide-worker'
+import { decodeResultEnvelope, encodeTypedArrayParams } from './pyodide-transport'
+
+// ============================================================================
+// 상수
+// ============================================================================
+
+/** 기본 최대 샤드 수 (Pyodide 인스턴스마다 수십~수백 MB 메모리 사용) */
+export const MAX_DEFAULT_SHARDS = 4
+
+/** 블록 최소 크기 (블록마다 데이터 전송 + Python 준비 비용이 있음) */
+export const MIN_BLOCK_SIZE = 25
+
+/** 블록 수 기준값: 요청 횟수를 대략 이만큼의 블록으로 나눔 */
+const TARGET_BLOCK_COUNT = 16
+
+/** 순차 정지 기본값 (helpers.sequential_permutation_test와 동일) */
+const DEFAULT_ALPHA = 0.05
+const DEFAULT_STOP_EXCEEDANCES = 20
+const MC_CONFIDENCE_Z = 2.576
+
+const SHARD_INIT_TIMEOUT_MS = 60000
+const SHARD_CALL_TIMEOUT_MS = 60000
+
+// ============================================================================
+// 타입
+// ============================================================================
+
+/**
+ * 샤드 Worker 최소 인터페이스
+ *
+ * 브라우저 Worker(addEventListener)와 Node worker_threads Worker(on)를 모두 허용
+ */
+export interface ShardWorkerLike {
+  postMessage(message: unknown, transfer?: Transferable[]): void
+  terminate(): unknown
+  addEventListener?(type: 'message', listener: (event: MessageEvent) => void): void
+  on?(event: 'message', listener: (data: unknown) => void): unknown
+}
+
+/**
+ * 샤드 Worker 생성 함수 (index: 0부터 시작하는 샤드 번호)
+ */
+export type ShardWorkerFactory = (index: number) => ShardWorkerLike
+
+/**
+ * Python permutation_block 결과
+ */
+export interface PermutationBlockResult {
+  observed: number
+  exceedances: number
+  permutations: number
+  cancelled?: boolean
+}
+
+/**
+ * Python *_bootstrap_block 결과
+ */
+export interface BootstrapBlockResult {
+  replicates: number[]
+  nBootstrap: number
+  cancelled?: boolean
+}
+
+/**
+ * 샤딩 순열 검정 병합 결과
+ */
+export interface ShardedPermutationResult {
+  observed: number
+  pValue: number
+  permutations: number
+  exceedances: number
+  mcStandardError: number
+  stoppingRule: 'early' | 'completed' | 'cancelled'
+  requestedPermutations: number
+  seed: number
+  blocks: number
+  shards: number
+  cancelled?: boolean
+}
+
+/**
+ * 샤딩 bootstrap 병합 결과
+ */
+export interface ShardedBootstrapResult {
+  replicates: number[]
+  nBootstrap: number
+  ci: [number, number] | null
+  requestedReplicates: number
+  seed: number
+  blocks: number
+  shards: number
+  cancelled?: boolean
+}
+
+/**
+ * 샤딩 공통 옵션
+ */
+export interface ShardedRunOptions {
+  /** 기준 seed (생략 시 무작위, 결과에 기록) */
+  seed?: number
+  /** 블록 크기 (생략 시 defaultBlockSize) */
+  blockSize?: number
+  /** 완료 블록 비율 진행률 (0-100) */
+  onProgress?: (progress: number, message?: string) => void
+  /** abort 시 남은 블록을 배정하지 않고 완료된 블록까지 병합 */
+  signal?: AbortSignal
+}
+
+export interface ShardedPermutationOptions extends ShardedRunOptions {
+  permutations: number
+  /** 조기 정지 판정 유의수준 (기본 0.05, 초과 판정 자체는 Python 블록이 수행) */
+  alpha?: number
+  /** Besag-Clifford 조기 정지에 필요한 최소 초과 횟수 */
+  stopExceedances?: number
+}
+
+export interface ShardedBootstrapOptions extends ShardedRunOptions {
+  replicates: number
+  /** 신뢰수준 (기본 0.95) */
+  confidence?: number
+  /** Python 블록 메서드의 반복 횟수 파라미터명 (예: fst_bootstrap_block → 'nBootstrap') */
+  countParam?: string
+}
+
+// ============================================================================
+// 순수 함수 (블록 계획 / 병합)
+// ============================================================================
+
+/**
+ * 요청 횟수 기준 기본 블록 크기 (샤드 수와 무관 → 같은 seed면 재현 가능)
+ */
+export function defaultBlockSize(total: number): number {
+  return Math.max(MIN_BLOCK_SIZE, Math.ceil(total / TARGET_BLOCK_COUNT))
+}
+
+/**
+ * 블록 크기 목록 (마지막 블록은 나머지)
+ */
+export function planBlocks(total: number, blockSize: number = defaultBlockSize(total)): number[] {
+  const sizes: number[] = []
+  for (let remaining = Math.max(0, Math.floor(total)); remaining > 0; remaining -= blockSize) {
+    sizes.push(Math.min(blockSize, remaining))
+  }
+  return sizes
+}
+
+/**
+ * 블록 seed: np.random.default_rng([seed, index])로 블록마다 독립 난수열
+ */
+export function blockSeed(seed: number, index: number): [number, number] {
+  return [seed, index]
+}
+
+/**
+ * 기본 샤드 수: 메인 스레드용 코어 1개를 남기고 MAX_DEFAULT_SHARDS 이하
+ */
+export function defaultShardCount(hardwareConcurrency?: number): number {
+  const cores = hardwareConcurrency ?? 2
+  return Math.max(1, Math.min(MAX_DEFAULT_SHARDS, cores - 1))
+}
+
+/**
+ * Monte Carlo p-value 표준오차 sqrt(p(1-p)/n)
+ */
+export function mcStandardError(pValue: number, n: number): number {
+  return n > 0 ? Math.sqrt((pValue * (1 - pValue)) / n) : Number.NaN
+}
+
+/**
+ * Besag-Clifford 조기 정지 판정 (초과 h회 이상 + p̂ 99% 하한 > alpha)
+ */
+export function shouldStopEarly(
+  exceedances: number,
+  permutations: number,
+  alpha: number = DEFAULT_ALPHA,
+  stopExceedances: number = DEFAULT_STOP_EXCEEDANCES
+): boolean {
+  if (exceedances < stopExceedances || permutations === 0) {
+    return false
+  }
+  const pHat = exceedances / permutations
+  return pHat - MC_CONFIDENCE_Z * mcStandardError(pHat, permutations) > alpha
+}
+
+/**
+ * 순열 블록 병합
+ *
+ * 조기 정지면 p = 초과 / 순열 수 (Besag-Clifford), 아니면 (초과 + 1) / (순열 수 + 1)
+ */
+export function mergePermutationBlocks(
+  blocks: PermutationBlockResult[],
+  stoppingRule: ShardedPermutationResult['stoppingRule']
+): Pick<ShardedPermutationResult, 'observed' | 'pValue' | 'permutations' | 'exceedances' | 'mcStandardError'> {
+  if (blocks.length === 0) {
+    throw new Error('병합할 순열 블록이 없습니다')
+  }
+
+  let permutations = 0
+  let exceedances = 0
+  for (const block of blocks) {
+    permutations += block.permutations
+    exceedances += block.exceedances
+  }
+
+  const pValue = stoppingRule === 'early'
+    ? exceedances / permutations
+    : (exceedances + 1) / (permutations + 1)
+
+  return {
+    observed: blocks[0].observed,
+    pValue,
+    permutations,
+    exceedances,
+    mcStandardError: mcStandardError(pValue, permutations)
+  }
+}
+
+/**
+ * 백분위수 (np.percentile 기본 linear 보간과 동일)
+ *
+ * @param sorted - 오름차순 정렬된 값
+ * @param q - 0-100
+ */
+export function percentile(sorted: ArrayLike<number>, q: number): number {
+  const n = sorted.length
+  if (n === 0) {
+    return Number.NaN
+  }
+  const rank = (q / 100) * (n - 1)
+  const lo = Math.floor(rank)
+  const hi = Math.min(lo + 1, n - 1)
+  return sorted[lo] + (sorted[hi] - sorted[lo]) * (rank - lo)
+}
+
+/**
+ * bootstrap 블록 병합: 블록 순서대로 replicate 연결 + 백분위수 CI
+ *
+ * @param blocks - 블록 번호 순서의 결과 (미완료 블록은 undefined)
+ * @param confidence - 신뢰수준 (기본 0.95)
+ */
+export function mergeBootstrapBlocks(
+  blocks: Array<BootstrapBlockResult | undefined>,
+  confidence: number = 0.95
+): Pick<ShardedBootstrapResult, 'replicates' | 'nBootstrap' | 'ci'> {
+  const replicates = blocks.flatMap((block) => block?.replicates ?? [])
+  if (replicates.length === 0) {
+    return { replicates, nBootstrap: 0, ci: null }
+  }
+
+  const sorted = Float64Array.from(replicates).sort()
+  const tail = ((1 - confidence) / 2) * 100
+  return {
+    replicates,
+    nBootstrap: replicates.length,
+    ci: [percentile(sorted, tail), percentile(sorted, 100 - tail)]
+  }
+}
+
+// ============================================================================
+// 샤드 채널 (Worker 1개와의 요청/응답)
+// ============================================================================
+
+interface PendingShardRequest {
+  resolve: (value: unknown) => void
+  reject: (reason: Error) => void
+  timeout: ReturnType<typeof setTimeout>
+}
+
+class ShardChannel {
+  private readonly pending = new Map<string, PendingShardRequest>()
+  private counter = 0
+  readonly loadedWorkers = new Set<number>()
+
+  constructor(
+    private readonly worker: ShardWorkerLike,
+    private readonly index: number
+  ) {
+    const handle = (data: unknown) => this.handleResponse(data as WorkerResponse)
+    if (typeof worker.on === 'function') {
+      worker.on('message', handle)
+    } else if (typeof worker.addEventListener === 'function') {
+      worker.addEventListener('message', (event: MessageEvent) => handle(event.data))
+    } else {
+      throw new Error('샤드 Worker가 message 이벤트를 지원하지 않습니다')
+    }
+  }
+
+  request(type: WorkerRequest['type'], data: Partial<WorkerRequest>, timeout: number): Promise<unknown> {
+    this.counter += 1
+    const id = `pyodide_shard_${this.index}_req_${this.counter}`
+
+    return new Promise((resolve, reject) => {
+      const timeoutHandle = setTimeout(() => {
+        this.pending.delete(id)
+        reject(new Error(`Pyodide shard ${this.index} request timeout (${timeout}ms)`))
+      }, timeout)
+
+      this.pending.set(id, { resolve, reject, timeout: timeoutHandle })
+      // transfer 없이 전송: 같은 typed array를 여러 블록/샤드에 복사해 보냄
+      this.worker.postMessage({ id, type, ...data } satisfies WorkerRequest)
+    })
+  }
+
+  terminate(): void {
+    this.worker.terminate()
+    for (const { reject, timeout } of this.pending.values()) {
+      clearTimeout(timeout)
+      reject(new Error('Pyodide shard Worker가 종료되었습니다.'))
+    }
+    this.pending.clear()
+    this.loadedWorkers.clear()
+  }
+
+  private handleResponse(response: WorkerResponse): void {
+    const pending = this.pending.get(response.id)
+    if (!pending || response.type === 'progress' || response.type === 'started') {
+      return
+    }
+
+    clearTimeout(pending.timeout)
+    this.pending.delete(response.id)
+
+    if (response.type === 'success') {
+      pending.resolve(decodeResultEnvelope(response.result, response.buffer))
+    } else {
+      pending.reject(new Error(response.error ?? 'Unknown shard worker error'))
+    }
+  }
+}
+
+// ============================================================================
+// 샤드 풀
+// ============================================================================
+
+/**
+ * 다중 Pyodide Worker 리샘플링 풀
+ *
+ * @example
+ * ```typescript
+ * const pool = new ShardedResamplingPool(
+ *   () => new Worker(new URL('./pyodide-worker.ts', import.meta.url), { type: 'module' }),
+ *   4,
+ *   { pyodideUrl, scriptUrl }
+ * )
+ * const result = await pool.runPermutation(8, 'permanova_permutation_block',
+ *   { distance_matrix, grouping }, { permutations: 9999 })
+ * pool.terminate()
+ * ```
+ */
+export class ShardedResamplingPool {
+  private channels: ShardChannel[] = []
+  private startPromise: Promise<void> | null = null
+
+  constructor(
+    private readonly factory: ShardWorkerFactory,
+    readonly size: number,
+    private readonly initData: Partial<WorkerRequest> = {}
+  ) {
+    if (!Number.isInteger(size) || size < 1) {
+      throw new Error(`샤드 수는 1 이상의 정수여야 합니다: ${size}`)
+    }
+  }
+
+  /**
+   * 샤드 Worker 생성 + Pyodide 초기화 (병렬)
+   */
+  start(): Promise<void> {
+    if (!this.startPromise) {
+      this.startPromise = (async () => {
+        this.channels = Array.from({ length: this.size }, (_, i) => new ShardChannel(this.factory(i), i))
+        try {
+          await Promise.all(
+            this.channels.map((channel) => channel.request('init', this.initData, SHARD_INIT_TIMEOUT_MS))
+          )
+        } catch (error) {
+          this.terminate()
+          throw error
+        }
+      })()
+    }
+    return this.startPromise
+  }
+
+  /**
+   * 순열 블록을 샤드에 나눠 실행하고 초과 횟수 병합
+   *
+   * @param workerNum - Python Worker 번호
+   * @param method - 블록 메서드 (permanova_permutation_block 등: permutations, seed 파라미터)
+   * @param params - 블록 공통 파라미터 (데이터)
+   * @param options - 요청 순열 수, seed, 블록 크기, 조기 정지 기준
+   */
+  async runPermutation(
+    workerNum: number,
+    method: string,
+    params: Record<string, unknown>,
+    options: ShardedPermutationOptions
+  ): Promise<ShardedPermutationResult> {
+    const seed = options.seed ?? randomSeed()
+    const sizes = planBlocks(options.permutations, options.blockSize)
+    const ordered: Array<PermutationBlockResult | undefined> = new Array(sizes.length)
+    // 조기 정지는 블록 번호 순서의 연속 구간(0..prefix-1)에만 적용:
+    // 완료 순서는 샤드 수/타이밍에 따라 달라지므로, 같은 seed → 같은 정지 지점과 결과
+    let prefix = 0
+    let exceedances = 0
+    let permutations = 0
+    let early = false
+
+    const { completed, cancelled } = await this.runBlocks<PermutationBlockResult>(
+      workerNum,
+      method,
+      params,
+      sizes,
+      (size, index) => ({ permutations: size, seed: blockSeed(seed, index) }),
+      (result, index) => {
+        ordered[index] = result
+        while (!early && prefix < sizes.length && ordered[prefix]) {
+          exceedances += ordered[prefix]!.exceedances
+          permutations += ordered[prefix]!.permutations
+          prefix += 1
+          early = shouldStopEarly(exceedances, permutations, options.alpha, options.stopExceedances)
+        }
+        return early
+      },
+      options
+    )
+
+    // 조기 정지면 정지 지점까지의 블록만 병합 (그 뒤에 끝난 실행 중 블록은 버림)
+    const merged = (early ? ordered.slice(0, prefix) : ordered)
+      .filter((block): block is PermutationBlockResult => block !== undefined)
+    const stoppingRule = early ? 'early' : cancelled ? 'cancelled' : 'completed'
+    return {
+      ...mergePermutationBlocks(merged, stoppingRule),
+      stoppingRule,
+      requestedPermutations: options.permutations,
+      seed,
+      blocks: early ? prefix : completed,
+      shards: this.size,
+      ...(cancelled && !early ? { cancelled: true } : {})
+    }
+  }
+
+  /**
+   * bootstrap 블록을 샤드에 나눠 실행하고 replicate 병합
+   *
+   * @param workerNum - Python Worker 번호
+   * @param method - 블록 메서드 (fst_bootstrap_block 등: 반복 횟수, seed 파라미터)
+   * @param params - 블록 공통 파라미터 (데이터)
+   * @param options - 요청 반복 수, seed, 블록 크기, 신뢰수준
+   */
+  async runBootstrap(
+    workerNum: number,
+    method: string,
+    params: Record<string, unknown>,
+    options: ShardedBootstrapOptions
+  ): Promise<ShardedBootstrapResult> {
+    const seed = options.seed ?? randomSeed()
+    const countParam = options.countParam ?? 'nBootstrap'
+    const sizes = planBlocks(options.replicates, options.blockSize)
+    const ordered: Array<BootstrapBlockResult | undefined> = new Array(sizes.length)
+
+    const { completed, cancelled } = await this.runBlocks<BootstrapBlockResult>(
+      workerNum,
+      method,
+      params,
+      sizes,
+      (size, index) => ({ [countParam]: size, seed: blockSeed(seed, index) }),
+      (result, index) => {
+        ordered[index] = result
+        return false
+      },
+      options
+    )
+
+    return {
+      ...mergeBootstrapBlocks(ordered, options.confidence),
+      requestedReplicates: options.replicates,
+      seed,
+      blocks: completed,
+      shards: this.size,
+      ...(cancelled ? { cancelled: true } : {})
+    }
+  }
+
+  /**
+   * 모든 샤드 Worker 종료
+   */
+  terminate(): void {
+    for (const channel of this.channels) {
+      channel.terminate()
+    }
+    this.channels = []
+    this.startPromise = null
+  }
+
+  /**
+   * 작업 큐: 각 샤드가 다음 블록을 가져가 실행, onBlock이 true를 반환하거나 abort되면 배정 중단
+   * (이미 실행 중인 블록은 기다렸다가 병합)
+   */
+  private async runBlocks<T>(
+    workerNum: number,
+    method: string,
+    params: Record<string, unknown>,
+    sizes: number[],
+    blockParams: (size: number, index: number) => Record<string, unknown>,
+    onBlock: (result: T, index: number) => boolean,
+    { onProgress, signal }: ShardedRunOptions
+  ): Promise<{ completed: number; cancelled: boolean }> {
+    signal?.throwIfAborted()
+    await this.start()
+
+    // 데이터는 한 번만 인코딩 (transfer하지 않으므로 블록마다 재사용 가능)
+    const encoded = encodeTypedArrayParams(params).params
+    let next = 0
+    let completed = 0
+    let stop = false
+
+    const runShard = async (channel: ShardChannel) => {
+      if (!channel.loadedWorkers.has(workerNum)) {
+        await channel.request('loadWorker', { workerNum }, SHARD_INIT_TIMEOUT_MS)
+        channel.loadedWorkers.add(workerNum)
+      }
+
+      while (!stop && !signal?.aborted && next < sizes.length) {
+        const index = next++
+        const result = await channel.request(
+          'callMethod',
+          { workerNum, method, params: { ...encoded, ...blockParams(sizes[index], index) }, memoize: false },
+          SHARD_CALL_TIMEOUT_MS
+        ) as T
+        completed += 1
+        stop = onBlock(result, index) || stop
+        onProgress?.((completed / sizes.length) * 100, method)
+      }
+    }
+
+    // 블록보다 샤드가 많으면 필요한 샤드만 사용, 한 샤드가 실패하면 나머지도 배정 중단
+    await Promise.all(
+      this.channels.slice(0, sizes.length).map((channel) =>
+        runShard(channel).catch((error: unknown) => {
+          stop = true
+          throw error
+        })
+      )
+    )
+
+    const cancelled = Boolean(signal?.aborted) && completed < sizes.length
+    if (completed === 0) {
+      throw new Error(cancelled ? 'Sharded resampling aborted' : '실행된 블록이 없습니다')
+    }
+    return { completed, cancelled }
+  }
+}
+
+function randomSeed(): number {
+  return Math.floor(Math.random() * 2 ** 31)
+}
@@ -0,0 +1,160 @@
+/**
+ * Pyodide 메모리 스냅샷 (Worker warm start)
+ *
+ * numpy/scipy + helpers.py + 자주 쓰는 Worker 모듈(1-3)까지 초기화한 Pyodide 메모리를
+ * Cache Storage에 저장하고, 다음 세션은 스냅샷에서 바로 복원한다
+ * (loadPackage / helpers.py 등록 / Worker 모듈 import 생략).
+ *
+ * - 키: Pyodide URL + 패키지 목록 + helpers.py/Worker 소스(사전 컴파일 번들 사용 시 번들)의 SHA-256
+ *   → 파일이 바뀌면 자동 무효화
+ * - 저장: 캐시 하나에 최신 스냅샷 1개만 유지 (다른 키는 저장 시 삭제)
+ * - Pyodide 스냅샷 API(_makeSnapshot / _loadSnapshot / makeMemorySnapshot)는 실험 기능이므로
+ *   어느 단계가 실패해도 일반 초기화로 진행한다
+ *
+ * pyodide-worker.ts는 ES Module import를 쓰지 않으므로 같은 로직을 복사해 사용한다
+ * (pyodide-init-logic.ts와 같은 방식, 이 파일이 테스트 대상).
+ */
+
+/**
+ * 스냅샷 키 계산에 들어가는 Python 소스 (helpers.py, worker{N}.py)
+ */
+export interface SnapshotSource {
+  name: string
+  code: string
+}
+
+/**
+ * 스냅샷과 함께 저장하는 메타데이터 (응답 헤더 x-snapshot-meta)
+ */
+export interface SnapshotMeta {
+  key: string
+  pyodideVersion: string
+  /** 스냅샷 안에 이미 로드된 Worker 모듈 번호 */
+  workers: number[]
+  /** 복원 후 pyodide.loadedPackages 보정용 (패키지 중복 로드 방지) */
+  loadedPackages: Record<string, string>
+  /** 사전 컴파일 Worker 번들(.pyc)로 로드했는지 (복원 후 이후 Worker도 번들에서 로드) */
+  bundle?: boolean
+  createdAt: number
+  bytes: number
+}
+
+/**
+ * init 메시지로 Worker에 전달하는 스냅샷 설정 (없으면 스냅샷 미사용)
+ */
+export interface SnapshotConfig {
+  cacheName: string
+  workers: number[]
+}
+
+// 캐시 항목 URL (실제 요청되지 않는 가상 경로)
+export const SNAPSHOT_URL_PREFIX = '/__pyodide-snapshot__/'
+const SNAPSHOT_META_HEADER = 'x-snapshot-meta'
+
+/**
+ * 스냅샷 키: 입력이 하나라도 바뀌면 다른 키 (SHA-256 hex)
+ *
+ * @param pyodideUrl Pyodide indexURL (버전이 경로에 포함)
+ * @param packages 스냅샷 전에 로드하는 패키지
+ * @param sources helpers.py + 스냅샷 Worker 소스
+ */
+export async function computeSnapshotKey(
+  pyodideUrl: string,
+  packages: readonly string[],
+  sources: readonly SnapshotSource[]
+): Promise<string> {
+  const payload = JSON.stringify([
+    pyodideUrl,
+    [...packages].sort(),
+    sources.map((source) => [source.name, source.code])
+  ])
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(payload))
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('')
+}
+
+/**
+ * 키가 일치하는 스냅샷 조회
+ *
+ * @returns 스냅샷 바이트 + 메타데이터, 없거나 메타데이터가 손상되었으면 null
+ */
+export async function readSnapshot(
+  cacheStorage: CacheStorage,
+  cacheName: string,
+  key: string
+): Promise<{ bytes: Uint8Array; meta: SnapshotMeta } | null> {
+  const cache = await cacheStorage.open(cacheName)
+  const response = await cache.match(SNAPSHOT_URL_PREFIX + key)
+  if (!response) {
+    return null
+  }
+
+  let meta: SnapshotMeta
+  try {
+    meta = JSON.parse(response.headers.get(SNAPSHOT_META_HEADER) ?? '') as SnapshotMeta
+  } catch {
+    return null
+  }
+  if (meta.key !== key) {
+    return null
+  }
+
+  return { bytes: new Uint8Array(await response.arrayBuffer()), meta }
+}
+
+/**
+ * 스냅샷 저장 (같은 캐시의 이전 스냅샷은 삭제)
+ */
+export async function writeSnapshot(
+  cacheStorage: CacheStorage,
+  cacheName: string,
+  meta: SnapshotMeta,
+  bytes: Uint8Array
+): Promise<void> {
+  const cache = await cacheStorage.open(cacheName)
+  const url = SNAPSHOT_URL_PREFIX + meta.key
+
+  for (const request of await cache.keys()) {
+    if (!request.url.endsWith(url)) {
+      await cache.delete(request)
+    }
+  }
+
+  await cache.put(
+    url,
+    new Response(bytes, {
+      headers: {
+        'content-type': 'application/octet-stream',
+        [SNAPSHOT_META_HEADER]: JSON.stringify(meta)
+      }
+    })
+  )
+}
+
+/**
+ * 스냅샷 전체 삭제 (복원 실패 시 호출 → 다음 세션에서 다시 생성)
+ */
+export async function deleteSnapshots(cacheStorage: CacheStorage, cacheName: string): Promise<boolean> {
+  return cacheStorage.delete(cacheName)
+}
+
+/**
+ * 복원된 인스턴스의 loadedPackages 보정
+ *
+ * 스냅샷 메모리에는 패키지가 이미 import되어 있으므로, JS 쪽 목록에 빠진 항목을 채워
+ * 이후 loadPackage가 같은 패키지를 다시 설치하지 않도록 한다.
+ *
+ * @returns 새로 채운 패키지 이름
+ */
+export function restoreLoadedPackages(
+  pyodide: { loadedPackages: Record<string, string> },
+  saved: Record<string, string>
+): string[] {
+  const added: string[] = []
+  for (const [name, channel] of Object.entries(saved)) {
+    if (!(name in pyodide.loadedPackages)) {
+      pyodide.loadedPackages[name] = channel
+      added.push(name)
+    }
+  }
+  return added
+}
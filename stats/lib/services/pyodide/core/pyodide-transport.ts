@@ -0,0 +1,365 @@
+/**
+ * Pyodide Worker 파라미터 전송 인코딩
+ *
+ * 목적: 대용량 숫자 배열을 JSON 문자열 대신 typed buffer로 전송
+ * - number[] → Float64Array (정수만 있으면 Int32Array)
+ * - postMessage transfer list로 ArrayBuffer 소유권 이전 (복사 없음)
+ * - Python 쪽에서는 helpers.decode_buffer_params가 list로 복원 (@array_params 파라미터만 NumPy 배열)
+ *
+ * 작은 배열은 기존처럼 일반 배열로 전송 (변환 오버헤드 > 이득)
+ *
+ * 결과 방향은 반대: helpers.encode_result_envelope가 대용량 숫자 배열을
+ * packed float64 버퍼로 분리 → decodeResultEnvelope가 원래 구조로 복원
+ *
+ * 배치 호출(callBatch)은 공유 입력 배열을 한 번만 전송하고 작업 파라미터에서
+ * sharedArrayRef(name)로 참조한다 (helpers.dispatch_batch)
+ *
+ * 상주 데이터셋은 registerDataset으로 한 번 올리고 datasetColumnRef/datasetRowsRef로 참조한다
+ *
+ * Worker 독립 순수 함수 → Vitest에서 직접 테스트 가능
+ */
+
+/**
+ * typed buffer로 전환하는 최소 배열 길이
+ */
+export const TYPED_ARRAY_MIN_LENGTH = 1024
+
+const INT32_MIN = -2147483648
+const INT32_MAX = 2147483647
+
+/**
+ * 인코딩된 파라미터 + postMessage transfer 목록
+ */
+export interface EncodedWorkerParams {
+  params: Record<string, unknown>
+  transfer: ArrayBuffer[]
+}
+
+/**
+ * 순수 숫자 배열을 typed array로 변환
+ *
+ * null/문자열/NaN이 하나라도 있으면 null 반환 (JSON 경로 유지)
+ *
+ * @param value - 변환 대상
+ * @param minLength - 최소 길이 (미만이면 변환하지 않음)
+ * @returns Float64Array | Int32Array | null
+ */
+export function toTypedNumericArray(
+  value: unknown,
+  minLength: number = TYPED_ARRAY_MIN_LENGTH
+): Float64Array | Int32Array | null {
+  if (!Array.isArray(value) || value.length < minLength) {
+    return null
+  }
+
+  let allInt32 = true
+  for (let i = 0; i < value.length; i++) {
+    const item = value[i]
+    if (typeof item !== 'number' || !Number.isFinite(item)) {
+      return null
+    }
+    if (allInt32 && (!Number.isInteger(item) || item < INT32_MIN || item > INT32_MAX)) {
+      allInt32 = false
+    }
+  }
+
+  return allInt32 ? Int32Array.from(value as number[]) : Float64Array.from(value as number[])
+}
+
+/**
+ * Worker 메서드 파라미터 인코딩
+ *
+ * - 최상위 숫자 배열 → typed array
+ * - 숫자 배열의 배열 (예: groups) → 행별 typed array
+ * - 그 외 값은 그대로 유지
+ *
+ * @param params - callWorkerMethod 파라미터
+ * @param minLength - typed array 전환 최소 길이
+ * @returns 인코딩된 파라미터와 transfer 목록
+ *
+ * @example
+ * ```typescript
+ * const { params, transfer } = encodeTypedArrayParams({ data: largeColumn })
+ * worker.postMessage({ type: 'callMethod', params }, transfer)
+ * ```
+ */
+export function encodeTypedArrayParams(
+  params: Record<string, unknown>,
+  minLength: number = TYPED_ARRAY_MIN_LENGTH
+): EncodedWorkerParams {
+  const encoded: Record<string, unknown> = {}
+  const transfer: ArrayBuffer[] = []
+
+  for (const [key, value] of Object.entries(params)) {
+    const typed = toTypedNumericArray(value, minLength)
+    if (typed) {
+      encoded[key] = typed
+      transfer.push(typed.buffer as ArrayBuffer)
+      continue
+    }
+
+    if (Array.isArray(value) && value.length > 0 && value.every(Array.isArray)) {
+      let converted = false
+      const rows = value.map((row: unknown) => {
+        const typedRow = toTypedNumericArray(row, minLength)
+        if (!typedRow) return row
+        converted = true
+        transfer.push(typedRow.buffer as ArrayBuffer)
+        return typedRow
+      })
+      encoded[key] = converted ? rows : value
+      continue
+    }
+
+    encoded[key] = value
+  }
+
+  return { params: encoded, transfer }
+}
+
+// ============================================================================
+// 결과 envelope 디코딩
+// ============================================================================
+
+/**
+ * 결과 envelope 해제에 필요한 PyProxy 최소 인터페이스
+ */
+export interface PyProxyLike {
+  get(key: unknown): unknown
+  getBuffer(type?: string): { data: Float64Array; release(): void }
+  destroy(): void
+}
+
+/**
+ * helpers.dispatch 반환값 (meta_json, packed) PyProxy 해제
+ *
+ * packed float64는 WASM 힙 view에서 독립 버퍼로 한 번만 복사한다
+ * (view는 release 이후 무효). envelope/packed PyProxy는 항상 destroy.
+ *
+ * @param envelope - (meta_json, packed) 튜플 PyProxy
+ * @returns JSON.parse된 메타데이터와 packed 버퍼 (비어 있으면 undefined)
+ */
+export function unpackResultEnvelope(envelope: PyProxyLike): { meta: unknown; buffer?: Float64Array } {
+  const packed = envelope.get(1) as PyProxyLike
+  try {
+    const meta: unknown = JSON.parse(envelope.get(0) as string)
+    const view = packed.getBuffer('f64')
+    try {
+      const buffer = view.data.length > 0 ? view.data.slice() : undefined
+      return { meta, buffer }
+    } finally {
+      view.release()
+    }
+  } finally {
+    packed.destroy()
+    envelope.destroy()
+  }
+}
+
+type BufferSpan = [offset: number, length: number]
+
+interface BufferRef {
+  __buffer__: BufferSpan
+  shape: number[]
+}
+
+interface RecordsRef {
+  __records__: Record<string, BufferSpan>
+  length: number
+}
+
+function isBufferRef(value: Record<string, unknown>): value is BufferRef & Record<string, unknown> {
+  return Array.isArray(value.__buffer__) && Array.isArray(value.shape)
+}
+
+function isRecordsRef(value: Record<string, unknown>): value is RecordsRef & Record<string, unknown> {
+  return (
+    typeof value.__records__ === 'object' &&
+    value.__records__ !== null &&
+    typeof value.length === 'number'
+  )
+}
+
+function sliceSpan(buffer: Float64Array, [offset, length]: BufferSpan): Float64Array {
+  return buffer.subarray(offset, offset + length)
+}
+
+/**
+ * Python 결과 envelope(JSON 메타 + packed float64 버퍼)을 원래 결과 구조로 복원
+ *
+ * - {__buffer__, shape: [n]} → number[]
+ * - {__buffer__, shape: [r, c]} → number[][]
+ * - {__records__, length} → 객체 배열 (예: rocPoints [{fpr, tpr}])
+ *
+ * 복원 결과는 일반 배열이므로 기존 결과 타입/저장 포맷과 호환된다.
+ *
+ * @param meta - JSON.parse된 메타데이터
+ * @param buffer - packed float64 버퍼 (대용량 배열이 없으면 undefined)
+ * @returns 복원된 결과
+ */
+export function decodeResultEnvelope(meta: unknown, buffer?: Float64Array): unknown {
+  if (!buffer || buffer.length === 0) {
+    return meta
+  }
+
+  const walk = (value: unknown): unknown => {
+    if (Array.isArray(value)) {
+      return value.map(walk)
+    }
+    if (typeof value !== 'object' || value === null) {
+      return value
+    }
+
+    const obj = value as Record<string, unknown>
+    if (isBufferRef(obj)) {
+      const data = sliceSpan(buffer, obj.__buffer__)
+      if (obj.shape.length === 2) {
+        const [rows, cols] = obj.shape
+        return Array.from({ length: rows }, (_, r) => Array.from(data.subarray(r * cols, (r + 1) * cols)))
+      }
+      return Array.from(data)
+    }
+
+    if (isRecordsRef(obj)) {
+      const columns = Object.entries(obj.__records__).map(
+        ([key, span]) => [key, sliceSpan(buffer, span)] as const
+      )
+      return Array.from({ length: obj.length }, (_, i) => {
+        const record: Record<string, number> = {}
+        for (const [key, column] of columns) {
+          record[key] = column[i]
+        }
+        return record
+      })
+    }
+
+    const decoded: Record<string, unknown> = {}
+    for (const [key, child] of Object.entries(obj)) {
+      decoded[key] = walk(child)
+    }
+    return decoded
+  }
+
+  return walk(meta)
+}
+
+// ============================================================================
+// 배치 호출 (callBatch)
+// ============================================================================
+
+/**
+ * 배치 공유 배열 참조 (helpers.dispatch_batch가 공유 배열로 치환)
+ */
+export interface SharedArrayRef {
+  __shared__: string
+}
+
+/**
+ * 배치 작업 하나 (worker 번호 + Python 함수명 + 파라미터)
+ */
+export interface BatchJob {
+  worker: number
+  method: string
+  params: Record<string, unknown>
+}
+
+/**
+ * 배치 작업 결과 (작업별 성공/실패가 독립적)
+ */
+export type BatchJobResult<T = unknown> =
+  | { ok: true; result: T }
+  | { ok: false; error: string }
+
+/**
+ * 공유 배열 참조 생성
+ *
+ * 파라미터 값 또는 리스트 1단계(예: groups의 각 그룹)에 사용할 수 있다.
+ *
+ * @param name - callBatch shared 인자의 키
+ * @returns { __shared__: name }
+ *
+ * @example
+ * ```typescript
+ * await core.callBatch(
+ *   [
+ *     { worker: 1, method: 'descriptive_stats', params: { data: sharedArrayRef('score') } },
+ *     { worker: 3, method: 'one_way_anova', params: { groups: [sharedArrayRef('a'), sharedArrayRef('b')] } }
+ *   ],
+ *   { score, a, b }
+ * )
+ * ```
+ */
+export function sharedArrayRef(name: string): SharedArrayRef {
+  return { __shared__: name }
+}
+
+/**
+ * 배치 요청 인코딩: 공유 배열 + 작업별 파라미터
+ *
+ * 공유 배열과 작업별 인라인 파라미터 모두 callMethod와 같은 기준(TYPED_ARRAY_MIN_LENGTH)으로
+ * 인코딩한다. 작은 공유 배열은 일반 배열로 보내도 Python 쪽에서 한 번만 NumPy로 변환되며,
+ * @array_params가 아닌 파라미터는 callMethod와 같이 list로 받는다.
+ *
+ * @param jobs - 배치 작업 목록
+ * @param shared - 공유 입력 배열
+ * @returns 인코딩된 작업/공유 배열과 transfer 목록
+ */
+export function encodeBatchRequest(
+  jobs: BatchJob[],
+  shared: Record<string, unknown>
+): { jobs: BatchJob[]; shared: Record<string, unknown>; transfer: ArrayBuffer[] } {
+  const encodedShared = encodeTypedArrayParams(shared)
+  const transfer = [...encodedShared.transfer]
+
+  const encodedJobs = jobs.map((job) => {
+    const encoded = encodeTypedArrayParams(job.params)
+    transfer.push(...encoded.transfer)
+    return { ...job, params: encoded.params }
+  })
+
+  return { jobs: encodedJobs, shared: encodedShared.params, transfer }
+}
+
+// ============================================================================
+// 상주 데이터셋 (registerDataset)
+// ============================================================================
+
+/**
+ * 등록 데이터셋 참조 (helpers._resolve_refs가 컬럼 배열/행 목록으로 치환)
+ */
+export interface DatasetRef {
+  datasetId: string
+  column?: string
+  columns?: string[]
+}
+
+/**
+ * registerDataset 결과 요약
+ */
+export interface DatasetSummary {
+  datasetId: string
+  rowCount: number
+  columns: Record<string, 'numeric' | 'categorical'>
+}
+
+/**
+ * 데이터셋 컬럼 참조 (배열 파라미터 자리에 사용: data, x, y, groups의 각 그룹 등)
+ *
+ * @param datasetId - registerDataset에 사용한 id
+ * @param column - 컬럼명
+ * @returns { datasetId, column }
+ */
+export function datasetColumnRef(datasetId: string, column: string): DatasetRef {
+  return { datasetId, column }
+}
+
+/**
+ * 데이터셋 행 참조 (행 객체 배열 파라미터 자리에 사용: means_plot_data의 data 등)
+ *
+ * @param datasetId - registerDataset에 사용한 id
+ * @param columns - 포함할 컬럼 (생략 시 전체)
+ * @returns { datasetId, columns? }
+ */
+export function datasetRowsRef(datasetId: string, columns?: string[]): DatasetRef {
+  return columns ? { datasetId, columns } : { datasetId }
+}
@@ -132,7 +132,7 @@ export const WORKER_PACKAGES = Object.freeze({
   [PyodideWorker.Hypothesis]: ['statsmodels', 'pandas'] as const,
   [PyodideWorker.NonparametricAnova]: ['statsmodels', 'pandas', 'scikit-learn'] as const,
   [PyodideWorker.RegressionAdvanced]: ['statsmodels', 'scikit-learn'] as const,
-  [PyodideWorker.Survival]: ['scikit-learn'] as const,
+  [PyodideWorker.Survival]: ['statsmodels', 'scikit-learn'] as const,
   [PyodideWorker.Matplotlib]: ['matplotlib', 'micropip'] as const,
   [PyodideWorker.Fisheries]: [] as const,
   [PyodideWorker.Ecology]: ['scikit-learn'] as const,
@@ -27,19 +27,79 @@
 /// <reference lib="webworker" />
 declare const self: DedicatedWorkerGlobalScope
 
-// ⚠️ Worker 컨텍스트이므로 ES Module import 사용 불가
-// 대신 postMessage로 초기화 로직 함수들을 전달받거나,
-// 동일한 로직을 pyodide-init-logic.ts에서 복사해 사용
+// 타입만 참조 (컴파일 시 제거되므로 Worker 번들에 import가 남지 않음)
+import type { SnapshotConfig, SnapshotMeta } from './pyodide-snapshot'
+// 결과 envelope 형식은 pyodide-transport.ts 한 곳에서 정의 (의존성 없는 모듈이라 Worker 번들에 포함)
+import { unpackResultEnvelope } from './pyodide-transport'
+
+// ⚠️ Worker 컨텍스트: 앱 모듈(서비스, 스토어 등)은 import하지 않음
+// 의존성 없는 순수 모듈(pyodide-transport.ts)만 import하고,
+// 그 외 초기화 로직은 pyodide-init-logic.ts에서 복사해 사용
 
 // Pyodide 타입 선언
 declare function loadPyodide(options: {
   indexURL: string
+  _makeSnapshot?: boolean      // makeMemorySnapshot 사용 준비 (실험 기능)
+  _loadSnapshot?: Uint8Array   // 메모리 스냅샷에서 복원 (실험 기능)
 }): Promise<PyodideInterface>
 
+interface PyBufferView {
+  data: Float64Array
+  release(): void
+}
+
+interface PyProxy {
+  (...args: unknown[]): unknown
+  get(key: unknown): unknown
+  getBuffer(type?: string): PyBufferView
+  toJs(): unknown
+  destroy(): void
+}
+
+// helpers 모듈 PyProxy (속성 접근마다 새 PyProxy 생성 → 초기화 시 1회만 접근)
+interface HelpersModuleProxy {
+  dispatch: PyProxy
+  dispatch_batch: PyProxy
+  register_dataset: PyProxy
+  unregister_dataset: PyProxy
+  clear_result_cache: PyProxy
+  load_worker_module: PyProxy
+  unload_worker_module: PyProxy
+  unload_idle_workers: PyProxy
+  enforce_memory_budget: PyProxy
+  record_worker_resident_bytes: PyProxy
+  memory_stats: PyProxy
+  set_progress_callback: PyProxy
+  set_interrupt_buffer: PyProxy
+  destroy(): void
+}
+
+// 상주 bridge 함수
+interface PythonBridge {
+  dispatch: PyProxy
+  dispatchBatch: PyProxy
+  registerDataset: PyProxy
+  unregisterDataset: PyProxy
+  clearResultCache: PyProxy
+  loadWorkerModule: PyProxy
+  unloadWorkerModule: PyProxy
+  unloadIdleWorkers: PyProxy
+  enforceMemoryBudget: PyProxy
+  recordWorkerResidentBytes: PyProxy
+  memoryStats: PyProxy
+}
+
 interface PyodideInterface {
   loadPackage(packages: string | string[]): Promise<void>
   runPythonAsync(code: string): Promise<string>
+  toPy(obj: unknown): PyProxy
+  pyimport(name: string): PyProxy
+  setInterruptBuffer(buffer: Int32Array): void
+  makeMemorySnapshot(): Uint8Array
+  unpackArchive(buffer: ArrayBuffer, format: string, options?: { extractDir?: string }): void
+  loadedPackages: Record<string, string>
   version: string
+  _module?: { HEAPU8: Uint8Array }  // Emscripten 모듈 (WASM 힙 크기 측정용)
   FS: {
     writeFile(path: string, data: string | Uint8Array): void
     readFile(path: string, options?: { encoding?: string }): string | Uint8Array
@@ -57,12 +117,32 @@ interface PyodideInterface {
  */
 interface WorkerRequest {
   id: string
-  type: 'init' | 'loadWorker' | 'callMethod' | 'terminate'
+  type: 'init' | 'loadWorker' | 'unloadWorker' | 'unloadIdleWorkers' | 'callMethod' | 'callBatch'
+    | 'registerDataset' | 'unregisterDataset' | 'clearResultCache' | 'memoryStats' | 'cancel' | 'terminate'
   workerNum?: number
   method?: string
-  params?: Record<string, unknown>
+  params?: Record<string, unknown>  // 대용량 숫자 배열은 Float64Array/Int32Array (pyodide-transport.ts)
+  memoize?: boolean    // callMethod: 결과 메모이제이션 사용 (helpers.dispatch)
   pyodideUrl?: string  // Pyodide indexURL (환경별 자동 선택)
   scriptUrl?: string   // Pyodide loader script URL (환경별 자동 선택)
+  maxIdleMs?: number   // unloadIdleWorkers: 이 시간 이상 호출 없는 Worker 모듈 해제
+  jobs?: BatchJob[]    // callBatch: 작업 목록 (params에서 { __shared__: name }으로 공유 배열 참조)
+  shared?: Record<string, unknown>  // callBatch: 공유 입력 배열 (한 번만 전송/정제)
+  datasetId?: string   // registerDataset / unregisterDataset
+  columns?: Record<string, unknown>  // registerDataset: 컬럼형 데이터 (숫자 컬럼은 typed array)
+  interruptBuffer?: Int32Array  // init: SharedArrayBuffer 기반 취소 신호 (메인 스레드가 2 기록 → 취소)
+  snapshot?: SnapshotConfig     // init: 메모리 스냅샷 warm start (없으면 일반 초기화)
+  workerBundleUrl?: string      // init: 사전 컴파일 Worker 번들(.pyc zip) URL (없으면 파일별 fetch + 컴파일)
+  memoryBudgetMB?: number       // init: Worker 상주 비용 + 결과 캐시 예산 (loadWorker 전에 오래 안 쓴 Worker 해제, 없으면 무제한)
+}
+
+/**
+ * callBatch 작업 하나 (pyodide-transport.ts의 BatchJob과 동일)
+ */
+interface BatchJob {
+  worker: number
+  method: string
+  params: Record<string, unknown>
 }
 
 /**
@@ -70,10 +150,12 @@ interface WorkerRequest {
  */
 interface WorkerResponse {
   id: string
-  type: 'success' | 'error' | 'progress'
+  type: 'success' | 'error' | 'progress' | 'started'  // started: callMethod/callBatch 실행 시작 (취소 대상 판별용)
   result?: unknown
+  buffer?: Float64Array  // 결과 envelope의 packed float64 버퍼 (decodeResultEnvelope로 복원)
   error?: string
-  progress?: number
+  progress?: number  // 0-100
+  message?: string   // progress: 진행 중인 작업 라벨 (예: 'permanova')
 }
 
 // ============================================================================
@@ -84,6 +166,51 @@ let pyodide: PyodideInterface | null = null
 let isInitialized = false
 const loadedWorkers: Set<number> = new Set()
 
+// 상주 dispatcher + Worker 모듈 로더 (helpers 모듈 함수 PyProxy)
+let bridge: PythonBridge | null = null
+
+// 실행 중인 callMethod/callBatch 요청 id (Python 진행률 콜백 → progress 메시지 대상)
+let activeRequestId: string | null = null
+
+// 메인 스레드와 공유하는 취소 신호 버퍼 (init에서 전달, 없으면 취소 불가)
+let sharedInterruptBuffer: Int32Array | null = null
+
+// 실행 전에 취소된 요청 id ('cancel' 메시지, 차례가 오면 실행하지 않고 건너뜀)
+const cancelledRequests: Set<string> = new Set()
+
+// WASM 힙 예산 (bytes, init에서 전달, null이면 governor 미사용)
+let memoryBudgetBytes: number | null = null
+
+// governor가 예산 때문에 해제한 Worker (호출되면 자동 재로드, 명시적 unload는 제외)
+const evictedWorkers: Set<number> = new Set()
+
+/**
+ * 요청 실행 시작: 진행률 대상 지정 + 이전 요청의 남은 취소 신호 초기화 + 메인 스레드에 시작 알림
+ * (메인 스레드는 started를 받은 요청에만 공유 버퍼로 취소 신호를 보낸다)
+ */
+function beginActiveRequest(requestId: string): void {
+  activeRequestId = requestId
+  if (sharedInterruptBuffer) {
+    Atomics.store(sharedInterruptBuffer, 0, 0)
+  }
+  const response: WorkerResponse = { id: requestId, type: 'started' }
+  self.postMessage(response)
+}
+
+/**
+ * 실행 전에 취소된 요청이면 true (취소 표시는 한 번만 사용)
+ */
+function consumeCancelled(requestId: string): boolean {
+  if (!cancelledRequests.delete(requestId)) {
+    return false
+  }
+  console.log(`[PyodideWorker] Skipping cancelled request: ${requestId}`)
+  return true
+}
+
+// Worker 모듈 파일 위치 (sys.path에 포함된 helpers.py와 같은 디렉터리)
+const WORKER_MODULE_DIR = '/home/pyodide'
+
 // Python Worker 파일명 매핑
 const WORKER_FILE_NAMES: Record<number, string> = {
   1: 'worker1-descriptive',
@@ -191,6 +318,281 @@ function getWorkerFileName(workerNum: number): string {
   return fileName
 }
 
+// ============================================================================
+// Python 모듈 공급: 사전 컴파일 번들(.pyc zip) 또는 파일별 소스 fetch
+// ============================================================================
+
+const CORE_PACKAGES = ['numpy', 'scipy']
+
+// scripts/build/build-worker-bundle.js가 만든 zip을 푸는 위치 (helpers.pyc, worker{N}.pyc, manifest.json)
+const WORKER_BUNDLE_DIR = `${WORKER_MODULE_DIR}/bundle`
+
+interface WorkerBundleArchive {
+  bytes: ArrayBuffer
+  digest: string  // SHA-256 hex (스냅샷 키에 사용)
+}
+
+// 번들 압축 해제 + bytecode 호환(magic number) 확인 완료 → helpers/Worker를 .pyc에서 로드
+let workerBundleReady = false
+
+async function sha256Hex(data: BufferSource): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-256', data)
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('')
+}
+
+async function fetchPythonSource(fileName: string): Promise<string> {
+  const url = `${self.location.origin}/workers/python/${fileName}.py`
+  const response = await fetch(url)
+  if (!response.ok) {
+    throw new Error(`Failed to load ${fileName}.py: ${response.statusText}`)
+  }
+  return response.text()
+}
+
+/**
+ * 사전 컴파일 번들 다운로드 (없거나 실패하면 null → 파일별 로드)
+ */
+async function fetchWorkerBundle(bundleUrl: string): Promise<WorkerBundleArchive | null> {
+  try {
+    const response = await fetch(new URL(bundleUrl, self.location.origin))
+    if (!response.ok) {
+      return null
+    }
+    const bytes = await response.arrayBuffer()
+    return { bytes, digest: await sha256Hex(bytes) }
+  } catch {
+    return null
+  }
+}
+
+/**
+ * 번들을 FS에 한 번에 풀고 현재 인터프리터와 bytecode 버전이 같은지 확인
+ *
+ * @returns true면 번들 사용, false면 파일별 로드
+ */
+async function installWorkerBundle(instance: PyodideInterface, bundle: WorkerBundleArchive): Promise<boolean> {
+  try {
+    instance.unpackArchive(bundle.bytes, 'zip', { extractDir: WORKER_BUNDLE_DIR })
+    const compatible = await instance.runPythonAsync(`
+import importlib.util
+import json
+
+with open('${WORKER_BUNDLE_DIR}/manifest.json', encoding='utf-8') as f:
+    _bundle_magic = json.load(f)['magic']
+_bundle_magic == importlib.util.MAGIC_NUMBER.hex()
+`) as unknown
+    if (compatible !== true) {
+      console.warn('[PyodideWorker] Worker bundle bytecode mismatch, loading sources instead')
+      return false
+    }
+    console.log(`[PyodideWorker] ✓ Worker bundle unpacked (${(bundle.bytes.byteLength / 1024).toFixed(1)}KB)`)
+    return true
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : String(error)
+    console.warn('[PyodideWorker] Worker bundle unavailable:', errorMessage)
+    return false
+  }
+}
+
+/**
+ * 번들의 helpers.pyc를 helpers 모듈로 등록 (registerHelpersModule의 번들 버전)
+ */
+async function registerBundledHelpers(instance: PyodideInterface): Promise<void> {
+  await instance.runPythonAsync(`
+import importlib.util
+import sys
+
+if '${WORKER_MODULE_DIR}' not in sys.path:
+    sys.path.insert(0, '${WORKER_MODULE_DIR}')
+
+spec = importlib.util.spec_from_file_location('helpers', '${WORKER_BUNDLE_DIR}/helpers.pyc')
+if spec is None or spec.loader is None:
+    raise ImportError('Failed to create module spec for helpers.pyc')
+
+module = importlib.util.module_from_spec(spec)
+sys.modules['helpers'] = module
+spec.loader.exec_module(module)
+`)
+}
+
+/**
+ * Worker 모듈 파일 경로 준비
+ * - 번들 사용: 이미 풀린 worker{N}.pyc (요청/컴파일 없음)
+ * - 아니면: 소스를 받아(code가 있으면 재사용) FS에 worker{N}.py로 기록
+ */
+async function prepareWorkerModule(instance: PyodideInterface, workerNum: number, code?: string): Promise<string> {
+  if (workerBundleReady) {
+    return `${WORKER_BUNDLE_DIR}/worker${workerNum}.pyc`
+  }
+
+  const fileName = getWorkerFileName(workerNum)
+  console.log(`[PyodideWorker] Loading ${fileName}.py`)
+  const modulePath = `${WORKER_MODULE_DIR}/worker${workerNum}.py`
+  instance.FS.writeFile(modulePath, code ?? await fetchPythonSource(fileName))
+  return modulePath
+}
+
+// ============================================================================
+// Memory Snapshot (pyodide-snapshot.ts와 동일한 로직)
+// ============================================================================
+
+const SNAPSHOT_URL_PREFIX = '/__pyodide-snapshot__/'
+const SNAPSHOT_META_HEADER = 'x-snapshot-meta'
+
+/**
+ * 스냅샷 준비 상태: 키 계산에 쓴 Worker 소스(번들 사용 시 비어 있음) + 캐시에서 찾은 스냅샷
+ */
+interface SnapshotPlan {
+  config: SnapshotConfig
+  key: string
+  workerSources: Map<number, string>
+  cached: { bytes: Uint8Array; meta: SnapshotMeta } | null
+}
+
+async function computeSnapshotKey(
+  pyodideUrl: string,
+  packages: readonly string[],
+  sources: ReadonlyArray<{ name: string; code: string }>
+): Promise<string> {
+  const payload = JSON.stringify([
+    pyodideUrl,
+    [...packages].sort(),
+    sources.map((source) => [source.name, source.code])
+  ])
+  return sha256Hex(new TextEncoder().encode(payload))
+}
+
+function snapshotPackages(workers: readonly number[]): string[] {
+  return [...new Set([...CORE_PACKAGES, ...workers.flatMap(getAdditionalPackages)])]
+}
+
+/**
+ * 스냅샷 키를 계산하고 캐시된 스냅샷 조회
+ * - 번들 사용: 번들 digest가 키 (소스 해시가 manifest에 포함되어 있으므로 추가 요청 없음)
+ * - 파일별 로드: helpers.py + 스냅샷 Worker 소스 해시
+ * (helpers.py/Worker 파일이 바뀌면 키가 달라져 기존 스냅샷은 무시됨)
+ */
+async function prepareSnapshot(
+  config: SnapshotConfig,
+  pyodideUrl: string,
+  bundle: WorkerBundleArchive | null,
+  helpersCode: string | null
+): Promise<SnapshotPlan> {
+  const workerSources = new Map<number, string>()
+  if (!bundle) {
+    const codes = await Promise.all(config.workers.map((workerNum) => fetchPythonSource(getWorkerFileName(workerNum))))
+    config.workers.forEach((workerNum, index) => workerSources.set(workerNum, codes[index]))
+  }
+  const key = await computeSnapshotKey(
+    pyodideUrl,
+    snapshotPackages(config.workers),
+    bundle
+      ? [{ name: 'worker-bundle', code: bundle.digest }]
+      : [
+          { name: 'helpers', code: helpersCode ?? '' },
+          ...[...workerSources].map(([workerNum, code]) => ({ name: `worker${workerNum}`, code }))
+        ]
+  )
+
+  let cached: SnapshotPlan['cached'] = null
+  const cache = await caches.open(config.cacheName)
+  const response = await cache.match(SNAPSHOT_URL_PREFIX + key)
+  if (response) {
+    try {
+      const meta = JSON.parse(response.headers.get(SNAPSHOT_META_HEADER) ?? '') as SnapshotMeta
+      if (meta.key === key) {
+        cached = { bytes: new Uint8Array(await response.arrayBuffer()), meta }
+      }
+    } catch {
+      cached = null
+    }
+  }
+
+  return { config, key, workerSources, cached }
+}
+
+/**
+ * 스냅샷 Worker 모듈 로드 → 메모리 스냅샷 생성 → Cache Storage 저장 (이전 스냅샷 삭제)
+ *
+ * 스냅샷에는 Python → JS 참조(JsProxy)가 없어야 하므로 bridge 획득/진행률 콜백 등록 전에
+ * runPythonAsync로만 Worker 모듈을 로드한다.
+ */
+async function createSnapshot(instance: PyodideInterface, plan: SnapshotPlan): Promise<'created' | 'failed'> {
+  try {
+    const extraPackages = snapshotPackages(plan.config.workers).filter((name) => !CORE_PACKAGES.includes(name))
+    if (extraPackages.length > 0) {
+      await instance.loadPackage(extraPackages)
+    }
+
+    for (const workerNum of plan.config.workers) {
+      const modulePath = await prepareWorkerModule(instance, workerNum, plan.workerSources.get(workerNum))
+      await instance.runPythonAsync(
+        `import helpers\n_methods = await helpers.load_worker_module(${workerNum}, '${modulePath}')\ndel _methods`
+      )
+      loadedWorkers.add(workerNum)
+    }
+
+    const bytes = instance.makeMemorySnapshot()
+    const meta: SnapshotMeta = {
+      key: plan.key,
+      pyodideVersion: instance.version,
+      workers: [...plan.config.workers],
+      loadedPackages: { ...instance.loadedPackages },
+      bundle: workerBundleReady,
+      createdAt: Date.now(),
+      bytes: bytes.byteLength
+    }
+
+    const cache = await caches.open(plan.config.cacheName)
+    const url = SNAPSHOT_URL_PREFIX + plan.key
+    for (const request of await cache.keys()) {
+      if (!request.url.endsWith(url)) {
+        await cache.delete(request)
+      }
+    }
+    await cache.put(url, new Response(bytes, {
+      headers: { 'content-type': 'application/octet-stream', [SNAPSHOT_META_HEADER]: JSON.stringify(meta) }
+    }))
+
+    console.log(`[PyodideWorker] ✓ Memory snapshot saved (${(bytes.byteLength / 1024 / 1024).toFixed(1)}MB)`)
+    return 'created'
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : String(error)
+    console.warn('[PyodideWorker] Memory snapshot skipped:', errorMessage)
+    return 'failed'
+  }
+}
+
+/**
+ * 스냅샷에서 복원 (실패 시 스냅샷 삭제 후 null → 일반 초기화)
+ */
+async function restoreSnapshot(pyodideUrl: string, plan: SnapshotPlan): Promise<PyodideInterface | null> {
+  if (!plan.cached) {
+    return null
+  }
+
+  try {
+    const instance = await loadPyodide({ indexURL: pyodideUrl, _loadSnapshot: plan.cached.bytes })
+
+    // 스냅샷 메모리에 이미 설치된 패키지를 JS 목록에도 반영 (loadPackage 중복 설치 방지)
+    for (const [name, channel] of Object.entries(plan.cached.meta.loadedPackages)) {
+      if (!(name in instance.loadedPackages)) {
+        instance.loadedPackages[name] = channel
+      }
+    }
+    plan.cached.meta.workers.forEach((workerNum) => loadedWorkers.add(workerNum))
+    // 번들은 스냅샷 FS 안에 이미 풀려 있음 (번들 digest가 키에 포함)
+    workerBundleReady = plan.cached.meta.bundle === true
+    return instance
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : String(error)
+    console.warn('[PyodideWorker] Snapshot restore failed, falling back to full init:', errorMessage)
+    await caches.delete(plan.config.cacheName).catch(() => false)
+    loadedWorkers.clear()
+    return null
+  }
+}
+
 // ============================================================================
 // Pyodide Loader 로드 (동적 - 환경별 자동 선택)
 // ============================================================================
@@ -204,12 +606,13 @@ function getWorkerFileName(workerNum: number): string {
 // ============================================================================
 
 self.onmessage = async (event: MessageEvent<WorkerRequest>) => {
-  const { id, type, workerNum, method, params, pyodideUrl, scriptUrl } = event.data
+  const { id, type, workerNum, method, params, pyodideUrl, scriptUrl, maxIdleMs, jobs, shared,
+    datasetId, columns, memoize, interruptBuffer, snapshot, workerBundleUrl, memoryBudgetMB } = event.data
 
   try {
     switch (type) {
       case 'init':
-        await handleInit(id, pyodideUrl, scriptUrl)
+        await handleInit(id, pyodideUrl, scriptUrl, interruptBuffer, snapshot, workerBundleUrl, memoryBudgetMB)
         break
 
       case 'loadWorker':
@@ -218,12 +621,53 @@ self.onmessage = async (event: MessageEvent<WorkerRequest>) => {
         }
         break
 
+      case 'unloadWorker':
+        if (workerNum) {
+          handleUnloadWorker(id, workerNum)
+        }
+        break
+
+      case 'unloadIdleWorkers':
+        handleUnloadIdleWorkers(id, maxIdleMs ?? 0)
+        break
+
       case 'callMethod':
         if (workerNum && method && params) {
-          await handleCallMethod(id, workerNum, method, params)
+          await handleCallMethod(id, workerNum, method, params, memoize ?? false)
         }
         break
 
+      case 'callBatch':
+        if (jobs) {
+          await handleCallBatch(id, jobs, shared ?? {})
+        }
+        break
+
+      case 'registerDataset':
+        if (datasetId && columns) {
+          handleRegisterDataset(id, datasetId, columns)
+        }
+        break
+
+      case 'unregisterDataset':
+        if (datasetId) {
+          handleUnregisterDataset(id, datasetId)
+        }
+        break
+
+      case 'clearResultCache':
+        handleClearResultCache(id)
+        break
+
+      case 'memoryStats':
+        handleMemoryStats(id)
+        break
+
+      case 'cancel':
+        // 응답 없음: 메인 스레드가 이미 reject한 요청
+        cancelledRequests.add(id)
+        break
+
       case 'terminate':
         handleTerminate()
         break
@@ -244,7 +688,11 @@ self.onmessage = async (event: MessageEvent<WorkerRequest>) => {
 async function handleInit(
   requestId: string,
   pyodideUrl?: string,
-  scriptUrl?: string
+  scriptUrl?: string,
+  interruptBuffer?: Int32Array,
+  snapshot?: SnapshotConfig,
+  workerBundleUrl?: string,
+  memoryBudgetMB?: number
 ): Promise<void> {
   if (isInitialized) {
     sendSuccess(requestId, { status: 'already_initialized' })
@@ -260,44 +708,111 @@ async function handleInit(
     importScripts(finalScriptUrl)
     console.log('[PyodideWorker] ✓ Pyodide loader loaded')
 
-    console.log('[PyodideWorker] Initializing Pyodide from:', finalPyodideUrl)
+    // 1. Python 모듈: 사전 컴파일 번들(요청 1회) 또는 helpers.py 소스 (스냅샷 키 계산에도 사용)
+    const bundle = workerBundleUrl ? await fetchWorkerBundle(workerBundleUrl) : null
+    let helpersCode: string | null = null
+    if (!bundle) {
+      console.log('[PyodideWorker] Loading helpers.py...')
+      helpersCode = await fetchPythonSource('helpers')
+    }
 
-    // 1. Load Pyodide with dynamic URL (환경별 자동 선택)
-    pyodide = await loadPyodide({
-      indexURL: finalPyodideUrl
-    })
+    // 2. 메모리 스냅샷 조회 → 있으면 복원 (loadPackage / helpers 등록 / Worker import 생략)
+    let snapshotStatus: 'restored' | 'created' | 'failed' | 'disabled' = 'disabled'
+    let snapshotPlan: SnapshotPlan | null = null
+    if (snapshot && typeof caches !== 'undefined') {
+      try {
+        snapshotPlan = await prepareSnapshot(snapshot, finalPyodideUrl, bundle, helpersCode)
+      } catch (error) {
+        const errorMessage = error instanceof Error ? error.message : String(error)
+        console.warn('[PyodideWorker] Memory snapshot unavailable:', errorMessage)
+      }
+    }
+    if (snapshotPlan) {
+      pyodide = await restoreSnapshot(finalPyodideUrl, snapshotPlan)
+      if (pyodide) {
+        snapshotStatus = 'restored'
+        console.log(`[PyodideWorker] ✓ Pyodide ${pyodide.version} restored from memory snapshot`)
+      }
+    }
 
     if (!pyodide) {
-      throw new Error('Pyodide load failed')
+      // 3. Load Pyodide with dynamic URL (환경별 자동 선택)
+      console.log('[PyodideWorker] Initializing Pyodide from:', finalPyodideUrl)
+      pyodide = await loadPyodide({
+        indexURL: finalPyodideUrl,
+        ...(snapshotPlan ? { _makeSnapshot: true } : {})
+      })
+
+      if (!pyodide) {
+        throw new Error('Pyodide load failed')
+      }
+
+      console.log(`[PyodideWorker] ✓ Pyodide ${pyodide.version} loaded`)
+
+      // 4. Load core packages (NumPy + SciPy)
+      console.log('[PyodideWorker] Loading core packages (numpy, scipy)...')
+      await pyodide.loadPackage(CORE_PACKAGES)
+      console.log('[PyodideWorker] ✓ Core packages loaded')
+
+      // 5. Register helpers as a module (번들이면 helpers.pyc, 아니면 helpers.py 소스)
+      workerBundleReady = bundle ? await installWorkerBundle(pyodide, bundle) : false
+      if (workerBundleReady) {
+        await registerBundledHelpers(pyodide)
+      } else {
+        await registerHelpersModule(pyodide, helpersCode ?? await fetchPythonSource('helpers'))
+      }
+      console.log('[PyodideWorker] ✓ helpers loaded and registered')
+
+      // 6. 자주 쓰는 Worker 모듈까지 로드한 뒤 스냅샷 저장 (다음 세션 warm start)
+      if (snapshotPlan) {
+        snapshotStatus = await createSnapshot(pyodide, snapshotPlan)
+      }
     }
 
-    console.log(`[PyodideWorker] ✓ Pyodide ${pyodide.version} loaded`)
-
-    // 2. Load core packages (NumPy + SciPy)
-    console.log('[PyodideWorker] Loading core packages (numpy, scipy)...')
-    await pyodide.loadPackage(['numpy', 'scipy'])
-    console.log('[PyodideWorker] ✓ Core packages loaded')
-
-    // 3. Load helpers.py first and register it as a module
-    console.log('[PyodideWorker] Loading helpers.py...')
-    const helpersUrl = `${self.location.origin}/workers/python/helpers.py`
-    console.log('[PyodideWorker] helpers.py URL:', helpersUrl)
-    const helpersResponse = await fetch(helpersUrl)
-
-    if (!helpersResponse.ok) {
-      throw new Error(`Failed to load helpers.py: ${helpersResponse.statusText}`)
+    // 7. 상주 dispatcher 획득 (callMethod마다 Python 소스를 생성/컴파일하지 않음)
+    const helpersModule = pyodide.pyimport('helpers') as unknown as HelpersModuleProxy
+    try {
+      bridge = {
+        dispatch: helpersModule.dispatch,
+        dispatchBatch: helpersModule.dispatch_batch,
+        registerDataset: helpersModule.register_dataset,
+        unregisterDataset: helpersModule.unregister_dataset,
+        clearResultCache: helpersModule.clear_result_cache,
+        loadWorkerModule: helpersModule.load_worker_module,
+        unloadWorkerModule: helpersModule.unload_worker_module,
+        unloadIdleWorkers: helpersModule.unload_idle_workers,
+        enforceMemoryBudget: helpersModule.enforce_memory_budget,
+        recordWorkerResidentBytes: helpersModule.record_worker_resident_bytes,
+        memoryStats: helpersModule.memory_stats
+      }
+      memoryBudgetBytes = memoryBudgetMB ? memoryBudgetMB * 1024 * 1024 : null
+
+      // 8. 진행률 콜백 + 취소 신호 (helpers.ProgressLoop)
+      // - 진행률: Python → 실행 중인 요청의 progress 메시지
+      // - 취소: 메인 스레드가 interruptBuffer[0]에 2(SIGINT) 기록 → 반복 경계에서 KeyboardInterrupt
+      helpersModule.set_progress_callback((fraction: number, label: string) => {
+        if (activeRequestId) {
+          sendProgress(activeRequestId, fraction * 100, label)
+        }
+      })
+      if (interruptBuffer) {
+        pyodide.setInterruptBuffer(interruptBuffer)
+        helpersModule.set_interrupt_buffer(interruptBuffer)
+        sharedInterruptBuffer = interruptBuffer
+      }
+    } finally {
+      helpersModule.destroy()
     }
 
-    const helpersCode = await helpersResponse.text()
-
-    // Register helpers.py using extracted function (테스트 가능)
-    await registerHelpersModule(pyodide, helpersCode)
-    console.log('[PyodideWorker] ✓ helpers.py loaded and registered')
-
     isInitialized = true
     console.log('[PyodideWorker] ✓ Pyodide initialized')
 
-    sendSuccess(requestId, { status: 'initialized' })
+    sendSuccess(requestId, {
+      status: 'initialized',
+      snapshot: snapshotStatus,
+      bundle: workerBundleReady,
+      workers: [...loadedWorkers]
+    })
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error)
     console.error('[PyodideWorker] Initialization failed:', errorMessage)
@@ -319,38 +834,65 @@ async function handleLoadWorker(requestId: string, workerNum: number): Promise<v
     return
   }
 
+  const { methods, evicted } = await loadWorkerModule(pyodide, workerNum)
+  sendSuccess(requestId, { status: 'loaded', workerNum, methods, evicted })
+}
+
+/**
+ * Worker 모듈 로드 (loadWorker 요청 + governor가 해제한 Worker 재로드 공용)
+ *
+ * @param protect 예산 초과 시에도 해제하지 않을 Worker (배치에 함께 쓰이는 Worker)
+ */
+async function loadWorkerModule(
+  instance: PyodideInterface,
+  workerNum: number,
+  protect: number[] = []
+): Promise<{ methods: string[]; evicted: number[] }> {
   try {
     console.log(`[PyodideWorker] Loading Python module: worker${workerNum}...`)
 
     // 1. Get correct file name using extracted function (테스트 가능)
     const fileName = getWorkerFileName(workerNum)
 
-    // 2. Fetch Python script
-    const scriptUrl = `${self.location.origin}/workers/python/${fileName}.py`
-    console.log(`[PyodideWorker] Loading ${fileName}.py from:`, scriptUrl)
-    const response = await fetch(scriptUrl)
-
-    if (!response.ok) {
-      throw new Error(`Failed to load ${fileName}.py: ${response.statusText}`)
-    }
-
-    const pythonCode = await response.text()
+    // 메모리 governor: 이 Worker까지 올리면 예산을 넘을 때 오래 안 쓴 Worker부터 해제
+    const evicted = enforceMemoryBudget(workerNum, protect)
+    const heapBefore = heapBytes()
 
-    // 3. Load additional packages BEFORE executing code (Worker 3/4 import 위해 필수)
+    // 2-3. 모듈 파일 준비(번들이면 풀려 있는 worker{N}.pyc, 아니면 소스 fetch 후 FS에 기록)와
+    //      추가 패키지 다운로드를 동시에 진행 — 모듈 실행은 둘 다 끝난 뒤 (Worker 3/4 import 위해 필수)
     const additionalPackages = getAdditionalPackages(workerNum)
     if (additionalPackages.length > 0) {
       console.log(`[PyodideWorker] Loading additional packages for worker${workerNum}:`, additionalPackages)
-      await pyodide.loadPackage(additionalPackages)
+    }
+    const [modulePath] = await Promise.all([
+      prepareWorkerModule(instance, workerNum),
+      additionalPackages.length > 0 ? instance.loadPackage(additionalPackages) : Promise.resolve()
+    ])
+    if (additionalPackages.length > 0) {
       console.log(`[PyodideWorker] ✓ Additional packages loaded`)
     }
 
-    // 4. Execute Python code (이제 statsmodels/sklearn import 가능)
-    await pyodide.runPythonAsync(pythonCode)
+    // 4. 독립 모듈(worker{N})로 import + dispatch 테이블 구성
+    //    (이제 statsmodels/sklearn import 가능, Worker 간 전역 이름 충돌 없음)
+    if (!bridge) {
+      throw new Error('Python dispatcher not initialized')
+    }
+    const registered = (await bridge.loadWorkerModule(workerNum, modulePath)) as PyProxy
+    let methods: string[]
+    try {
+      methods = registered.toJs() as string[]
+    } finally {
+      registered.destroy()
+    }
 
     loadedWorkers.add(workerNum)
-    console.log(`[PyodideWorker] ✓ Worker${workerNum} (${fileName}) loaded`)
+    evictedWorkers.delete(workerNum)
+    if (heapBefore > 0) {
+      bridge.recordWorkerResidentBytes(workerNum, heapBytes() - heapBefore)
+    }
+    console.log(`[PyodideWorker] ✓ Worker${workerNum} (${fileName}) loaded: ${methods.length} methods`)
 
-    sendSuccess(requestId, { status: 'loaded', workerNum })
+    return { methods, evicted }
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error)
     console.error(`[PyodideWorker] Worker${workerNum} load failed:`, errorMessage)
@@ -358,6 +900,116 @@ async function handleLoadWorker(requestId: string, workerNum: number): Promise<v
   }
 }
 
+/**
+ * governor가 해제한 Worker를 호출 전에 다시 로드 (메인 스레드는 로드된 상태로 알고 있음)
+ */
+async function reloadEvictedWorkers(instance: PyodideInterface, workerNums: number[]): Promise<void> {
+  for (const workerNum of workerNums) {
+    if (evictedWorkers.has(workerNum) && !loadedWorkers.has(workerNum)) {
+      console.log(`[PyodideWorker] Reloading evicted worker${workerNum}`)
+      await loadWorkerModule(instance, workerNum, workerNums)
+    }
+  }
+}
+
+
+// ============================================================================
+// Memory Governor (helpers.enforce_memory_budget)
+// ============================================================================
+
+/**
+ * 현재 WASM 힙 크기 (bytes, 측정 불가 시 0)
+ */
+function heapBytes(): number {
+  return pyodide?._module?.HEAPU8.byteLength ?? 0
+}
+
+/**
+ * 예산 초과 예상 시 LRU Worker 해제 (예산 미설정이면 no-op)
+ *
+ * 사용량은 Python 쪽에서 로드된 Worker 상주 비용 + 결과 캐시로 계산 (HEAPU8은 줄지 않으므로 쓰지 않음)
+ *
+ * @param incoming 곧 로드할 Worker 번호 (상주 비용을 미리 반영)
+ * @param protect 해제하지 않을 Worker 번호
+ * @returns 해제된 Worker 번호 (호출 시 reloadEvictedWorkers로 재로드)
+ */
+function enforceMemoryBudget(incoming: number, protect: number[]): number[] {
+  if (!bridge || memoryBudgetBytes === null) {
+    return []
+  }
+
+  const evictedProxy = bridge.enforceMemoryBudget(memoryBudgetBytes, incoming, protect) as PyProxy
+  let evicted: number[]
+  try {
+    evicted = evictedProxy.toJs() as number[]
+  } finally {
+    evictedProxy.destroy()
+  }
+
+  if (evicted.length > 0) {
+    evicted.forEach((workerNum) => {
+      loadedWorkers.delete(workerNum)
+      evictedWorkers.add(workerNum)
+    })
+    console.log(`[PyodideWorker] Memory budget: evicted workers ${evicted.join(', ')} before loading worker${incoming}`)
+  }
+  return evicted
+}
+
+/**
+ * WASM 힙 크기 + Worker별 상주 비용 (오래 안 쓴 순)
+ */
+function handleMemoryStats(requestId: string): void {
+  if (!bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const stats = JSON.parse(bridge.memoryStats(heapBytes()) as string) as Record<string, unknown>
+  sendSuccess(requestId, { ...stats, budgetBytes: memoryBudgetBytes })
+}
+
+// ============================================================================
+// Unload Worker Handlers
+// ============================================================================
+
+/**
+ * Worker 모듈을 sys.modules에서 제거하여 WASM 힙 회수
+ * (다음 loadWorker 시 재로드)
+ */
+function handleUnloadWorker(requestId: string, workerNum: number): void {
+  if (!bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const unloaded = bridge.unloadWorkerModule(workerNum) as boolean
+  loadedWorkers.delete(workerNum)
+  evictedWorkers.delete(workerNum)
+  console.log(`[PyodideWorker] Worker${workerNum} unloaded: ${unloaded}`)
+
+  sendSuccess(requestId, { status: unloaded ? 'unloaded' : 'not_loaded', workerNum })
+}
+
+/**
+ * maxIdleMs 이상 호출되지 않은 Worker 모듈 일괄 해제
+ */
+function handleUnloadIdleWorkers(requestId: string, maxIdleMs: number): void {
+  if (!bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const idleProxy = bridge.unloadIdleWorkers(maxIdleMs / 1000) as PyProxy
+  let unloaded: number[]
+  try {
+    unloaded = idleProxy.toJs() as number[]
+  } finally {
+    idleProxy.destroy()
+  }
+
+  unloaded.forEach((workerNum) => loadedWorkers.delete(workerNum))
+  console.log('[PyodideWorker] Idle workers unloaded:', unloaded)
+
+  sendSuccess(requestId, { status: 'unloaded', workerNums: unloaded })
+}
 
 // ============================================================================
 // Call Method Handler
@@ -367,12 +1019,18 @@ async function handleCallMethod(
   requestId: string,
   workerNum: number,
   method: string,
-  params: Record<string, unknown>
+  params: Record<string, unknown>,
+  memoize: boolean
 ): Promise<void> {
   if (!pyodide) {
     throw new Error('Pyodide not initialized')
   }
 
+  if (consumeCancelled(requestId)) {
+    return
+  }
+
+  await reloadEvictedWorkers(pyodide, [workerNum])
   if (!loadedWorkers.has(workerNum)) {
     throw new Error(`Worker${workerNum} not loaded. Call 'loadWorker' first.`)
   }
@@ -380,18 +1038,30 @@ async function handleCallMethod(
   try {
     console.log(`[PyodideWorker] Executing: ${method}`)
 
-    // Execute Python function
-    const pyResult = await pyodide.runPythonAsync(`
-import json
-result = ${method}(**${JSON.stringify(params)})
-json.dumps(result)
-    `)
+    if (!bridge) {
+      throw new Error('Python dispatcher not initialized')
+    }
+
+    // Execute Python function via resident dispatcher (PyProxy 직접 호출)
+    // - params: typed array(Float64Array/Int32Array)는 toPy에서 memoryview로 매핑
+    // - helpers.dispatch가 함수 테이블 조회 + 파라미터명 검증 + buffer 디코딩 후 호출
+    const pyParams = pyodide.toPy(params)
+    const dispatchStart = performance.now()
+    let envelope: PyProxy
+    beginActiveRequest(requestId)
+    try {
+      envelope = bridge.dispatch(workerNum, method, pyParams, memoize) as PyProxy
+    } finally {
+      activeRequestId = null
+      pyParams.destroy()
+    }
+    const dispatchMs = performance.now() - dispatchStart
 
-    // Convert result to JavaScript
-    const jsResult = JSON.parse(pyResult)
+    // Convert result envelope to JavaScript (JSON 메타 + packed float64 버퍼)
+    const { meta, buffer } = unpackResultEnvelope(envelope)
 
-    console.log(`[PyodideWorker] ✓ ${method} completed`)
-    sendSuccess(requestId, jsResult)
+    console.log(`[PyodideWorker] ✓ ${method} completed (dispatch ${dispatchMs.toFixed(1)}ms)`)
+    sendSuccess(requestId, meta, buffer)
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error)
     console.error(`[PyodideWorker] Execute failed:`, errorMessage)
@@ -399,15 +1069,128 @@ json.dumps(result)
   }
 }
 
+// ============================================================================
+// Call Batch Handler
+// ============================================================================
+
+/**
+ * 여러 Worker 메서드를 한 번의 dispatch_batch 호출로 실행
+ * (공유 배열은 한 번만 toPy/NumPy 변환, 결과는 하나의 envelope로 응답)
+ */
+async function handleCallBatch(
+  requestId: string,
+  jobs: BatchJob[],
+  shared: Record<string, unknown>
+): Promise<void> {
+  if (!pyodide || !bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  if (consumeCancelled(requestId)) {
+    return
+  }
+
+  const batchWorkers = [...new Set(jobs.map((job) => job.worker))]
+  await reloadEvictedWorkers(pyodide, batchWorkers)
+  const missing = batchWorkers.filter((n) => !loadedWorkers.has(n))
+  if (missing.length > 0) {
+    throw new Error(`Worker${missing.join(', ')} not loaded. Call 'loadWorker' first.`)
+  }
+
+  try {
+    console.log(`[PyodideWorker] Executing batch: ${jobs.map((job) => job.method).join(', ')}`)
+
+    const pyJobs = pyodide.toPy(jobs)
+    const pyShared = pyodide.toPy(shared)
+    const dispatchStart = performance.now()
+    let envelope: PyProxy
+    beginActiveRequest(requestId)
+    try {
+      envelope = bridge.dispatchBatch(pyJobs, pyShared) as PyProxy
+    } finally {
+      activeRequestId = null
+      pyJobs.destroy()
+      pyShared.destroy()
+    }
+    const dispatchMs = performance.now() - dispatchStart
+
+    const { meta, buffer } = unpackResultEnvelope(envelope)
+
+    console.log(`[PyodideWorker] ✓ batch of ${jobs.length} completed (dispatch ${dispatchMs.toFixed(1)}ms)`)
+    sendSuccess(requestId, meta, buffer)
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : String(error)
+    console.error(`[PyodideWorker] Batch failed:`, errorMessage)
+    throw new Error(`Batch execution failed: ${errorMessage}`)
+  }
+}
+
+// ============================================================================
+// Dataset Handlers
+// ============================================================================
+
+/**
+ * 컬럼형 데이터셋 상주 등록 (이후 { datasetId, column } 참조로 분석, 데이터 재전송 없음)
+ */
+function handleRegisterDataset(
+  requestId: string,
+  datasetId: string,
+  columns: Record<string, unknown>
+): void {
+  if (!pyodide || !bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const pyColumns = pyodide.toPy(columns)
+  let summaryJson: string
+  try {
+    summaryJson = bridge.registerDataset(datasetId, pyColumns) as string
+  } finally {
+    pyColumns.destroy()
+  }
+
+  console.log(`[PyodideWorker] ✓ Dataset registered: ${datasetId}`)
+  sendSuccess(requestId, JSON.parse(summaryJson))
+}
+
+/**
+ * 상주 데이터셋 해제
+ */
+function handleUnregisterDataset(requestId: string, datasetId: string): void {
+  if (!bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const removed = bridge.unregisterDataset(datasetId) as boolean
+  sendSuccess(requestId, { status: removed ? 'removed' : 'not_found', removed })
+}
+
+/**
+ * 결과 메모이제이션 캐시 비우기
+ */
+function handleClearResultCache(requestId: string): void {
+  if (!bridge) {
+    throw new Error('Pyodide not initialized')
+  }
+
+  const cleared = bridge.clearResultCache() as number
+  sendSuccess(requestId, { status: 'cleared', cleared })
+}
+
 // ============================================================================
 // Terminate Handler
 // ============================================================================
 
 function handleTerminate(): void {
   console.log('[PyodideWorker] Terminating...')
+  if (bridge) {
+    Object.values(bridge).forEach((fn: PyProxy) => fn.destroy())
+    bridge = null
+  }
   isInitialized = false
   pyodide = null
   loadedWorkers.clear()
+  evictedWorkers.clear()
   self.close()
 }
 
@@ -415,13 +1198,14 @@ function handleTerminate(): void {
 // Response Helpers
 // ============================================================================
 
-function sendSuccess(id: string, result: unknown): void {
+function sendSuccess(id: string, result: unknown, buffer?: Float64Array): void {
   const response: WorkerResponse = {
     id,
     type: 'success',
-    result
+    result,
+    buffer
   }
-  self.postMessage(response)
+  self.postMessage(response, buffer ? [buffer.buffer as ArrayBuffer] : [])
 }
 
 function sendError(id: string, error: string): void {
@@ -433,11 +1217,12 @@ function sendError(id: string, error: string): void {
   self.postMessage(response)
 }
 
-function sendProgress(id: string, progress: number): void {
+function sendProgress(id: string, progress: number, message?: string): void {
   const response: WorkerResponse = {
     id,
     type: 'progress',
-    progress
+    progress,
+    message
   }
   self.postMessage(response)
 }
@@ -12,3 +12,6 @@ export * from './pyodide-helper';
 
 /** Worker 프리페치 (분석 시작 전 사전 로딩) */
 export * from './prefetch-worker';
+
+/** Worker 프리페치 계획 (다음 Worker 예측 + 메모리 상한) */
+export * from './prefetch-planner';
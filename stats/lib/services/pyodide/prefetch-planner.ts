@@ -0,0 +1,213 @@
+/**
+ * Pyodide Worker Prefetch 계획
+ *
+ * 현재 분석 페이지(선택한 메서드 카테고리)에서 다음에 필요할 Worker를 예측하고,
+ * 메모리 상한 안에서 미리 로드할 Worker 목록을 정한다.
+ *
+ * - 예측: 메서드 카테고리의 Worker(가중치 1) + 이어서 호출되는 Worker
+ *   (선행 정규성 검정 → Worker 1, 비모수 대안 → Worker 3 등, 가중치 < 1)
+ * - 비용: WORKER_PACKAGES 기준 아직 설치되지 않은 패키지 + 모듈 자체 (추정 MB)
+ *   → 이미 로드된 Worker와 패키지를 공유하면 비용이 작아진다 (Worker 3 이후 Worker 2는 모듈 비용만)
+ * - 상한: 이미 로드된 Worker까지 포함한 추정 WASM 힙이 memoryCeilingMB를 넘지 않는 범위에서
+ *   가중치 순으로 선택 (넘는 Worker는 건너뛰고 다음 후보 검토)
+ *
+ * 순수 함수만 두어 테스트 대상으로 삼고, 실제 로드는 prefetch-worker.ts가 담당한다.
+ */
+
+import { WORKER_PACKAGES } from './core/pyodide-worker.enum'
+import type { WorkerNumber } from '@/lib/constants/methods-registry.types'
+
+/**
+ * Pyodide 런타임 + numpy/scipy + helpers 추정 힙 (MB)
+ */
+export const BASE_HEAP_MB = 120
+
+/**
+ * 패키지별 설치 + import 후 추정 힙 증가량 (MB, 브라우저 측정값을 반올림)
+ */
+export const PACKAGE_HEAP_MB: Readonly<Record<string, number>> = Object.freeze({
+  pandas: 30,
+  statsmodels: 35,
+  'scikit-learn': 40,
+  matplotlib: 25,
+  micropip: 2,
+  biopython: 15
+})
+
+// 목록에 없는 패키지의 보수적 추정치
+const UNKNOWN_PACKAGE_HEAP_MB = 20
+
+// Worker 모듈(.py/.pyc) 자체의 추정 힙
+const WORKER_MODULE_HEAP_MB = 2
+
+/**
+ * 후속 Worker 가중치 (카테고리 Worker = 1)
+ */
+export const FOLLOW_UP_WEIGHT = 0.5
+
+/**
+ * StatisticalMethod.category → Worker 번호
+ *
+ * 실제 callWorkerMethod 호출 패턴 기반 (pyodide-core.service.ts 참조):
+ * - Worker 1: descriptive, normality, outlier, cronbach, bonferroni
+ * - Worker 2: t-test, chi-square, correlation, z-test, levene
+ * - Worker 3: nonparametric, ANOVA, post-hoc
+ * - Worker 4: regression, PCA, factor, cluster
+ * - Worker 5: survival
+ */
+export const CATEGORY_WORKER_MAP: Readonly<Record<string, readonly WorkerNumber[]>> = Object.freeze({
+  'descriptive': [1],
+  't-test': [2],
+  'chi-square': [2],
+  'correlation': [2],       // Worker 2 (일반), partial은 Worker 2+statsmodels
+  'anova': [3],             // Worker 3 (one-way, two-way, repeated, ancova, manova)
+  'nonparametric': [3],     // Worker 3 (mann-whitney, wilcoxon, kruskal 등)
+  'regression': [4],        // Worker 4 (linear, multiple, logistic)
+  'multivariate': [4],      // Worker 4 (PCA, factor, cluster, discriminant)
+  'timeseries': [4],        // Worker 4 (ARIMA, seasonal, stationarity)
+  'survival': [5],          // Worker 5 (kaplan-meier, cox, roc)
+  'psychometrics': [1],     // Worker 1 (cronbach)
+  'design': [1],            // Worker 1
+  'other': [1],             // Worker 1
+})
+
+/**
+ * 카테고리별 후속 Worker (변수 선택 완료 후 이어서 호출되는 Worker)
+ *
+ * - 선행 가정 검정(preemptive-assumption-service.ts): 정규성 → Worker 1, 등분산(Levene) → Worker 2
+ * - 모수 검정의 가정 위반 시 비모수 대안 → Worker 3
+ * - 기술통계 → 이어지는 가설검정 → Worker 2
+ */
+export const CATEGORY_FOLLOW_UP_MAP: Readonly<Record<string, readonly WorkerNumber[]>> = Object.freeze({
+  'descriptive': [2],
+  't-test': [1, 3],
+  'correlation': [1],
+  'anova': [1, 2],
+  'nonparametric': [1, 2],
+  'regression': [1],
+})
+
+/**
+ * 예측된 Worker 후보
+ */
+export interface PrefetchCandidate {
+  worker: WorkerNumber
+  /** 다음에 필요할 가능성 (0-1, 클수록 먼저 로드) */
+  weight: number
+}
+
+/**
+ * 계획 입력
+ */
+export interface PrefetchPlanInput {
+  candidates: readonly PrefetchCandidate[]
+  /** 이미 로드된 Worker (스냅샷 복원 포함) */
+  loadedWorkers: Iterable<number>
+  /** 추정 WASM 힙 상한 (MB), 이미 로드된 Worker 포함 */
+  memoryCeilingMB: number
+  /** 측정한 현재 힙 (MB), 없으면 BASE_HEAP_MB + 로드된 Worker 추정치 */
+  usedMB?: number
+}
+
+/**
+ * 계획 결과
+ */
+export interface PrefetchPlan {
+  /** 로드 순서대로 */
+  workers: WorkerNumber[]
+  /** 새로 설치될 패키지 (로드 순서대로) */
+  packages: string[]
+  /** 계획 실행 후 추정 힙 (MB) */
+  estimatedMB: number
+  /** 상한 때문에 건너뛴 Worker */
+  skipped: { worker: WorkerNumber; costMB: number }[]
+}
+
+function packageHeapMB(pkg: string): number {
+  return PACKAGE_HEAP_MB[pkg] ?? UNKNOWN_PACKAGE_HEAP_MB
+}
+
+function workerPackages(worker: number): readonly string[] {
+  return (WORKER_PACKAGES as Readonly<Record<number, readonly string[]>>)[worker] ?? []
+}
+
+/**
+ * Worker를 추가로 로드할 때의 추정 힙 증가량 (이미 설치된 패키지는 제외)
+ *
+ * @param worker Worker 번호
+ * @param installed 이미 설치된 패키지
+ */
+export function estimateWorkerCostMB(worker: number, installed: ReadonlySet<string>): number {
+  return workerPackages(worker)
+    .filter((pkg) => !installed.has(pkg))
+    .reduce((sum, pkg) => sum + packageHeapMB(pkg), WORKER_MODULE_HEAP_MB)
+}
+
+/**
+ * 메서드 카테고리 → 다음에 필요할 Worker 후보 (가중치 내림차순, 중복 제거)
+ *
+ * @param category StatisticalMethod.category
+ * @param includeFollowUps 후속 Worker 포함 여부
+ */
+export function predictWorkers(category: string, includeFollowUps = true): PrefetchCandidate[] {
+  const candidates: PrefetchCandidate[] = []
+  const seen = new Set<number>()
+
+  const push = (workers: readonly WorkerNumber[] | undefined, weight: number) => {
+    for (const worker of workers ?? []) {
+      if (!seen.has(worker)) {
+        seen.add(worker)
+        candidates.push({ worker, weight })
+      }
+    }
+  }
+
+  push(CATEGORY_WORKER_MAP[category], 1)
+  if (includeFollowUps) {
+    push(CATEGORY_FOLLOW_UP_MAP[category], FOLLOW_UP_WEIGHT)
+  }
+  return candidates
+}
+
+/**
+ * 메모리 상한 안에서 로드할 Worker 선택
+ *
+ * 가중치가 높은 후보부터 검토하고, 상한을 넘는 후보는 건너뛴 뒤 다음 후보를 계속 검토한다
+ * (무거운 Worker 3이 빠져도 가벼운 Worker 1은 로드).
+ */
+export function planWorkerPrefetch(input: PrefetchPlanInput): PrefetchPlan {
+  const loaded = new Set(input.loadedWorkers)
+  const installed = new Set([...loaded].flatMap((worker) => [...workerPackages(worker)]))
+
+  let estimatedMB = input.usedMB ?? [...installed].reduce(
+    (sum, pkg) => sum + packageHeapMB(pkg),
+    BASE_HEAP_MB + loaded.size * WORKER_MODULE_HEAP_MB
+  )
+
+  const plan: PrefetchPlan = { workers: [], packages: [], estimatedMB, skipped: [] }
+  const ordered = [...input.candidates].sort((a, b) => b.weight - a.weight)
+
+  for (const { worker } of ordered) {
+    if (loaded.has(worker) || plan.workers.includes(worker)) {
+      continue
+    }
+
+    const costMB = estimateWorkerCostMB(worker, installed)
+    if (estimatedMB + costMB > input.memoryCeilingMB) {
+      plan.skipped.push({ worker, costMB })
+      continue
+    }
+
+    for (const pkg of workerPackages(worker)) {
+      if (!installed.has(pkg)) {
+        installed.add(pkg)
+        plan.packages.push(pkg)
+      }
+    }
+    estimatedMB += costMB
+    plan.workers.push(worker)
+  }
+
+  plan.estimatedMB = estimatedMB
+  return plan
+}
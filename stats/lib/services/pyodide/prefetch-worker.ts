@@ -1,85 +1,94 @@
 /**
  * Pyodide Worker Prefetch
  *
- * 메서드 선택 시점에 해당 Worker의 추가 패키지를 미리 로드합니다.
- * 사용자가 변수 매핑(Step 3)하는 동안 패키지 로드가 완료되어
+ * 메서드 선택 시점에 다음에 필요할 Worker(패키지 + 모듈)를 미리 로드합니다.
+ * 사용자가 변수 매핑(Step 3)하는 동안 로드가 완료되어
  * 분석 실행 시 대기 시간을 줄입니다.
  *
- * - Worker 1: 추가 패키지 없음 (prefetch 불필요)
- * - Worker 2: statsmodels + pandas
- * - Worker 3: statsmodels + pandas + scikit-learn
- * - Worker 4: statsmodels + scikit-learn
- * - Worker 5: scikit-learn
+ * - 대상: 메서드 카테고리의 Worker + 결과 단계에서 이어지는 Worker (prefetch-planner.ts)
+ * - 메모리 상한(PYODIDE.PREFETCH.MEMORY_CEILING_MB)을 넘는 Worker는 건너뜀 → 분석 실행 시 로드
+ * - Worker 로드 안에서는 스크립트 fetch와 패키지 다운로드가 동시에 진행됨
  */
 
 import { PyodideCoreService } from './core/pyodide-core.service'
+import { planWorkerPrefetch, predictWorkers, type PrefetchPlan } from './prefetch-planner'
 import type { StatisticalMethod } from '@/types/analysis'
 import { getMethodByAlias } from '@/lib/constants/statistical-methods'
+import { PYODIDE } from '@/lib/constants'
 import { logger } from '@/lib/utils/logger'
 
-/**
- * StatisticalMethod.category → Worker 번호 매핑
- *
- * 실제 callWorkerMethod 호출 패턴 기반 (pyodide-core.service.ts 참조):
- * - Worker 1: descriptive, normality, outlier, cronbach, bonferroni
- * - Worker 2: t-test, chi-square, correlation, z-test, levene
- * - Worker 3: nonparametric, ANOVA, post-hoc
- * - Worker 4: regression, PCA, factor, cluster
- * - Worker 5: survival
- *
- * 일부 카테고리는 여러 Worker에 걸쳐 있으므로,
- * 추가 패키지가 필요한 가장 큰 Worker를 prefetch 합니다.
- */
-const CATEGORY_WORKER_MAP: Record<string, (1 | 2 | 3 | 4 | 5)[]> = {
-  'descriptive': [1],
-  't-test': [2],
-  'chi-square': [2],
-  'correlation': [2],       // Worker 2 (일반), partial은 Worker 2+statsmodels
-  'anova': [3],             // Worker 3 (one-way, two-way, repeated, ancova, manova)
-  'nonparametric': [3],     // Worker 3 (mann-whitney, wilcoxon, kruskal 등)
-  'regression': [4],        // Worker 4 (linear, multiple, logistic)
-  'multivariate': [4],      // Worker 4 (PCA, factor, cluster, discriminant)
-  'timeseries': [4],        // Worker 4 (ARIMA, seasonal, stationarity)
-  'survival': [5],          // Worker 5 (kaplan-meier, cox, roc)
-  'psychometrics': [1],     // Worker 1 (cronbach)
-  'design': [1],            // Worker 1
-  'other': [1],             // Worker 1
+export interface PrefetchOptions {
+  /** 추정 WASM 힙 상한 (MB), 기본 PYODIDE.PREFETCH.MEMORY_CEILING_MB */
+  memoryCeilingMB?: number
+  /** 후속 Worker(정규성/비모수 대안 등) 포함 여부, 기본 PYODIDE.PREFETCH.FOLLOW_UPS */
+  includeFollowUps?: boolean
 }
 
+// 진행 중인 prefetch (메서드를 빠르게 바꾸면 이전 계획의 남은 Worker는 건너뜀)
+let activePrefetchId = 0
+
 /**
- * 메서드 선택 시 해당 Worker의 추가 패키지를 백그라운드로 미리 로드
+ * 메서드 선택 시 다음에 필요할 Worker를 백그라운드로 미리 로드
  *
  * - 실패해도 무시 (callWorkerMethod 시점에 재시도됨)
  * - Pyodide가 초기화되지 않았으면 스킵
- * - Worker 1은 추가 패키지 없으므로 스킵
+ * - 계획 순서대로 하나씩 로드 (실제 분석 호출과 겹치면 진행 중인 로드를 공유)
+ *
+ * @returns 실행한 계획 (스킵 시 null)
  */
-export function prefetchWorkerForMethod(method: StatisticalMethod): void {
+export function prefetchWorkerForMethod(
+  method: StatisticalMethod,
+  options: PrefetchOptions = {}
+): PrefetchPlan | null {
   const coreService = PyodideCoreService.getInstance()
 
   // Pyodide가 아직 초기화되지 않았으면 prefetch 무의미
-  if (!coreService.isInitialized()) return
+  if (!coreService.isInitialized()) return null
 
   // Primary: method.category로 직접 조회.
   // Fallback: canonical entry category (category가 stale하거나 compat alias가 id에만 남은 경우 방어).
-  const canonicalCategory = getMethodByAlias(method.id)?.category
-  const workers =
-    CATEGORY_WORKER_MAP[method.category] ??
-    (canonicalCategory ? CATEGORY_WORKER_MAP[canonicalCategory] : undefined)
-  if (!workers) return
-
-  for (const workerNum of workers) {
-    // Worker 1은 추가 패키지 없음
-    if (workerNum === 1) continue
+  const includeFollowUps = options.includeFollowUps ?? PYODIDE.PREFETCH.FOLLOW_UPS
+  let candidates = predictWorkers(method.category, includeFollowUps)
+  if (candidates.length === 0) {
+    const canonicalCategory = getMethodByAlias(method.id)?.category
+    candidates = canonicalCategory ? predictWorkers(canonicalCategory, includeFollowUps) : []
+  }
+  if (candidates.length === 0) return null
 
-    logger.info(`[Prefetch] Worker ${workerNum} 패키지 미리 로드 시작`, {
+  const plan = planWorkerPrefetch({
+    candidates,
+    loadedWorkers: coreService.getLoadedWorkers(),
+    memoryCeilingMB: options.memoryCeilingMB ?? PYODIDE.PREFETCH.MEMORY_CEILING_MB
+  })
+  if (plan.skipped.length > 0) {
+    logger.info('[Prefetch] 메모리 상한으로 건너뜀', {
       methodId: method.id,
-      category: method.category
-    })
-
-    coreService.ensureWorkerLoaded(workerNum).catch((err: unknown) => {
-      // prefetch 실패는 치명적이지 않음 — 분석 실행 시 재시도됨
-      const message = err instanceof Error ? err.message : String(err)
-      logger.warn(`[Prefetch] Worker ${workerNum} prefetch 실패 (분석 시 재시도):`, message)
+      skipped: plan.skipped,
+      estimatedMB: plan.estimatedMB
     })
   }
+  if (plan.workers.length === 0) return plan
+
+  logger.info(`[Prefetch] Worker ${plan.workers.join(', ')} 미리 로드 시작`, {
+    methodId: method.id,
+    category: method.category,
+    packages: plan.packages,
+    estimatedMB: plan.estimatedMB
+  })
+
+  const prefetchId = ++activePrefetchId
+  void (async () => {
+    for (const workerNum of plan.workers) {
+      if (prefetchId !== activePrefetchId) return
+      try {
+        await coreService.ensureWorkerLoaded(workerNum)
+      } catch (err: unknown) {
+        // prefetch 실패는 치명적이지 않음 — 분석 실행 시 재시도됨
+        const message = err instanceof Error ? err.message : String(err)
+        logger.warn(`[Prefetch] Worker ${workerNum} prefetch 실패 (분석 시 재시도):`, message)
+      }
+    }
+  })()
+
+  return plan
 }
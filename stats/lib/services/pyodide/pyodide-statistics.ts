@@ -322,6 +322,73 @@ export class PyodideStatisticsService {
     return Generated.descriptiveStats(data)
   }
 
+  /**
+   * 여러 컬럼 기술통계 일괄 계산 (컬럼마다 descriptiveStats를 호출하는 대신 1회 호출)
+   * @param columns 컬럼명 → 숫자 배열 (결측은 null/NaN)
+   * @param confidenceLevel 신뢰수준 (기본 0.95)
+   * @returns 통계량별 컬럼 순서 배열 (계산 불가 값은 null)
+   */
+  async descriptiveStatsTable(
+    columns: Record<string, number[]>,
+    confidenceLevel?: number
+  ): Promise<Generated.DescriptiveStatsTableResult> {
+    return Generated.descriptiveStatsTable(columns, confidenceLevel)
+  }
+
+  /**
+   * 스트리밍 기술통계: 청크 하나를 스케치 상태에 반영
+   * @param chunk 청크 값 (결측은 null/NaN)
+   * @param state 이전 상태 (첫 청크는 null)
+   * @param k 분위수 스케치 크기 (새 스케치일 때만 사용)
+   * @returns 다음 호출에 넘길 새 상태 (append 시에도 보관해 두었다가 이어서 사용)
+   */
+  async descriptiveSketchUpdate(
+    chunk: number[],
+    state: Generated.DescriptiveSketchUpdateResult | null = null,
+    k?: number
+  ): Promise<Generated.DescriptiveSketchUpdateResult> {
+    return Generated.descriptiveSketchUpdate(chunk, state, k)
+  }
+
+  /**
+   * 스트리밍 기술통계: 샤드별(병렬 Worker) 상태 병합
+   */
+  async descriptiveSketchMerge(
+    states: Array<Generated.DescriptiveSketchUpdateResult | null>
+  ): Promise<Generated.DescriptiveSketchMergeResult> {
+    return Generated.descriptiveSketchMerge(states)
+  }
+
+  /**
+   * 스트리밍 기술통계: 상태 → 요약 (exact=false이면 사분위수는 근사값)
+   */
+  async descriptiveSketchFinalize(
+    state: Generated.DescriptiveSketchUpdateResult,
+    confidenceLevel?: number
+  ): Promise<Generated.DescriptiveSketchFinalizeResult> {
+    return Generated.descriptiveSketchFinalize(state, confidenceLevel)
+  }
+
+  /**
+   * 청크 단위 입력(대용량 CSV 파싱 등)의 기술통계
+   * 전체 배열을 메모리에 올리지 않고 청크마다 스케치 상태만 갱신한다.
+   * @param chunks 숫자 청크 (동기/비동기 이터러블)
+   * @param confidenceLevel 신뢰수준 (기본 0.95)
+   */
+  async descriptiveStatsStreaming(
+    chunks: Iterable<number[]> | AsyncIterable<number[]>,
+    confidenceLevel?: number
+  ): Promise<Generated.DescriptiveSketchFinalizeResult> {
+    let state: Generated.DescriptiveSketchUpdateResult | null = null
+    for await (const chunk of chunks) {
+      state = await this.descriptiveSketchUpdate(chunk, state)
+    }
+    if (!state) {
+      throw new Error('No valid data')
+    }
+    return this.descriptiveSketchFinalize(state, confidenceLevel)
+  }
+
   /**
    * 집단별 평균 플롯 데이터 생성 (Worker 1 means_plot_data)
    * @param data 원시 행 데이터 (List[Dict])
@@ -368,16 +435,26 @@ export class PyodideStatisticsService {
 
   /**
    * 빈도분석 (Frequency Analysis)
+   * topK 지정 시 상위 k개 범주(빈도 내림차순) + 나머지를 합친 otherLabel 행
    */
-  async frequencyAnalysis(values: (string | number)[]): Promise<Generated.FrequencyAnalysisResult> {
-    return Generated.frequencyAnalysis(values)
+  async frequencyAnalysis(
+    values: (string | number)[],
+    topK?: number,
+    otherLabel?: string
+  ): Promise<Generated.FrequencyAnalysisResult> {
+    return Generated.frequencyAnalysis(values, topK, otherLabel)
   }
 
   /**
    * 교차표 분석 (Crosstab Analysis)
+   * sparse=true면 0이 아닌 칸만 담은 observedSparse 반환 (chiSquareIndependenceTest에 그대로 전달 가능)
    */
-  async crosstabAnalysis(rowValues: (string | number)[], colValues: (string | number)[]): Promise<Generated.CrosstabAnalysisResult> {
-    return Generated.crosstabAnalysis(rowValues, colValues)
+  async crosstabAnalysis(
+    rowValues: (string | number)[],
+    colValues: (string | number)[],
+    sparse: boolean = false
+  ): Promise<Generated.CrosstabAnalysisResult> {
+    return Generated.crosstabAnalysis(rowValues, colValues, sparse)
   }
 
   /**
@@ -697,6 +774,31 @@ export class PyodideStatisticsService {
     return result
   }
 
+  /**
+   * 계절 Mann-Kendall 추세 검정 - Worker 1 사용
+   * Python seasonal_mann_kendall_test(data, seasonalPeriods)
+   */
+  async seasonalMannKendallTest(
+    data: number[],
+    seasonalPeriods = 12
+  ): Promise<Generated.SeasonalMannKendallTestResult> {
+    const result = await Generated.seasonalMannKendallTest(data, seasonalPeriods)
+    assertWorkerResultFields(result, ['tau', 'pValue', 'trend', 'senSlope'], 'seasonal_mann_kendall_test')
+    return result
+  }
+
+  /**
+   * 지역(다지점) Mann-Kendall 추세 검정 - Worker 1 사용
+   * Python regional_mann_kendall_test(series)
+   */
+  async regionalMannKendallTest(
+    series: Record<string, number[]> | number[][]
+  ): Promise<Generated.RegionalMannKendallTestResult> {
+    const result = await Generated.regionalMannKendallTest(series)
+    assertWorkerResultFields(result, ['tau', 'pValue', 'trend', 'senSlope', 'stations'], 'regional_mann_kendall_test')
+    return result
+  }
+
   // ========== Wrapper 메서드들 (StatisticalCalculator와의 호환성) ==========
 
   /**
@@ -1390,7 +1492,7 @@ export class PyodideStatisticsService {
    * 카이제곱 독립성 검정 (Chi-Square Test of Independence)
    */
   async chiSquareIndependenceTest(
-    observedMatrix: number[][],
+    observedMatrix: number[][] | NonNullable<Generated.CrosstabAnalysisResult['observedSparse']>,
     yatesCorrection: boolean = false,
     alpha: number = 0.05
   ): Promise<Generated.ChiSquareIndependenceTestResult> {
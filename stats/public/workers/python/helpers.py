@@ -4,10 +4,46 @@ Python Worker Helper Functions
 공통 데이터 정제 함수 모음
 - 반복되는 NaN/None 제거 로직을 1개 함수로 통합
 - 4개 Worker에서 30+회 반복되던 코드를 Helper로 대체
+- 숫자/typed buffer 입력은 NumPy 벡터화 경로로 처리 (요소별 루프는 혼합 입력 전용)
 """
 
+import itertools
+import math
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
 import numpy as np
-from typing import List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+# ============================================================================
+# 내부: 벡터화 변환
+# ============================================================================
+
+def _as_float_array(data, ndim: int) -> Optional[np.ndarray]:
+    """
+    입력을 한 번에 float64 배열로 변환 (fast path)
+
+    숫자 리스트, None 섞인 숫자 리스트(None → NaN), ndarray, memoryview
+    (Pyodide typed buffer) 등은 np.asarray 한 번으로 변환된다.
+    변환 불가(비숫자 문자열, ragged 행 등)하거나 차원이 다르면 None을 반환하여
+    호출부가 요소별 변환 경로로 폴백하도록 한다.
+
+    Args:
+        data: 원본 데이터
+        ndim: 기대 차원 (1: 벡터, 2: 행렬)
+
+    Returns:
+        float64 배열 또는 None
+    """
+    try:
+        arr = np.asarray(data, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != ndim:
+        return None
+    return arr
 
 # ============================================================================
 # 단일 배열 정제
@@ -27,6 +63,15 @@ def clean_array(data: List[Union[float, int, None]]) -> np.ndarray:
         >>> clean_array([1, 2, None, 3, np.nan, 4])
         array([1., 2., 3., 4.])
     """
+    cached = _cached_clean(data)
+    if cached is not None:
+        return cached.copy()
+
+    arr = _as_float_array(data, 1)
+    if arr is not None:
+        return arr[_finite_mask(arr)]
+
+    # 폴백: 문자열/None 혼합 리스트 → 요소별 변환
     result = []
     for x in data:
         # Skip None
@@ -77,6 +122,13 @@ def clean_paired_arrays(
     if len(array1) != len(array2):
         raise ValueError(f"Arrays must have same length: {len(array1)} != {len(array2)}")
 
+    arr1 = _as_float_array(array1, 1)
+    arr2 = _as_float_array(array2, 1) if arr1 is not None else None
+    if arr1 is not None and arr2 is not None:
+        mask = _finite_mask(arr1) & _finite_mask(arr2)
+        return arr1[mask], arr2[mask]
+
+    # 폴백: 문자열/None 혼합 리스트 → 요소별 변환
     clean1 = []
     clean2 = []
 
@@ -128,6 +180,142 @@ def clean_groups(groups: List[List[Union[float, int, None]]]) -> List[np.ndarray
     return [clean_array(group) for group in groups]
 
 
+# ============================================================================
+# 여러 컬럼 → NaN 패딩 행렬 (컬럼별 통계 일괄 계산용)
+# ============================================================================
+
+def column_matrix(columns: Any) -> Tuple[List[str], np.ndarray]:
+    """
+    여러 컬럼을 (최대 길이 × 컬럼 수) float64 행렬 하나로 합침
+
+    무효값(None/NaN/Inf/비숫자)과 짧은 컬럼의 남는 칸은 NaN으로 채운다.
+    컬럼 사이의 행 대응은 보장하지 않으므로 (비숫자 문자열이 섞인 컬럼은
+    clean_array 결과를 앞에서부터 채움) 컬럼별 통계에만 사용한다.
+
+    Args:
+        columns: {컬럼명: 값 배열} 또는 값 배열 리스트 (이름은 "0", "1", ...)
+
+    Returns:
+        (컬럼명 리스트, NaN 패딩 행렬)
+
+    Examples:
+        >>> column_matrix({'a': [1, None, 3], 'b': [4]})
+        (['a', 'b'], array([[ 1.,  4.], [nan, nan], [ 3., nan]]))
+    """
+    if hasattr(columns, 'to_py'):
+        columns = columns.to_py()
+    if isinstance(columns, dict):
+        names = [str(name) for name in columns]
+        values = list(columns.values())
+    else:
+        values = list(columns)
+        names = [str(i) for i in range(len(values))]
+
+    arrays = []
+    for column in values:
+        arr = _as_float_array(column, 1)
+        if arr is None:
+            arr = clean_array(column)
+        else:
+            arr = np.where(_finite_mask(arr), arr, np.nan)
+        arrays.append(arr)
+
+    matrix = np.full((max((arr.size for arr in arrays), default=0), len(arrays)), np.nan)
+    for j, arr in enumerate(arrays):
+        matrix[:arr.size, j] = arr
+    return names, matrix
+
+
+# ============================================================================
+# 범주 코드화 + 분할표 (교차분석/카이제곱 공용)
+# ============================================================================
+
+def encode_categories(values: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    범주형 값을 (정렬된 고유 범주, 정수 코드)로 변환
+
+    np.unique(return_inverse=True) 한 번으로 끝나므로 범주 수와 무관하게
+    O(n log n). 코드는 범주 배열의 인덱스이다.
+
+    Examples:
+        >>> encode_categories(['b', 'a', 'b'])
+        (array(['a', 'b'], dtype='<U1'), array([1, 0, 1]))
+    """
+    if hasattr(values, 'to_py'):
+        values = values.to_py()
+    categories, codes = np.unique(np.asarray(values), return_inverse=True)
+    return categories, codes.ravel().astype(np.intp, copy=False)
+
+
+def contingency_counts(
+    row_codes: np.ndarray,
+    col_codes: np.ndarray,
+    shape: Tuple[int, int],
+    sparse: bool = False
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    행/열 코드 쌍을 분할표 도수로 집계 (결합 코드 row * C + col 에 bincount 1회)
+
+    Args:
+        row_codes, col_codes: encode_categories 코드 (같은 길이)
+        shape: (행 범주 수, 열 범주 수)
+        sparse: True면 0이 아닌 칸만 COO (rowIndex, colIndex, counts)로 반환.
+            R×C가 관측 수보다 훨씬 크면 bincount 대신 결합 코드 np.unique로
+            집계하여 (R×C) 배열을 만들지 않는다.
+
+    Returns:
+        dense: (R, C) int64 행렬 / sparse: (rowIndex, colIndex, counts)
+    """
+    n_rows, n_cols = int(shape[0]), int(shape[1])
+    cells = n_rows * n_cols
+    combined = row_codes.astype(np.int64) * n_cols + col_codes
+    if not sparse:
+        return np.bincount(combined, minlength=cells).reshape(n_rows, n_cols)
+
+    if cells <= max(combined.size, 1 << 16):
+        flat = np.bincount(combined, minlength=cells)
+        keys = np.flatnonzero(flat)
+        counts = flat[keys]
+    else:
+        keys, counts = np.unique(combined, return_counts=True)
+    return keys // n_cols, keys % n_cols, counts.astype(np.int64, copy=False)
+
+
+def parse_sparse_table(table: Any) -> Tuple[Tuple[int, int], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    COO 분할표 {'shape': [R, C], 'rowIndex', 'colIndex', 'counts'} 검증
+
+    같은 칸이 여러 번 나오면 합산한다 (crosstab_analysis 출력은 칸당 1개).
+
+    Returns:
+        ((R, C), rowIndex, colIndex, counts) - 칸 중복 제거, 0 도수 칸 제외
+    """
+    if hasattr(table, 'to_py'):
+        table = table.to_py()
+    try:
+        n_rows, n_cols = (int(v) for v in table['shape'])
+        rows = np.asarray(table['rowIndex'], dtype=np.int64).ravel()
+        cols = np.asarray(table['colIndex'], dtype=np.int64).ravel()
+        counts = np.asarray(table['counts'], dtype=float).ravel()
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Sparse table requires 'shape', 'rowIndex', 'colIndex' and 'counts'") from e
+
+    if n_rows < 1 or n_cols < 1:
+        raise ValueError(f"Invalid sparse table shape: ({n_rows}, {n_cols})")
+    if not (rows.size == cols.size == counts.size):
+        raise ValueError("rowIndex, colIndex and counts must have the same length")
+    if rows.size and (rows.min() < 0 or rows.max() >= n_rows or cols.min() < 0 or cols.max() >= n_cols):
+        raise ValueError("Sparse table index out of range")
+    if not np.all(np.isfinite(counts)) or np.any(counts < 0):
+        raise ValueError("Sparse table counts must be finite and non-negative")
+
+    keys, inverse = np.unique(rows * n_cols + cols, return_inverse=True)
+    summed = np.bincount(inverse.ravel(), weights=counts, minlength=keys.size)
+    nonzero = summed > 0
+    keys = keys[nonzero]
+    return (n_rows, n_cols), keys // n_cols, keys % n_cols, summed[nonzero]
+
+
 # ============================================================================
 # X-Y 쌍 정제 (회귀분석용)
 # ============================================================================
@@ -185,6 +373,16 @@ def clean_multiple_regression(
     if len(X_matrix) != len(y_data):
         raise ValueError(f"X and y must have same number of samples: {len(X_matrix)} != {len(y_data)}")
 
+    X_arr = _as_float_array(X_matrix, 2)
+    y_arr = _as_float_array(y_data, 1) if X_arr is not None else None
+    if X_arr is not None and y_arr is not None:
+        mask = np.isfinite(y_arr) & np.isfinite(X_arr).all(axis=1)
+        if not mask.any():
+            # 요소별 경로와 동일하게 빈 1차원 배열 반환
+            return np.array([]), np.array([])
+        return X_arr[mask], y_arr[mask]
+
+    # 폴백: 문자열/None 혼합 리스트 → 요소별 변환
     clean_X = []
     clean_y = []
 
@@ -259,3 +457,1557 @@ def is_valid_number(value: Union[float, int, None]) -> bool:
         return not (np.isnan(value_float) or np.isinf(value_float))
     except (TypeError, ValueError):
         return False
+
+
+# ============================================================================
+# Bridge: typed buffer 파라미터 디코딩 + 고정 호출 진입점
+# ============================================================================
+
+def array_params(*names: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    NumPy 배열 입력을 받는 Worker 파라미터 표시 데코레이터
+
+    typed buffer로 전송된 파라미터는 기본적으로 list로 복원된다 (Worker 함수의
+    `if not x`, `.append` 등 리스트 관용구 보호). 표시한 파라미터만 NumPy 배열
+    그대로 받으며, 함수가 clean_array 등 배열 안전 경로로만 사용해야 한다.
+
+    Examples:
+        >>> @array_params('data')
+        ... def descriptive_stats(data, confidenceLevel=0.95): ...
+    """
+    def mark(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.__array_params__ = frozenset(names)
+        return func
+    return mark
+
+
+def _decode_buffer(value, as_array: bool = False):
+    """
+    typed buffer 하나를 list(기본) 또는 NumPy 배열로 변환 (그 외 값은 그대로 반환)
+
+    - memoryview: pyodide.toPy가 Float64Array/Int32Array를 변환한 결과
+    - JsProxy buffer: toPy가 변환하지 않은 typed array (to_memoryview 보유)
+    - int32 버퍼는 int64로 승격 (제곱합 등에서 오버플로 방지), list면 Python int
+    """
+    if isinstance(value, memoryview):
+        arr = np.asarray(value)
+    elif hasattr(value, 'to_memoryview'):
+        arr = np.asarray(value.to_memoryview())
+    else:
+        return value
+
+    if arr.dtype.kind in 'iu':
+        arr = arr.astype(np.int64)
+    return arr if as_array else arr.tolist()
+
+
+def decode_buffer_params(params: Dict[str, Any], array_names: frozenset = frozenset()) -> Dict[str, Any]:
+    """
+    Worker 메서드 파라미터의 typed buffer를 원래 형태로 복원
+
+    최상위 값과 리스트 1단계(예: groups의 각 그룹)까지 변환한다.
+    array_names(@array_params 표시)의 파라미터만 NumPy 배열, 나머지는 list.
+
+    Args:
+        params: pyodide.toPy로 변환된 파라미터 dict
+        array_names: NumPy 배열로 받을 파라미터명
+
+    Returns:
+        typed buffer가 list/NumPy 배열로 바뀐 새 dict
+    """
+    decoded = {}
+    for key, value in params.items():
+        as_array = key in array_names
+        if isinstance(value, list):
+            decoded[key] = [_decode_buffer(item, as_array) for item in value]
+        else:
+            decoded[key] = _decode_buffer(value, as_array)
+    return decoded
+
+
+# 결과 envelope: 이 길이 이상의 숫자 배열은 JSON 대신 packed float64 버퍼로 전송
+RESULT_BUFFER_MIN_LENGTH = 1024
+
+
+def _is_plain_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numeric_block(value) -> Optional[np.ndarray]:
+    """
+    숫자 리스트(1D) 또는 동일 길이 숫자 리스트의 리스트(2D)를 float64 배열로 변환
+
+    bool/None/문자열/비유한값이 섞여 있거나 크기가 임계값 미만이면 None
+    """
+    if not value:
+        return None
+
+    first = value[0]
+    if isinstance(first, (list, tuple)):
+        width = len(first)
+        if width == 0 or len(value) * width < RESULT_BUFFER_MIN_LENGTH:
+            return None
+        for row in value:
+            if not isinstance(row, (list, tuple)) or len(row) != width:
+                return None
+            if not all(_is_plain_number(v) for v in row):
+                return None
+    else:
+        if len(value) < RESULT_BUFFER_MIN_LENGTH:
+            return None
+        if not all(_is_plain_number(v) for v in value):
+            return None
+
+    arr = np.array(value, dtype=float)
+    if not np.isfinite(arr).all():
+        return None
+    return arr
+
+
+def _record_columns(value) -> Optional[Dict[str, np.ndarray]]:
+    """
+    동일 키를 가진 숫자 레코드 리스트(예: rocPoints [{fpr, tpr}])를 열 배열로 변환
+    """
+    if len(value) < RESULT_BUFFER_MIN_LENGTH or not isinstance(value[0], dict):
+        return None
+
+    keys = list(value[0].keys())
+    if not keys:
+        return None
+    for record in value:
+        if not isinstance(record, dict) or list(record.keys()) != keys:
+            return None
+        if not all(_is_plain_number(record[k]) for k in keys):
+            return None
+
+    columns = {k: np.array([record[k] for record in value], dtype=float) for k in keys}
+    if not all(np.isfinite(col).all() for col in columns.values()):
+        return None
+    return columns
+
+
+def encode_result_envelope(result: Any) -> Tuple[str, np.ndarray]:
+    """
+    결과를 JSON 메타데이터 + packed float64 버퍼로 분리
+
+    대용량 숫자 배열(residuals, individualK, distanceMatrix 등)과 숫자 레코드
+    리스트(rocPoints)는 하나의 float64 버퍼에 이어 붙이고, JSON에는 위치만 남긴다.
+    - 배열: {"__buffer__": [offset, length], "shape": [...]}
+    - 레코드: {"__records__": {key: [offset, length], ...}, "length": n}
+    작은 배열/스칼라는 그대로 JSON에 남는다.
+    TS 쪽 decodeResultEnvelope가 원래 구조(number[], 객체 배열)로 복원한다.
+
+    Args:
+        result: Worker 함수 반환값 (JSON 직렬화 가능 구조)
+
+    Returns:
+        (메타데이터 JSON 문자열, packed float64 배열)
+    """
+    import json
+
+    chunks: List[np.ndarray] = []
+    offset = 0
+
+    def _push(arr: np.ndarray) -> List[int]:
+        nonlocal offset
+        flat = arr.ravel()
+        chunks.append(flat)
+        span = [offset, int(flat.size)]
+        offset += int(flat.size)
+        return span
+
+    def _walk(value):
+        if isinstance(value, dict):
+            return {k: _walk(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            block = _numeric_block(value)
+            if block is not None:
+                return {'__buffer__': _push(block), 'shape': list(block.shape)}
+            columns = _record_columns(value)
+            if columns is not None:
+                return {
+                    '__records__': {k: _push(col) for k, col in columns.items()},
+                    'length': len(value),
+                }
+            return [_walk(v) for v in value]
+        return value
+
+    meta = json.dumps(_walk(result))
+    packed = np.concatenate(chunks) if chunks else np.empty(0, dtype=float)
+    return meta, packed
+
+
+# ============================================================================
+# Bridge: Worker 모듈(worker1 ~ worker10) + 함수 테이블 + 상주 dispatcher
+# ============================================================================
+
+# worker_num → {method: (func, 허용 파라미터명 | None(**kwargs), 필수 파라미터명)}
+_WORKER_DISPATCH: Dict[int, Dict[str, Tuple[Callable[..., Any], Optional[frozenset], frozenset]]] = {}
+
+# worker_num → 마지막 로드/호출 시각 (time.monotonic)
+_WORKER_LAST_USED: Dict[int, float] = {}
+
+
+def worker_module_name(worker_num: int) -> str:
+    """Worker 모듈명 (sys.modules 키): worker3 등"""
+    return f'worker{worker_num}'
+
+
+def register_worker_functions(worker_num: int, functions: Dict[str, Callable[..., Any]]) -> List[str]:
+    """
+    Worker 함수 테이블 등록 (시그니처는 등록 시 한 번만 분석)
+
+    Args:
+        worker_num: Worker 번호
+        functions: {함수명: 함수} (public 함수만)
+
+    Returns:
+        등록된 함수명 목록 (정렬)
+    """
+    import inspect
+
+    table = _WORKER_DISPATCH.setdefault(worker_num, {})
+    for name, func in functions.items():
+        accepted: Optional[frozenset] = frozenset()
+        required = frozenset()
+        try:
+            parameters = inspect.signature(func).parameters.values()
+        except (TypeError, ValueError):
+            parameters = None
+
+        if parameters is None or any(p.kind == p.VAR_KEYWORD for p in parameters):
+            accepted = None
+        else:
+            keyword_params = [
+                p for p in parameters
+                if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            ]
+            accepted = frozenset(p.name for p in keyword_params)
+            required = frozenset(p.name for p in keyword_params if p.default is p.empty)
+
+        table[name] = (func, accepted, required)
+
+    return sorted(table)
+
+
+async def load_worker_module(worker_num: int, path: str) -> List[str]:
+    """
+    Worker 파일을 독립 모듈(worker{N})로 로드하고 dispatch 테이블 구성
+
+    - importlib spec으로 모듈을 만들어 sys.modules에 등록 (Worker 간 전역 이름 충돌 없음)
+    - top-level await(worker6의 micropip 설치)를 허용하므로 모듈 본문을
+      PyCF_ALLOW_TOP_LEVEL_AWAIT로 컴파일해 모듈 네임스페이스에서 실행한다
+    - 이 모듈에서 정의된 public 함수만 등록 (import 함수, _private 함수 제외)
+
+    Args:
+        worker_num: Worker 번호
+        path: Pyodide FS 상의 Worker 파일 경로 (예: /home/pyodide/worker3.py,
+            사전 컴파일 번들이면 /home/pyodide/bundle/worker3.pyc)
+
+    Returns:
+        등록된 함수명 목록
+
+    Raises:
+        ImportError: 모듈 spec 생성 실패
+    """
+    import ast
+    import importlib
+    import importlib.util
+    import inspect
+    import sys
+    import time
+    import types
+
+    name = worker_module_name(worker_num)
+    importlib.invalidate_caches()
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Failed to create module spec for {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        if path.endswith('.pyc'):
+            code = load_compiled_code(path)
+        else:
+            with open(path, encoding='utf-8') as f:
+                source = f.read()
+            code = compile(source, path, 'exec', flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+        pending = eval(code, module.__dict__)
+        if inspect.iscoroutine(pending):
+            await pending
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+
+    functions = {
+        attr: value for attr, value in vars(module).items()
+        if not attr.startswith('_')
+        and isinstance(value, types.FunctionType)
+        and value.__module__ == name
+    }
+    _WORKER_DISPATCH.pop(worker_num, None)
+    _WORKER_LAST_USED[worker_num] = time.monotonic()
+    return register_worker_functions(worker_num, functions)
+
+
+def load_compiled_code(path: str):
+    """
+    사전 컴파일 Worker 번들의 .pyc에서 code 객체 로드 (소스 컴파일 생략)
+
+    scripts/build/worker_bundle.py가 PEP 552 형식(magic + flags + source hash + marshal)으로
+    PyCF_ALLOW_TOP_LEVEL_AWAIT 컴파일한 code 객체를 기록한다.
+
+    Raises:
+        ImportError: 현재 인터프리터와 bytecode 버전(magic number)이 다른 경우
+    """
+    import importlib.util
+    import marshal
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != importlib.util.MAGIC_NUMBER:
+        raise ImportError(f"{path}: bytecode magic mismatch (rebuild the worker bundle)")
+    return marshal.loads(data[16:])
+
+
+def unload_worker_module(worker_num: int) -> bool:
+    """
+    Worker 모듈을 sys.modules와 dispatch 테이블에서 제거하고 GC 실행
+
+    모듈 전역(대형 상수 테이블, 캐시 등)을 해제하여 WASM 힙을 회수한다.
+    다시 필요하면 load_worker_module로 재로드한다.
+
+    Args:
+        worker_num: Worker 번호
+
+    Returns:
+        실제로 로드되어 있었으면 True
+    """
+    import gc
+
+    if not _drop_worker_module(worker_num):
+        return False
+    gc.collect()
+    return True
+
+
+def _drop_worker_module(worker_num: int) -> bool:
+    """unload_worker_module 본체 (GC 제외): 모듈 캐시 비우기 → sys.modules/테이블/결과 캐시에서 제거"""
+    import sys
+
+    module = sys.modules.pop(worker_module_name(worker_num), None)
+    _WORKER_DISPATCH.pop(worker_num, None)
+    _WORKER_LAST_USED.pop(worker_num, None)
+    _WORKER_RESIDENT_BYTES.pop(worker_num, None)
+    clear_result_cache(worker_num)
+    if module is None:
+        return False
+
+    # 함수 객체가 외부(PyProxy 등)에 남아 모듈 전역이 살아 있어도 캐시는 해제
+    clear_module_caches(module)
+    return True
+
+
+def unload_idle_workers(max_idle_seconds: float) -> List[int]:
+    """
+    max_idle_seconds 이상 호출되지 않은 Worker 모듈 일괄 해제
+
+    Args:
+        max_idle_seconds: 유휴 기준 (초)
+
+    Returns:
+        해제된 Worker 번호 목록 (정렬)
+    """
+    import gc
+    import time
+
+    now = time.monotonic()
+    idle = sorted(
+        worker_num for worker_num, last_used in _WORKER_LAST_USED.items()
+        if now - last_used >= max_idle_seconds
+    )
+    for worker_num in idle:
+        _drop_worker_module(worker_num)
+    if idle:
+        gc.collect()
+    return idle
+
+
+def dispatch(worker_num: int, method: str, params: Any, memoize: bool = False) -> Tuple[str, np.ndarray]:
+    """
+    상주 dispatcher: 함수 테이블 조회 → 파라미터명 검증 → 호출 → 결과 envelope
+
+    호출마다 Python 소스를 생성/컴파일하지 않으며, JS에서 PyProxy로 직접 호출한다.
+
+    Args:
+        worker_num: Worker 번호
+        method: Worker 함수명 (snake_case)
+        params: 파라미터 dict (JsProxy이면 to_py로 변환, typed buffer 포함 가능)
+        memoize: True면 결과 캐시 사용 (메서드명 + 입력 내용 해시 키, 바이트 예산 LRU,
+            취소 등으로 mark_result_uncacheable이 호출된 결과는 저장하지 않음)
+
+    params['_profile']가 True(또는 'memory')면 구간 계측 후 결과에 _perf 블록을 붙인다
+    (_profiled_call 참고).
+
+    Returns:
+        encode_result_envelope(result): (메타데이터 JSON, packed float64 버퍼)
+
+    Raises:
+        AttributeError: 해당 Worker에 함수가 등록되지 않은 경우
+        TypeError: 알 수 없는 파라미터 또는 필수 파라미터 누락
+    """
+    if not memoize:
+        return encode_result_envelope(_invoke(worker_num, method, params))
+
+    if hasattr(params, 'to_py'):
+        params = params.to_py()
+
+    # 계측 호출(_profile)은 매번 실제로 실행해야 하므로 캐시 미사용
+    key = None if params.get('_profile') else _result_cache_key(worker_num, method, params)
+    if key is None:
+        return encode_result_envelope(_invoke(worker_num, method, params))
+
+    cached = _RESULT_CACHE.get(key)
+    if cached is not None:
+        import time
+
+        _RESULT_CACHE.move_to_end(key)
+        _RESULT_CACHE_STATS['hits'] += 1
+        _WORKER_LAST_USED[worker_num] = time.monotonic()
+        return cached
+
+    global _result_uncacheable
+    _RESULT_CACHE_STATS['misses'] += 1
+    _result_uncacheable = False
+    envelope = encode_result_envelope(_invoke(worker_num, method, params))
+    # 취소된 부분 결과(cancelled, stoppingRule 'cancelled' 등)는 저장하지 않음
+    if not _result_uncacheable:
+        _result_cache_put(key, envelope)
+    return envelope
+
+
+def _invoke(worker_num: int, method: str, params: Any, shared: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    dispatch/dispatch_batch 공통: 함수 테이블 조회 → 파라미터명 검증 → 참조 치환 → 호출
+
+    파라미터 값의 {"__shared__": name}(배치 공유 배열)과
+    {"datasetId": id, "column": name}(등록 데이터셋) 참조를 실제 값으로 바꾼 뒤 호출한다.
+    """
+    import time
+
+    entry = _WORKER_DISPATCH.get(worker_num, {}).get(method)
+    if entry is None:
+        raise AttributeError(f"Worker{worker_num} method not found: {method}")
+    _WORKER_LAST_USED[worker_num] = time.monotonic()
+
+    if hasattr(params, 'to_py'):
+        params = params.to_py()
+
+    # _profile: 호출 제어 파라미터 (Worker 함수에 전달하지 않음)
+    profile = None
+    if '_profile' in params:
+        params = dict(params)
+        profile = params.pop('_profile')
+
+    func, accepted, required = entry
+    names = params.keys()
+    if accepted is not None:
+        unknown = names - accepted
+        if unknown:
+            raise TypeError(f"{method}() got unexpected parameter(s): {', '.join(sorted(unknown))}")
+    missing = required - names
+    if missing:
+        raise TypeError(f"{method}() missing required parameter(s): {', '.join(sorted(missing))}")
+
+    array_names = getattr(func, '__array_params__', frozenset())
+    kwargs = decode_buffer_params(_resolve_refs(params, shared or {}, array_names), array_names)
+    if profile:
+        return _profiled_call(method, func, kwargs, profile)
+    return func(**kwargs)
+
+
+# ============================================================================
+# Bridge: 배치 호출 (공유 입력 배열 1회 전송/정제)
+# ============================================================================
+
+# dispatch_batch 실행 중 공유 배열 정제 결과 캐시: id(원본) → [원본, 정제 결과 | None]
+_SHARED_CLEAN_CACHE: Optional[Dict[int, list]] = None
+
+
+def _cached_clean(data) -> Optional[np.ndarray]:
+    """배치 공유 배열이면 clean_array 결과 캐시 항목 반환 (그 외 None)"""
+    if _SHARED_CLEAN_CACHE is None or not isinstance(data, np.ndarray) or data.ndim != 1:
+        return None
+    entry = _SHARED_CLEAN_CACHE.get(id(data))
+    if entry is None or entry[0] is not data:
+        return None
+    if entry[1] is None:
+        entry[1] = data[_finite_mask(data)] if data.dtype.kind == 'f' else data.astype(float)
+    return entry[1]
+
+
+def _decode_shared_array(value):
+    """공유 배열 1회 변환: typed buffer/숫자 리스트 → NumPy (문자열 등은 그대로)"""
+    decoded = _decode_buffer(value, as_array=True)
+    if isinstance(decoded, np.ndarray):
+        return decoded
+    if isinstance(decoded, list):
+        arr = _as_float_array(decoded, 1)
+        if arr is not None:
+            return arr
+    return decoded
+
+
+def dispatch_batch(jobs: Any, shared: Any = None) -> Tuple[str, np.ndarray]:
+    """
+    여러 Worker 메서드를 한 번의 호출로 실행 (결과 envelope 1개)
+
+    - shared: {name: 배열} 공유 입력. 한 번만 NumPy로 변환하고,
+      배치 안에서 clean_array 결과도 한 번만 계산한다 (호출마다 복사본 반환)
+    - 공유 배열은 작업 간에 격리된다: @array_params 파라미터는 읽기 전용 배열,
+      그 외 파라미터는 작업마다 새 list를 받는다 (제자리 수정이 다음 작업에 번지지 않음)
+    - jobs: [{"worker": n, "method": name, "params": {...}}]
+      params 값(및 리스트 1단계)에 {"__shared__": name}으로 공유 배열 참조
+    - 한 작업이 실패해도 나머지는 계속 실행
+
+    Args:
+        jobs: 작업 목록 (JsProxy이면 to_py로 변환)
+        shared: 공유 입력 배열 dict (typed buffer 포함 가능)
+
+    Returns:
+        encode_result_envelope([{"ok": True, "result": ...} | {"ok": False, "error": "..."}])
+    """
+    global _SHARED_CLEAN_CACHE
+
+    if hasattr(jobs, 'to_py'):
+        jobs = jobs.to_py()
+    if hasattr(shared, 'to_py'):
+        shared = shared.to_py()
+
+    # name → (전송된 원본, 읽기 전용 NumPy 배열 | None)
+    entries = {}
+    for name, value in (shared or {}).items():
+        arr = _decode_shared_array(value)
+        if isinstance(arr, np.ndarray):
+            arr.flags.writeable = False
+        else:
+            arr = None
+        entries[name] = (value, arr)
+    _SHARED_CLEAN_CACHE = {
+        id(arr): [arr, None] for _, arr in entries.values() if arr is not None
+    }
+
+    results: List[Dict[str, Any]] = []
+    try:
+        for job in jobs:
+            try:
+                result = _invoke(int(job['worker']), job['method'], job.get('params') or {}, entries)
+                results.append({'ok': True, 'result': result})
+            except Exception as e:
+                results.append({'ok': False, 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        _SHARED_CLEAN_CACHE = None
+
+    return encode_result_envelope(results)
+
+
+# ============================================================================
+# Bridge: 상주 데이터셋 (한 번 등록 → 컬럼 참조로 분석)
+# ============================================================================
+
+# dataset_id → {컬럼명: NumPy 배열(숫자) | list(문자열 등)}
+_DATASETS: Dict[str, Dict[str, Any]] = {}
+
+# id(float 컬럼 배열) → (배열, np.isfinite 마스크): 등록 시 1회 계산
+_COLUMN_MASKS: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+_DATASET_REF_KEYS = frozenset({'datasetId', 'column', 'columns'})
+
+# dataset_id → 등록 일련번호 (같은 id 재등록 시 결과 캐시 키가 바뀌도록)
+_DATASET_VERSIONS: Dict[str, int] = {}
+_DATASET_SERIAL = itertools.count(1)
+
+
+def _finite_mask(arr: np.ndarray) -> np.ndarray:
+    """유효(유한) 값 마스크: 등록 데이터셋 컬럼이면 캐시된 마스크 재사용"""
+    entry = _COLUMN_MASKS.get(id(arr))
+    if entry is not None and entry[0] is arr:
+        return entry[1]
+    return np.isfinite(arr)
+
+
+def register_dataset(dataset_id: str, columns: Any) -> str:
+    """
+    컬럼형 데이터셋을 Pyodide에 상주 등록
+
+    숫자 컬럼은 NumPy 배열(읽기 전용)로 저장하고 유효성 마스크를 미리 계산한다.
+    이후 Worker 메서드는 배열 대신 참조로 데이터를 받는다 (데이터 재전송 없음).
+    - {"datasetId": id, "column": name} → 컬럼 값 (@array_params 파라미터면 읽기 전용 배열,
+      그 외에는 NaN → None인 새 list)
+    - {"datasetId": id, "columns": [...]} → 행 dict 리스트 (생략 시 전체 컬럼)
+    같은 id로 다시 등록하면 교체된다.
+
+    Args:
+        dataset_id: 데이터셋 식별자
+        columns: {컬럼명: 값 배열} (typed buffer 포함 가능, JsProxy이면 to_py로 변환)
+
+    Returns:
+        JSON 요약 {"datasetId", "rowCount", "columns": {name: "numeric" | "categorical"}}
+
+    Raises:
+        ValueError: 컬럼 길이가 서로 다른 경우
+    """
+    import json
+
+    if hasattr(columns, 'to_py'):
+        columns = columns.to_py()
+
+    decoded = {name: _decode_shared_array(values) for name, values in columns.items()}
+    lengths = {len(values) for values in decoded.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Dataset columns must have same length: {sorted(lengths)}")
+
+    unregister_dataset(dataset_id)
+    _DATASET_VERSIONS[dataset_id] = next(_DATASET_SERIAL)
+    kinds = {}
+    for name, values in decoded.items():
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+            if values.dtype.kind == 'f':
+                _COLUMN_MASKS[id(values)] = (values, np.isfinite(values))
+            kinds[name] = 'numeric'
+        else:
+            kinds[name] = 'categorical'
+    _DATASETS[dataset_id] = decoded
+
+    return json.dumps({
+        'datasetId': dataset_id,
+        'rowCount': lengths.pop() if lengths else 0,
+        'columns': kinds,
+    })
+
+
+def unregister_dataset(dataset_id: str) -> bool:
+    """
+    등록 데이터셋과 컬럼 마스크 해제
+
+    Returns:
+        실제로 등록되어 있었으면 True
+    """
+    columns = _DATASETS.pop(dataset_id, None)
+    _DATASET_VERSIONS.pop(dataset_id, None)
+    if columns is None:
+        return False
+    for values in columns.values():
+        _COLUMN_MASKS.pop(id(values), None)
+    return True
+
+
+def _column_items(column: Any) -> List[Any]:
+    """등록 컬럼 → 새 list (NaN/Inf는 JS 데이터와 같이 None)"""
+    if not isinstance(column, np.ndarray):
+        return list(column)
+    items = column.tolist()
+    if column.dtype.kind == 'f':
+        for i in np.flatnonzero(~_finite_mask(column)):
+            items[i] = None
+    return items
+
+
+def _dataset_rows(columns: Dict[str, Any], names: List[str]) -> List[Dict[str, Any]]:
+    """등록 컬럼 → 행 dict 리스트 (NaN/Inf는 JS 행 데이터와 같이 None)"""
+    values = [_column_items(columns[name]) for name in names]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def _dataset_value(ref: Dict[str, Any], as_array: bool = False) -> Any:
+    """
+    데이터셋 참조 해석: column → 배열, columns(또는 생략) → 행 dict 리스트
+
+    column 참조는 as_array(@array_params 파라미터)이고 숫자 컬럼이면 등록된 읽기 전용
+    배열 그대로 (캐시된 마스크 재사용), 그 외에는 호출마다 새 list.
+    """
+    dataset_id = ref['datasetId']
+    columns = _DATASETS.get(dataset_id)
+    if columns is None:
+        raise KeyError(f"Unknown dataset: {dataset_id}")
+
+    if 'column' in ref:
+        if ref['column'] not in columns:
+            raise KeyError(f"Unknown column in dataset {dataset_id}: {ref['column']}")
+        column = columns[ref['column']]
+        if as_array and isinstance(column, np.ndarray):
+            return column
+        return _column_items(column)
+
+    names = ref.get('columns') or list(columns)
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise KeyError(f"Unknown column(s) in dataset {dataset_id}: {', '.join(unknown)}")
+    return _dataset_rows(columns, names)
+
+
+def _resolve_refs(
+    params: Dict[str, Any],
+    shared: Dict[str, Tuple[Any, Optional[np.ndarray]]],
+    array_names: frozenset = frozenset()
+) -> Dict[str, Any]:
+    """
+    파라미터의 공유 배열/데이터셋 참조를 실제 값으로 치환
+
+    최상위 값과 리스트 1단계(예: groups의 각 그룹)까지 치환한다.
+    공유 배열과 데이터셋 컬럼은 array_names 파라미터면 읽기 전용 NumPy 배열,
+    그 외에는 호출마다 새 list.
+
+    Args:
+        params: 파라미터 dict
+        shared: dispatch_batch 공유 배열 {name: (전송된 원본, 읽기 전용 배열 | None)}
+        array_names: NumPy 배열로 받을 파라미터명 (@array_params)
+
+    Raises:
+        KeyError: 등록되지 않은 공유 배열/데이터셋/컬럼
+    """
+    def _resolve(value, as_array):
+        if not isinstance(value, dict):
+            return value
+        if '__shared__' in value:
+            name = value['__shared__']
+            if name not in shared:
+                raise KeyError(f"Unknown shared array: {name}")
+            raw, arr = shared[name]
+            if as_array and arr is not None:
+                return arr
+            # typed buffer는 호출마다 새 list로 복원, list 원본은 얕은 복사
+            return list(raw) if isinstance(raw, list) else _decode_buffer(raw)
+        if 'datasetId' in value and value.keys() <= _DATASET_REF_KEYS:
+            return _dataset_value(value, as_array)
+        return value
+
+    resolved = {}
+    for key, value in params.items():
+        as_array = key in array_names
+        if isinstance(value, list):
+            resolved[key] = [_resolve(item, as_array) for item in value]
+        else:
+            resolved[key] = _resolve(value, as_array)
+    return resolved
+
+
+# ============================================================================
+# Bridge: 결과 메모이제이션 (내용 주소 키 + 바이트 예산 LRU)
+# ============================================================================
+
+# 결과 캐시 기본 예산 (메타 JSON 길이 + packed 버퍼 바이트 합)
+RESULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# (worker_num, method, 입력 해시) → (메타 JSON, packed float64): 오래된 항목이 앞
+_RESULT_CACHE: 'OrderedDict[Tuple[int, str, str], Tuple[str, np.ndarray]]' = OrderedDict()
+_RESULT_CACHE_STATS: Dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+_result_cache_max_bytes = RESULT_CACHE_MAX_BYTES
+
+# 현재 호출 결과를 캐시하면 안 되는지 (취소된 부분 결과 등, mark_result_uncacheable)
+_result_uncacheable = False
+
+
+def stochastic_method(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    확률적(난수 사용) Worker 함수 표시 데코레이터
+
+    표시된 함수는 seed 파라미터가 주어진 호출만 결과 캐시에 저장/조회한다
+    (seed 없는 순열/부트스트랩 결과를 재사용하면 재실행과 결과가 달라진다).
+    """
+    func.__stochastic__ = True
+    return func
+
+
+def _envelope_nbytes(envelope: Tuple[str, np.ndarray]) -> int:
+    meta, packed = envelope
+    return len(meta) + int(packed.nbytes)
+
+
+def _hash_value(h, value) -> None:
+    """입력값을 정규화해서 해시에 반영 (dict 키 정렬, 숫자 배열은 float64 바이트)"""
+    value = _decode_buffer(value, as_array=True)
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in 'biuf':
+            arr = np.ascontiguousarray(value, dtype=float)
+            h.update(b'A' + repr(arr.shape).encode())
+            h.update(memoryview(arr).cast('B'))
+        else:
+            _hash_value(h, value.tolist())
+        return
+
+    if isinstance(value, dict):
+        if 'datasetId' in value and value.keys() <= _DATASET_REF_KEYS:
+            # 데이터셋 참조는 내용 대신 (id, 등록 일련번호, 컬럼)으로 키 구성
+            version = _DATASET_VERSIONS.get(value['datasetId'])
+            if version is None:
+                raise KeyError(f"Unknown dataset: {value['datasetId']}")
+            h.update(b'D' + repr((value['datasetId'], version, value.get('column'), value.get('columns'))).encode())
+            return
+        h.update(b'{')
+        for key in sorted(value, key=str):
+            h.update(repr(str(key)).encode())
+            _hash_value(h, value[key])
+        h.update(b'}')
+        return
+
+    if isinstance(value, (list, tuple)):
+        if value and all(type(v) in (int, float) for v in value):
+            _hash_value(h, np.asarray(value, dtype=float))
+        elif all(v is None or isinstance(v, (str, int, float, bool)) for v in value):
+            h.update(b'L' + repr(list(value)).encode())
+        else:
+            h.update(b'[')
+            for item in value:
+                _hash_value(h, item)
+            h.update(b']')
+        return
+
+    h.update(b'S' + repr(value).encode())
+
+
+def _result_cache_key(worker_num: int, method: str, params: Dict[str, Any]) -> Optional[Tuple[int, str, str]]:
+    """
+    결과 캐시 키: (worker, method, 정규화 입력 해시)
+
+    캐시하면 안 되는 호출은 None:
+    - 등록되지 않은 메서드/데이터셋 (호출 시 원래 에러가 나도록)
+    - seed 없는 확률적 메서드 (@stochastic_method)
+    """
+    import hashlib
+
+    entry = _WORKER_DISPATCH.get(worker_num, {}).get(method)
+    if entry is None:
+        return None
+    if getattr(entry[0], '__stochastic__', False) and params.get('seed') is None:
+        return None
+
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        _hash_value(h, params)
+    except KeyError:
+        return None
+    return worker_num, method, h.hexdigest()
+
+
+def mark_result_uncacheable() -> None:
+    """
+    현재 호출 결과를 결과 캐시에 저장하지 않도록 표시
+
+    입력만으로 정해지지 않는 결과(취소로 잘린 부분 결과 등)가 같은 입력의 다음
+    memoize 호출에 완전한 결과처럼 재사용되지 않게 한다. dispatch가 호출마다 초기화한다.
+    """
+    global _result_uncacheable
+    _result_uncacheable = True
+
+
+def _result_cache_put(key: Tuple[int, str, str], envelope: Tuple[str, np.ndarray]) -> None:
+    """결과 저장 후 예산 초과분을 오래된 순으로 제거 (예산보다 큰 결과는 저장하지 않음)"""
+    nbytes = _envelope_nbytes(envelope)
+    if nbytes > _result_cache_max_bytes:
+        return
+
+    _RESULT_CACHE[key] = envelope
+    _RESULT_CACHE_STATS['bytes'] += nbytes
+    while _RESULT_CACHE_STATS['bytes'] > _result_cache_max_bytes:
+        _, evicted = _RESULT_CACHE.popitem(last=False)
+        _RESULT_CACHE_STATS['bytes'] -= _envelope_nbytes(evicted)
+        _RESULT_CACHE_STATS['evictions'] += 1
+
+
+def configure_result_cache(max_bytes: int) -> None:
+    """
+    결과 캐시 바이트 예산 변경 (초과분은 즉시 LRU 제거, 0이면 모두 비움)
+
+    Args:
+        max_bytes: 새 예산 (바이트)
+    """
+    global _result_cache_max_bytes
+
+    _result_cache_max_bytes = max(0, int(max_bytes))
+    while _RESULT_CACHE and _RESULT_CACHE_STATS['bytes'] > _result_cache_max_bytes:
+        _, evicted = _RESULT_CACHE.popitem(last=False)
+        _RESULT_CACHE_STATS['bytes'] -= _envelope_nbytes(evicted)
+        _RESULT_CACHE_STATS['evictions'] += 1
+
+
+def clear_result_cache(worker_num: Optional[int] = None) -> int:
+    """
+    결과 캐시 비우기
+
+    Args:
+        worker_num: 지정하면 해당 Worker 결과만 제거
+
+    Returns:
+        제거된 항목 수
+    """
+    keys = [key for key in _RESULT_CACHE if worker_num is None or key[0] == worker_num]
+    for key in keys:
+        _RESULT_CACHE_STATS['bytes'] -= _envelope_nbytes(_RESULT_CACHE.pop(key))
+    return len(keys)
+
+
+def result_cache_stats() -> str:
+    """결과 캐시 통계 JSON {"hits", "misses", "evictions", "bytes", "entries", "maxBytes"}"""
+    import json
+
+    return json.dumps({
+        **_RESULT_CACHE_STATS,
+        'entries': len(_RESULT_CACHE),
+        'maxBytes': _result_cache_max_bytes,
+    })
+
+
+# ============================================================================
+# 메모리 governor: Worker 상주 비용 + WASM 힙 예산 내 LRU 해제
+# ============================================================================
+
+# Worker 파일 헤더의 추정 메모리 (측정값이 없을 때 상주 비용)
+WORKER_RESIDENT_ESTIMATE_MB: Dict[int, int] = {
+    1: 80, 2: 90, 3: 180, 4: 200, 5: 100, 6: 120, 7: 50, 8: 80, 9: 50, 10: 3,
+}
+
+# worker_num → 로드 시 측정한 WASM 힙 증가량 (bytes, record_worker_resident_bytes)
+_WORKER_RESIDENT_BYTES: Dict[int, int] = {}
+
+_MB = 1024 * 1024
+
+
+def record_worker_resident_bytes(worker_num: int, nbytes: int) -> None:
+    """
+    Worker 로드 전후 WASM 힙 증가량 기록 (JS가 HEAPU8 크기로 측정)
+
+    힙이 이미 여유가 있어 늘지 않았으면(0 이하) 헤더 추정치를 유지한다.
+    """
+    if nbytes > 0:
+        _WORKER_RESIDENT_BYTES[worker_num] = int(nbytes)
+
+
+def worker_resident_bytes(worker_num: int) -> int:
+    """Worker 상주 비용 (측정값, 없으면 헤더 추정치)"""
+    measured = _WORKER_RESIDENT_BYTES.get(worker_num)
+    if measured is not None:
+        return measured
+    return WORKER_RESIDENT_ESTIMATE_MB.get(worker_num, 50) * _MB
+
+
+def clear_module_caches(module: Any) -> int:
+    """
+    모듈 전역 캐시 비우기
+
+    - 이름이 _CACHE로 끝나는 dict/list/set (예: worker10의 _AVAILABLE_TABLES_CACHE)
+    - functools.lru_cache/cache 함수 (cache_clear)
+
+    Returns:
+        비운 캐시 수
+    """
+    cleared = 0
+    for name, value in list(vars(module).items()):
+        if name.endswith('_CACHE') and isinstance(value, (dict, list, set)):
+            value.clear()
+            cleared += 1
+        elif callable(getattr(value, 'cache_clear', None)) and getattr(value, '__module__', None) == module.__name__:
+            value.cache_clear()
+            cleared += 1
+    return cleared
+
+
+def enforce_memory_budget(
+    budget_bytes: int,
+    incoming: Optional[int] = None,
+    protect: Optional[List[int]] = None,
+) -> List[int]:
+    """
+    메모리 예산 유지: 예상 사용량이 예산을 넘는 만큼 오래 안 쓴 Worker 모듈부터 해제 + 캐시 정리 + GC
+
+    사용량 = 로드된 Worker 상주 비용 합계 + 로드할 Worker 상주 비용 + 결과 캐시 bytes.
+    WASM 힙(HEAPU8)은 한 번 커지면 줄지 않으므로 힙 크기로 판단하면 예산을 넘은 뒤
+    로드할 때마다 Worker를 계속 해제하게 된다 — 해제로 실제 회수되는 양으로만 계산한다.
+
+    1. 결과 캐시를 비워 회수 가능한 만큼 먼저 차감
+    2. 모자라면 마지막 사용 시각이 오래된 Worker부터 해제 (incoming/protect 제외)
+    3. 해제가 있었으면 gc.collect() 1회
+
+    Args:
+        budget_bytes: 예산 (bytes)
+        incoming: 곧 로드할 Worker 번호 (상주 비용을 미리 반영, 이미 로드됐으면 무시)
+        protect: 해제하지 않을 Worker 번호 (예: 실행 중인 배치의 Worker)
+
+    Returns:
+        해제된 Worker 번호 (해제 순서)
+    """
+    import gc
+
+    required = sum(worker_resident_bytes(worker_num) for worker_num in _WORKER_LAST_USED)
+    required += _RESULT_CACHE_STATS['bytes']
+    if incoming is not None and incoming not in _WORKER_LAST_USED:
+        required += worker_resident_bytes(incoming)
+    required -= int(budget_bytes)
+    if required <= 0:
+        return []
+
+    required -= _RESULT_CACHE_STATS['bytes']
+    clear_result_cache()
+
+    keep = set(protect or [])
+    if incoming is not None:
+        keep.add(incoming)
+    candidates = sorted(
+        (last_used, worker_num) for worker_num, last_used in _WORKER_LAST_USED.items()
+        if worker_num not in keep
+    )
+
+    evicted: List[int] = []
+    for _, worker_num in candidates:
+        if required <= 0:
+            break
+        required -= worker_resident_bytes(worker_num)
+        _drop_worker_module(worker_num)
+        evicted.append(worker_num)
+
+    if evicted:
+        gc.collect()
+    return evicted
+
+
+def memory_stats(heap_bytes: int = 0) -> str:
+    """
+    메모리 통계 JSON
+
+    {"heapBytes", "residentBytes", "resultCacheBytes",
+     "workers": [{"worker", "residentBytes", "measured", "idleSeconds"}]} (오래 안 쓴 순)
+    """
+    import json
+    import time
+
+    now = time.monotonic()
+    workers = [
+        {
+            'worker': worker_num,
+            'residentBytes': worker_resident_bytes(worker_num),
+            'measured': worker_num in _WORKER_RESIDENT_BYTES,
+            'idleSeconds': round(now - last_used, 3),
+        }
+        for worker_num, last_used in sorted(_WORKER_LAST_USED.items(), key=lambda item: item[1])
+    ]
+    return json.dumps({
+        'heapBytes': int(heap_bytes),
+        'residentBytes': sum(worker['residentBytes'] for worker in workers),
+        'resultCacheBytes': _RESULT_CACHE_STATS['bytes'],
+        'workers': workers,
+    })
+
+
+# ============================================================================
+# 진행률 보고 + 협력적 취소 (pyodide.setInterruptBuffer)
+# ============================================================================
+
+# JS 진행률 콜백: (0~1 진행률, 라벨) — Web Worker가 sendProgress로 메인 스레드에 전달
+_PROGRESS_CALLBACK: Optional[Callable[[float, str], None]] = None
+
+# pyodide.setInterruptBuffer와 공유하는 Int32Array (buffer[0] == 2 → SIGINT)
+_INTERRUPT_BUFFER: Any = None
+
+_SIGINT = 2
+
+
+class OperationCancelled(Exception):
+    """취소 요청으로 중단되었고 부분 결과도 만들 수 없는 경우 (완료된 반복 0회)"""
+
+
+def set_progress_callback(callback: Optional[Callable[[float, str], None]]) -> None:
+    """진행률 콜백 등록 (None이면 해제)"""
+    global _PROGRESS_CALLBACK
+    _PROGRESS_CALLBACK = callback
+
+
+def set_interrupt_buffer(buffer: Any) -> None:
+    """
+    취소 신호 버퍼 등록 (JS에서 pyodide.setInterruptBuffer에 넘긴 것과 같은 Int32Array)
+
+    Pyodide 인터프리터도 같은 버퍼를 보고 KeyboardInterrupt를 발생시키지만,
+    ProgressLoop는 N회 반복마다 직접 확인하여 반복 경계에서 확실히 멈춘다.
+    """
+    global _INTERRUPT_BUFFER
+    _INTERRUPT_BUFFER = buffer
+
+
+def report_progress(fraction: float, label: str = '') -> None:
+    """진행률 보고 (콜백 미등록 시 무시, 콜백 오류는 계산에 영향 없음)"""
+    if _PROGRESS_CALLBACK is None:
+        return
+    try:
+        _PROGRESS_CALLBACK(float(min(max(fraction, 0.0), 1.0)), label)
+    except Exception:
+        pass
+
+
+def check_cancelled() -> None:
+    """
+    취소 신호 확인: 요청되었으면 신호를 소비하고 KeyboardInterrupt 발생
+    (이후 부분 결과는 결과 캐시에 저장하지 않음)
+
+    Raises:
+        KeyboardInterrupt: 취소 요청됨
+    """
+    if _INTERRUPT_BUFFER is not None and _INTERRUPT_BUFFER[0] == _SIGINT:
+        _INTERRUPT_BUFFER[0] = 0
+        mark_result_uncacheable()
+        raise KeyboardInterrupt
+
+
+class ProgressLoop:
+    """
+    진행률 보고 + 취소 가능한 반복 (순열/부트스트랩/단계 선택 루프용)
+
+    every회 반복마다 진행률을 보고하고 취소 신호를 확인한다.
+    취소(KeyboardInterrupt)되면 with 블록을 빠져나와 completed까지의 결과로
+    부분 결과를 만들 수 있다. 완료된 반복이 0회면 OperationCancelled.
+
+    Examples:
+        >>> with ProgressLoop(999, 'permanova') as loop:
+        ...     for i in loop:
+        ...         f_perms[i] = ...
+        >>> f_perms = f_perms[:loop.completed]
+    """
+
+    def __init__(self, total: int, label: str = '', every: Optional[int] = None):
+        self.total = max(0, int(total))
+        self.label = label
+        self.every = every if every is not None else max(1, self.total // 50)
+        self.completed = 0
+        self.cancelled = False
+
+    def __enter__(self) -> 'ProgressLoop':
+        return self
+
+    def __iter__(self):
+        for i in range(self.total):
+            yield i
+            self.completed = i + 1
+            if self.completed == self.total:
+                report_progress(1.0, self.label)
+            elif self.completed % self.every == 0:
+                report_progress(self.completed / self.total, self.label)
+                check_cancelled()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None or not issubclass(exc_type, KeyboardInterrupt):
+            return False
+        self.cancelled = True
+        mark_result_uncacheable()
+        if self.completed == 0:
+            raise OperationCancelled(f"{self.label or 'operation'} cancelled") from exc
+        return True
+
+
+# ============================================================================
+# 구간 계측 (호출 파라미터 _profile → 결과 _perf 블록)
+# ============================================================================
+
+# 현재 dispatch 호출의 계측기 (None이면 perf_span/instrumented는 측정 없이 통과)
+_ACTIVE_PROFILER: Optional['_Profiler'] = None
+
+
+class _Profiler:
+    """
+    한 Worker 호출 동안의 구간별 누적 시간/호출 수/입력 크기/메모리 peak
+
+    구간은 중첩 경로('sequential_permutation_test/_recount_alleles')로 집계한다.
+    memory=True면 tracemalloc으로 구간별 할당 peak(구간 시작 시점 대비 바이트)를 잰다.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.stages: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        # 열린 구간: [경로, 시작 시각, 시작 시점 할당량, 구간 내 최대 할당량]
+        self.stack: List[List[Any]] = []
+
+    def enter(self, name: str) -> None:
+        path = f"{self.stack[-1][0]}/{name}" if self.stack else name
+        if path not in self.stages:
+            # 처음 들어간 순서대로 보고 (루트 = 메서드 자신)
+            self.stages[path] = {'name': path, 'calls': 0, 'totalMs': 0.0, 'maxMs': 0.0}
+        current = 0
+        if self.memory:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            if self.stack:
+                self.stack[-1][3] = max(self.stack[-1][3], peak)
+            tracemalloc.reset_peak()
+        self.stack.append([path, time.perf_counter(), current, current])
+
+    def exit(self, size: Any = None) -> None:
+        path, started, start_bytes, peak_bytes = self.stack.pop()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        stage = self.stages[path]
+        stage['calls'] += 1
+        stage['totalMs'] += elapsed_ms
+        stage['maxMs'] = max(stage['maxMs'], elapsed_ms)
+        if size is not None:
+            stage['size'] = max(stage.get('size', 0), size)
+
+        if self.memory:
+            import tracemalloc
+
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+            stage['peakBytes'] = max(stage.get('peakBytes', 0), peak_bytes - start_bytes)
+            if self.stack:
+                self.stack[-1][3] = max(self.stack[-1][3], peak_bytes)
+
+    def report(self) -> List[Dict[str, Any]]:
+        stages = []
+        for stage in self.stages.values():
+            entry = dict(stage)
+            entry['totalMs'] = round(entry['totalMs'], 3)
+            entry['maxMs'] = round(entry['maxMs'], 3)
+            stages.append(entry)
+        return stages
+
+
+def _value_size(value: Any) -> Optional[int]:
+    """입력 크기: 배열은 원소 수(2차원이면 행 수), 문자열/리스트/dict는 길이, 스칼라는 None"""
+    if isinstance(value, np.ndarray):
+        return int(value.shape[0]) if value.ndim else None
+    if isinstance(value, (list, tuple, dict, str)):
+        return len(value)
+    return None
+
+
+@contextmanager
+def perf_span(name: str, size: Any = None):
+    """
+    계측 구간 (with 블록). 계측 중이 아니면 아무것도 기록하지 않는다.
+
+    Args:
+        name: 구간 이름 (중첩 시 상위 구간 경로 아래에 집계)
+        size: 입력 크기 (정수, 또는 _value_size로 잴 값)
+
+    Examples:
+        >>> with perf_span('ols_refit', size=len(predictorVars)):
+        ...     selected = forward_selection(X, y, alpha)
+    """
+    profiler = _ACTIVE_PROFILER
+    if profiler is None:
+        yield
+        return
+    profiler.enter(name)
+    try:
+        yield
+    finally:
+        profiler.exit(size if size is None or isinstance(size, int) else _value_size(size))
+
+
+def instrumented(name: Optional[str] = None, size_arg: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    함수 전체를 계측 구간으로 감싸는 데코레이터 (핫패스 내부 함수용)
+
+    계측 중이 아닐 때는 전역 변수 확인 한 번만 추가된다.
+
+    Args:
+        name: 구간 이름 (기본: 함수명)
+        size_arg: 입력 크기로 기록할 파라미터 이름 (_value_size 기준)
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        import functools
+        import inspect
+
+        label = name or func.__name__
+        size_index = None
+        if size_arg is not None:
+            size_index = list(inspect.signature(func).parameters).index(size_arg)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE_PROFILER
+            if profiler is None:
+                return func(*args, **kwargs)
+
+            size = None
+            if size_index is not None:
+                size = _value_size(args[size_index] if size_index < len(args) else kwargs.get(size_arg))
+            profiler.enter(label)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.exit(size)
+
+        return wrapper
+
+    return decorator
+
+
+def _profiled_call(method: str, func: Callable[..., Any], params: Dict[str, Any], mode: Any) -> Any:
+    """
+    계측기를 켠 채로 Worker 함수 호출 → dict 결과에 _perf 블록 추가
+
+    Args:
+        mode: True(시간만) | 'memory'(tracemalloc 할당 peak 포함)
+
+    Returns:
+        결과 (dict면 _perf: { method, totalMs, memory, inputSizes, stages[, peakBytes] } 추가)
+    """
+    global _ACTIVE_PROFILER
+
+    memory = mode == 'memory'
+    started_tracing = False
+    if memory:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+
+    profiler = _Profiler(memory=memory)
+    previous = _ACTIVE_PROFILER
+    _ACTIVE_PROFILER = profiler
+    try:
+        profiler.enter(method)
+        try:
+            result = func(**params)
+        finally:
+            profiler.exit()
+    finally:
+        _ACTIVE_PROFILER = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+    if not isinstance(result, dict):
+        return result
+
+    stages = profiler.report()
+    root = stages[0]
+    perf: Dict[str, Any] = {
+        'method': method,
+        'totalMs': root['totalMs'],
+        'memory': memory,
+        'inputSizes': {
+            key: size for key, size in ((key, _value_size(value)) for key, value in params.items()) if size is not None
+        },
+        'stages': stages[1:],
+    }
+    if memory:
+        perf['peakBytes'] = root.get('peakBytes', 0)
+    return {**result, '_perf': perf}
+
+
+# ============================================================================
+# 호출별 난수 스트림 (전역 np.random 상태 미사용)
+# ============================================================================
+
+def make_rng(seed: Any = None) -> np.random.Generator:
+    """
+    호출별 np.random.Generator 생성
+
+    Args:
+        seed: None(OS 엔트로피) | 정수 | 정수 리스트 | SeedSequence | Generator(그대로 사용)
+
+    Returns:
+        독립 Generator (전역 np.random 상태와 무관)
+    """
+    return np.random.default_rng(seed)
+
+
+def spawn_rngs(seed: Any, n: int) -> List[np.random.Generator]:
+    """
+    seed(None | 정수 | 정수 리스트 | SeedSequence) 하나에서 서로 독립인 하위 스트림 n개 생성
+    (SeedSequence.spawn)
+
+    한 호출 안의 여러 확률적 단계(예: fst 순열 + bootstrap)가 서로의 난수 소비량에
+    영향을 주지 않도록 단계마다 별도 스트림을 쓴다.
+    """
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in sequence.spawn(n)]
+
+
+# ============================================================================
+# 순차 Monte Carlo 순열 검정 (Besag & Clifford 1991)
+# ============================================================================
+
+# 순열 검정 시간 예산(초): Pyodide Worker 호출 타임아웃(60s) 안에서 여유를 둔 값
+PERMUTATION_TIME_BUDGET_S = 20.0
+
+# "명확히 유의수준 위" 판정에 쓰는 Monte Carlo 신뢰구간 폭 (양측 99%)
+_MC_CONFIDENCE_Z = 2.576
+
+
+def _mc_standard_error(p_value: float, n: int) -> float:
+    """Monte Carlo p-value 표준오차 sqrt(p(1-p)/n)"""
+    return math.sqrt(p_value * (1.0 - p_value) / n) if n > 0 else float('nan')
+
+
+@instrumented(size_arg='permutations')
+def sequential_permutation_test(
+    draw: Callable[[np.random.Generator], float],
+    observed: float,
+    permutations: int = 999,
+    seed: Any = None,
+    label: str = '',
+    two_sided: bool = False,
+    alpha: float = 0.05,
+    stop_exceedances: int = 20,
+    min_permutations: int = 99,
+    max_permutations: Optional[int] = None,
+    time_budget: float = PERMUTATION_TIME_BUDGET_S,
+) -> Dict[str, Any]:
+    """
+    순차 정지 순열 검정 드라이버 (Besag & Clifford 1991, Biometrika 78:301-304)
+
+    draw(rng)로 순열 통계량을 하나씩 뽑으며 관측값 이상(two_sided면 절댓값 기준)인
+    횟수를 센다. 고정 횟수 대신 다음 규칙으로 멈춘다:
+
+    - 조기 정지: 초과 횟수가 stop_exceedances 이상이고 p̂의 99% 하한이 alpha보다
+      크면 (명확히 비유의) p = 초과 횟수 / 순열 수 (Besag-Clifford 추정량)
+    - 요청 횟수 도달: p의 99% 구간이 alpha를 포함하면 (경계 근처) 시간 예산 안에서
+      max_permutations(기본 요청의 10배)까지 연장, 아니면 종료
+    - 시간 예산 초과: min_permutations 이상 수행했으면 종료 (대규모 데이터 보호)
+
+    seed가 주어지면 시간 예산은 쓰지 않고 횟수 규칙(조기 정지, permutations,
+    max_permutations)으로만 멈춘다 — 같은 seed는 기기 속도/부하와 무관하게 같은 결과.
+    seed가 없으면 시간 예산이 결과에 영향을 주므로 결과 캐시에 저장하지 않는다.
+
+    조기 정지 외에는 p = (초과 + 1) / (순열 수 + 1). 모든 결과에 Monte Carlo
+    표준오차 sqrt(p(1-p)/n)를 보고한다. 진행률 보고/취소는 ProgressLoop와 같은
+    방식이며 취소 시 완료된 순열까지의 결과를 반환한다.
+
+    Args:
+        draw: rng를 받아 순열 통계량 하나를 계산하는 함수
+        observed: 관측 통계량
+        permutations: 요청 순열 수 (경계 근처가 아니면 상한)
+        seed: make_rng seed (None이면 재현 불가 무작위 + 시간 예산 적용)
+        label: 진행률 라벨
+        two_sided: True면 |통계량| >= |관측값|을 초과로 셈
+        alpha: 경계 판정 유의수준
+        stop_exceedances: 조기 정지에 필요한 최소 초과 횟수 (Besag-Clifford h)
+        min_permutations: 시간 예산으로 멈추기 전 최소 순열 수
+        max_permutations: 경계 근처일 때 연장 상한 (None이면 permutations × 10)
+        time_budget: 시간 예산(초, seed가 없을 때만 적용)
+
+    Returns:
+        { pValue, permutations, exceedances, mcStandardError, stoppingRule,
+          requestedPermutations } (+ 취소 시 cancelled)
+        stoppingRule: 'early' | 'completed' | 'extended' | 'time-budget' | 'cancelled'
+
+    Raises:
+        OperationCancelled: 순열을 하나도 완료하기 전에 취소됨
+    """
+    permutations = max(1, int(permutations))
+    limit = max_permutations if max_permutations is not None else permutations * 10
+    limit = max(limit, permutations)
+    min_permutations = min(min_permutations, permutations)
+    every = max(1, permutations // 50)
+    threshold = abs(observed) if two_sided else observed
+    rng = make_rng(seed)
+    # seed 재현성: 시간 예산은 seed 없는 호출에만 적용
+    timed = seed is None
+    if timed:
+        mark_result_uncacheable()
+
+    start = time.perf_counter()
+    done = 0
+    exceed = 0
+    rule = 'completed'
+    try:
+        while True:
+            stat = draw(rng)
+            hit = (abs(stat) if two_sided else stat) >= threshold
+            done += 1
+            exceed += int(hit)
+
+            if exceed >= stop_exceedances:
+                p_hat = exceed / done
+                if p_hat - _MC_CONFIDENCE_Z * _mc_standard_error(p_hat, done) > alpha:
+                    rule = 'early'
+                    break
+
+            elapsed = time.perf_counter() - start
+            over_budget = timed and elapsed >= time_budget
+            if done >= permutations:
+                p_hat = (exceed + 1) / (done + 1)
+                near_alpha = abs(p_hat - alpha) <= _MC_CONFIDENCE_Z * _mc_standard_error(p_hat, done)
+                if not near_alpha or done >= limit or over_budget:
+                    rule = 'extended' if done > permutations else 'completed'
+                    break
+            elif done >= min_permutations and over_budget:
+                rule = 'time-budget'
+                break
+
+            if done % every == 0:
+                progress = done / permutations
+                if timed:
+                    progress = max(progress, elapsed / time_budget)
+                report_progress(progress, label)
+                check_cancelled()
+    except KeyboardInterrupt as exc:
+        if done == 0:
+            raise OperationCancelled(f"{label or 'permutation test'} cancelled") from exc
+        rule = 'cancelled'
+        mark_result_uncacheable()
+
+    report_progress(1.0, label)
+    if rule == 'early':
+        p_value = exceed / done
+    else:
+        p_value = (exceed + 1) / (done + 1)
+
+    result: Dict[str, Any] = {
+        'pValue': float(p_value),
+        'permutations': done,
+        'exceedances': exceed,
+        'mcStandardError': float(_mc_standard_error(p_value, done)),
+        'stoppingRule': rule,
+        'requestedPermutations': permutations,
+    }
+    if rule == 'cancelled':
+        result['cancelled'] = True
+    return result
+
+
+@instrumented(size_arg='permutations')
+def permutation_block(
+    draw: Callable[[Any], float],
+    observed: float,
+    permutations: int,
+    seed: Any,
+    label: str = '',
+    two_sided: bool = False,
+) -> Dict[str, Any]:
+    """
+    고정 크기 순열 블록 (다중 Pyodide Worker 샤딩용)
+
+    블록마다 seed([기준 seed, 블록 번호])로 독립 난수열을 만들어 draw(rng)를 반복하고
+    초과 횟수만 돌려준다. 블록 결과 병합과 정지 판정은 JS 쪽
+    (pyodide-shard-pool.ts mergePermutationBlocks)에서 한다.
+
+    Args:
+        draw: rng를 받아 순열 통계량 하나를 계산하는 함수
+        observed: 관측 통계량
+        permutations: 블록 순열 수
+        seed: make_rng seed (정수 또는 정수 리스트)
+        label: 진행률 라벨
+        two_sided: True면 |통계량| >= |관측값|을 초과로 셈
+
+    Returns:
+        { observed, exceedances, permutations } (+ 취소 시 cancelled)
+    """
+    rng = make_rng(seed)
+    threshold = abs(observed) if two_sided else observed
+    exceed = 0
+    with ProgressLoop(permutations, label) as loop:
+        for _ in loop:
+            stat = draw(rng)
+            exceed += int((abs(stat) if two_sided else stat) >= threshold)
+
+    result: Dict[str, Any] = {
+        'observed': float(observed),
+        'exceedances': exceed,
+        'permutations': loop.completed,
+    }
+    if loop.cancelled:
+        result['cancelled'] = True
+    return result
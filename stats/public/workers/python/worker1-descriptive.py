@@ -4,11 +4,13 @@
 # - Estimated memory: ~80MB
 # - Cold start time: ~0.8s
 
-from typing import List, Dict, Union, Literal, Optional, Any
+import heapq
+from collections import Counter
+from typing import List, Dict, Union, Literal, Optional, Any, Tuple
 import numpy as np
 from scipy import stats
 from scipy.stats import binomtest
-from helpers import clean_array
+from helpers import array_params, clean_array, column_matrix, contingency_counts, encode_categories, make_rng
 
 
 def _safe_bool(value: Union[bool, np.bool_]) -> bool:
@@ -21,6 +23,7 @@ def _safe_bool(value: Union[bool, np.bool_]) -> bool:
         return bool(value)
 
 
+@array_params('data')
 def descriptive_stats(
     data: List[Union[float, int, None]],
     confidenceLevel: float = 0.95
@@ -74,6 +77,113 @@ def descriptive_stats(
     }
 
 
+def _nullable_list(values: np.ndarray) -> List[Optional[float]]:
+    """float 배열 → JSON 리스트 (NaN/Inf는 None)"""
+    return [float(v) if np.isfinite(v) else None for v in values]
+
+
+def descriptive_stats_table(
+    columns: Any,
+    confidenceLevel: float = 0.95
+) -> Dict[str, Any]:
+    """
+    여러 컬럼의 기술통계를 한 번에 계산 (descriptive_stats와 같은 정의)
+
+    컬럼을 NaN 패딩 행렬 하나로 합친 뒤 컬럼별로 한 번만 정렬하고,
+    분위수/최빈값은 정렬 행렬에서, 적률은 마스크 합으로 모든 컬럼을 함께 계산한다.
+    결과는 컬럼 순서의 리스트이며 계산할 수 없는 값(유효값 0개, 분산 0의 왜도 등)은 None.
+    """
+    if not (0 < confidenceLevel < 1):
+        raise ValueError("confidenceLevel must be between 0 and 1")
+
+    names, matrix = column_matrix(columns)
+    if not names:
+        raise ValueError("No columns")
+
+    valid = ~np.isnan(matrix)
+    n = valid.sum(axis=0)
+    safe_n = np.maximum(n, 1)
+    last = np.maximum(n - 1, 0)
+
+    # 컬럼별 1회 정렬 (NaN은 뒤로)
+    sorted_matrix = np.sort(matrix, axis=0) if matrix.shape[0] > 0 else np.full((1, len(names)), np.nan)
+
+    def _at(rows: np.ndarray) -> np.ndarray:
+        return np.take_along_axis(sorted_matrix, rows[np.newaxis, :], axis=0)[0]
+
+    def _quantile(p: float) -> np.ndarray:
+        # np.percentile 기본(linear) 보간: 위치 p * (n - 1)
+        pos = p * last
+        lower = np.floor(pos).astype(int)
+        upper = np.minimum(lower + 1, last)
+        low_value = _at(lower)
+        return low_value + (_at(upper) - low_value) * (pos - lower)
+
+    q1 = _quantile(0.25)
+    median = _quantile(0.5)
+    q3 = _quantile(0.75)
+
+    # 최빈값: 정렬 열의 연속 구간 길이 → 가장 긴 구간 중 가장 작은 값 (stats.mode와 동일)
+    rows = np.arange(sorted_matrix.shape[0])[:, np.newaxis]
+    starts = np.empty(sorted_matrix.shape, dtype=bool)
+    starts[0] = True
+    starts[1:] = sorted_matrix[1:] != sorted_matrix[:-1]
+    run_start = np.maximum.accumulate(np.where(starts, rows, 0), axis=0)
+    run_length = np.where(rows < n, rows - run_start + 1, 0)
+    mode = _at(np.argmax(run_length, axis=0))
+
+    # 적률 (평균 → 편차 2회 패스)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, matrix, 0.0).sum(axis=0) / safe_n
+        dev = np.where(valid, matrix - mean, 0.0)
+        dev2 = dev * dev
+        m2 = dev2.sum(axis=0) / safe_n
+        m3 = (dev2 * dev).sum(axis=0) / safe_n
+        m4 = (dev2 * dev2).sum(axis=0) / safe_n
+
+        variance = np.where(n >= 2, m2 * n / np.maximum(n - 1, 1), np.nan)
+        std = np.sqrt(variance)
+
+        # scipy.stats.skew/kurtosis와 같이 분산이 수치적으로 0이면 정의하지 않음
+        degenerate = m2 <= (np.finfo(float).eps * mean) ** 2
+        skewness = np.where(degenerate, np.nan, m3 / m2 ** 1.5)
+        kurtosis = np.where(degenerate, np.nan, m4 / (m2 * m2) - 3.0)
+
+        sem = np.where(n >= 2, std / np.sqrt(safe_n), 0.0)
+        t_crit = stats.t.ppf((1 + confidenceLevel) / 2, np.maximum(n - 1, 1))
+        half_width = np.where((n >= 2) & (sem > 0), t_crit * sem, 0.0)
+
+    empty = n == 0
+    mean = np.where(empty, np.nan, mean)
+    sem = np.where(empty, np.nan, sem)
+
+    def _column(values: np.ndarray) -> List[Optional[float]]:
+        return _nullable_list(np.where(empty, np.nan, values))
+
+    return {
+        'columns': names,
+        'mean': _column(mean),
+        'median': _column(median),
+        'mode': _column(mode),
+        'std': _column(std),
+        'variance': _column(variance),
+        'min': _column(_at(np.zeros_like(last))),
+        'max': _column(_at(last)),
+        'q1': _column(q1),
+        'q3': _column(q3),
+        'iqr': _column(q3 - q1),
+        'skewness': _column(skewness),
+        'kurtosis': _column(kurtosis),
+        'n': [int(v) for v in n],
+        'se': _column(sem),
+        'sem': _column(sem),
+        'confidenceLevel': float(confidenceLevel),
+        'ciLower': _column(mean - half_width),
+        'ciUpper': _column(mean + half_width)
+    }
+
+
+@array_params('data')
 def normality_test(data: List[Union[float, int, None]], alpha: float = 0.05) -> Dict[str, Union[float, bool]]:
     clean_data = clean_array(data)
 
@@ -90,6 +200,7 @@ def normality_test(data: List[Union[float, int, None]], alpha: float = 0.05) ->
     }
 
 
+@array_params('data')
 def outlier_detection(
     data: List[Union[float, int, None]],
     method: Literal['iqr', 'zscore'] = 'iqr'
@@ -119,7 +230,28 @@ def outlier_detection(
     }
 
 
-def frequency_analysis(values: List[Any]) -> Dict[str, Union[List[str], List[int], List[float], int]]:
+def frequency_analysis(
+    values: List[Any],
+    topK: Optional[int] = None,
+    otherLabel: str = 'Other'
+) -> Dict[str, Union[List[str], List[int], List[float], int]]:
+    """
+    빈도분석
+
+    Args:
+        values: 범주 값
+        topK: 지정하면 해시 계수(Counter) 후 상위 k개 범주만 빈도 내림차순으로
+            반환하고, 나머지는 otherLabel 행 하나로 합친다. 정렬은 살아남은 k개에만
+            적용되므로 고유값이 많은 자유 텍스트 컬럼에 사용한다.
+            None이면 전체 범주를 범주 순으로 반환 (기존 동작).
+        otherLabel: 합산 행 이름
+
+    Returns:
+        total/uniqueCount는 항상 전체 기준, otherCount는 합산된 범주 수 (0이면 합산 행 없음)
+    """
+    if topK is not None:
+        return _frequency_top_k(values, int(topK), otherLabel)
+
     values_np = np.array(values)
 
     if len(values_np) == 0:
@@ -137,14 +269,73 @@ def frequency_analysis(values: List[Any]) -> Dict[str, Union[List[str], List[int
         'percentages': [float(p) for p in percentages],
         'cumulativePercentages': [float(c) for c in cumulative],
         'total': int(total),
-        'uniqueCount': int(len(unique_vals))
+        'uniqueCount': int(len(unique_vals)),
+        'otherCount': 0
+    }
+
+
+def _frequency_top_k(values: List[Any], top_k: int, other_label: str) -> Dict[str, Any]:
+    """
+    상위 k개 빈도 + 기타 합산 (Counter 해시 계수 O(n), heapq 선택 O(m log k))
+
+    빈도 동률은 범주 문자열 순. 기타 행을 포함한 누적 백분율은 100으로 끝난다.
+    """
+    if top_k < 1:
+        raise ValueError(f"topK must be at least 1: {top_k}")
+    if hasattr(values, 'to_py'):
+        values = values.to_py()
+
+    counter = Counter(values)
+    total = sum(counter.values())
+    if total == 0:
+        raise ValueError("Empty data for frequency analysis")
+
+    # 서로 다른 값이 같은 문자열이 되는 경우(1과 '1')는 출력 범주 기준으로 합산
+    labeled: Dict[str, int] = {}
+    for value, count in counter.items():
+        label = str(value)
+        labeled[label] = labeled.get(label, 0) + count
+    top = heapq.nsmallest(top_k, labeled.items(), key=lambda item: (-item[1], item[0]))
+
+    categories = [label for label, _ in top]
+    counts = [count for _, count in top]
+    other_count = len(labeled) - len(top)
+    if other_count > 0:
+        categories.append(other_label)
+        counts.append(total - sum(counts))
+
+    counts_np = np.asarray(counts, dtype=float)
+    percentages = counts_np / total * 100
+    cumulative = np.cumsum(counts_np) / total * 100
+
+    return {
+        'categories': categories,
+        'frequencies': [int(c) for c in counts],
+        'percentages': percentages.tolist(),
+        'cumulativePercentages': cumulative.tolist(),
+        'total': int(total),
+        'uniqueCount': len(labeled),
+        'otherCount': int(other_count)
     }
 
 
 def crosstab_analysis(
     rowValues: List[Any],
-    colValues: List[Any]
-) -> Dict[str, Union[List[str], List[List[int]], List[int], int]]:
+    colValues: List[Any],
+    sparse: bool = False
+) -> Dict[str, Any]:
+    """
+    교차분석 (분할표 도수)
+
+    행/열 값을 각각 np.unique 코드로 바꾼 뒤 결합 코드에 bincount 1회로 집계한다
+    (범주 조합마다 전체를 훑는 O(R·C·n) 대신 O(n log n)).
+
+    Args:
+        rowValues, colValues: 같은 길이의 범주 값
+        sparse: True면 observedMatrix 대신 0이 아닌 칸만 담은 COO 표
+            (observedSparse)를 반환. 범주가 많은 넓은 표용이며
+            chi_square_independence_test의 observedMatrix로 그대로 넘길 수 있다.
+    """
     row_values = np.array(rowValues)
     col_values = np.array(colValues)
 
@@ -154,27 +345,34 @@ def crosstab_analysis(
     if len(row_values) == 0:
         raise ValueError("Empty data for crosstab analysis")
 
-    row_categories = np.unique(row_values)
-    col_categories = np.unique(col_values)
-
-    observed_matrix = np.zeros((len(row_categories), len(col_categories)), dtype=int)
-
-    for i, row_cat in enumerate(row_categories):
-        for j, col_cat in enumerate(col_categories):
-            count = np.sum((row_values == row_cat) & (col_values == col_cat))
-            observed_matrix[i, j] = count
-
-    row_totals = observed_matrix.sum(axis=1)
-    col_totals = observed_matrix.sum(axis=0)
-    grand_total = observed_matrix.sum()
+    row_categories, row_codes = encode_categories(row_values)
+    col_categories, col_codes = encode_categories(col_values)
+    shape = (len(row_categories), len(col_categories))
+
+    row_totals = np.bincount(row_codes, minlength=shape[0])
+    col_totals = np.bincount(col_codes, minlength=shape[1])
+
+    observed_matrix = None
+    observed_sparse = None
+    if sparse:
+        rows, cols, counts = contingency_counts(row_codes, col_codes, shape, sparse=True)
+        observed_sparse = {
+            'shape': [int(shape[0]), int(shape[1])],
+            'rowIndex': rows.tolist(),
+            'colIndex': cols.tolist(),
+            'counts': counts.tolist()
+        }
+    else:
+        observed_matrix = contingency_counts(row_codes, col_codes, shape).tolist()
 
     return {
         'rowCategories': [str(c) for c in row_categories],
         'colCategories': [str(c) for c in col_categories],
-        'observedMatrix': observed_matrix.tolist(),
+        'observedMatrix': observed_matrix,
+        'observedSparse': observed_sparse,
         'rowTotals': row_totals.tolist(),
         'colTotals': col_totals.tolist(),
-        'grandTotal': int(grand_total)
+        'grandTotal': int(len(row_values))
     }
 
 
@@ -248,6 +446,7 @@ def cronbach_alpha(itemsMatrix: List[List[Union[float, int]]]) -> Dict[str, Unio
     }
 
 
+@array_params('data')
 def kolmogorov_smirnov_test(data: List[Union[float, int, None]]) -> Dict[str, Union[float, bool]]:
     clean_data = clean_array(data)
 
@@ -267,6 +466,7 @@ def kolmogorov_smirnov_test(data: List[Union[float, int, None]]) -> Dict[str, Un
     }
 
 
+@array_params('values')
 def ks_test_one_sample(values: List[Union[float, int]]) -> Dict[str, Union[float, int, bool, str, Dict]]:
     """
     Kolmogorov-Smirnov one-sample test (normality test)
@@ -315,6 +515,7 @@ def ks_test_one_sample(values: List[Union[float, int]]) -> Dict[str, Union[float
     }
 
 
+@array_params('values1', 'values2')
 def ks_test_two_sample(values1: List[Union[float, int]], values2: List[Union[float, int]]) -> Dict[str, Union[float, int, bool, Dict]]:
     """
     Kolmogorov-Smirnov two-sample test
@@ -358,6 +559,243 @@ def ks_test_two_sample(values1: List[Union[float, int]], values2: List[Union[flo
     }
 
 
+# =============================================================================
+# Mann-Kendall 추세 검정 (쌍을 나열하지 않는 O(n log n) 경로)
+# =============================================================================
+# References:
+# - Knight, W. R. (1966). A computer method for calculating Kendall's tau with ungrouped data
+# - Dillencourt, M. B., Mount, D. M., Netanyahu, N. S. (1992). A randomized algorithm for slope selection
+# - Hirsch, R. M., Slack, J. R., Smith, R. A. (1982). Techniques of trend analysis for monthly water quality data
+# - Helsel, D. R., Frans, L. M. (2006). Regional Kendall test for trend
+#
+# - S: 병합 정렬 단계마다 "오른쪽 원소보다 큰 왼쪽 원소 수"를 searchsorted로 세어 합산 (Knight)
+# - Sen's slope: 기울기 ≤ θ 인 쌍 수 = (x - θt) 순서의 역순 쌍 수이므로, 무작위 표본 쌍의 기울기로
+#   목표 순위를 포함하는 구간을 좁히고 구간 안 쌍이 4n 이하가 되면 그 쌍만 나열해 선택
+# - 여러 계열(계절, 지점)은 (그룹, 값) 순위로 한 번의 병합 패스에서 그룹 안 쌍만 함께 센다
+
+_MK_ENUMERATE_FACTOR = 4
+_MK_SAMPLE_SIZE = 4096
+_MK_ALPHA = 0.05
+
+
+def _dense_ranks(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """(그룹, 값) 순서의 조밀 순위 (같은 그룹의 같은 값 = 같은 순위)"""
+    order = np.lexsort((values, groups))
+    sorted_values, sorted_groups = values[order], groups[order]
+    step = np.ones(values.size, dtype=np.int64)
+    step[1:] = (sorted_values[1:] != sorted_values[:-1]) | (sorted_groups[1:] != sorted_groups[:-1])
+    ranks = np.empty(values.size, dtype=np.int64)
+    ranks[order] = np.cumsum(step) - 1
+    return ranks
+
+
+def _inversion_pass(
+    seq: np.ndarray,
+    groups: np.ndarray,
+    strict: bool = True,
+    picks: Optional[np.ndarray] = None
+) -> Tuple[int, np.ndarray, Optional[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    같은 그룹 안에서 위치 p < q 이고 seq[p] > seq[q] (strict=False면 ≥)인 역순 쌍 세기
+
+    상향식 병합 정렬: 너비 w 블록 쌍마다 오른쪽 원소보다 큰 왼쪽 원소는 정렬된 왼쪽 절반의
+    연속 구간이므로 searchsorted 한 번으로 모든 블록을 함께 센다. seq는 그룹별로 연속 배치되어
+    있어야 하며 ((그룹, 값) 순위라 그룹 사이 쌍은 역순이 되지 않음), picks(오름차순 쌍 순번)를
+    주면 해당 순번 쌍의 위치를 구간에서 바로 꺼낸다 (전체 나열 = np.arange(쌍 수)).
+
+    Returns:
+        (역순 쌍 수, 그룹별 역순 쌍 수, picks 쌍의 (p, q) 위치 | None)
+    """
+    n = seq.size
+    ranks = _dense_ranks(seq, groups)
+    span = int(ranks.max()) + 1 if n else 1
+    index = np.arange(n)
+    group_totals = np.zeros(int(groups.max()) + 1 if n else 1)
+    picked_p: List[np.ndarray] = []
+    picked_q: List[np.ndarray] = []
+    total = 0
+
+    width = 1
+    while width < n:
+        positions = np.arange(n)
+        block = positions // (2 * width)
+        is_left = positions % (2 * width) < width
+        keys = block * span + ranks
+        left_keys, right_keys = keys[is_left], keys[~is_left]
+        left_index, right_index = index[is_left], index[~is_left]
+
+        # 블록 b의 왼쪽 절반은 left_keys[b*w : (b+1)*w] (오른쪽이 있는 블록의 왼쪽은 항상 가득 참)
+        upper = (block[~is_left] + 1) * width
+        left_le = np.searchsorted(left_keys, right_keys, side='right')
+        first = left_le if strict else np.searchsorted(left_keys, right_keys, side='left')
+        counts = upper - first
+
+        group_totals += np.bincount(groups[right_index], weights=counts, minlength=group_totals.size)
+        if picks is not None and counts.size:
+            ends = np.cumsum(counts) + total
+            start, stop = np.searchsorted(picks, [total, ends[-1]])
+            chosen = picks[start:stop]
+            owner = np.searchsorted(ends, chosen, side='right')
+            offset = chosen - (ends[owner] - counts[owner])
+            picked_p.append(left_index[first[owner] + offset])
+            picked_q.append(right_index[owner])
+        total += int(counts.sum())
+
+        # 병합: 왼쪽 원소 앞에는 더 작은 오른쪽, 오른쪽 원소 앞에는 같거나 작은 왼쪽 (안정)
+        merged = np.empty(n, dtype=np.int64)
+        left_at = np.flatnonzero(is_left) + np.searchsorted(right_keys, left_keys, side='left') - block[is_left] * width
+        right_at = np.flatnonzero(~is_left) - width + left_le - block[~is_left] * width
+        merged[left_at] = positions[is_left]
+        merged[right_at] = positions[~is_left]
+        ranks = ranks[merged]
+        index = index[merged]
+        width *= 2
+
+    picked = None
+    if picks is not None:
+        picked = (
+            np.concatenate(picked_p) if picked_p else np.empty(0, dtype=np.int64),
+            np.concatenate(picked_q) if picked_q else np.empty(0, dtype=np.int64),
+        )
+    return total, group_totals.astype(np.int64), picked
+
+
+def _mk_group_scores(values: np.ndarray, groups: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+    """
+    그룹별 Mann-Kendall S, Var(S) (동률 보정), 쌍 수, 동률 쌍 수
+
+    values는 그룹별 시간 순서로 연속 배치, groups는 0부터 오름차순.
+    """
+    ranks = _dense_ranks(values, groups)
+    tie_sizes = np.bincount(ranks).astype(float)
+    tie_groups = np.zeros(tie_sizes.size, dtype=np.int64)
+    tie_groups[ranks] = groups
+
+    n = np.bincount(groups, minlength=n_groups).astype(float)
+    pairs = n * (n - 1) / 2
+    tied_pairs = np.bincount(tie_groups, weights=tie_sizes * (tie_sizes - 1) / 2, minlength=n_groups)
+    tie_var = np.bincount(tie_groups, weights=tie_sizes * (tie_sizes - 1) * (2 * tie_sizes + 5), minlength=n_groups)
+
+    _, decreasing, _ = _inversion_pass(values, groups)
+    decreasing = np.pad(decreasing, (0, n_groups - decreasing.size))
+    return {
+        'n': n,
+        's': pairs - tied_pairs - 2 * decreasing,
+        'varS': (n * (n - 1) * (2 * n + 5) - tie_var) / 18,
+        'pairs': pairs,
+        'tiedPairs': tied_pairs,
+    }
+
+
+def _mk_z_p(s: float, var_s: float) -> Tuple[float, float]:
+    """연속성 보정 Z와 양측 p-value"""
+    if s > 0:
+        z = (s - 1) / np.sqrt(var_s)
+    elif s < 0:
+        z = (s + 1) / np.sqrt(var_s)
+    else:
+        z = 0.0
+    return float(z), float(2 * (1 - stats.norm.cdf(abs(z))))
+
+
+def _mk_trend(p: float, z: float) -> str:
+    if p < _MK_ALPHA:
+        return 'increasing' if z > 0 else 'decreasing'
+    return 'no trend'
+
+
+def _slope_pairs(
+    times: np.ndarray,
+    values: np.ndarray,
+    groups: np.ndarray,
+    lo: Optional[Tuple[float, float]],
+    hi: Optional[Tuple[float, float]],
+    hi_inclusive: bool = True,
+    picks: Optional[np.ndarray] = None
+) -> Tuple[int, Optional[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    그룹 안 쌍 중 lo < 기울기 ≤ hi (hi_inclusive=False면 < hi) 인 쌍 세기/꺼내기
+
+    경계는 기울기를 만든 쌍의 (dx, dt)로 받고 None이면 제한 없음. i, j (t_i < t_j)에 대해
+    기울기 > dx/dt ⇔ key_i < key_j (key = x·dt - dx·t)이므로 key_lo 순서로 늘어놓은 key_hi의
+    역순 쌍이 곧 구간 안 쌍이다. 나눗셈 대신 곱으로 비교하여 정수 자료의 같은 기울기(2/4 = 1/2)가
+    반올림으로 갈리지 않는다. lo가 없으면 시간 순서, hi가 없으면 시간 역순을 키로 쓰고,
+    key_lo 동률(기울기 == lo)은 key_hi 오름차순으로 두어 세지 않는다.
+    """
+    key_lo = times if lo is None else values * lo[1] - lo[0] * times
+    key_hi = -times if hi is None else values * hi[1] - hi[0] * times
+    order = np.lexsort((key_hi, key_lo, groups))
+    total, _, picked = _inversion_pass(key_hi[order], groups[order], strict=not hi_inclusive, picks=picks)
+    if picked is not None:
+        picked = (order[picked[0]], order[picked[1]])
+    return total, picked
+
+
+def _select_slopes(times: np.ndarray, values: np.ndarray, groups: np.ndarray, ranks: List[int], n_pairs: int) -> List[float]:
+    """
+    그룹 안 쌍 기울기 중 ranks번째(0부터, 오름차순 인접 순위)로 작은 값들 (쌍 전체를 만들지 않는 무작위 선택)
+
+    표본 쌍 기울기에서 목표 순위 앞뒤 값을 골라 정확히 세고, 목표를 포함하는 (lo, hi] 구간만 남긴다.
+    난수는 구간을 좁히는 속도에만 영향을 주고 결과는 같으므로 seed를 고정한다.
+    """
+    rng = make_rng(0)
+    found: Dict[int, float] = {}
+    lo: Optional[Tuple[float, float]] = None
+    hi: Optional[Tuple[float, float]] = None
+    hi_inclusive, below, up_to = True, 0, n_pairs
+    limit = max(_MK_ENUMERATE_FACTOR * values.size, _MK_SAMPLE_SIZE)
+
+    while True:
+        pending = [k for k in ranks if k not in found]
+        if not pending:
+            return [found[k] for k in ranks]
+
+        inside = up_to - below
+        if inside <= limit:
+            p, q = _slope_pairs(times, values, groups, lo, hi, hi_inclusive, np.arange(inside))[1]
+            slopes = np.partition((values[q] - values[p]) / (times[q] - times[p]), [k - below for k in pending])
+            found.update((k, float(slopes[k - below])) for k in pending)
+            continue
+
+        picks = np.unique(rng.integers(0, inside, _MK_SAMPLE_SIZE))
+        p, q = _slope_pairs(times, values, groups, lo, hi, hi_inclusive, picks)[1]
+        dx, dt = values[q] - values[p], times[q] - times[p]
+        sample = dx / dt
+        order = np.argsort(sample, kind='stable')
+        spread = 3.0 * np.sqrt(sample.size)
+        low_at = int((pending[0] - below) / inside * sample.size - spread)
+        high_at = int((pending[-1] - below) / inside * sample.size + spread)
+
+        for at in (order[max(low_at, 0)], order[min(high_at, sample.size - 1)]):
+            candidate = (float(dx[at]), float(dt[at]))
+            at_most = _slope_pairs(times, values, groups, None, candidate)[0]
+            if at_most <= pending[0]:
+                lo, below = candidate, at_most
+                continue
+            if np.count_nonzero(sample == sample[at]) > 1:
+                # 동률 기울기가 목표 순위를 덮으면 바로 확정, 아니면 동률 묶음을 구간에서 제외
+                less = _slope_pairs(times, values, groups, None, candidate, False)[0]
+                found.update((k, float(sample[at])) for k in pending if less <= k < at_most)
+                remaining = [k for k in pending if k not in found]
+                if remaining and remaining[-1] < less:
+                    hi, hi_inclusive, up_to = candidate, False, less
+                elif remaining and remaining[0] >= at_most:
+                    lo, below = candidate, at_most
+                break
+            if pending[-1] < at_most < up_to:
+                hi, hi_inclusive, up_to = candidate, True, at_most
+
+
+def _sen_slope(times: np.ndarray, values: np.ndarray, groups: np.ndarray, n_pairs: int) -> float:
+    """그룹 안 쌍 기울기의 중앙값 (쌍이 짝수 개면 가운데 두 값의 평균)"""
+    if n_pairs == 0:
+        return 0.0
+    middle = (n_pairs - 1) // 2
+    ranks = [middle] if n_pairs % 2 else [middle, middle + 1]
+    return float(np.mean(_select_slopes(times, values, groups, ranks, n_pairs)))
+
+
+@array_params('data')
 def mann_kendall_test(data: List[Union[float, int]]) -> Dict[str, Union[str, float, int]]:
     """
     Mann-Kendall trend test for time series data
@@ -368,58 +806,23 @@ def mann_kendall_test(data: List[Union[float, int]]) -> Dict[str, Union[str, flo
     if n < 3:
         raise ValueError("Mann-Kendall test requires at least 3 observations")
 
-    # Calculate S statistic
-    s = 0
-    for i in range(n-1):
-        for j in range(i+1, n):
-            s += np.sign(clean_data[j] - clean_data[i])
-
-    # Calculate variance of S (with tie correction)
-    var_s = n * (n - 1) * (2 * n + 5) / 18
-    # Subtract tie correction: Σ t_p(t_p-1)(2t_p+5)/18
-    _, counts = np.unique(clean_data, return_counts=True)
-    tie_groups = counts[counts > 1]
-    for t in tie_groups:
-        var_s -= t * (t - 1) * (2 * t + 5) / 18
-
-    # Calculate standardized test statistic Z
-    if s > 0:
-        z = (s - 1) / np.sqrt(var_s)
-    elif s < 0:
-        z = (s + 1) / np.sqrt(var_s)
-    else:
-        z = 0
-
-    # Calculate p-value (two-tailed test)
-    p = 2 * (1 - stats.norm.cdf(abs(z)))
-
-    # Calculate Kendall's tau
-    tau, _ = stats.kendalltau(range(n), clean_data)
-
-    # Calculate slope (Sen's slope estimator)
-    slopes = []
-    for i in range(n-1):
-        for j in range(i+1, n):
-            if j != i:
-                slope = (clean_data[j] - clean_data[i]) / (j - i)
-                slopes.append(slope)
-    sen_slope = np.median(slopes) if slopes else 0
-
-    # Calculate intercept
-    intercept = np.median(clean_data) - sen_slope * np.median(range(n))
-
-    # Determine trend
-    alpha = 0.05
-    if p < alpha:
-        if z > 0:
-            trend = 'increasing'
-        else:
-            trend = 'decreasing'
-    else:
-        trend = 'no trend'
+    times = np.arange(n, dtype=float)
+    groups = np.zeros(n, dtype=np.int64)
+    scores = _mk_group_scores(clean_data, groups, 1)
+    s = float(scores['s'][0])
+    var_s = float(scores['varS'][0])
+    z, p = _mk_z_p(s, var_s)
+
+    # Kendall's tau-b (시간은 동률 없음)
+    pairs = float(scores['pairs'][0])
+    denominator = np.sqrt(pairs * (pairs - scores['tiedPairs'][0]))
+    tau = s / denominator if denominator > 0 else np.nan
+
+    sen_slope = _sen_slope(times, clean_data, groups, int(pairs))
+    intercept = np.median(clean_data) - sen_slope * np.median(times)
 
     return {
-        'trend': trend,
+        'trend': _mk_trend(p, z),
         'tau': float(tau),
         'zScore': float(z),
         'pValue': float(p),
@@ -428,6 +831,126 @@ def mann_kendall_test(data: List[Union[float, int]]) -> Dict[str, Union[str, flo
         'n': int(n)
     }
 
+
+def _finite_series(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    NaN 패딩 행렬(행 = 시간, 열 = 계열) → 계열별로 연속 배치한 (시간, 값, 그룹) 배열
+
+    결측은 제외하되 시간(행 위치)은 유지하여 기울기 간격이 원래 간격을 따른다.
+    """
+    groups, times = np.nonzero(np.isfinite(matrix.T))
+    return times.astype(float), matrix[times, groups], groups.astype(np.int64)
+
+
+def _mk_combined(times: np.ndarray, values: np.ndarray, groups: np.ndarray, n_groups: int) -> Dict[str, Any]:
+    """그룹별 S/Var(S)를 합친 결합 검정 (그룹 간 독립 가정) + 그룹 안 쌍 기울기 중앙값"""
+    scores = _mk_group_scores(values, groups, n_groups)
+    s = float(scores['s'].sum())
+    var_s = float(scores['varS'].sum())
+    z, p = _mk_z_p(s, var_s)
+    pairs = float(scores['pairs'].sum())
+
+    return {
+        'scores': scores,
+        'trend': _mk_trend(p, z),
+        'tau': s / pairs if pairs > 0 else 0.0,
+        's': s,
+        'varS': var_s,
+        'zScore': z,
+        'pValue': p,
+        'senSlope': _sen_slope(times, values, groups, int(pairs)),
+    }
+
+
+def seasonal_mann_kendall_test(
+    data: List[Union[float, int, None]],
+    seasonalPeriods: int = 12
+) -> Dict[str, Any]:
+    """
+    계절 Mann-Kendall 검정 (Hirsch et al. 1982)
+
+    data[i]의 계절은 i % seasonalPeriods, 연도(시간)는 i // seasonalPeriods.
+    계절별 S와 Var(S)를 합해 검정하고, Sen's slope는 같은 계절 안 쌍(연도 단위) 기울기의 중앙값이다.
+    결측(None/NaN)은 제외하되 연도 간격은 유지한다. tau는 S / 계절 내 쌍 수 (Hirsch의 정의).
+    """
+    period = int(seasonalPeriods)
+    if period < 2:
+        raise ValueError("seasonalPeriods must be >= 2")
+
+    _, column = column_matrix([data])
+    values_by_time = np.full(-(-column.shape[0] // period) * period, np.nan)
+    values_by_time[:column.shape[0]] = column[:, 0]
+    times, values, groups = _finite_series(values_by_time.reshape(-1, period))
+    if values.size < 3:
+        raise ValueError("Seasonal Mann-Kendall test requires at least 3 observations")
+
+    result = _mk_combined(times, values, groups, period)
+    scores = result.pop('scores')
+    if scores['pairs'].sum() == 0:
+        raise ValueError("Seasonal Mann-Kendall test requires at least 2 years in some season")
+
+    return {
+        **result,
+        's': int(result['s']),
+        'n': int(values.size),
+        'seasonalPeriods': period,
+        'seasons': [
+            {'season': season, 'n': int(scores['n'][season]), 's': int(scores['s'][season]),
+             'varS': float(scores['varS'][season])}
+            for season in range(period)
+        ],
+    }
+
+
+def regional_mann_kendall_test(series: Any) -> Dict[str, Any]:
+    """
+    지역(다지점) Mann-Kendall 검정 (Regional Kendall, Helsel & Frans 2006)
+
+    지점별 계열(같은 시간 간격)의 S와 Var(S)를 합해 지역 추세를 검정하고, 지역 Sen's slope는
+    지점 안 쌍 기울기 전체의 중앙값이다. 지점 간 상관 보정은 하지 않는다 (독립 가정).
+    지점별 S는 모든 지점을 한 번의 병합 패스로 함께 계산한다.
+
+    Args:
+        series: {지점명: 계열} 또는 계열 리스트 (이름은 "0", "1", ...)
+    """
+    names, matrix = column_matrix(series)
+    if not names:
+        raise ValueError("At least one series is required")
+
+    times, values, groups = _finite_series(matrix)
+    n_stations = len(names)
+    result = _mk_combined(times, values, groups, n_stations)
+    scores = result.pop('scores')
+    if scores['pairs'].sum() == 0:
+        raise ValueError("Regional Mann-Kendall test requires a series with at least 2 observations")
+
+    stations = []
+    for station in range(n_stations):
+        n = int(scores['n'][station])
+        if n < 3:
+            stations.append({'station': names[station], 'n': n, 's': None, 'zScore': None, 'pValue': None, 'senSlope': None, 'trend': None})
+            continue
+        z, p = _mk_z_p(float(scores['s'][station]), float(scores['varS'][station]))
+        mask = groups == station
+        stations.append({
+            'station': names[station],
+            'n': n,
+            's': int(scores['s'][station]),
+            'zScore': z,
+            'pValue': p,
+            'senSlope': _sen_slope(times[mask], values[mask], np.zeros(n, dtype=np.int64), int(scores['pairs'][station])),
+            'trend': _mk_trend(p, z),
+        })
+
+    return {
+        **result,
+        's': int(result['s']),
+        'n': int(values.size),
+        'nStations': n_stations,
+        'stations': stations,
+    }
+
+
 def bonferroni_correction(pValues, alpha=0.05):
     """
     Bonferroni correction for multiple comparisons
@@ -1090,3 +1613,297 @@ def convert_effect_sizes(
     }
 
     return result
+
+
+# =============================================================================
+# Streaming Descriptive Sketch (청크 입력 + 병합 가능한 요약 상태)
+# =============================================================================
+# References:
+# - Welford, B. P. (1962). Note on a method for calculating corrected sums of squares and products
+# - Pébay, P. (2008). Formulas for robust, one-pass parallel computation of covariances
+#   and arbitrary-order statistical moments (SAND2008-6212)
+# - Karnin, Z., Lang, K., Liberty, E. (2016). Optimal quantile approximation in streams (KLL)
+#
+# Worker 메서드는 상태를 갖지 않으므로 스케치 상태는 JSON dict로 주고받는다.
+# - descriptive_sketch_update(data, state) → 청크를 반영한 새 상태
+# - descriptive_sketch_merge(states) → 샤드별 상태 병합
+# - descriptive_sketch_finalize(state) → descriptive_stats와 같은 키의 요약 (mode 제외)
+# 분위수 스케치의 compaction은 레벨별 홀/짝 오프셋을 번갈아 사용해 결정적이다
+# (같은 입력 → 같은 상태, 결과 메모이제이션 가능).
+
+DEFAULT_SKETCH_K = 200
+_SKETCH_CAPACITY_DECAY = 2.0 / 3.0
+_SKETCH_MIN_CAPACITY = 2
+
+
+class _DescriptiveSketch:
+    """적률(n, mean, M2, M3, M4) + min/max + KLL 분위수 스케치"""
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K):
+        if int(k) != k or k < 8:
+            raise ValueError("k must be an integer >= 8")
+        self.k = int(k)
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        # levels[h]: 가중치 2^h 항목 (정렬 보장 없음), parity[h]: 다음 compaction 오프셋
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.parity: List[int] = [0]
+
+    # ------------------------------------------------------------------
+    # 적률: 두 부분 집합 결합 (Pébay 2008, 식 2.1/3.1/3.2)
+    # ------------------------------------------------------------------
+    def _combine_moments(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float) -> None:
+        n_a = self.n
+        if n_b == 0:
+            return
+        if n_a == 0:
+            self.n, self.mean, self.m2, self.m3, self.m4 = n_b, mean_b, m2_b, m3_b, m4_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        m2_a, m3_a = self.m2, self.m3
+
+        self.m4 = (
+            self.m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6.0 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4.0 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self.m3 = (
+            m3_a + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3.0 * delta_n * (n_a * m2_b - n_b * m2_a)
+        )
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.mean = self.mean + delta_n * n_b
+        self.n = n
+
+    # ------------------------------------------------------------------
+    # KLL: 레벨 용량 초과 시 정렬 후 한 칸 건너 절반을 상위 레벨로 올림
+    # ------------------------------------------------------------------
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(_SKETCH_MIN_CAPACITY, int(np.ceil(self.k * _SKETCH_CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+                self.parity.append(0)
+
+            items = np.sort(items)
+            # 홀수 개면 가장 작은 값 하나는 현재 레벨에 남김
+            keep = items[:items.size % 2]
+            pairs = items[items.size % 2:]
+            promoted = pairs[self.parity[level]::2]
+            self.parity[level] ^= 1
+
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            # 상위 레벨이 넘치면 다음 반복에서 처리, 레벨 추가로 하위 용량이 줄었을 수 있으므로 처음부터
+            level = 0
+
+    def update(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        mean_b = float(np.mean(values))
+        dev = values - mean_b
+        dev2 = dev * dev
+        self._combine_moments(
+            int(values.size), mean_b,
+            float(dev2.sum()), float((dev2 * dev).sum()), float((dev2 * dev2).sum())
+        )
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: '_DescriptiveSketch') -> None:
+        self._combine_moments(other.n, other.mean, other.m2, other.m3, other.m4)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        # 정확도는 작은 k가 결정하므로 병합 결과도 작은 k 사용
+        self.k = min(self.k, other.k)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+            self.parity.append(0)
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantiles(self, probs: List[float]) -> np.ndarray:
+        """
+        가중 순위 보간 분위수 (np.percentile linear와 같은 위치 p * (n - 1))
+
+        항목 i(가중치 w)는 순위 [누적 - w, 누적 - 1]을 대표하므로 중심 순위에 두고 보간한다.
+        compaction 전(모든 가중치 1)에는 np.percentile과 정확히 같다.
+        """
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(items.size, 2.0 ** h) for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, weights = values[order], weights[order]
+        centers = np.cumsum(weights) - weights + (weights - 1.0) / 2.0
+        total = weights.sum()
+        return np.interp(np.asarray(probs) * (total - 1.0), centers, values)
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def to_state(self) -> Dict[str, Any]:
+        empty = self.n == 0
+        return {
+            'n': int(self.n),
+            'mean': float(self.mean),
+            'm2': float(self.m2),
+            'm3': float(self.m3),
+            'm4': float(self.m4),
+            'min': None if empty else float(self.min),
+            'max': None if empty else float(self.max),
+            'k': self.k,
+            'levels': [items.tolist() for items in self.levels],
+            'parity': list(self.parity),
+        }
+
+    @classmethod
+    def from_state(cls, state: Optional[Dict[str, Any]], k: int = DEFAULT_SKETCH_K) -> '_DescriptiveSketch':
+        if hasattr(state, 'to_py'):
+            state = state.to_py()
+        if not state:
+            return cls(k)
+
+        try:
+            sketch = cls(state['k'])
+            sketch.n = int(state['n'])
+            sketch.mean = float(state['mean'])
+            sketch.m2 = float(state['m2'])
+            sketch.m3 = float(state['m3'])
+            sketch.m4 = float(state['m4'])
+            if sketch.n > 0:
+                sketch.min = float(state['min'])
+                sketch.max = float(state['max'])
+            sketch.levels = [np.asarray(items, dtype=float).ravel() for items in state['levels']] or [np.empty(0)]
+            sketch.parity = [int(p) & 1 for p in state['parity']]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid sketch state: {exc}") from exc
+
+        if len(sketch.parity) != len(sketch.levels):
+            raise ValueError("Invalid sketch state: levels/parity length mismatch")
+        if sum(items.size * 2 ** h for h, items in enumerate(sketch.levels)) != sketch.n:
+            raise ValueError("Invalid sketch state: level weights do not match n")
+        return sketch
+
+
+@array_params('data')
+def descriptive_sketch_update(
+    data: List[Union[float, int, None]],
+    state: Optional[Dict[str, Any]] = None,
+    k: int = DEFAULT_SKETCH_K
+) -> Dict[str, Any]:
+    """
+    청크 하나를 스케치 상태에 반영
+
+    Args:
+        data: 청크 값 (None/NaN/Inf 제외)
+        state: 이전 상태 (None이면 새 스케치)
+        k: 분위수 스케치 크기 (새 스케치일 때만 사용, 클수록 정확, 상태 크기 ~3k)
+
+    Returns:
+        새 상태 (JSON, 다음 update/merge/finalize 입력)
+    """
+    sketch = _DescriptiveSketch.from_state(state, k)
+    sketch.update(clean_array(data))
+    return sketch.to_state()
+
+
+def descriptive_sketch_merge(states: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    여러 샤드의 스케치 상태 병합 (순서 무관, 적률은 정확히 결합)
+
+    Returns:
+        병합된 상태
+    """
+    if not states:
+        raise ValueError("At least one sketch state is required")
+
+    sketch = _DescriptiveSketch.from_state(states[0])
+    for state in states[1:]:
+        sketch.merge(_DescriptiveSketch.from_state(state))
+    return sketch.to_state()
+
+
+def descriptive_sketch_finalize(
+    state: Dict[str, Any],
+    confidenceLevel: float = 0.95
+) -> Dict[str, Any]:
+    """
+    스케치 상태 → 기술통계 요약
+
+    mean/std/variance/skewness/kurtosis/min/max/CI는 전체 데이터와 같고(부동소수 오차 내),
+    q1/median/q3는 exact=False이면 KLL 근사값이다. mode는 스트리밍으로 구할 수 없어 제외.
+    lowerFence/upperFence(Q1 - 1.5 IQR, Q3 + 1.5 IQR)로 청크별 이상치 판정을 할 수 있다.
+    """
+    if not (0 < confidenceLevel < 1):
+        raise ValueError("confidenceLevel must be between 0 and 1")
+
+    sketch = _DescriptiveSketch.from_state(state)
+    n = sketch.n
+    if n == 0:
+        raise ValueError("No valid data")
+
+    mean = sketch.mean
+    variance = sketch.m2 / (n - 1) if n >= 2 else None
+    std = float(np.sqrt(variance)) if variance is not None else None
+
+    m2 = sketch.m2 / n
+    if m2 <= (np.finfo(float).eps * mean) ** 2:
+        skewness = kurtosis = None
+    else:
+        skewness = float((sketch.m3 / n) / m2 ** 1.5)
+        kurtosis = float((sketch.m4 / n) / (m2 * m2) - 3.0)
+
+    sem = std / np.sqrt(n) if std is not None else 0.0
+    if n >= 2 and sem > 0:
+        ci_lower, ci_upper = stats.t.interval(confidenceLevel, df=n - 1, loc=mean, scale=sem)
+    else:
+        ci_lower = ci_upper = mean
+
+    q1, median, q3 = (float(q) for q in sketch.quantiles([0.25, 0.5, 0.75]))
+    iqr = q3 - q1
+
+    return {
+        'mean': float(mean),
+        'median': median,
+        'std': std,
+        'variance': float(variance) if variance is not None else None,
+        'min': float(sketch.min),
+        'max': float(sketch.max),
+        'q1': q1,
+        'q3': q3,
+        'iqr': iqr,
+        'lowerFence': q1 - 1.5 * iqr,
+        'upperFence': q3 + 1.5 * iqr,
+        'skewness': skewness,
+        'kurtosis': kurtosis,
+        'n': int(n),
+        'se': float(sem),
+        'sem': float(sem),
+        'confidenceLevel': float(confidenceLevel),
+        'ciLower': float(ci_lower),
+        'ciUpper': float(ci_upper),
+        'exact': sketch.exact,
+        'k': sketch.k
+    }
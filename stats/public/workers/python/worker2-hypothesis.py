@@ -9,7 +9,7 @@ import numpy as np
 from scipy import stats
 from scipy.stats import binomtest
 import math
-from helpers import clean_array, clean_paired_arrays, clean_groups
+from helpers import ProgressLoop, array_params, clean_array, clean_paired_arrays, clean_groups, parse_sparse_table, perf_span
 
 
 def _safe_float(value: Optional[float]) -> Optional[float]:
@@ -112,6 +112,7 @@ def t_test_paired(
     }
 
 
+@array_params('data')
 def t_test_one_sample(
     data: List[Union[float, int, None]],
     popmean: float = 0,
@@ -320,6 +321,7 @@ def t_test_paired_summary(
     }
 
 
+@array_params('data')
 def z_test(
     data: List[Union[float, int, None]],
     popmean: float,
@@ -572,11 +574,78 @@ def chi_square_goodness_test(
     }
 
 
+def _chi_square_sparse(
+    shape: tuple,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    counts: np.ndarray
+) -> tuple:
+    """
+    COO 분할표의 Pearson 카이제곱 (0이 아닌 칸만 순회, (R×C) 행렬 미생성)
+
+    0 도수 칸의 기여는 (0 - E)²/E = E 이므로 그 합은 n - Σ_nz E 로 한 번에 구한다.
+
+    Returns:
+        (chi2, dof, n)
+    """
+    n_rows, n_cols = shape
+    row_totals = np.bincount(rows, weights=counts, minlength=n_rows)
+    col_totals = np.bincount(cols, weights=counts, minlength=n_cols)
+    n = float(counts.sum())
+
+    if n <= 0:
+        raise ValueError("Table cannot be all zeros")
+    if np.any(row_totals == 0) or np.any(col_totals == 0):
+        raise ValueError("The internally computed table of expected frequencies has a zero element (empty row or column).")
+
+    dof = (n_rows - 1) * (n_cols - 1)
+    if dof == 0:
+        return 0.0, 0, n
+
+    expected = row_totals[rows] * col_totals[cols] / n
+    chi2_stat = float(np.sum((counts - expected) ** 2 / expected) + (n - expected.sum()))
+    return max(chi2_stat, 0.0), dof, n
+
+
 def chi_square_independence_test(
-    observedMatrix: List[List[Union[float, int]]],
+    observedMatrix: Union[List[List[Union[float, int]]], Dict[str, Any]],
     yatesCorrection: bool = False,
     alpha: float = 0.05
 ) -> Dict[str, Union[float, int, bool, List[List[float]], None]]:
+    """
+    카이제곱 독립성 검정
+
+    observedMatrix는 2차원 도수 행렬 또는 crosstab_analysis(sparse=True)의
+    observedSparse (COO: shape/rowIndex/colIndex/counts). 희소 입력은 0이 아닌
+    칸만으로 통계량을 계산하고 observedMatrix/expectedMatrix는 None으로 반환한다
+    (2×2는 Yates 보정을 위해 밀집 경로 사용).
+    """
+    if hasattr(observedMatrix, 'to_py'):
+        observedMatrix = observedMatrix.to_py()
+
+    if isinstance(observedMatrix, dict):
+        shape, rows, cols, counts = parse_sparse_table(observedMatrix)
+        if shape != (2, 2):
+            chi2_stat, dof, n = _chi_square_sparse(shape, rows, cols, counts)
+            p_value = stats.chi2.sf(chi2_stat, dof) if dof > 0 else 1.0
+            critical_value = stats.chi2.ppf(1 - alpha, dof)
+            min_dim = min(shape)
+            cramers_v = np.sqrt(chi2_stat / (n * (min_dim - 1))) if min_dim > 1 else 0.0
+
+            return {
+                'chiSquare': float(chi2_stat),
+                'pValue': _safe_float(p_value),
+                'degreesOfFreedom': int(dof),
+                'criticalValue': float(critical_value),
+                'reject': _safe_bool(p_value < alpha),
+                'cramersV': float(cramers_v),
+                'observedMatrix': None,
+                'expectedMatrix': None
+            }
+        dense = np.zeros(shape)
+        dense[rows, cols] = counts
+        observedMatrix = dense
+
     observed = np.array(observedMatrix, dtype=float)
 
     if observed.size == 0:
@@ -910,80 +979,82 @@ def stepwise_regression_forward(data, dependentVar, predictorVars, significanceL
     import warnings
     warnings.filterwarnings('ignore')
 
-    df = pd.DataFrame(data)
+    with perf_span('pandas_setup', size=data):
+        df = pd.DataFrame(data)
 
-    # 결측값 제거
-    all_vars = [dependentVar] + predictorVars
-    df_clean = df[all_vars].dropna()
+        # 결측값 제거
+        all_vars = [dependentVar] + predictorVars
+        df_clean = df[all_vars].dropna()
 
-    y = df_clean[dependentVar].values
-    X_full = df_clean[predictorVars]
+        y = df_clean[dependentVar].values
+        X_full = df_clean[predictorVars]
 
     def forward_selection(X, y, sig_level):
-        """전진선택법 구현"""
+        """전진선택법 구현 (단계마다 진행률 보고, 취소 시 그때까지 선택된 변수로 모델 구성)"""
         initial_features = []
         remaining_features = list(X.columns)
         step_history = []
         step = 1
 
-        while remaining_features:
-            best_pval = float('inf')
-            best_feature = None
-            best_f_stat = None
+        with ProgressLoop(len(remaining_features), 'stepwise_regression_forward', every=1) as loop:
+            for _ in loop:
+                best_pval = float('inf')
+                best_feature = None
+                best_f_stat = None
 
-            for feature in remaining_features:
-                test_features = initial_features + [feature]
-                X_test = sm.add_constant(X[test_features])
+                for feature in remaining_features:
+                    test_features = initial_features + [feature]
+                    X_test = sm.add_constant(X[test_features])
 
-                try:
-                    model = sm.OLS(y, X_test).fit()
-                    if len(initial_features) == 0:
-                        f_stat = model.fvalue
-                        p_val = model.f_pvalue
-                    else:
-                        X_prev = sm.add_constant(X[initial_features])
-                        model_prev = sm.OLS(y, X_prev).fit()
-
-                        sse_full = model.ssr
-                        sse_reduced = model_prev.ssr
-                        df_diff = 1
-                        df_error = len(y) - len(test_features) - 1
-
-                        f_stat = ((sse_reduced - sse_full) / df_diff) / (sse_full / df_error)
-                        p_val = 1 - stats.f.cdf(f_stat, df_diff, df_error)
-
-                    if p_val < best_pval:
-                        best_pval = p_val
-                        best_feature = feature
-                        best_f_stat = f_stat
-                except:
-                    continue
-
-            if best_pval < sig_level and best_feature:
-                initial_features.append(best_feature)
-                remaining_features.remove(best_feature)
-
-                X_current = sm.add_constant(X[initial_features])
-                model_current = sm.OLS(y, X_current).fit()
-
-                step_history.append({
-                    'step': step,
-                    'action': 'add',
-                    'variable': best_feature,
-                    'rSquared': float(model_current.rsquared),
-                    'adjRSquared': float(model_current.rsquared_adj),
-                    'fChange': float(best_f_stat),
-                    'fChangeP': float(best_pval),
-                    'criterionValue': float(model_current.aic)
-                })
-                step += 1
-            else:
-                break
+                    try:
+                        model = sm.OLS(y, X_test).fit()
+                        if len(initial_features) == 0:
+                            f_stat = model.fvalue
+                            p_val = model.f_pvalue
+                        else:
+                            X_prev = sm.add_constant(X[initial_features])
+                            model_prev = sm.OLS(y, X_prev).fit()
+
+                            sse_full = model.ssr
+                            sse_reduced = model_prev.ssr
+                            df_diff = 1
+                            df_error = len(y) - len(test_features) - 1
+
+                            f_stat = ((sse_reduced - sse_full) / df_diff) / (sse_full / df_error)
+                            p_val = 1 - stats.f.cdf(f_stat, df_diff, df_error)
+
+                        if p_val < best_pval:
+                            best_pval = p_val
+                            best_feature = feature
+                            best_f_stat = f_stat
+                    except Exception:
+                        continue
+
+                if best_pval < sig_level and best_feature:
+                    X_current = sm.add_constant(X[initial_features + [best_feature]])
+                    model_current = sm.OLS(y, X_current).fit()
+
+                    initial_features.append(best_feature)
+                    remaining_features.remove(best_feature)
+                    step_history.append({
+                        'step': step,
+                        'action': 'add',
+                        'variable': best_feature,
+                        'rSquared': float(model_current.rsquared),
+                        'adjRSquared': float(model_current.rsquared_adj),
+                        'fChange': float(best_f_stat),
+                        'fChangeP': float(best_pval),
+                        'criterionValue': float(model_current.aic)
+                    })
+                    step += 1
+                else:
+                    break
 
-        return initial_features, step_history
+        return initial_features, step_history, loop.cancelled
 
     # 단계적 회귀분석 실행
-    selected_features, step_history = forward_selection(X_full, y, significanceLevel)
+    with perf_span('ols_refits', size=len(predictorVars)):
+        selected_features, step_history, cancelled = forward_selection(X_full, y, significanceLevel)
 
     # 최종 모델
     if selected_features:
@@ -1030,20 +1101,21 @@ def stepwise_regression_forward(data, dependentVar, predictorVars, significanceL
                 })
 
         # 모델 진단
-        residuals = final_model.resid
-        dw_stat = durbin_watson(residuals)
-        jb_stat, jb_p = jarque_bera(residuals)
+        with perf_span('diagnostics'):
+            residuals = final_model.resid
+            dw_stat = durbin_watson(residuals)
+            jb_stat, jb_p = jarque_bera(residuals)
 
-        try:
-            lm, lm_p, fvalue, f_p = het_breuschpagan(residuals, X_final)
-            bp_p = f_p
-        except:
-            bp_p = 1.0
+            try:
+                lm, lm_p, fvalue, f_p = het_breuschpagan(residuals, X_final)
+                bp_p = f_p
+            except:
+                bp_p = 1.0
 
-        try:
-            condition_num = np.linalg.cond(X_final)
-        except:
-            condition_num = 1.0
+            try:
+                condition_num = np.linalg.cond(X_final)
+            except:
+                condition_num = 1.0
 
         # 제외된 변수들
         excluded_vars = [var for var in predictorVars if var not in selected_features]
@@ -1104,7 +1176,8 @@ def stepwise_regression_forward(data, dependentVar, predictorVars, significanceL
                 'conditionNumber': float(condition_num)
             },
             'excludedVariables': excluded_variables,
-            'interpretation': interpretation
+            'interpretation': interpretation,
+            **({'cancelled': True} if cancelled else {})
         }
     else:
         # 변수가 선택되지 않은 경우
@@ -10,11 +10,10 @@ import numpy as np
 from scipy import stats
 from itertools import combinations
 from helpers import clean_array, clean_paired_arrays, clean_groups as clean_groups_helper
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
-from sklearn.decomposition import PCA, FactorAnalysis
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
+
+# statsmodels / pandas / scikit-learn은 필요한 함수 안에서 지연 import
+# (mann_whitney_test 등 SciPy만 쓰는 메서드는 무거운 import 비용 없이 실행)
+# 측정: python scripts/worker-import-report.py 3
 
 
 def _safe_bool(value: Union[bool, np.bool_]) -> bool:
@@ -8,7 +8,10 @@ import json
 from typing import List, Dict, Union, Literal, Optional, Any
 import numpy as np
 from scipy import stats
-from helpers import clean_array, clean_xy_regression, clean_multiple_regression
+from helpers import ProgressLoop, array_params, clean_array, clean_xy_regression, clean_multiple_regression
+
+# statsmodels / scikit-learn은 필요한 함수 안에서 지연 import (모듈 최상위 import 금지)
+# 측정: python scripts/worker-import-report.py 4
 
 
 def _safe_bool(value: Union[bool, np.bool_]) -> bool:
@@ -1082,6 +1085,9 @@ def cluster_analysis(data, method='kmeans', nClusters=3, linkage='ward', distanc
     """
     Comprehensive K-means clustering analysis with sklearn
     Returns detailed clustering metrics matching ClusterAnalysisResult interface
+
+    K-means 재시작(n_init=10)을 직접 반복하여 진행률을 보고하고,
+    취소 시 완료된 재시작 중 최선의 해로 결과를 만든다 (cancelled, nInit).
     """
     from sklearn.cluster import KMeans
     from sklearn.preprocessing import StandardScaler
@@ -1098,8 +1104,17 @@ def cluster_analysis(data, method='kmeans', nClusters=3, linkage='ward', distanc
     scaler = StandardScaler()
     X_scaled = scaler.fit_transform(X)
 
-    model = KMeans(n_clusters=nClusters, random_state=42, n_init=10)
-    labels = model.fit_predict(X_scaled)
+    # KMeans(n_init=10, random_state=42)와 동일: 같은 RandomState를 재시작마다 이어 쓰고
+    # inertia가 엄격히 작을 때만 교체
+    n_init = 10
+    random_state = np.random.RandomState(42)
+    model = None
+    with ProgressLoop(n_init, 'cluster_analysis', every=1) as loop:
+        for _ in loop:
+            candidate = KMeans(n_clusters=nClusters, random_state=random_state, n_init=1).fit(X_scaled)
+            if model is None or candidate.inertia_ < model.inertia_:
+                model = candidate
+    labels = model.labels_
     centroids = model.cluster_centers_
     inertia = float(model.inertia_)
 
@@ -1162,7 +1177,8 @@ def cluster_analysis(data, method='kmeans', nClusters=3, linkage='ward', distanc
         'betweenClusterSS': between_ss,
         'totalSS': total_ss,
         'clusterSizes': cluster_sizes,
-        'clusterStatistics': cluster_stats
+        'clusterStatistics': cluster_stats,
+        **({'cancelled': True, 'nInit': loop.completed} if loop.cancelled else {})
     }
 
 
@@ -1575,6 +1591,7 @@ def cox_regression(times, events, covariateData, covariateNames):
     }
 
 
+@array_params('residuals')
 def durbin_watson_test(residuals):
     from statsmodels.stats.stattools import durbin_watson
 
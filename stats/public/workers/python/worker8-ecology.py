@@ -2,6 +2,7 @@
 # Notes:
 # - Dependencies: NumPy, SciPy, scikit-learn (for NMDS only)
 # - 6 tools: alpha_diversity, rarefaction, beta_diversity, nmds, permanova, mantel_test
+# - *_permutation_block: 다중 Worker 샤딩용 고정 크기 순열 블록 (pyodide-shard-pool.ts)
 # - PERMANOVA/Mantel: numpy/scipy direct implementation (scikit-bio not in Pyodide)
 #   Validated against R vegan::adonis2() and vegan::mantel()
 # - Estimated memory: ~80MB
@@ -11,7 +12,7 @@ import numpy as np
 from scipy import stats
 from scipy.spatial.distance import pdist, squareform
 from scipy.special import gammaln
-from helpers import clean_array
+from helpers import clean_array, permutation_block, sequential_permutation_test, stochastic_method
 
 
 # ─── 내부 유틸 ─────────────────────────────────────────────
@@ -279,24 +280,8 @@ def nmds(
     }
 
 
-def permanova(
-    distance_matrix: List[List[float]],
-    grouping: List[str],
-    permutations: int = 999,
-) -> Dict:
-    """
-    PERMANOVA (Anderson 2001).
-    Ref: Anderson, M.J. (2001) Austral Ecology, 26, 32-46.
-
-    Parameters
-    ----------
-    distance_matrix : n×n 거리행렬
-    grouping        : 지점별 그룹 레이블 (길이 n)
-
-    Returns
-    -------
-    { pseudoF, pValue, rSquared, permutations, ssBetween, ssWithin, ssTotal }
-    """
+def _permanova_model(distance_matrix: List[List[float]], grouping: List[str]) -> Dict:
+    """PERMANOVA 관측 통계량 + 순열 통계량 함수 draw(rng)"""
     dm = np.array(distance_matrix, dtype=float)
     grouping_arr = np.array(grouping)
     n = len(grouping_arr)
@@ -308,11 +293,6 @@ def permanova(
     if n < a + 1:
         raise ValueError(f"Not enough observations ({n}) for {a} groups")
 
-    # 대규모 데이터 가드
-    actual_perms = permutations
-    if n > 200 and permutations > 99:
-        actual_perms = 99
-
     D2 = dm ** 2
     ss_total = float(np.sum(D2) / (2 * n))
 
@@ -326,49 +306,90 @@ def permanova(
         return ss_w
 
     ss_within = calc_ss_within(grouping_arr)
-    ss_between = ss_total - ss_within
-    f_stat = (ss_between / (a - 1)) / (ss_within / (n - a))
 
-    # 순열 검정
-    f_perms = np.zeros(actual_perms)
-    for i in range(actual_perms):
-        perm = np.random.permutation(grouping_arr)
-        ss_w_perm = calc_ss_within(perm)
-        ss_b_perm = ss_total - ss_w_perm
-        f_perms[i] = (ss_b_perm / (a - 1)) / (ss_w_perm / (n - a))
+    def draw(rng):
+        ss_w_perm = calc_ss_within(rng.permutation(grouping_arr))
+        return ((ss_total - ss_w_perm) / (a - 1)) / (ss_w_perm / (n - a))
+
+    return {
+        'f_stat': ((ss_total - ss_within) / (a - 1)) / (ss_within / (n - a)),
+        'ss_total': ss_total,
+        'ss_within': ss_within,
+        'draw': draw,
+    }
+
 
-    p_value = float((np.sum(f_perms >= f_stat) + 1) / (actual_perms + 1))
+@stochastic_method
+def permanova(
+    distance_matrix: List[List[float]],
+    grouping: List[str],
+    permutations: int = 999,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    PERMANOVA (Anderson 2001).
+    Ref: Anderson, M.J. (2001) Austral Ecology, 26, 32-46.
+
+    Parameters
+    ----------
+    distance_matrix : n×n 거리행렬
+    grouping        : 지점별 그룹 레이블 (길이 n)
+    seed            : 순열 난수 seed (지정 시 결과 재현 + 결과 캐시 가능)
+
+    Returns
+    -------
+    { pseudoF, pValue, rSquared, permutations, ssBetween, ssWithin, ssTotal,
+      mcStandardError, stoppingRule, requestedPermutations }
+    순열 수는 순차 정지 규칙으로 결정 (helpers.sequential_permutation_test)
+    취소 시 완료된 순열까지의 p-value + cancelled
+    """
+    model = _permanova_model(distance_matrix, grouping)
+    f_stat = model['f_stat']
+    ss_total = model['ss_total']
+    ss_within = model['ss_within']
+    ss_between = ss_total - ss_within
+    draw = model['draw']
+
+    # 순차 정지 순열 검정 (대규모 데이터는 시간 예산으로 제한, 취소 시 부분 결과)
+    perm_test = sequential_permutation_test(draw, f_stat, permutations, seed=seed, label='permanova')
     r_squared = float(ss_between / ss_total)
 
-    return {
+    result = {
         "pseudoF": round(float(f_stat), 4),
-        "pValue": round(p_value, 4),
+        "pValue": round(perm_test['pValue'], 4),
         "rSquared": round(r_squared, 4),
-        "permutations": actual_perms,
+        "permutations": perm_test['permutations'],
         "ssBetween": round(float(ss_between), 4),
         "ssWithin": round(float(ss_within), 4),
         "ssTotal": round(float(ss_total), 4),
+        "mcStandardError": round(perm_test['mcStandardError'], 4),
+        "stoppingRule": perm_test['stoppingRule'],
+        "requestedPermutations": perm_test['requestedPermutations'],
     }
+    if perm_test.get('cancelled'):
+        result["cancelled"] = True
+    return result
 
 
-def mantel_test(
-    matrix_x: List[List[float]],
-    matrix_y: List[List[float]],
-    permutations: int = 999,
-    method: str = 'pearson',
+def permanova_permutation_block(
+    distance_matrix: List[List[float]],
+    grouping: List[str],
+    permutations: int,
+    seed: List[int],
 ) -> Dict:
     """
-    Mantel Test — 두 거리행렬 간 상관 검정 (양측).
-
-    Parameters
-    ----------
-    matrix_x, matrix_y : n×n 거리행렬
-    method : 'pearson' | 'spearman'
+    PERMANOVA 순열 블록 (다중 Worker 샤딩용, helpers.permutation_block)
 
     Returns
     -------
-    { r, pValue, permutations, method }
+    { observed (pseudo-F), exceedances, permutations }
     """
+    model = _permanova_model(distance_matrix, grouping)
+    return permutation_block(model['draw'], model['f_stat'], permutations, seed, label='permanova')
+
+
+def _mantel_model(matrix_x: List[List[float]], matrix_y: List[List[float]], method: str) -> Dict:
+    """Mantel 관측 r + 순열 통계량 함수 draw(rng)"""
     mx = np.array(matrix_x, dtype=float)
     my = np.array(matrix_y, dtype=float)
     n = mx.shape[0]
@@ -385,18 +406,73 @@ def mantel_test(
     corr_fn = stats.pearsonr if method == 'pearson' else stats.spearmanr
     r_obs, _ = corr_fn(x, y)
 
-    # 순열 검정
-    r_perms = np.zeros(permutations)
-    for i in range(permutations):
-        perm = np.random.permutation(n)
-        y_perm = my[np.ix_(perm, perm)][tri_idx]
-        r_perms[i], _ = corr_fn(x, y_perm)
+    def draw(rng):
+        perm = rng.permutation(n)
+        r_perm, _ = corr_fn(x, my[np.ix_(perm, perm)][tri_idx])
+        return r_perm
 
-    p_value = float((np.sum(np.abs(r_perms) >= np.abs(r_obs)) + 1) / (permutations + 1))
+    return {'r': r_obs, 'draw': draw}
 
-    return {
+
+@stochastic_method
+def mantel_test(
+    matrix_x: List[List[float]],
+    matrix_y: List[List[float]],
+    permutations: int = 999,
+    method: str = 'pearson',
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    Mantel Test — 두 거리행렬 간 상관 검정 (양측).
+
+    Parameters
+    ----------
+    matrix_x, matrix_y : n×n 거리행렬
+    method : 'pearson' | 'spearman'
+    seed   : 순열 난수 seed (지정 시 결과 재현 + 결과 캐시 가능)
+
+    Returns
+    -------
+    { r, pValue, permutations, method, mcStandardError, stoppingRule, requestedPermutations }
+    순열 수는 순차 정지 규칙으로 결정 (helpers.sequential_permutation_test)
+    취소 시 완료된 순열까지의 p-value + cancelled
+    """
+    model = _mantel_model(matrix_x, matrix_y, method)
+    r_obs = model['r']
+    draw = model['draw']
+
+    # 순차 정지 순열 검정 (양측: |r| 기준, 취소 시 부분 결과)
+    perm_test = sequential_permutation_test(
+        draw, r_obs, permutations, seed=seed, label='mantel_test', two_sided=True,
+    )
+
+    result = {
         "r": round(float(r_obs), 4),
-        "pValue": round(p_value, 4),
-        "permutations": permutations,
+        "pValue": round(perm_test['pValue'], 4),
+        "permutations": perm_test['permutations'],
         "method": method,
+        "mcStandardError": round(perm_test['mcStandardError'], 4),
+        "stoppingRule": perm_test['stoppingRule'],
+        "requestedPermutations": perm_test['requestedPermutations'],
     }
+    if perm_test.get('cancelled'):
+        result["cancelled"] = True
+    return result
+
+
+def mantel_permutation_block(
+    matrix_x: List[List[float]],
+    matrix_y: List[List[float]],
+    permutations: int,
+    seed: List[int],
+    method: str = 'pearson',
+) -> Dict:
+    """
+    Mantel 순열 블록 (다중 Worker 샤딩용, 양측 |r| 기준)
+
+    Returns
+    -------
+    { observed (r), exceedances, permutations }
+    """
+    model = _mantel_model(matrix_x, matrix_y, method)
+    return permutation_block(model['draw'], model['r'], permutations, seed, label='mantel_test', two_sided=True)
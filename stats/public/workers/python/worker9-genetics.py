@@ -2,12 +2,16 @@
 # Notes:
 # - Dependencies: NumPy, SciPy (no additional packages beyond base)
 # - Tools: Hardy-Weinberg equilibrium test, Fst (fixation index)
+# - fst_permutation_block / fst_bootstrap_block: 다중 Worker 샤딩용 고정 크기 블록 (pyodide-shard-pool.ts)
 # - Estimated memory: ~50MB
 
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 import math
 import numpy as np
 from scipy import stats
+from helpers import (
+    ProgressLoop, instrumented, make_rng, permutation_block, sequential_permutation_test, spawn_rngs, stochastic_method,
+)
 
 
 # ─── 내부 함수 ────────────────────────────────────────────
@@ -84,6 +88,7 @@ def _hw_exact_pvalue(het: int, hom1: int, hom2: int) -> float:
     return min(1.0, max(0.0, p_value))
 
 
+@instrumented(size_arg='genotypes')
 def _parse_genotypes(
     genotypes: List[List[str]],
     pop_labels: List[str],
@@ -208,6 +213,7 @@ def _parse_genotypes(
     }
 
 
+@instrumented(size_arg='parsed_gts')
 def _recount_alleles(
     parsed_gts: List[List[Optional[tuple]]],
     pop_labels: List[str],
@@ -275,6 +281,7 @@ def _hudson_fst_pair_components(p1, p2, n1, n2):
     return num, den
 
 
+@instrumented(size_arg='locus_data')
 def _multilocus_hudson_fst(locus_data, pop_labels_unique):
     """
     Multilocus Hudson Fst = Σnum / Σden (ratio of sums).
@@ -337,12 +344,34 @@ def _multilocus_hudson_fst(locus_data, pop_labels_unique):
     return global_fst, pairwise, per_locus_components
 
 
+# 취소된 bootstrap에서 CI를 보고할 최소 반복 수
+_MIN_PARTIAL_BOOTSTRAP = 20
+
+
+def _bootstrap_fst_replicate(per_locus_components: List[Dict], rng) -> float:
+    """Locus 복원추출 bootstrap 1회 Fst (ratio of sums)"""
+    n_loci = len(per_locus_components)
+    indices = rng.choice(n_loci, size=n_loci, replace=True)
+    total_num = 0.0
+    total_den = 0.0
+    for idx in indices:
+        for (_, _), (num, den) in per_locus_components[idx].items():
+            total_num += num
+            total_den += den
+    return max(0.0, total_num / total_den) if total_den > 0 else 0.0
+
+
+@instrumented(size_arg='per_locus_components')
 def _bootstrap_fst_ci(
     per_locus_components: List[Dict],
     n_pops: int,
     n_bootstrap: int,
+    rng: np.random.Generator,
 ) -> Optional[Dict]:
-    """Locus 복원추출 bootstrap — 95% CI 계산. 유전자좌 1개면 None 반환."""
+    """
+    Locus 복원추출 bootstrap — 95% CI 계산. 유전자좌 1개면 None 반환.
+    취소 시 완료된 반복으로 CI 계산 (20회 미만이면 CI 없음) + bootstrapCancelled.
+    """
     n_loci = len(per_locus_components)
     if n_loci < 2 or n_bootstrap <= 0:
         if n_bootstrap > 0 and n_loci < 2:
@@ -356,24 +385,30 @@ def _bootstrap_fst_ci(
         actual_boot = max(100, int(5e7 / (n_loci * n_pairs)))
 
     boot_fsts = []
-    for _ in range(actual_boot):
-        indices = np.random.choice(n_loci, size=n_loci, replace=True)
-        total_num = 0.0
-        total_den = 0.0
-        for idx in indices:
-            for (_, _), (num, den) in per_locus_components[idx].items():
-                total_num += num
-                total_den += den
-        boot_fst = max(0.0, total_num / total_den) if total_den > 0 else 0.0
-        boot_fsts.append(boot_fst)
+    with ProgressLoop(actual_boot, 'fst bootstrap') as loop:
+        for _ in loop:
+            boot_fsts.append(_bootstrap_fst_replicate(per_locus_components, rng))
+    boot_fsts = boot_fsts[:loop.completed]
+
+    if loop.cancelled and len(boot_fsts) < _MIN_PARTIAL_BOOTSTRAP:
+        return {
+            'bootstrapCi': None,
+            'nBootstrap': len(boot_fsts),
+            'bootstrapWarning': "취소됨 — bootstrap 반복 부족으로 CI 생략",
+            'bootstrapCancelled': True,
+        }
 
     ci_lower = float(np.percentile(boot_fsts, 2.5))
     ci_upper = float(np.percentile(boot_fsts, 97.5))
-    return {
+    result = {
         'bootstrapCi': [round(ci_lower, 6), round(ci_upper, 6)],
-        'nBootstrap': actual_boot,
+        'nBootstrap': len(boot_fsts),
         'bootstrapWarning': None,
     }
+    if loop.cancelled:
+        result['bootstrapWarning'] = f"취소됨 — {len(boot_fsts)}/{actual_boot}회 bootstrap으로 CI 계산"
+        result['bootstrapCancelled'] = True
+    return result
 
 
 def _interpret_wright_fst(global_fst: float) -> str:
@@ -604,6 +639,52 @@ def hardy_weinberg(
     return first
 
 
+def _locus_count_data(
+    locusCountData: List[Dict],
+    populationLabels: Optional[List[str]],
+) -> Tuple[List[Dict], List[str]]:
+    """v3 집계 allele count → (_multilocus_hudson_fst 입력 locus_data, 정렬된 집단 라벨)"""
+    # TS에서 전달한 populationLabels 사용 (중복 순회 제거)
+    pop_labels_unique = sorted(populationLabels) if populationLabels else sorted({
+        p for entry in locusCountData for p in entry.get('counts', {}).keys()
+    })
+    if len(pop_labels_unique) < 2:
+        raise ValueError("최소 2개 집단이 필요합니다")
+
+    locus_data = []
+    for entry in locusCountData:
+        alleles = entry.get('alleles', [])
+        counts = entry.get('counts', {})
+        sample_sizes = entry.get('sampleSizes', {})
+        locus_data.append({
+            'alleles': alleles,
+            'counts': {p: counts.get(p, [0] * len(alleles)) for p in pop_labels_unique},
+            'sample_sizes': {p: sample_sizes.get(p, 0) for p in pop_labels_unique},
+        })
+    return locus_data, pop_labels_unique
+
+
+def _fst_permutation_draw(parsed: Dict, individualPopulations: List[str]):
+    """v2 집단 라벨 순열 Fst 함수 draw(rng) — 문자열 파싱은 1회만, 셔플 시 allele 재집계만 수행"""
+    pre_parsed_gts = parsed['_parsed_gts']
+    pre_allele_universes = parsed['_allele_universes']
+    pre_allele_indices = parsed['_allele_indices']
+    pop_arr = np.array(individualPopulations)
+
+    def draw(rng):
+        shuffled_parsed = _recount_alleles(
+            pre_parsed_gts, rng.permutation(pop_arr).tolist(),
+            pre_allele_universes, pre_allele_indices,
+        )
+        perm_fst, _, _ = _multilocus_hudson_fst(
+            shuffled_parsed['locus_data'], shuffled_parsed['pop_labels_unique'],
+        )
+        return perm_fst
+
+    return draw
+
+
+@stochastic_method
 def fst(
     populations: Optional[List[List[Union[float, int]]]] = None,
     populationLabels: Optional[List[str]] = None,
@@ -613,6 +694,7 @@ def fst(
     locusCountData: Optional[List[Dict]] = None,
     nPermutations: int = 999,
     nBootstrap: int = 1000,
+    seed: Optional[int] = None,
 ) -> Dict:
     """
     Fst (Fixation Index) — Hudson (1992) + Bhatia et al. (2013) 편향 보정.
@@ -629,29 +711,17 @@ def fst(
     individualPopulations : v2 — 개체별 집단 라벨
     locusNames            : v2 — 유전자좌 이름 목록
     locusCountData        : v3 — [{locus, alleles, counts: {pop: [...]}, sampleSizes: {pop: int}}, ...]
-    nPermutations         : v2 — permutation 횟수 (0이면 미실행, 기본 999)
+    nPermutations         : v2 — 요청 permutation 횟수 (0이면 미실행, 기본 999, 순차 정지 규칙으로 가감)
     nBootstrap            : v2 — bootstrap 횟수 (0이면 미실행, 기본 1000)
+    seed                  : v2/v3 — 난수 seed (순열/bootstrap은 SeedSequence.spawn으로 분리한 독립 스트림)
     """
+    # 순열과 bootstrap은 서로의 난수 소비량에 영향받지 않도록 하위 스트림 분리
+    perm_rng, boot_rng = spawn_rngs(seed, 2)
+
     # ── v3 경로: 집계된 allele count (long-format) ──
     if locusCountData is not None:
-        # TS에서 전달한 populationLabels 사용 (중복 순회 제거)
-        pop_labels_unique = sorted(populationLabels) if populationLabels else sorted({
-            p for entry in locusCountData for p in entry.get('counts', {}).keys()
-        })
+        locus_data, pop_labels_unique = _locus_count_data(locusCountData, populationLabels)
         n_pops = len(pop_labels_unique)
-        if n_pops < 2:
-            raise ValueError("최소 2개 집단이 필요합니다")
-
-        locus_data = []
-        for entry in locusCountData:
-            alleles = entry.get('alleles', [])
-            counts = entry.get('counts', {})
-            sample_sizes = entry.get('sampleSizes', {})
-            locus_data.append({
-                'alleles': alleles,
-                'counts': {p: counts.get(p, [0] * len(alleles)) for p in pop_labels_unique},
-                'sample_sizes': {p: sample_sizes.get(p, 0) for p in pop_labels_unique},
-            })
 
         locus_list = [e.get('locus', f"Locus {i+1}") for i, e in enumerate(locusCountData)]
 
@@ -671,7 +741,7 @@ def fst(
             'nPermutations': 0,
         }
 
-        boot_result = _bootstrap_fst_ci(per_locus_components, n_pops, nBootstrap)
+        boot_result = _bootstrap_fst_ci(per_locus_components, n_pops, nBootstrap, boot_rng)
         if boot_result:
             result.update(boot_result)
 
@@ -704,46 +774,32 @@ def fst(
         }
 
         # ── Permutation test ──
-        n_ind = parsed['n_individuals']
         if nPermutations > 0:
-            # 사전 예산 추정: per-perm 비용 ∝ O(n_ind × n_loci), Pyodide 60s 타임아웃 고려
-            actual_perm = nPermutations
-            budget = n_ind * len(locus_list) * nPermutations
-            if budget > 5e8:    # e.g. 500 ind × 50 loci × 999
-                actual_perm = 99
-            elif budget > 1e8:  # e.g. 200 ind × 10 loci × 999
-                actual_perm = 499
-
-            # 최적화: 문자열 파싱은 1회만, 집단 라벨 셔플 시 allele 재집계만 수행
-            pre_parsed_gts = parsed['_parsed_gts']
-            pre_allele_universes = parsed['_allele_universes']
-            pre_allele_indices = parsed['_allele_indices']
-
-            pop_arr = np.array(individualPopulations)
-            count_ge = 0
-            for _ in range(actual_perm):
-                shuffled = np.random.permutation(pop_arr)
-                shuffled_list = shuffled.tolist()
-                shuffled_parsed = _recount_alleles(
-                    pre_parsed_gts, shuffled_list,
-                    pre_allele_universes, pre_allele_indices,
-                )
-                perm_fst, _, _ = _multilocus_hudson_fst(
-                    shuffled_parsed['locus_data'], shuffled_parsed['pop_labels_unique'],
-                )
-                if perm_fst >= global_fst:
-                    count_ge += 1
-
-            perm_p = (count_ge + 1) / (actual_perm + 1)
-            result['permutationPValue'] = round(perm_p, 6)
-            result['nPermutations'] = actual_perm
+            draw = _fst_permutation_draw(parsed, individualPopulations)
+
+            # 순차 정지 순열 검정: per-perm 비용 ∝ O(n_ind × n_loci)이므로 고정 횟수 축소 대신
+            # 시간 예산(Pyodide 60s 타임아웃 고려)과 Besag-Clifford 조기 정지로 조절
+            perm_test = sequential_permutation_test(
+                draw, global_fst, nPermutations, seed=perm_rng, label='fst permutation',
+            )
+            result['permutationPValue'] = round(perm_test['pValue'], 6)
+            result['nPermutations'] = perm_test['permutations']
+            result['mcStandardError'] = round(perm_test['mcStandardError'], 6)
+            result['stoppingRule'] = perm_test['stoppingRule']
+            result['requestedPermutations'] = perm_test['requestedPermutations']
+            if perm_test.get('cancelled'):
+                # 취소 시 완료된 순열까지의 p-value만 보고하고 bootstrap은 생략
+                result['cancelled'] = True
+                nBootstrap = 0
         else:
             result['permutationPValue'] = None
             result['nPermutations'] = 0
 
         # ── Bootstrap CI ──
-        boot_result = _bootstrap_fst_ci(per_locus_components, n_pops, nBootstrap)
+        boot_result = _bootstrap_fst_ci(per_locus_components, n_pops, nBootstrap, boot_rng)
         if boot_result:
+            if boot_result.pop('bootstrapCancelled', False):
+                result['cancelled'] = True
             result.update(boot_result)
 
         return result
@@ -799,6 +855,71 @@ def fst(
     }
 
 
+def fst_permutation_block(
+    genotypes: List[List[str]],
+    individualPopulations: List[str],
+    permutations: int,
+    seed: List[int],
+    locusNames: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Fst 집단 라벨 순열 블록 (v2 유전자형 입력, 다중 Worker 샤딩용)
+
+    Returns
+    -------
+    { observed (globalFst), exceedances, permutations }
+    """
+    n_loci = len(genotypes[0]) if genotypes else 0
+    locus_list = locusNames if locusNames and len(locusNames) == n_loci else [f"Locus {i+1}" for i in range(n_loci)]
+    parsed = _parse_genotypes(genotypes, individualPopulations, locus_list)
+    global_fst, _, _ = _multilocus_hudson_fst(parsed['locus_data'], parsed['pop_labels_unique'])
+
+    draw = _fst_permutation_draw(parsed, individualPopulations)
+    return permutation_block(draw, global_fst, permutations, seed, label='fst permutation')
+
+
+def fst_bootstrap_block(
+    nBootstrap: int,
+    seed: List[int],
+    genotypes: Optional[List[List[str]]] = None,
+    individualPopulations: Optional[List[str]] = None,
+    locusCountData: Optional[List[Dict]] = None,
+    populationLabels: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Fst locus bootstrap 블록 (v2 유전자형 또는 v3 집계 입력, 다중 Worker 샤딩용)
+
+    CI는 JS 쪽에서 블록 replicate를 합친 뒤 백분위수(2.5%, 97.5%)로 계산한다.
+
+    Returns
+    -------
+    { replicates: [Fst, ...], nBootstrap }
+    """
+    if locusCountData is not None:
+        locus_data, pop_labels_unique = _locus_count_data(locusCountData, populationLabels)
+    elif genotypes is not None and individualPopulations:
+        n_loci = len(genotypes[0]) if genotypes else 0
+        parsed = _parse_genotypes(genotypes, individualPopulations, [f"Locus {i+1}" for i in range(n_loci)])
+        locus_data, pop_labels_unique = parsed['locus_data'], parsed['pop_labels_unique']
+    else:
+        raise ValueError("genotypes + individualPopulations 또는 locusCountData가 필요합니다")
+
+    _, _, per_locus_components = _multilocus_hudson_fst(locus_data, pop_labels_unique)
+    if len(per_locus_components) < 2:
+        raise ValueError("유전자좌 1개 — bootstrap CI 불가")
+
+    rng = make_rng(seed)
+    replicates = []
+    with ProgressLoop(nBootstrap, 'fst bootstrap') as loop:
+        for _ in loop:
+            replicates.append(_bootstrap_fst_replicate(per_locus_components, rng))
+
+    result: Dict = {'replicates': replicates[:loop.completed], 'nBootstrap': loop.completed}
+    if loop.cancelled:
+        result['cancelled'] = True
+    return result
+
+
 def seq_similarity(
     sequences: List[str],
     labels: List[str],
@@ -0,0 +1,205 @@
+"""
+Worker 벤치마크용 합성 데이터 생성기
+
+목적: 통계/생태/유전/분자생물 Worker 메서드 입력을 크기 n으로 재현 가능하게 생성
+- 모든 값은 JSON 직렬화 가능한 Python 기본 타입 (Pyodide 브리지를 거친 입력과 같은 형태)
+- 같은 (seed, n)이면 항상 같은 데이터
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+DNA_BASES = np.array(list('ACGT'))
+AMINO_ACIDS = np.array(list('ACDEFGHIKLMNPQRSTVWY'))
+
+
+class SyntheticData:
+    """크기 n 하나에 대한 도메인별 합성 데이터"""
+
+    def __init__(self, n: int, seed: int = 0):
+        self.n = n
+        self.rng = np.random.default_rng([seed, n])
+
+    # ------------------------------------------------------------------
+    # 수치 데이터
+    # ------------------------------------------------------------------
+
+    def numeric(self, n: int = None, loc: float = 50.0, scale: float = 10.0) -> List[float]:
+        """정규분포 수치 배열"""
+        return self.rng.normal(loc, scale, n or self.n).tolist()
+
+    def positive(self, n: int = None) -> List[float]:
+        """양수 수치 배열 (로그 정규)"""
+        return self.rng.lognormal(1.0, 0.5, n or self.n).tolist()
+
+    def groups(self, k: int = 3, n: int = None, shift: float = 1.0) -> List[List[float]]:
+        """k개 집단, 전체 n개 관측 (집단 평균을 shift씩 이동)"""
+        size = max((n or self.n) // k, 3)
+        return [self.rng.normal(50.0 + i * shift, 10.0, size).tolist() for i in range(k)]
+
+    def labels(self, k: int = 3, n: int = None, prefix: str = 'G') -> List[str]:
+        """k개 범주 라벨 (모든 범주가 최소 한 번 등장)"""
+        n = n or self.n
+        codes = np.arange(n) % k
+        self.rng.shuffle(codes)
+        return [f'{prefix}{c + 1}' for c in codes]
+
+    def binary(self, n: int = None, p: float = 0.5) -> List[int]:
+        """0/1 배열"""
+        return self.rng.binomial(1, p, n or self.n).tolist()
+
+    def counts(self, n: int = None, lam: float = 3.0) -> List[int]:
+        """Poisson 계수 배열"""
+        return self.rng.poisson(lam, n or self.n).tolist()
+
+    def matrix(self, p: int = 4, n: int = None, correlated: bool = True) -> List[List[float]]:
+        """n × p 행렬 (correlated면 공통 잠재 요인 포함)"""
+        n = n or self.n
+        X = self.rng.normal(0.0, 1.0, (n, p))
+        if correlated:
+            X += self.rng.normal(0.0, 1.0, (n, 1))
+        return X.tolist()
+
+    def linear_response(self, X: List[List[float]], noise: float = 1.0) -> List[float]:
+        """X의 선형 결합 + 잡음"""
+        arr = np.asarray(X)
+        beta = np.linspace(1.0, 0.2, arr.shape[1])
+        return (arr @ beta + self.rng.normal(0.0, noise, arr.shape[0])).tolist()
+
+    def logistic_response(self, X: List[List[float]]) -> List[int]:
+        """X의 로지스틱 모형에서 생성한 0/1 반응"""
+        arr = np.asarray(X)
+        eta = arr @ np.linspace(0.8, 0.1, arr.shape[1])
+        return self.rng.binomial(1, 1.0 / (1.0 + np.exp(-eta))).tolist()
+
+    def records(self, numeric: List[str], categorical: Dict[str, int] = None,
+                n: int = None) -> List[Dict]:
+        """행 객체 배열 (PapaParse JSON 형태): 수치 열 + k수준 범주 열"""
+        n = n or self.n
+        columns = {name: self.rng.normal(50.0, 10.0, n) for name in numeric}
+        if numeric:
+            # 첫 열(종속변수)이 나머지 열과 관련되도록 구성
+            first = numeric[0]
+            for other in numeric[1:]:
+                columns[first] = columns[first] + 0.5 * columns[other]
+        cat_columns = {
+            name: self.labels(k, n, prefix=name[:1].upper())
+            for name, k in (categorical or {}).items()
+        }
+        rows = []
+        for i in range(n):
+            row = {name: float(col[i]) for name, col in columns.items()}
+            row.update({name: col[i] for name, col in cat_columns.items()})
+            rows.append(row)
+        return rows
+
+    def series(self, n: int = None, period: int = 12) -> List[float]:
+        """추세 + 계절성 + AR(1) 잡음 시계열"""
+        n = n or self.n
+        t = np.arange(n)
+        noise = np.zeros(n)
+        eps = self.rng.normal(0.0, 1.0, n)
+        for i in range(1, n):
+            noise[i] = 0.6 * noise[i - 1] + eps[i]
+        return (100.0 + 0.05 * t + 5.0 * np.sin(2 * np.pi * t / period) + noise).tolist()
+
+    def contingency(self, rows: int = 3, cols: int = 3, n: int = None) -> List[List[int]]:
+        """총합 n인 r × c 분할표 (모든 칸 1 이상)"""
+        n = max(n or self.n, rows * cols)
+        cells = self.rng.multinomial(n - rows * cols, np.full(rows * cols, 1.0 / (rows * cols))) + 1
+        return cells.reshape(rows, cols).tolist()
+
+    # ------------------------------------------------------------------
+    # 생존 / 어업
+    # ------------------------------------------------------------------
+
+    def survival(self, n: int = None) -> Dict[str, List]:
+        """지수분포 생존 시간 + 약 30% 중도절단"""
+        n = n or self.n
+        times = self.rng.exponential(10.0, n) + 0.1
+        events = (self.rng.random(n) > 0.3).astype(int)
+        return {'times': np.round(times, 3).tolist(), 'events': events.tolist()}
+
+    def fish_growth(self, n: int = None) -> Dict[str, List[float]]:
+        """von Bertalanffy 성장(연령-체장) + 체장-체중 관계"""
+        n = n or self.n
+        ages = self.rng.uniform(0.5, 15.0, n)
+        lengths = 80.0 * (1.0 - np.exp(-0.3 * (ages + 0.5))) + self.rng.normal(0.0, 2.0, n)
+        lengths = np.clip(lengths, 1.0, None)
+        weights = 0.01 * lengths ** 3.05 * np.exp(self.rng.normal(0.0, 0.05, n))
+        return {'ages': ages.tolist(), 'lengths': lengths.tolist(), 'weights': weights.tolist()}
+
+    # ------------------------------------------------------------------
+    # 생태 (종 풍부도)
+    # ------------------------------------------------------------------
+
+    def abundance_rows(self, n_sites: int = None, n_species: int = 30,
+                       site_col: str = 'site') -> List[Dict]:
+        """지점 × 종 풍부도 행 (음이항 분포, PapaParse JSON 형태)"""
+        n_sites = n_sites or self.n
+        means = self.rng.lognormal(1.0, 1.0, n_species)
+        matrix = self.rng.negative_binomial(2, 2.0 / (2.0 + means), (n_sites, n_species))
+        matrix[:, 0] += 1  # 빈 지점 방지
+        species = [f'sp{j + 1}' for j in range(n_species)]
+        return [
+            {site_col: f'S{i + 1}', **dict(zip(species, map(int, counts)))}
+            for i, counts in enumerate(matrix)
+        ]
+
+    def distance_matrix(self, n: int = None, dims: int = 3) -> List[List[float]]:
+        """n개 점의 유클리드 거리 행렬 (대칭, 대각 0)"""
+        n = n or self.n
+        points = self.rng.normal(0.0, 1.0, (n, dims))
+        diff = points[:, None, :] - points[None, :, :]
+        return np.sqrt((diff ** 2).sum(axis=-1)).tolist()
+
+    # ------------------------------------------------------------------
+    # 유전 / 서열
+    # ------------------------------------------------------------------
+
+    def genotype_counts(self, n_loci: int = None, n_ind: int = 200) -> List[List[int]]:
+        """유전자좌별 [AA, Aa, aa] 관측 수 (HWE 근처)"""
+        n_loci = n_loci or self.n
+        p = self.rng.uniform(0.2, 0.8, n_loci)
+        probs = np.stack([p ** 2, 2 * p * (1 - p), (1 - p) ** 2], axis=1)
+        return [self.rng.multinomial(n_ind, row).tolist() for row in probs]
+
+    def genotype_table(self, n_ind: int = None, n_loci: int = 8,
+                       n_pops: int = 3) -> Dict[str, List]:
+        """개체 × 유전자좌 'A/B' 유전자형 + 집단 라벨 (집단별 allele 빈도 차이)"""
+        n_ind = n_ind or self.n
+        pops = self.labels(n_pops, n_ind, prefix='P')
+        pop_index = np.array([int(label[1:]) - 1 for label in pops])
+        alleles = np.array(['A', 'B', 'C'])
+        base = self.rng.dirichlet(np.ones(3), n_loci)
+        genotypes = np.empty((n_ind, n_loci), dtype=object)
+        for k in range(n_pops):
+            members = np.flatnonzero(pop_index == k)
+            for j in range(n_loci):
+                freqs = self.rng.dirichlet(base[j] * 20.0)
+                draws = self.rng.choice(alleles, (len(members), 2), p=freqs)
+                genotypes[members, j] = [f'{a}/{b}' for a, b in draws]
+        return {'genotypes': genotypes.tolist(), 'populations': pops}
+
+    def dna(self, length: int = None) -> str:
+        """무작위 DNA 서열 (ATG 시작)"""
+        length = length or self.n
+        return 'ATG' + ''.join(self.rng.choice(DNA_BASES, max(length - 3, 0)))
+
+    def protein(self, length: int = None) -> str:
+        """무작위 단백질 서열"""
+        return ''.join(self.rng.choice(AMINO_ACIDS, length or self.n))
+
+    def aligned_sequences(self, n_seq: int = 8, length: int = None,
+                          mutation_rate: float = 0.05) -> List[str]:
+        """공통 조상에서 점 돌연변이로 만든 정렬 DNA 서열"""
+        length = length or self.n
+        ancestor = self.rng.choice(DNA_BASES, length)
+        sequences = []
+        for _ in range(n_seq):
+            seq = ancestor.copy()
+            mutated = self.rng.random(length) < mutation_rate
+            seq[mutated] = self.rng.choice(DNA_BASES, int(mutated.sum()))
+            sequences.append(''.join(seq))
+        return sequences
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Python Worker 메서드 벤치마크 (CPython)
+
+목적: worker1~10의 모든 public 메서드를 입력 크기 n = 1e2 … 1e6으로 늘려가며
+실행 시간과 최대 메모리를 측정하고, JSON 기준선과 비교해 성능 회귀를 검출
+
+- 입력: synthetic_data.SyntheticData (도메인별 합성 데이터, seed 고정)
+- 케이스: worker_cases.CASES (메서드별 파라미터 생성 + n 상한)
+- 시간: time.perf_counter 반복 측정 중앙값 (데이터 생성 시간 제외)
+- 메모리: tracemalloc 최대 할당량 (NumPy 버퍼 포함, 별도 1회 실행)
+- 다음 크기의 예상 시간(선형 외삽)이 --time-cap을 넘으면 해당 메서드는 중단
+
+CPython 기준 측정값이므로 Pyodide(WASM)에서는 절대값이 더 크지만 크기별 증가 추세는 유사
+의존성이 없는 Worker(matplotlib, Biopython 미설치 등)는 skipped로 기록
+
+사용법:
+    python scripts/benchmarks/worker_benchmark.py 1 3 --sizes 100 1000 10000
+    python scripts/benchmarks/worker_benchmark.py --json bench-baseline.json
+    python scripts/benchmarks/worker_benchmark.py --baseline bench-baseline.json --fail-on-regression
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_data import SyntheticData  # noqa: E402
+from worker_cases import CASES, BenchCase  # noqa: E402
+
+WORKER_DIR = Path(__file__).resolve().parent.parent.parent / 'public' / 'workers' / 'python'
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+# 이 값보다 짧은 측정은 잡음으로 보고 회귀 판정에서 제외
+NOISE_FLOOR_S = 0.001
+NOISE_FLOOR_BYTES = 1024 * 1024
+
+
+def find_worker_file(worker_num: int) -> Path:
+    """worker{N}-*.py 경로 탐색"""
+    matches = sorted(WORKER_DIR.glob(f'worker{worker_num}-*.py'))
+    if not matches:
+        raise FileNotFoundError(f'Worker {worker_num} 파일 없음: {WORKER_DIR}')
+    return matches[0]
+
+
+def collect_public_methods(source: str) -> List[str]:
+    """모듈 최상위 public 함수명 (Worker가 노출하는 메서드)"""
+    tree = ast.parse(source)
+    return [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and not node.name.startswith('_')
+    ]
+
+
+def load_worker(worker_num: int) -> ModuleType:
+    """Worker 모듈 로드 (helpers import를 위해 Worker 디렉터리를 sys.path에 추가)"""
+    if str(WORKER_DIR) not in sys.path:
+        sys.path.insert(0, str(WORKER_DIR))
+    path = find_worker_file(worker_num)
+    spec = importlib.util.spec_from_file_location(f'worker{worker_num}_bench', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+def _call(fn: Callable, params: Dict) -> float:
+    """1회 호출 시간(초)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.perf_counter()
+        fn(**params)
+        return time.perf_counter() - start
+
+
+def measure(fn: Callable, params: Dict, repeat: int, memory: bool = True,
+            warmup: bool = False) -> Dict:
+    """
+    실행 시간 중앙값 + 최대 메모리 측정
+
+    1회 실행이 1초를 넘으면 반복하지 않는다 (큰 n에서 측정 시간 절약).
+    메모리는 tracemalloc 오버헤드가 시간에 섞이지 않도록 별도 실행으로 측정한다.
+    warmup: 함수 안 지연 import(pandas, statsmodels 등)를 첫 크기 측정에서 제외
+    """
+    if warmup:
+        _call(fn, params)
+    timings = [_call(fn, params)]
+    while len(timings) < repeat and timings[0] < 1.0:
+        timings.append(_call(fn, params))
+
+    point = {'seconds': statistics.median(timings), 'runs': len(timings)}
+    if memory:
+        tracemalloc.start()
+        try:
+            _call(fn, params)
+            point['peakBytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return point
+
+
+def benchmark_method(fn: Callable, case: BenchCase, sizes: List[int], time_cap: float,
+                     repeat: int, seed: int, memory: bool = True) -> Dict:
+    """
+    메서드 하나를 크기별로 측정
+
+    Returns:
+        { note, points: [{n, seconds, runs, peakBytes}], stopped, error? }
+        stopped: completed | time-cap | max-n | fixed-input | error
+    """
+    result: Dict = {'note': case.note, 'points': [], 'stopped': 'completed'}
+    run_sizes = sizes if case.scalable else sizes[:1]
+
+    for i, n in enumerate(run_sizes):
+        if case.max_n is not None and n > case.max_n:
+            result['stopped'] = 'max-n'
+            break
+
+        try:
+            params = case.build(SyntheticData(n, seed))
+            point = measure(fn, params, repeat, memory, warmup=i == 0)
+        except Exception as exc:  # noqa: BLE001 — 메서드 오류는 리포트에 기록하고 다음 메서드로
+            result['stopped'] = 'error'
+            result['error'] = f'n={n}: {type(exc).__name__}: {exc}'[:300]
+            break
+
+        result['points'].append({'n': n, **point})
+
+        if i + 1 < len(run_sizes):
+            # 선형 외삽: 다음 크기에서 적어도 이만큼은 걸린다
+            projected = point['seconds'] * run_sizes[i + 1] / n
+            if projected > time_cap:
+                result['stopped'] = 'time-cap'
+                break
+
+    if not case.scalable:
+        result['stopped'] = 'fixed-input'
+    return result
+
+
+def build_report(workers: List[int], sizes: List[int], time_cap: float, repeat: int,
+                 seed: int, methods: Optional[List[str]] = None, memory: bool = True,
+                 verbose: bool = True) -> Dict:
+    """Worker 목록 전체 벤치마크 리포트 생성"""
+    import scipy
+
+    report: Dict = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'platform': platform.platform(),
+        },
+        'config': {'sizes': sizes, 'timeCapS': time_cap, 'repeat': repeat, 'seed': seed},
+        'methods': {},
+        'skipped': {},
+    }
+
+    for worker_num in workers:
+        try:
+            module = load_worker(worker_num)
+        except (ImportError, SyntaxError) as exc:
+            # SyntaxError: Pyodide 전용 최상위 await (worker6 micropip.install)
+            report['skipped'][f'worker{worker_num}'] = f'{type(exc).__name__}: {exc}'
+            if verbose:
+                print(f'[Worker {worker_num}] 건너뜀: {exc}')
+            continue
+
+        source = find_worker_file(worker_num).read_text(encoding='utf-8')
+        for name in collect_public_methods(source):
+            if methods and name not in methods:
+                continue
+            key = f'worker{worker_num}.{name}'
+            case = CASES.get(worker_num, {}).get(name)
+            if case is None:
+                report['skipped'][key] = '벤치마크 케이스 없음 (worker_cases.CASES에 등록 필요)'
+                continue
+
+            entry = benchmark_method(getattr(module, name), case, sizes, time_cap, repeat, seed, memory)
+            report['methods'][key] = {'worker': worker_num, 'method': name, **entry}
+            if verbose:
+                print_method(key, report['methods'][key])
+
+    return report
+
+
+# ============================================================================
+# 기준선 비교
+# ============================================================================
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = 0.25) -> List[Dict]:
+    """
+    같은 (메서드, n) 측정값을 기준선과 비교
+
+    Returns:
+        [{method, n, metric: seconds|peakBytes, baseline, current, ratio, status}]
+        status: regression | improvement (잡음 하한 미만 차이는 제외)
+    """
+    changes: List[Dict] = []
+    floors = {'seconds': NOISE_FLOOR_S, 'peakBytes': NOISE_FLOOR_BYTES}
+
+    for key, entry in current.get('methods', {}).items():
+        base_entry = baseline.get('methods', {}).get(key)
+        if not base_entry:
+            continue
+        base_points = {point['n']: point for point in base_entry['points']}
+        for point in entry['points']:
+            base_point = base_points.get(point['n'])
+            if base_point is None:
+                continue
+            for metric, floor in floors.items():
+                before, after = base_point.get(metric), point.get(metric)
+                if before is None or after is None or abs(after - before) < floor or before <= 0:
+                    continue
+                ratio = after / before
+                if ratio > 1 + threshold:
+                    status = 'regression'
+                elif ratio < 1 / (1 + threshold):
+                    status = 'improvement'
+                else:
+                    continue
+                changes.append({
+                    'method': key,
+                    'n': point['n'],
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'ratio': round(ratio, 3),
+                    'status': status,
+                })
+
+    return changes
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+
+def _format_bytes(value: Optional[int]) -> str:
+    if value is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            return f'{value:.0f}{unit}' if unit == 'B' else f'{value:.1f}{unit}'
+        value /= 1024
+    return '-'
+
+
+def print_method(key: str, entry: Dict) -> None:
+    """메서드 한 줄 요약: 크기별 시간/메모리 + 중단 사유"""
+    cells = [
+        f"n={point['n']:.0e} {point['seconds'] * 1000:.1f}ms/{_format_bytes(point.get('peakBytes'))}"
+        for point in entry['points']
+    ]
+    suffix = entry['stopped'] if entry['stopped'] == 'completed' else f"[{entry['stopped']}]"
+    print(f"  {key:<46} {'  '.join(cells) or '-'}  {suffix}")
+    if entry.get('error'):
+        print(f"    ! {entry['error']}")
+
+
+def print_changes(changes: List[Dict]) -> None:
+    """기준선 대비 변화 표"""
+    if not changes:
+        print('\n기준선 대비 유의한 변화 없음')
+        return
+    print(f"\n  {'메서드':<46} {'n':>9} {'지표':<10} {'기준선':>12} {'현재':>12} {'비율':>7}")
+    for change in sorted(changes, key=lambda c: (c['status'], -c['ratio'])):
+        if change['metric'] == 'seconds':
+            before, after = f"{change['baseline'] * 1000:.1f}ms", f"{change['current'] * 1000:.1f}ms"
+        else:
+            before, after = _format_bytes(change['baseline']), _format_bytes(change['current'])
+        mark = '▲' if change['status'] == 'regression' else '▼'
+        print(
+            f"  {change['method']:<46} {change['n']:>9} {change['metric']:<10} "
+            f"{before:>12} {after:>12} {change['ratio']:>6.2f}x {mark}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Python Worker 메서드 크기별 벤치마크')
+    parser.add_argument('workers', nargs='*', type=int, default=list(range(1, 11)), help='Worker 번호 (기본: 1~10)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='입력 크기 목록 (기본: 1e2~1e6)')
+    parser.add_argument('--time-cap', type=float, default=10.0, help='메서드별 1회 실행 시간 상한(초), 넘을 것으로 예상되면 중단')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 seed')
+    parser.add_argument('--method', dest='methods', action='append', help='특정 메서드만 측정 (여러 번 지정 가능)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--json', dest='json_path', help='JSON 리포트 저장 경로 (기준선으로 사용)')
+    parser.add_argument('--baseline', help='비교할 기준선 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=0.25, help='회귀 판정 비율 (기본 0.25 = 25%% 느려짐)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    sizes = sorted(set(args.sizes))
+    print(f"크기: {', '.join(f'{n:.0e}' for n in sizes)} / 시간 상한 {args.time_cap:g}s / 반복 {args.repeat}")
+    report = build_report(
+        args.workers, sizes, args.time_cap, args.repeat, args.seed,
+        methods=args.methods, memory=not args.no_memory,
+    )
+
+    missing = {key: reason for key, reason in report['skipped'].items() if '.' in key}
+    if missing:
+        print(f'\n케이스 없는 메서드 {len(missing)}개: {", ".join(sorted(missing))}')
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f'\nJSON 저장: {args.json_path}')
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        changes = compare_reports(baseline, report, args.threshold)
+        print_changes(changes)
+        if args.fail_on_regression and any(c['status'] == 'regression' for c in changes):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Worker 메서드별 벤치마크 케이스
+
+각 public 메서드에 대해 크기 n → 호출 파라미터를 만드는 build 함수를 등록한다.
+n의 의미는 메서드마다 다르며 (관측 수, 지점 수, 개체 수, 서열 길이) note에 적는다.
+
+- max_n: 입력 자체가 O(n²)이거나 (거리 행렬) 알고리즘이 n에 대해 급격히 느려지는
+  메서드의 상한. 시간 상한(--time-cap)과 별도로 적용
+- scalable=False: 요약 통계만 받는 메서드 (입력 크기와 무관) → 첫 크기에서만 측정
+
+새 public 메서드를 추가하면 여기에도 케이스를 등록해야 한다
+(__tests__/workers/test_worker_benchmark_cases.py가 누락을 검사)
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from synthetic_data import SyntheticData
+
+
+class BenchCase(NamedTuple):
+    build: Callable[[SyntheticData], Dict]
+    max_n: Optional[int] = None
+    scalable: bool = True
+    note: str = 'observations'
+
+
+def _fixed(params: Dict) -> BenchCase:
+    """입력 크기와 무관한 메서드 (요약 통계 입력)"""
+    return BenchCase(lambda d: dict(params), scalable=False, note='summary input')
+
+
+def _sketch_state(values: List[float]) -> Dict:
+    """compaction 전(단일 레벨) 기술통계 스케치 상태"""
+    n = len(values)
+    mean = sum(values) / n
+    dev = [v - mean for v in values]
+    return {
+        'n': n, 'mean': mean,
+        'm2': sum(v ** 2 for v in dev), 'm3': sum(v ** 3 for v in dev), 'm4': sum(v ** 4 for v in dev),
+        'min': min(values), 'max': max(values),
+        'k': 200, 'levels': [values], 'parity': [0],
+    }
+
+
+def _regression(d: SyntheticData, p: int = 3) -> Dict:
+    X = d.matrix(p)
+    return {'xMatrix': X, 'yValues': d.linear_response(X)}
+
+
+def _logistic(d: SyntheticData, p: int = 3) -> Dict:
+    X = d.matrix(p, correlated=False)
+    return {'xMatrix': X, 'yValues': d.logistic_response(X)}
+
+
+def _ordinal_records(d: SyntheticData) -> Dict:
+    rows = d.records(['x1', 'x2'])
+    for row in rows:
+        row['y'] = int(min(max((row['x1'] - 20.0) // 20.0, 0), 3))
+    return {'dependent_var': 'y', 'independent_vars': ['x1', 'x2'], 'data': rows}
+
+
+def _grouped_records(d: SyntheticData, groups: int = 10) -> List[Dict]:
+    """집단별 무선 절편이 있는 행 데이터 (혼합모형용)"""
+    rows = d.records(['y', 'x'], {'group': groups})
+    intercepts = dict(zip([f'G{g + 1}' for g in range(groups)], d.rng.normal(0.0, 5.0, groups)))
+    for row in rows:
+        row['y'] += intercepts[row['group']]
+    return rows
+
+
+def _dose_response(d: SyntheticData) -> Dict:
+    dose = d.rng.uniform(0.1, 100.0, d.n)
+    response = 5.0 + 95.0 / (1.0 + (20.0 / dose) ** 1.5) + d.rng.normal(0.0, 3.0, d.n)
+    return {'doseData': dose.tolist(), 'responseData': response.tolist()}
+
+
+def _two_way(d: SyntheticData, factors: int = 2) -> Dict:
+    params = {'dataValues': d.numeric()}
+    names = ['factor1Values', 'factor2Values', 'factor3Values'][:factors]
+    for i, name in enumerate(names):
+        params[name] = d.labels(2 + i % 2, prefix='ABC'[i])
+    return params
+
+
+def _repeated(d: SyntheticData, k: int = 4) -> Dict:
+    subjects = max(d.n // k, 3)
+    base = d.rng.normal(50.0, 10.0, (subjects, 1))
+    matrix = base + d.rng.normal(0.0, 3.0, (subjects, k)) + [0.5 * t for t in range(k)]
+    return {
+        'dataMatrix': matrix.tolist(),
+        'subjectIds': [f's{i + 1}' for i in range(subjects)],
+        'timeLabels': [f't{t + 1}' for t in range(k)],
+    }
+
+
+def _binary_matrix(d: SyntheticData, k: int = 4) -> Dict:
+    subjects = max(d.n // k, 3)
+    probs = [0.3 + 0.1 * t for t in range(k)]
+    return {'dataMatrix': [[int(d.rng.random() < p) for p in probs] for _ in range(subjects)]}
+
+
+def _fst_genotypes(d: SyntheticData) -> Dict:
+    table = d.genotype_table()
+    return {'genotypes': table['genotypes'], 'individualPopulations': table['populations']}
+
+
+def _sequences(d: SyntheticData) -> Dict:
+    sequences = d.aligned_sequences()
+    return {'sequences': sequences, 'labels': [f'seq{i + 1}' for i in range(len(sequences))]}
+
+
+# ============================================================================
+# Worker별 케이스
+# ============================================================================
+
+CASES: Dict[int, Dict[str, BenchCase]] = {
+    1: {
+        'descriptive_stats': BenchCase(lambda d: {'data': d.numeric()}),
+        'descriptive_stats_table': BenchCase(lambda d: {'columns': {f'v{i}': d.numeric() for i in range(20)}}, note='rows x 20 columns'),
+        'descriptive_sketch_update': BenchCase(lambda d: {'data': d.numeric()}),
+        'descriptive_sketch_merge': BenchCase(lambda d: {'states': [_sketch_state(d.numeric()) for _ in range(4)]}, note='observations per shard'),
+        'descriptive_sketch_finalize': BenchCase(lambda d: {'state': _sketch_state(d.numeric())}),
+        'normality_test': BenchCase(lambda d: {'data': d.numeric()}),
+        'outlier_detection': BenchCase(lambda d: {'data': d.numeric()}),
+        'frequency_analysis': BenchCase(lambda d: {'values': d.labels(12)}),
+        'crosstab_analysis': BenchCase(lambda d: {'rowValues': d.labels(200, prefix='R'), 'colValues': d.labels(50, prefix='C')}, note='200 x 50 categories'),
+        'one_sample_proportion_test': _fixed({'successCount': 60, 'totalCount': 100}),
+        'cronbach_alpha': BenchCase(lambda d: {'itemsMatrix': d.matrix(6)}, note='respondents'),
+        'kolmogorov_smirnov_test': BenchCase(lambda d: {'data': d.numeric()}),
+        'ks_test_one_sample': BenchCase(lambda d: {'values': d.numeric()}),
+        'ks_test_two_sample': BenchCase(lambda d: {'values1': d.numeric(), 'values2': d.numeric(loc=52.0)}),
+        'mann_kendall_test': BenchCase(lambda d: {'data': d.series()}),
+        'seasonal_mann_kendall_test': BenchCase(lambda d: {'data': d.series(), 'seasonalPeriods': 12}),
+        'regional_mann_kendall_test': BenchCase(lambda d: {'series': [d.series() for _ in range(5)]}, note='observations per station'),
+        'bonferroni_correction': BenchCase(lambda d: {'pValues': d.rng.uniform(0.0, 1.0, d.n).tolist()}, note='p-values'),
+        'means_plot_data': BenchCase(lambda d: {'data': d.records(['y'], {'group': 4}), 'dependentVar': 'y', 'factorVar': 'group'}),
+        'effect_size_from_t': _fixed({'tValue': 2.5, 'df': 58, 'n1': 30, 'n2': 30}),
+        'effect_size_from_f': _fixed({'fValue': 4.2, 'dfBetween': 2, 'dfWithin': 57}),
+        'effect_size_from_chi_square': _fixed({'chiSquare': 9.5, 'n': 120, 'df': 4, 'rows': 3, 'cols': 3}),
+        'effect_size_from_r': _fixed({'r': 0.35, 'n': 80}),
+        'effect_size_from_d': _fixed({'d': 0.6, 'n1': 30, 'n2': 30}),
+        'effect_size_from_odds_ratio': _fixed({'oddsRatio': 2.4, 'ciLower': 1.3, 'ciUpper': 4.4}),
+        'effect_size_from_means': _fixed({'mean1': 52.0, 'std1': 10.0, 'n1': 30, 'mean2': 47.0, 'std2': 9.0, 'n2': 30}),
+        'convert_effect_sizes': _fixed({'inputType': 'd', 'value': 0.6, 'n1': 30, 'n2': 30}),
+    },
+    2: {
+        't_test_two_sample': BenchCase(lambda d: {'group1': d.numeric(), 'group2': d.numeric(loc=52.0)}),
+        't_test_paired': BenchCase(lambda d: {'values1': d.numeric(), 'values2': d.numeric(loc=51.0)}),
+        't_test_one_sample': BenchCase(lambda d: {'data': d.numeric(), 'popmean': 50.0}),
+        't_test_one_sample_summary': _fixed({'mean': 52.0, 'std': 10.0, 'n': 40, 'popmean': 50.0}),
+        't_test_two_sample_summary': _fixed({'mean1': 52.0, 'std1': 10.0, 'n1': 30, 'mean2': 47.0, 'std2': 9.0, 'n2': 30}),
+        't_test_paired_summary': _fixed({'meanDiff': 1.5, 'stdDiff': 3.0, 'nPairs': 25}),
+        'z_test': BenchCase(lambda d: {'data': d.numeric(), 'popmean': 50.0, 'popstd': 10.0}),
+        'chi_square_test': BenchCase(lambda d: {'observedMatrix': d.contingency()}, scalable=False, note='table total'),
+        'binomial_test': _fixed({'successCount': 60, 'totalCount': 100}),
+        'correlation_test': BenchCase(lambda d: {'x': d.numeric(), 'y': d.numeric()}),
+        'partial_correlation': BenchCase(lambda d: {'dataMatrix': d.matrix(4), 'xIdx': 0, 'yIdx': 1, 'controlIndices': [2, 3]}),
+        'levene_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'bartlett_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'chi_square_goodness_test': BenchCase(lambda d: {'observed': d.counts(d.n, lam=20.0)}, note='categories'),
+        'chi_square_independence_test': BenchCase(lambda d: {'observedMatrix': d.contingency()}, scalable=False, note='table total'),
+        'fisher_exact_test': BenchCase(lambda d: {'table': d.contingency(2, 2)}, scalable=False, note='table total'),
+        'partial_correlation_analysis': BenchCase(lambda d: {'data': d.records(['a', 'b', 'c']), 'analysisVars': ['a', 'b'], 'controlVars': ['c']}),
+        'stepwise_regression_forward': BenchCase(lambda d: {'data': d.records(['y', 'x1', 'x2', 'x3']), 'dependentVar': 'y', 'predictorVars': ['x1', 'x2', 'x3']}),
+        'response_surface_analysis': BenchCase(lambda d: {'data': d.records(['y', 'x1', 'x2']), 'dependentVar': 'y', 'predictorVars': ['x1', 'x2']}),
+        'ancova_analysis': BenchCase(lambda d: {'dependent_var': 'y', 'factor_vars': ['group'], 'covariate_vars': ['cov'], 'data': d.records(['y', 'cov'], {'group': 3})}),
+        'ordinal_regression': BenchCase(_ordinal_records, max_n=100_000),
+        'mixed_model': BenchCase(lambda d: {'dependent_var': 'y', 'fixed_effects': ['x'], 'random_effects': ['group'], 'data': _grouped_records(d)}, max_n=100_000),
+        'power_analysis': _fixed({'testType': 't-test', 'analysisType': 'a-priori'}),
+    },
+    3: {
+        'mann_whitney_test': BenchCase(lambda d: {'group1': d.numeric(), 'group2': d.numeric(loc=52.0)}),
+        'wilcoxon_test': BenchCase(lambda d: {'values1': d.numeric(), 'values2': d.numeric(loc=51.0)}),
+        'kruskal_wallis_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'friedman_test': BenchCase(lambda d: {'groups': d.groups(4)}),
+        'get_t_critical': _fixed({'df': 30}),
+        'calculate_statistical_power': _fixed({'f_statistic': 4.2, 'df1': 2, 'df2': 57}),
+        'test_assumptions': BenchCase(lambda d: {'groups': d.groups()}),
+        'one_way_anova': BenchCase(lambda d: {'groups': d.groups()}),
+        'two_way_anova': BenchCase(_two_way),
+        'tukey_hsd': BenchCase(lambda d: {'groups': d.groups()}),
+        'sign_test': BenchCase(lambda d: {'before': d.numeric(), 'after': d.numeric(loc=51.0)}),
+        'runs_test': BenchCase(lambda d: {'sequence': d.numeric()}),
+        'mcnemar_test': BenchCase(lambda d: {'contingencyTable': d.contingency(2, 2)}, scalable=False, note='table total'),
+        'cochran_q_test': BenchCase(_binary_matrix),
+        'mood_median_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'repeated_measures_anova': BenchCase(_repeated),
+        'ancova': BenchCase(lambda d: {'yValues': d.numeric(), 'groupValues': d.labels(3), 'covariates': [d.numeric()]}),
+        'manova': BenchCase(lambda d: {'dataMatrix': d.matrix(3), 'groupValues': d.labels(3), 'varNames': ['v1', 'v2', 'v3']}),
+        'scheffe_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'dunn_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'games_howell_test': BenchCase(lambda d: {'groups': d.groups()}),
+        'three_way_anova': BenchCase(lambda d: _two_way(d, 3)),
+        'friedman_posthoc': BenchCase(lambda d: {'groups': d.groups(4)}),
+        'repeated_measures_posthoc': BenchCase(lambda d: {k: v for k, v in _repeated(d).items() if k != 'subjectIds'}),
+        'cochran_q_posthoc': BenchCase(_binary_matrix),
+    },
+    4: {
+        'linear_regression': BenchCase(lambda d: {'x': d.numeric(), 'y': d.numeric()}),
+        'multiple_regression': BenchCase(lambda d: (lambda r: {'X': r['xMatrix'], 'y': r['yValues']})(_regression(d))),
+        'logistic_regression': BenchCase(lambda d: (lambda r: {'X': r['xMatrix'], 'y': r['yValues']})(_logistic(d))),
+        'pca_analysis': BenchCase(lambda d: {'data': d.matrix(5)}),
+        'curve_estimation': BenchCase(lambda d: {'xValues': d.positive(), 'yValues': d.positive()}),
+        'nonlinear_regression': BenchCase(lambda d: (lambda x: {'xValues': x, 'yValues': [2.0 * 1.1 ** v + e for v, e in zip(x, d.numeric(loc=0.0, scale=0.5))]})(d.rng.uniform(0.0, 10.0, d.n).tolist())),
+        'stepwise_regression': BenchCase(lambda d: {**_regression(d, 4), 'variableNames': ['x1', 'x2', 'x3', 'x4']}),
+        'binary_logistic': BenchCase(_logistic),
+        'multinomial_logistic': BenchCase(lambda d: {'xMatrix': d.matrix(3), 'yValues': [int(c[1:]) for c in d.labels(3)]}),
+        'ordinal_logistic': BenchCase(lambda d: (lambda r: {'xMatrix': r['xMatrix'], 'yValues': [int(min(max(v // 1.5 + 2, 0), 4)) for v in r['yValues']]})(_regression(d)), max_n=100_000),
+        'probit_regression': BenchCase(_logistic),
+        'poisson_regression': BenchCase(lambda d: {'xMatrix': d.matrix(2, correlated=False), 'yValues': d.counts()}),
+        'negative_binomial_regression': BenchCase(lambda d: {'xMatrix': d.matrix(2, correlated=False), 'yValues': d.counts()}),
+        'factor_analysis_method': BenchCase(lambda d: {'data': d.matrix(6)}),
+        'factor_analysis': BenchCase(lambda d: {'dataMatrix': d.matrix(6)}),
+        'cluster_analysis': BenchCase(lambda d: {'data': d.matrix(3)}, max_n=100_000),
+        'kmeans_clustering': BenchCase(lambda d: {'dataMatrix': d.matrix(3)}, max_n=100_000),
+        'hierarchical_clustering': BenchCase(lambda d: {'dataMatrix': d.matrix(3)}, max_n=10_000, note='observations (O(n²) linkage)'),
+        'time_series_analysis': BenchCase(lambda d: {'dataValues': d.series()}, note='time points'),
+        'time_series_decomposition': BenchCase(lambda d: {'values': d.series()}, note='time points'),
+        'arima_forecast': BenchCase(lambda d: {'values': d.series()}, max_n=100_000, note='time points'),
+        'sarima_forecast': BenchCase(lambda d: {'values': d.series()}, max_n=10_000, note='time points'),
+        'var_model': BenchCase(lambda d: {'dataMatrix': list(map(list, zip(d.series(), d.series(), d.series())))}, note='time points'),
+        'mixed_effects_model': BenchCase(lambda d: {'data': _grouped_records(d), 'dependentColumn': 'y', 'fixedEffects': ['x'], 'randomEffects': ['group']}, max_n=100_000),
+        'kaplan_meier_survival': BenchCase(lambda d: d.survival()),
+        'cox_regression': BenchCase(lambda d: {**d.survival(), 'covariateData': [d.numeric(), d.binary()], 'covariateNames': ['age', 'treatment']}, max_n=10_000, note='observations (O(n²) C-index)'),
+        'durbin_watson_test': BenchCase(lambda d: {'residuals': d.numeric(loc=0.0)}),
+        'discriminant_analysis': BenchCase(lambda d: {'data': d.matrix(3), 'groups': d.labels(3)}),
+        'dose_response_analysis': BenchCase(_dose_response),
+        'stationarity_test': BenchCase(lambda d: {'values': d.series()}, note='time points'),
+    },
+    5: {
+        'kaplan_meier_analysis': BenchCase(lambda d: (lambda s: {'time': s['times'], 'event': s['events'], 'group': d.labels(2)})(d.survival())),
+        'meta_analysis': BenchCase(lambda d: {'effectSizes': d.numeric(loc=0.4, scale=0.2), 'standardErrors': d.rng.uniform(0.05, 0.3, d.n).tolist()}, note='studies'),
+        'icc_analysis': BenchCase(lambda d: {'data': (lambda base: [[b + e for e in d.numeric(3, loc=0.0, scale=2.0)] for b in base])(d.numeric())}, note='subjects'),
+        'roc_curve_analysis': BenchCase(lambda d: (lambda y: {'actualClass': y, 'predictedProb': [min(max(0.5 * c + u, 0.0), 1.0) for c, u in zip(y, d.rng.uniform(0.0, 0.6, d.n))]})(d.binary())),
+    },
+    6: {
+        'render_chart': BenchCase(
+            lambda d: {
+                'chartSpec': {'chartType': 'bar', 'encoding': {'x': {'field': 'group'}, 'y': {'field': 'value'}}},
+                'data': {'group': d.labels(6), 'value': d.numeric()},
+                'exportConfig': {'format': 'png', 'dpi': 100},
+            },
+            max_n=100_000,
+        ),
+    },
+    7: {
+        'fit_vbgf': BenchCase(lambda d: (lambda f: {'ages': f['ages'], 'lengths': f['lengths']})(d.fish_growth()), note='fish'),
+        'length_weight': BenchCase(lambda d: (lambda f: {'lengths': f['lengths'], 'weights': f['weights']})(d.fish_growth()), note='fish'),
+        'condition_factor': BenchCase(lambda d: (lambda f: {'lengths': f['lengths'], 'weights': f['weights'], 'groups': d.labels(3)})(d.fish_growth()), note='fish'),
+    },
+    8: {
+        'alpha_diversity': BenchCase(lambda d: {'rows': d.abundance_rows()}, note='sites × 30 species'),
+        'rarefaction': BenchCase(lambda d: {'rows': d.abundance_rows()}, max_n=10_000, note='sites × 30 species'),
+        'beta_diversity': BenchCase(lambda d: {'rows': d.abundance_rows()}, max_n=5_000, note='sites (O(n²) distance)'),
+        'nmds': BenchCase(lambda d: {'distance_matrix': d.distance_matrix()}, max_n=1_000, note='sites (n × n input)'),
+        'permanova': BenchCase(lambda d: {'distance_matrix': d.distance_matrix(), 'grouping': d.labels(3), 'permutations': 199, 'seed': 0}, max_n=2_000, note='sites (n × n input)'),
+        'permanova_permutation_block': BenchCase(lambda d: {'distance_matrix': d.distance_matrix(), 'grouping': d.labels(3), 'permutations': 100, 'seed': [0, 0]}, max_n=2_000, note='sites (n × n input)'),
+        'mantel_test': BenchCase(lambda d: {'matrix_x': d.distance_matrix(), 'matrix_y': d.distance_matrix(), 'permutations': 199, 'seed': 0}, max_n=2_000, note='sites (n × n input)'),
+        'mantel_permutation_block': BenchCase(lambda d: {'matrix_x': d.distance_matrix(), 'matrix_y': d.distance_matrix(), 'permutations': 100, 'seed': [0, 0]}, max_n=2_000, note='sites (n × n input)'),
+    },
+    9: {
+        'hardy_weinberg': BenchCase(lambda d: {'rows': d.genotype_counts()}, note='loci'),
+        'fst': BenchCase(lambda d: {**_fst_genotypes(d), 'nPermutations': 199, 'nBootstrap': 200, 'seed': 0}, max_n=100_000, note='individuals × 8 loci'),
+        'fst_permutation_block': BenchCase(lambda d: {**_fst_genotypes(d), 'permutations': 100, 'seed': [0, 0]}, max_n=100_000, note='individuals × 8 loci'),
+        'fst_bootstrap_block': BenchCase(lambda d: {**_fst_genotypes(d), 'nBootstrap': 100, 'seed': [0, 0]}, max_n=100_000, note='individuals × 8 loci'),
+        'seq_similarity': BenchCase(_sequences, note='alignment length × 8 sequences'),
+        'build_phylogeny': BenchCase(_sequences, note='alignment length × 8 sequences'),
+    },
+    10: {
+        'translate': BenchCase(lambda d: {'sequence': d.dna()}, note='bases'),
+        'find_orfs': BenchCase(lambda d: {'sequence': d.dna()}, note='bases'),
+        'codon_usage': BenchCase(lambda d: {'sequence': d.dna()}, note='bases'),
+        'protein_properties': BenchCase(lambda d: {'proteinSeq': d.protein()}, note='residues'),
+    },
+}
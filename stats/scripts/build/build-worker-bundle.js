@@ -0,0 +1,78 @@
+#!/usr/bin/env node
+
+/**
+ * Python Worker 사전 컴파일 번들 빌드
+ *
+ * helpers.py + worker{N}-*.py → public/workers/python/worker-bundle.zip (.pyc + manifest.json)
+ * Pyodide Worker는 번들을 한 번 받아 FS에 풀고 소스 컴파일 없이 모듈을 로드한다.
+ * 번들이 없거나 bytecode 버전이 다르면 기존처럼 파일별로 fetch + 컴파일한다.
+ *
+ * bytecode magic number가 브라우저 Pyodide와 같아야 하므로 npm pyodide(같은 버전) 안에서
+ * scripts/build/worker_bundle.py를 실행해 컴파일한다.
+ *
+ * 사용법:
+ *   node scripts/build/build-worker-bundle.js            # 실패 시 exit 1
+ *   node scripts/build/build-worker-bundle.js --optional # 실패 시 경고만 (prebuild용)
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const WORKER_DIR = path.join(__dirname, '../../public/workers/python');
+const OUTPUT_PATH = path.join(WORKER_DIR, 'worker-bundle.zip');
+const BUILDER_PATH = path.join(__dirname, 'worker_bundle.py');
+
+/**
+ * 번들 대상 모듈: helpers + worker{N} (런타임 모듈명 = helpers.worker_module_name)
+ *
+ * @returns {{ name: string, filename: string }[]}
+ */
+function collectModules() {
+  const workers = fs.readdirSync(WORKER_DIR)
+    .map((filename) => ({ filename, match: /^worker(\d+)-[\w-]+\.py$/.exec(filename) }))
+    .filter(({ match }) => match)
+    .map(({ filename, match }) => ({ name: `worker${match[1]}`, filename }))
+    .sort((a, b) => Number(a.name.slice(6)) - Number(b.name.slice(6)));
+
+  return [{ name: 'helpers', filename: 'helpers.py' }, ...workers];
+}
+
+async function main() {
+  const optional = process.argv.includes('--optional');
+
+  try {
+    const modules = collectModules();
+    console.log(`📦 Worker 번들 빌드: ${modules.map((m) => m.name).join(', ')}`);
+
+    const { loadPyodide } = await import('pyodide');
+    const pyodide = await loadPyodide();
+
+    pyodide.FS.mkdirTree('/build');
+    pyodide.FS.writeFile('/build/worker_bundle.py', fs.readFileSync(BUILDER_PATH, 'utf-8'));
+    pyodide.globals.set('bundle_modules', pyodide.toPy(
+      modules.map(({ name, filename }) => [name, filename, fs.readFileSync(path.join(WORKER_DIR, filename), 'utf-8')])
+    ));
+
+    const result = await pyodide.runPythonAsync(`
+import sys
+sys.path.insert(0, '/build')
+from worker_bundle import build_bundle
+build_bundle([tuple(m) for m in bundle_modules])
+`);
+    const bytes = result.toJs();
+    result.destroy();
+
+    fs.writeFileSync(OUTPUT_PATH, bytes);
+    console.log(`✅ ${path.relative(process.cwd(), OUTPUT_PATH)} (${(bytes.length / 1024).toFixed(1)} KB, Pyodide ${pyodide.version})`);
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    if (optional) {
+      console.warn(`⚠️  Worker 번들 빌드 건너뜀 (파일별 로드로 동작): ${message}`);
+      return;
+    }
+    console.error(`❌ Worker 번들 빌드 실패: ${message}`);
+    process.exit(1);
+  }
+}
+
+main();
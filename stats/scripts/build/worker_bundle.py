@@ -0,0 +1,84 @@
+"""
+Python Worker 사전 컴파일 번들 (worker-bundle.zip)
+
+helpers.py + worker{N}-*.py를 .pyc로 컴파일해 zip 하나로 묶는다.
+Pyodide Worker는 zip을 한 번에 FS로 풀고(pyodide.unpackArchive) 소스 컴파일 없이 로드한다.
+
+- bytecode는 실행할 인터프리터와 magic number가 같아야 하므로 Pyodide 안에서 실행한다
+  (scripts/build/build-worker-bundle.js가 npm pyodide로 이 모듈을 호출)
+- Worker 모듈은 helpers.load_worker_module과 같은 플래그(PyCF_ALLOW_TOP_LEVEL_AWAIT)로 컴파일
+  → worker6의 top-level await 유지
+- .pyc 형식: PEP 552 unchecked hash (magic + flags + source hash + marshal code)
+
+zip 구성:
+    helpers.pyc, worker1.pyc, ..., worker10.pyc
+    manifest.json: { format, pythonVersion, magic, modules: { name: { source, sha256, bytes } } }
+"""
+
+import ast
+import hashlib
+import importlib.util
+import io
+import json
+import marshal
+import sys
+import zipfile
+from typing import Dict, List, Tuple
+
+BUNDLE_FORMAT = 1
+
+# PEP 552 flags: bit 0 = hash 기반, bit 1 = check_source (0 → 로드 시 소스 비교 안 함)
+_UNCHECKED_HASH_FLAGS = 0b01
+
+
+def compile_module(name: str, source: str) -> bytes:
+    """
+    모듈 소스 → .pyc 바이트 (현재 인터프리터의 magic number)
+
+    Args:
+        name: 모듈명 (code 객체의 파일명 표시용, 예: worker3)
+        source: 소스 코드
+
+    Raises:
+        SyntaxError: 소스 컴파일 실패
+    """
+    source_bytes = source.encode('utf-8')
+    code = compile(source_bytes, f'{name}.py', 'exec', flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT, dont_inherit=True)
+    return (
+        importlib.util.MAGIC_NUMBER
+        + _UNCHECKED_HASH_FLAGS.to_bytes(4, 'little')
+        + importlib.util.source_hash(source_bytes)
+        + marshal.dumps(code)
+    )
+
+
+def build_bundle(modules: List[Tuple[str, str, str]]) -> bytes:
+    """
+    모듈 목록 → 번들 zip 바이트
+
+    Args:
+        modules: [(모듈명, 원본 파일명, 소스)] 예: ('worker1', 'worker1-descriptive.py', '...')
+
+    Returns:
+        zip 바이트 (모듈별 .pyc + manifest.json)
+    """
+    manifest: Dict = {
+        'format': BUNDLE_FORMAT,
+        'pythonVersion': '.'.join(map(str, sys.version_info[:3])),
+        'magic': importlib.util.MAGIC_NUMBER.hex(),
+        'modules': {},
+    }
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, filename, source in modules:
+            pyc = compile_module(name, source)
+            archive.writestr(f'{name}.pyc', pyc)
+            manifest['modules'][name] = {
+                'source': filename,
+                'sha256': hashlib.sha256(source.encode('utf-8')).hexdigest(),
+                'bytes': len(pyc),
+            }
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2, sort_keys=True))
+
+    return buffer.getvalue()
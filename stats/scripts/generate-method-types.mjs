@@ -75,8 +75,8 @@ function paramToType(param) {
   else if (name === 'individualPopulations') {
     type = 'string[]'
   }
-  // 순열/부트스트랩 반복 수
-  else if (name === 'nPermutations' || name === 'nBootstrap') {
+  // 순열/부트스트랩 반복 수 + 난수 seed
+  else if (name === 'nPermutations' || name === 'nBootstrap' || name === 'seed') {
     type = 'number'
   }
   // 숫자 배열 (1D)
@@ -151,7 +151,8 @@ function paramToType(param) {
     type = 'number'
   }
   // 불린
-  else if (name === 'equalVar' || name === 'yatesCorrection' || name === 'includeInteraction' || name === 'includeQuadratic') {
+  else if (name === 'equalVar' || name === 'yatesCorrection' || name === 'includeInteraction' || name === 'includeQuadratic' ||
+    name === 'sparse') {
     type = 'boolean'
   }
   // 제약 조건 (null 허용)
@@ -336,6 +337,62 @@ const METHOD_TYPE_OVERRIDES = {
     'ciLower': 'number',
     'ciUpper': 'number',
   },
+  'descriptive_stats_table': {
+    'columns': 'string[]',
+    'mean': '(number | null)[]',
+    'median': '(number | null)[]',
+    'mode': '(number | null)[]',
+    'std': '(number | null)[]',
+    'variance': '(number | null)[]',
+    'min': '(number | null)[]',
+    'max': '(number | null)[]',
+    'q1': '(number | null)[]',
+    'q3': '(number | null)[]',
+    'iqr': '(number | null)[]',
+    'skewness': '(number | null)[]',
+    'kurtosis': '(number | null)[]',
+    'n': 'number[]',
+    'se': '(number | null)[]',
+    'sem': '(number | null)[]',
+    'confidenceLevel': 'number',
+    'ciLower': '(number | null)[]',
+    'ciUpper': '(number | null)[]',
+  },
+  'descriptive_sketch_update': {
+    'm2': 'number',
+    'm3': 'number',
+    'm4': 'number',
+    'min': 'number | null',
+    'max': 'number | null',
+    'k': 'number',
+    'levels': 'number[][]',
+    'parity': 'number[]',
+  },
+  'descriptive_sketch_merge': {
+    'm2': 'number',
+    'm3': 'number',
+    'm4': 'number',
+    'min': 'number | null',
+    'max': 'number | null',
+    'k': 'number',
+    'levels': 'number[][]',
+    'parity': 'number[]',
+  },
+  'descriptive_sketch_finalize': {
+    'std': 'number | null',
+    'variance': 'number | null',
+    'lowerFence': 'number',
+    'upperFence': 'number',
+    'skewness': 'number | null',
+    'kurtosis': 'number | null',
+    'se': 'number',
+    'sem': 'number',
+    'confidenceLevel': 'number',
+    'ciLower': 'number',
+    'ciUpper': 'number',
+    'exact': 'boolean',
+    'k': 'number',
+  },
   'outlier_detection': {
     'outlierCount': 'number',
   },
@@ -352,10 +409,39 @@ const METHOD_TYPE_OVERRIDES = {
     'criticalValue': 'number',
     'sampleSizes': '{ n1: number; n2: number }',
   },
+  'frequency_analysis': {
+    'otherCount': 'number',
+  },
+  'crosstab_analysis': {
+    'observedMatrix': 'number[][] | null',
+    'observedSparse': '{ shape: [number, number]; rowIndex: number[]; colIndex: number[]; counts: number[] } | null',
+  },
+  'chi_square_independence_test': {
+    'observedMatrix': 'number[][] | null',
+    'expectedMatrix': 'number[][] | null',
+  },
   'mann_kendall_test': {
     'zScore': 'number',
     'senSlope': 'number',
   },
+  'seasonal_mann_kendall_test': {
+    'trend': 'string',
+    's': 'number',
+    'varS': 'number',
+    'zScore': 'number',
+    'senSlope': 'number',
+    'seasonalPeriods': 'number',
+    'seasons': 'Array<{ season: number; n: number; s: number; varS: number }>',
+  },
+  'regional_mann_kendall_test': {
+    'trend': 'string',
+    's': 'number',
+    'varS': 'number',
+    'zScore': 'number',
+    'senSlope': 'number',
+    'nStations': 'number',
+    'stations': 'Array<{ station: string; n: number; s: number | null; zScore: number | null; pValue: number | null; senSlope: number | null; trend: string | null }>',
+  },
   'bonferroni_correction': {
     'originalPValues': 'number[]',
     'correctedPValues': 'number[]',
@@ -590,6 +676,14 @@ function returnsToInterface(methodName, returns) {
     } else if (cleanKey === 'sampleMean' || cleanKey === 'sampleStd' || cleanKey === 'standardError') {
       type = 'number'
     }
+    // 순차 정지 순열 검정 (helpers.sequential_permutation_test)
+    else if (cleanKey === 'mcStandardError' || cleanKey === 'requestedPermutations') {
+      type = 'number'
+    } else if (cleanKey === 'stoppingRule') {
+      type = "'early' | 'completed' | 'extended' | 'time-budget' | 'cancelled'"
+    } else if (cleanKey === 'cancelled') {
+      type = 'boolean'
+    }
     // F/Chi/Z 통계량
     else if (cleanKey === 'fStatistic' || cleanKey === 'chiSquare' || cleanKey === 'zStatistic') {
       type = 'number'
@@ -810,6 +904,25 @@ function toCamelCase(str) {
  * key-name 추론이 부정확한 경우 사용
  */
 const METHOD_PARAM_OVERRIDES = {
+  'descriptive_stats_table': {
+    'columns': 'Record<string, number[]> | number[][]',
+  },
+  'descriptive_sketch_update': {
+    'state': 'DescriptiveSketchUpdateResult | null',
+    'k': 'number',
+  },
+  'descriptive_sketch_merge': {
+    'states': 'Array<DescriptiveSketchUpdateResult | null>',
+  },
+  'descriptive_sketch_finalize': {
+    'state': 'DescriptiveSketchUpdateResult',
+  },
+  'regional_mann_kendall_test': {
+    'series': 'Record<string, number[]> | number[][]',
+  },
+  'chi_square_independence_test': {
+    'observedMatrix': "number[][] | NonNullable<CrosstabAnalysisResult['observedSparse']>",
+  },
   'arima_forecast': {
     'values': 'number[]',
     'order': '[number, number, number]',
@@ -817,6 +930,8 @@ const METHOD_PARAM_OVERRIDES = {
   },
   'frequency_analysis': {
     'values': '(string | number)[]',
+    'topK': 'number',
+    'otherLabel': 'string',
   },
   'runs_test': {
     'sequence': '(string | number)[]',
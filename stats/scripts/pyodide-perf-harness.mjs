@@ -0,0 +1,509 @@
+/**
+ * Pyodide 성능 측정 하네스 (run-pyodide-golden-tests.mjs --perf)
+ *
+ * 사용자 환경은 CPython이 아니라 WASM이므로 (Python 루프 3~5배 느림 등) 실제 Pyodide에서
+ * 배포 전 회귀를 잡기 위한 측정값을 수집한다.
+ *
+ * - Pyodide 부트스트랩 / loadPackage 시간
+ * - Worker 모듈 실행 시간 (helpers.load_worker_module — 앱과 같은 로드 경로)
+ * - 메서드 호출 지연: encode(typed buffer + toPy) / execute(helpers.dispatch) / decode(envelope 해제)
+ * - WASM 힙 high-water (메모리는 줄어들지 않으므로 현재 크기 = 최대치)
+ *
+ * 리포트는 JSON으로 저장하고 --perf-baseline으로 이전 리포트와 비교한다.
+ * 순수 함수(인자 파싱, 인코딩, 비교)는 Vitest에서 직접 테스트한다.
+ */
+
+import { mkdirSync, readdirSync, readFileSync, writeFileSync } from 'fs';
+import { dirname, join } from 'path';
+
+export const PERF_DEFAULT_REPORT = 'test-results/pyodide-perf.json';
+export const PERF_DEFAULT_SIZES = [1000, 10000, 100000];
+export const PERF_REGRESSION_THRESHOLD = 0.25;
+
+// 이 값보다 작은 차이는 잡음으로 보고 회귀 판정에서 제외
+export const PERF_NOISE_FLOOR_MS = 2;
+export const PERF_NOISE_FLOOR_BYTES = 1024 * 1024;
+
+/**
+ * pyodide-transport.ts TYPED_ARRAY_MIN_LENGTH와 동일
+ */
+export const TYPED_ARRAY_MIN_LENGTH = 1024;
+
+/**
+ * pyodide-core.service.ts WORKER_EXTRA_PACKAGES와 동일
+ * (Node 스크립트에서 TS 모듈을 직접 import할 수 없음)
+ */
+export const WORKER_EXTRA_PACKAGES = Object.freeze({
+  1: [],
+  2: ['statsmodels', 'pandas'],
+  3: ['statsmodels', 'pandas', 'scikit-learn'],
+  4: ['statsmodels', 'scikit-learn'],
+  5: ['scikit-learn'],
+  6: ['matplotlib', 'micropip'],
+  7: [],
+  8: ['scikit-learn'],
+  9: [],
+  10: ['biopython'],
+});
+
+const INT32_MIN = -2147483648;
+const INT32_MAX = 2147483647;
+
+// ============================================================================
+// CLI 옵션
+// ============================================================================
+
+/**
+ * 성능 모드 인자 파싱 (--flag value 또는 --flag=value)
+ *
+ * @param {string[]} argv - process.argv.slice(2)
+ */
+export function parsePerfArgs(argv) {
+  const options = {
+    enabled: false,
+    reportPath: PERF_DEFAULT_REPORT,
+    baselinePath: null,
+    threshold: PERF_REGRESSION_THRESHOLD,
+    failOnRegression: false,
+    sizes: PERF_DEFAULT_SIZES,
+    repeat: 3,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const [flag, inline] = argv[i].split('=', 2);
+    const value = () => inline ?? argv[++i];
+    switch (flag) {
+      case '--perf':
+        options.enabled = true;
+        break;
+      case '--perf-report':
+        options.enabled = true;
+        options.reportPath = value();
+        break;
+      case '--perf-baseline':
+        options.enabled = true;
+        options.baselinePath = value();
+        break;
+      case '--perf-threshold':
+        options.threshold = Number(value());
+        break;
+      case '--perf-sizes':
+        options.sizes = value().split(',').map(Number).filter((n) => n > 0);
+        break;
+      case '--perf-repeat':
+        options.repeat = Math.max(1, Number(value()));
+        break;
+      case '--perf-fail-on-regression':
+        options.failOnRegression = true;
+        break;
+      default:
+        break;
+    }
+  }
+
+  return options;
+}
+
+// ============================================================================
+// 파라미터 인코딩 / 결과 envelope 해제 (앱 전송 경로 재현)
+// ============================================================================
+
+function toTypedNumericArray(value, minLength) {
+  if (!Array.isArray(value) || value.length < minLength) return null;
+  let allInt32 = true;
+  for (const item of value) {
+    if (typeof item !== 'number' || !Number.isFinite(item)) return null;
+    if (allInt32 && (!Number.isInteger(item) || item < INT32_MIN || item > INT32_MAX)) allInt32 = false;
+  }
+  return allInt32 ? Int32Array.from(value) : Float64Array.from(value);
+}
+
+/**
+ * pyodide-transport.ts encodeTypedArrayParams와 같은 규칙
+ * - 최상위 숫자 배열, 숫자 배열의 배열(행별) → typed array
+ */
+export function encodeTypedParams(params, minLength = TYPED_ARRAY_MIN_LENGTH) {
+  const encoded = {};
+  for (const [key, value] of Object.entries(params)) {
+    const typed = toTypedNumericArray(value, minLength);
+    if (typed) {
+      encoded[key] = typed;
+    } else if (Array.isArray(value) && value.length > 0 && value.every(Array.isArray)) {
+      encoded[key] = value.map((row) => toTypedNumericArray(row, minLength) ?? row);
+    } else {
+      encoded[key] = value;
+    }
+  }
+  return encoded;
+}
+
+/**
+ * pyodide-transport.ts unpackResultEnvelope와 같은 해제 절차
+ * (meta JSON.parse + packed float64 복사, PyProxy destroy)
+ */
+export function unpackEnvelope(envelope) {
+  const packed = envelope.get(1);
+  try {
+    const meta = JSON.parse(envelope.get(0));
+    const view = packed.getBuffer('f64');
+    try {
+      return { meta, bufferLength: view.data.length, buffer: view.data.slice() };
+    } finally {
+      view.release();
+    }
+  } finally {
+    packed.destroy();
+    envelope.destroy();
+  }
+}
+
+// ============================================================================
+// 기록기
+// ============================================================================
+
+/**
+ * WASM 선형 메모리 크기(바이트). Pyodide 내부 모듈 구조가 다르면 0
+ */
+export function wasmHeapBytes(pyodide) {
+  const heap = pyodide?._module?.HEAPU8;
+  return heap ? heap.buffer.byteLength : 0;
+}
+
+function round(value) {
+  return Math.round(value * 100) / 100;
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+export class PerfRecorder {
+  constructor() {
+    this.pyodide = null;
+    this.bootstrapMs = null;
+    this.packages = [];
+    this.workers = [];
+    this.calls = [];
+    this.goldenTests = [];
+    this.heapSamples = [];
+  }
+
+  attach(pyodide, bootstrapMs) {
+    this.pyodide = pyodide;
+    this.bootstrapMs = round(bootstrapMs);
+    this.sampleHeap('bootstrap');
+  }
+
+  sampleHeap(phase) {
+    const bytes = wasmHeapBytes(this.pyodide);
+    this.heapSamples.push({ phase, bytes });
+    return bytes;
+  }
+
+  /**
+   * pyodide.loadPackage 시간 측정 (이미 로드된 패키지는 거의 0ms)
+   */
+  async loadPackages(packages, label = packages.join(',')) {
+    const start = performance.now();
+    await this.pyodide.loadPackage(packages);
+    const ms = performance.now() - start;
+    this.packages.push({ label, packages, ms: round(ms) });
+    this.sampleHeap(`packages:${label}`);
+    return ms;
+  }
+
+  recordGoldenTest(name, ms, ok) {
+    this.goldenTests.push({ name, ms: round(ms), ok });
+  }
+
+  /**
+   * Worker 모듈 로드: 추가 패키지 → helpers.load_worker_module (앱과 같은 경로)
+   */
+  async loadWorker(helpers, workerNum, source, moduleDir = '/home/pyodide') {
+    const entry = { worker: workerNum, packagesMs: 0, execMs: null, methods: 0 };
+    try {
+      const extra = WORKER_EXTRA_PACKAGES[workerNum] ?? [];
+      if (extra.length > 0) {
+        entry.packagesMs = round(await this.loadPackages([...extra], `worker${workerNum}`));
+      }
+      const path = `${moduleDir}/worker${workerNum}.py`;
+      this.pyodide.FS.writeFile(path, source);
+
+      const start = performance.now();
+      const registered = await helpers.load_worker_module(workerNum, path);
+      entry.execMs = round(performance.now() - start);
+      try {
+        entry.methods = registered.toJs().length;
+      } finally {
+        registered.destroy();
+      }
+    } catch (error) {
+      entry.error = String(error.message ?? error).split('\n').slice(-2).join(' ').slice(0, 300);
+    }
+    entry.heapBytes = this.sampleHeap(`worker${workerNum}`);
+    this.workers.push(entry);
+    return entry;
+  }
+
+  /**
+   * 메서드 호출 지연 측정: encode / execute / decode 단계별 중앙값
+   *
+   * 첫 호출(지연 import 포함)은 coldMs로 따로 기록하고 반복 측정에서 제외
+   */
+  async timeCall(dispatch, workerNum, method, params, n, repeat = 3) {
+    const runOnce = () => {
+      let t0 = performance.now();
+      const pyParams = this.pyodide.toPy(encodeTypedParams(params));
+      const encodeMs = performance.now() - t0;
+      let envelope;
+      try {
+        t0 = performance.now();
+        envelope = dispatch(workerNum, method, pyParams, false);
+      } finally {
+        pyParams.destroy();
+      }
+      const executeMs = performance.now() - t0;
+      t0 = performance.now();
+      unpackEnvelope(envelope);
+      const decodeMs = performance.now() - t0;
+      return { encodeMs, executeMs, decodeMs };
+    };
+
+    const entry = { worker: workerNum, method, n };
+    try {
+      const cold = runOnce();
+      entry.coldMs = round(cold.encodeMs + cold.executeMs + cold.decodeMs);
+
+      const runs = [];
+      for (let i = 0; i < repeat; i++) runs.push(runOnce());
+      for (const phase of ['encodeMs', 'executeMs', 'decodeMs']) {
+        entry[phase] = round(median(runs.map((run) => run[phase])));
+      }
+      entry.totalMs = round(entry.encodeMs + entry.executeMs + entry.decodeMs);
+      entry.runs = repeat;
+    } catch (error) {
+      entry.error = String(error.message ?? error).split('\n').slice(-2).join(' ').slice(0, 300);
+    }
+    entry.heapBytes = this.sampleHeap(`call:worker${workerNum}.${method}@${n}`);
+    this.calls.push(entry);
+    return entry;
+  }
+
+  toReport(meta = {}) {
+    const bytes = this.heapSamples.map((sample) => sample.bytes);
+    return {
+      generatedAt: new Date().toISOString(),
+      ...meta,
+      bootstrapMs: this.bootstrapMs,
+      packages: this.packages,
+      workers: this.workers,
+      calls: this.calls,
+      goldenTests: this.goldenTests,
+      heap: {
+        initialBytes: bytes[0] ?? 0,
+        highWaterBytes: bytes.length > 0 ? Math.max(...bytes) : 0,
+        samples: this.heapSamples,
+      },
+    };
+  }
+}
+
+// ============================================================================
+// 합성 입력 (seed 고정)
+// ============================================================================
+
+/**
+ * mulberry32 PRNG + Box-Muller 정규 난수
+ */
+export function createRng(seed) {
+  let state = seed >>> 0;
+  const uniform = () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+  const normal = (mean = 0, sd = 1) => {
+    const u = 1 - uniform();
+    return mean + sd * Math.sqrt(-2 * Math.log(u)) * Math.cos(2 * Math.PI * uniform());
+  };
+  return { uniform, normal };
+}
+
+const normals = (rng, n, mean = 50, sd = 10) => Array.from({ length: n }, () => rng.normal(mean, sd));
+const labels = (n, k, prefix) => Array.from({ length: n }, (_, i) => `${prefix}${(i % k) + 1}`);
+
+function distanceMatrix(rng, n) {
+  const points = Array.from({ length: n }, () => [rng.normal(), rng.normal()]);
+  return points.map(([ax, ay]) => points.map(([bx, by]) => Math.hypot(ax - bx, ay - by)));
+}
+
+/**
+ * Worker별 대표 메서드 (Python 루프 비중이 다른 메서드를 고르게 포함)
+ * maxN: n × n 입력 등 크기 상한
+ */
+export const PERF_CASES = [
+  { worker: 1, method: 'descriptive_stats', build: (rng, n) => ({ data: normals(rng, n) }) },
+  { worker: 1, method: 'normality_test', build: (rng, n) => ({ data: normals(rng, n) }), maxN: 5000 },
+  { worker: 1, method: 'frequency_analysis', build: (rng, n) => ({ values: labels(n, 12, 'c') }) },
+  { worker: 1, method: 'mann_kendall_test', build: (rng, n) => ({ data: normals(rng, n).map((v, i) => v + 0.01 * i) }), maxN: 10000 },
+  { worker: 2, method: 't_test_two_sample', build: (rng, n) => ({ group1: normals(rng, n), group2: normals(rng, n, 52) }) },
+  { worker: 2, method: 'correlation_test', build: (rng, n) => ({ x: normals(rng, n), y: normals(rng, n) }) },
+  { worker: 3, method: 'one_way_anova', build: (rng, n) => ({ groups: [0, 1, 2].map((g) => normals(rng, Math.floor(n / 3), 50 + g)) }) },
+  { worker: 3, method: 'mann_whitney_test', build: (rng, n) => ({ group1: normals(rng, n), group2: normals(rng, n, 52) }) },
+  { worker: 3, method: 'kruskal_wallis_test', build: (rng, n) => ({ groups: [0, 1, 2].map((g) => normals(rng, Math.floor(n / 3), 50 + g)) }) },
+  { worker: 4, method: 'linear_regression', build: (rng, n) => ({ x: normals(rng, n), y: normals(rng, n) }) },
+  {
+    worker: 5,
+    method: 'kaplan_meier_analysis',
+    build: (rng, n) => ({
+      time: Array.from({ length: n }, () => 0.1 - 10 * Math.log(1 - rng.uniform())),
+      event: Array.from({ length: n }, () => (rng.uniform() > 0.3 ? 1 : 0)),
+    }),
+  },
+  {
+    worker: 7,
+    method: 'length_weight',
+    build: (rng, n) => {
+      const lengths = Array.from({ length: n }, () => 10 + 70 * rng.uniform());
+      return { lengths, weights: lengths.map((l) => 0.01 * l ** 3 * Math.exp(rng.normal(0, 0.05))) };
+    },
+  },
+  {
+    worker: 8,
+    method: 'permanova',
+    build: (rng, n) => ({ distance_matrix: distanceMatrix(rng, n), grouping: labels(n, 3, 'G'), permutations: 199, seed: 0 }),
+    maxN: 1000,
+  },
+  {
+    worker: 9,
+    method: 'hardy_weinberg',
+    build: (rng, n) => ({
+      rows: Array.from({ length: Math.min(n, 1000) }, () => {
+        const p = 0.2 + 0.6 * rng.uniform();
+        return [Math.round(200 * p * p), Math.round(400 * p * (1 - p)), Math.round(200 * (1 - p) * (1 - p))];
+      }),
+    }),
+    maxN: 1000,
+  },
+];
+
+/**
+ * 성능 측정 실행: 상주 dispatcher 준비 → Worker 로드 → 메서드 호출
+ *
+ * @param {object} pyodide - loadPyodide 결과 (helpers.py가 /home/pyodide에 있어야 함)
+ * @param {PerfRecorder} recorder
+ * @param {{ sizes: number[], repeat: number, workerDir: string, log?: (line: string) => void }} options
+ */
+export async function runPerfSuite(pyodide, recorder, { sizes, repeat, workerDir, log = () => {} }) {
+  const helpers = pyodide.pyimport('helpers');
+  const dispatch = helpers.dispatch;
+  try {
+    const workers = [...new Set(PERF_CASES.map((c) => c.worker))];
+    const fileNames = {};
+    for (const file of readdirWorkerFiles(workerDir)) {
+      fileNames[Number(file.match(/^worker(\d+)-/)[1])] = file;
+    }
+
+    const loaded = new Set();
+    for (const worker of workers) {
+      const source = readFileSync(join(workerDir, fileNames[worker]), 'utf-8');
+      const entry = await recorder.loadWorker(helpers, worker, source);
+      if (entry.error) {
+        log(`  ⚠ worker${worker} load failed: ${entry.error}`);
+        continue;
+      }
+      loaded.add(worker);
+      log(`  ✓ worker${worker} exec ${entry.execMs}ms (+packages ${entry.packagesMs}ms, ${entry.methods} methods)`);
+    }
+
+    for (const perfCase of PERF_CASES) {
+      if (!loaded.has(perfCase.worker)) continue;
+      for (const n of sizes) {
+        if (perfCase.maxN && n > perfCase.maxN) break;
+        const params = perfCase.build(createRng(n), n);
+        const entry = await recorder.timeCall(dispatch, perfCase.worker, perfCase.method, params, n, repeat);
+        if (entry.error) {
+          log(`  ✗ worker${perfCase.worker}.${perfCase.method} n=${n}: ${entry.error}`);
+          break;
+        }
+        log(
+          `  ✓ worker${perfCase.worker}.${perfCase.method} n=${n}: ` +
+            `encode ${entry.encodeMs}ms / execute ${entry.executeMs}ms / decode ${entry.decodeMs}ms`
+        );
+      }
+    }
+  } finally {
+    dispatch.destroy();
+    helpers.destroy();
+  }
+}
+
+function readdirWorkerFiles(workerDir) {
+  return readdirSync(workerDir).filter((file) => /^worker\d+-.*\.py$/.test(file));
+}
+
+// ============================================================================
+// 리포트 저장 / 기준선 비교
+// ============================================================================
+
+/**
+ * 리포트 → 비교용 평탄 지표 { key: { value, unit } }
+ */
+export function flattenPerfMetrics(report) {
+  const metrics = {};
+  const put = (key, value, unit) => {
+    if (typeof value === 'number' && Number.isFinite(value)) metrics[key] = { value, unit };
+  };
+
+  put('bootstrap', report.bootstrapMs, 'ms');
+  for (const pkg of report.packages ?? []) put(`package:${pkg.label}`, pkg.ms, 'ms');
+  for (const worker of report.workers ?? []) put(`worker${worker.worker}:exec`, worker.execMs, 'ms');
+  for (const call of report.calls ?? []) {
+    const key = `call:worker${call.worker}.${call.method}@${call.n}`;
+    put(`${key}:execute`, call.executeMs, 'ms');
+    put(`${key}:total`, call.totalMs, 'ms');
+  }
+  put('heap:highWater', report.heap?.highWaterBytes, 'bytes');
+  return metrics;
+}
+
+/**
+ * 기준선 대비 변화 (비율 임계값 + 잡음 하한을 모두 넘는 것만)
+ *
+ * @returns {{ key: string, unit: string, baseline: number, current: number, ratio: number, status: 'regression' | 'improvement' }[]}
+ */
+export function comparePerfReports(baseline, current, threshold = PERF_REGRESSION_THRESHOLD) {
+  const before = flattenPerfMetrics(baseline);
+  const after = flattenPerfMetrics(current);
+  const changes = [];
+
+  for (const [key, { value, unit }] of Object.entries(after)) {
+    const base = before[key];
+    if (!base || base.value <= 0) continue;
+    const floor = unit === 'bytes' ? PERF_NOISE_FLOOR_BYTES : PERF_NOISE_FLOOR_MS;
+    if (Math.abs(value - base.value) < floor) continue;
+
+    const ratio = value / base.value;
+    let status = null;
+    if (ratio > 1 + threshold) status = 'regression';
+    else if (ratio < 1 / (1 + threshold)) status = 'improvement';
+    if (status) {
+      changes.push({ key, unit, baseline: base.value, current: value, ratio: round(ratio), status });
+    }
+  }
+
+  return changes;
+}
+
+export function writePerfReport(report, reportPath) {
+  mkdirSync(dirname(reportPath), { recursive: true });
+  writeFileSync(reportPath, JSON.stringify(report, null, 2));
+}
+
+export function readPerfReport(reportPath) {
+  return JSON.parse(readFileSync(reportPath, 'utf-8'));
+}
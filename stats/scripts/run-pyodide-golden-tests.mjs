@@ -9,11 +9,25 @@
  *
  * 또는 npm script:
  * npm run test:pyodide-golden
+ *
+ * 성능 모드 (--perf): 패키지 로드 / Worker 모듈 실행 / 메서드 호출(encode·execute·decode) 시간과
+ * WASM 힙 high-water를 JSON 리포트로 저장 (scripts/pyodide-perf-harness.mjs)
+ * npm run test:pyodide-perf
+ * node --experimental-vm-modules scripts/run-pyodide-golden-tests.mjs --perf \
+ *   --perf-report test-results/pyodide-perf.json --perf-baseline perf-baseline.json --perf-fail-on-regression
  */
 
 import { readFileSync } from 'fs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
+import {
+  PerfRecorder,
+  comparePerfReports,
+  parsePerfArgs,
+  readPerfReport,
+  runPerfSuite,
+  writePerfReport,
+} from './pyodide-perf-harness.mjs';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -36,6 +50,10 @@ function colorize(text, color) {
 const goldenValuesPath = join(__dirname, '../__tests__/workers/golden-values/statistical-golden-values.json');
 const goldenValues = JSON.parse(readFileSync(goldenValuesPath, 'utf-8'));
 
+// 성능 모드 (--perf)
+const perfOptions = parsePerfArgs(process.argv.slice(2));
+const perfRecorder = perfOptions.enabled ? new PerfRecorder() : null;
+
 // 테스트 결과 추적
 let passed = 0;
 let failed = 0;
@@ -91,11 +109,14 @@ function isCloseEnough(actual, expected, tolerance) {
 
 // 테스트 실행
 async function runTest(name, testFn) {
+  const testStart = performance.now();
   try {
     await testFn();
+    perfRecorder?.recordGoldenTest(name, performance.now() - testStart, true);
     passed++;
     console.log(colorize(`  ✓ ${name}`, 'green'));
   } catch (error) {
+    perfRecorder?.recordGoldenTest(name, performance.now() - testStart, false);
     failed++;
     failures.push({ name, error: error.message });
     console.log(colorize(`  ✗ ${name}`, 'red'));
@@ -116,16 +137,21 @@ async function main() {
     const { loadPyodide } = await import('pyodide');
     // Node.js 환경에서는 indexURL 없이 로컬 패키지 사용
     pyodide = await loadPyodide();
+    perfRecorder?.attach(pyodide, Date.now() - startTime);
     console.log(colorize(`  ✓ Pyodide loaded (${((Date.now() - startTime) / 1000).toFixed(1)}s)`, 'green'));
   } catch (error) {
     console.log(colorize(`  ✗ Failed to load Pyodide: ${error.message}`, 'red'));
     process.exit(1);
   }
 
+  // 성능 모드에서는 loadPackage 시간을 리포트에 기록
+  const loadPackages = (packages) =>
+    perfRecorder ? perfRecorder.loadPackages(packages) : pyodide.loadPackage(packages);
+
   console.log(colorize('\n📦 Loading packages (scipy, numpy)...', 'yellow'));
   const packageStart = Date.now();
   try {
-    await pyodide.loadPackage(['numpy', 'scipy']);
+    await loadPackages(['numpy', 'scipy']);
     console.log(colorize(`  ✓ Packages loaded (${((Date.now() - packageStart) / 1000).toFixed(1)}s)`, 'green'));
   } catch (error) {
     console.log(colorize(`  ✗ Failed to load packages: ${error.message}`, 'red'));
@@ -482,7 +508,7 @@ json.dumps({'statistic': float(result.statistic), 'pValue': float(result.pvalue)
   const advancedStart = Date.now();
   let sklearnLoaded = false;
   try {
-    await pyodide.loadPackage(['scikit-learn']);
+    await loadPackages(['scikit-learn']);
     console.log(colorize(`  ✓ sklearn loaded (${((Date.now() - advancedStart) / 1000).toFixed(1)}s)`, 'green'));
     sklearnLoaded = true;
   } catch (error) {
@@ -876,7 +902,7 @@ json.dumps({'fStatistic': float(f_stat), 'pValue': float(p_value)})
   const statsmodelsStart = Date.now();
   let statsmodelsLoaded = false;
   try {
-    await pyodide.loadPackage(['statsmodels']);
+    await loadPackages(['statsmodels']);
     console.log(colorize(`  ✓ statsmodels loaded (${((Date.now() - statsmodelsStart) / 1000).toFixed(1)}s)`, 'green'));
     statsmodelsLoaded = true;
   } catch (error) {
@@ -1017,6 +1043,15 @@ json.dumps({
 
   // Load worker9-genetics.py into Pyodide
   console.log(colorize('\n🧬 Population Genetics (Worker 9)', 'cyan'));
+  // worker9는 helpers(stochastic_method)를 import → helpers.py를 sys.path에 먼저 배치
+  const helpersCode = readFileSync(join(__dirname, '../public/workers/python/helpers.py'), 'utf-8');
+  pyodide.FS.mkdirTree('/home/pyodide');
+  pyodide.FS.writeFile('/home/pyodide/helpers.py', helpersCode);
+  await pyodide.runPythonAsync(`
+import sys
+if '/home/pyodide' not in sys.path:
+    sys.path.insert(0, '/home/pyodide')
+`);
   const workerCode = readFileSync(join(__dirname, '../public/workers/python/worker9-genetics.py'), 'utf-8');
   await pyodide.runPythonAsync(workerCode);
   console.log(colorize('  ✓ Worker 9 loaded', 'green'));
@@ -1164,6 +1199,15 @@ _out
     }
   }
 
+  // ============================================================
+  // PERFORMANCE MODE (--perf)
+  // ============================================================
+
+  let perfRegressions = 0;
+  if (perfRecorder) {
+    perfRegressions = await runPerformanceMode(pyodide);
+  }
+
   // 결과 요약
   console.log(colorize('\n' + '=' .repeat(60), 'blue'));
   console.log(colorize('📋 SUMMARY', 'cyan'));
@@ -1183,7 +1227,50 @@ _out
   const totalTime = ((Date.now() - startTime) / 1000).toFixed(1);
   console.log(colorize(`\n⏱️  Total time: ${totalTime}s`, 'cyan'));
 
-  process.exit(failed > 0 ? 1 : 0);
+  const perfFailed = perfOptions.failOnRegression && perfRegressions > 0;
+  process.exit(failed > 0 || perfFailed ? 1 : 0);
+}
+
+// 성능 측정 → 리포트 저장 → 기준선 비교 (회귀 개수 반환)
+async function runPerformanceMode(pyodide) {
+  console.log(colorize('\n⏱️  Performance Mode', 'cyan'));
+  await runPerfSuite(pyodide, perfRecorder, {
+    sizes: perfOptions.sizes,
+    repeat: perfOptions.repeat,
+    workerDir: join(__dirname, '../public/workers/python'),
+    log: (line) => console.log(colorize(line, line.includes('✓') ? 'green' : 'yellow')),
+  });
+
+  const report = perfRecorder.toReport({
+    node: process.versions.node,
+    pyodide: pyodide.version,
+    config: { sizes: perfOptions.sizes, repeat: perfOptions.repeat },
+  });
+  writePerfReport(report, perfOptions.reportPath);
+  const heapMb = (report.heap.highWaterBytes / 1024 / 1024).toFixed(1);
+  console.log(colorize(`  ✓ WASM heap high-water: ${heapMb}MB`, 'green'));
+  console.log(colorize(`  ✓ Report saved: ${perfOptions.reportPath}`, 'green'));
+
+  if (!perfOptions.baselinePath) return 0;
+
+  const changes = comparePerfReports(readPerfReport(perfOptions.baselinePath), report, perfOptions.threshold);
+  const regressions = changes.filter((change) => change.status === 'regression');
+  console.log(colorize(`\n📈 Baseline comparison (${perfOptions.baselinePath})`, 'cyan'));
+  if (changes.length === 0) {
+    console.log(colorize('  No significant changes', 'green'));
+  }
+  for (const change of changes) {
+    const format = (value) =>
+      change.unit === 'bytes' ? `${(value / 1024 / 1024).toFixed(1)}MB` : `${value.toFixed(1)}ms`;
+    const mark = change.status === 'regression' ? '▲' : '▼';
+    console.log(
+      colorize(
+        `  ${mark} ${change.key}: ${format(change.baseline)} → ${format(change.current)} (${change.ratio}x)`,
+        change.status === 'regression' ? 'red' : 'green'
+      )
+    );
+  }
+  return regressions.length;
 }
 
 main().catch(err => {
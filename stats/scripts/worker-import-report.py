@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Python Worker import 시간 리포트
+
+목적: 무거운 패키지(scikit-learn, statsmodels, pandas)를 함수 안에서 지연 import했을 때
+메서드별로 절약되는 cold start 시간을 측정
+
+- AST로 메서드별 지연 import 모듈 수집 (같은 모듈의 헬퍼 호출은 전이적으로 합산)
+- 모듈 조합별로 새 프로세스에서 import 시간 측정 (numpy/scipy.stats는 기준선으로 선 로드)
+- 절약 시간 = 전체 무거운 모듈 import 시간 - 해당 메서드가 실제로 필요한 모듈 import 시간
+
+CPython 기준 측정값이므로 Pyodide(WASM)에서는 절대값이 더 크지만 비율은 유사
+
+사용법:
+    python scripts/worker-import-report.py 3 4
+    python scripts/worker-import-report.py 3 --repeat 5 --json import-report.json
+"""
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Set
+
+WORKER_DIR = Path(__file__).resolve().parent.parent / 'public' / 'workers' / 'python'
+
+HEAVY_ROOTS = ('sklearn', 'statsmodels', 'pandas')
+
+BASELINE_IMPORTS = 'import numpy, scipy, scipy.stats'
+
+
+def find_worker_file(worker_num: int) -> Path:
+    """worker{N}-*.py 경로 탐색"""
+    matches = sorted(WORKER_DIR.glob(f'worker{worker_num}-*.py'))
+    if not matches:
+        raise FileNotFoundError(f'Worker {worker_num} 파일 없음: {WORKER_DIR}')
+    return matches[0]
+
+
+def _heavy_modules(node: ast.AST) -> Set[str]:
+    """노드 안의 import 문 중 무거운 패키지 모듈명 수집"""
+    modules: Set[str] = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Import):
+            names = [alias.name for alias in child.names]
+        elif isinstance(child, ast.ImportFrom) and child.module and child.level == 0:
+            names = [child.module]
+        else:
+            continue
+        modules.update(name for name in names if name.split('.')[0] in HEAVY_ROOTS)
+    return modules
+
+
+def collect_method_imports(source: str) -> Dict[str, Set[str]]:
+    """
+    public 메서드별 지연 import 모듈 수집
+
+    같은 모듈에 정의된 함수 호출은 전이적으로 따라간다
+    (예: 메서드 → _helper → statsmodels)
+    """
+    tree = ast.parse(source)
+    functions = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    direct = {name: _heavy_modules(node) for name, node in functions.items()}
+    calls = {
+        name: {
+            child.func.id
+            for child in ast.walk(node)
+            if isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Name)
+            and child.func.id in functions
+            and child.func.id != name
+        }
+        for name, node in functions.items()
+    }
+
+    def resolve(name: str, seen: Set[str]) -> Set[str]:
+        modules = set(direct[name])
+        for callee in calls[name] - seen:
+            modules |= resolve(callee, seen | {callee})
+        return modules
+
+    return {
+        name: resolve(name, {name})
+        for name in functions
+        if not name.startswith('_')
+    }
+
+
+def collect_top_level_imports(source: str) -> Set[str]:
+    """모듈 최상위(함수 밖) 무거운 import 수집"""
+    tree = ast.parse(source)
+    modules: Set[str] = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            modules |= _heavy_modules(node)
+    return modules
+
+
+def _run_timed(statement: str) -> float:
+    """새 프로세스에서 기준선 import 후 statement 실행 시간(초) 측정"""
+    code = (
+        f'{BASELINE_IMPORTS}\n'
+        'import sys, time\n'
+        f'sys.path.insert(0, {str(WORKER_DIR)!r})\n'
+        't = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(time.perf_counter() - t)\n'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_import_time(modules: FrozenSet[str], repeat: int) -> float:
+    """모듈 조합 import 시간 중앙값(초). 빈 조합은 0"""
+    if not modules:
+        return 0.0
+    statement = '; '.join(f'import {name}' for name in sorted(modules))
+    return statistics.median(_run_timed(statement) for _ in range(repeat))
+
+
+def measure_worker_load_time(path: Path, repeat: int) -> float:
+    """Worker 모듈 자체 로드 시간 중앙값(초)"""
+    statement = (
+        'import importlib.util; '
+        f'spec = importlib.util.spec_from_file_location("worker", {str(path)!r}); '
+        'module = importlib.util.module_from_spec(spec); '
+        'spec.loader.exec_module(module)'
+    )
+    return statistics.median(_run_timed(statement) for _ in range(repeat))
+
+
+def build_report(worker_num: int, repeat: int) -> Dict:
+    """Worker 하나의 import 시간 리포트 생성"""
+    path = find_worker_file(worker_num)
+    source = path.read_text(encoding='utf-8')
+    method_imports = collect_method_imports(source)
+    top_level = collect_top_level_imports(source)
+
+    all_heavy = frozenset(top_level.union(*method_imports.values()))
+    cache: Dict[FrozenSet[str], float] = {}
+
+    def cost(modules: FrozenSet[str]) -> float:
+        if modules not in cache:
+            cache[modules] = measure_import_time(modules, repeat)
+        return cache[modules]
+
+    eager_cost = cost(all_heavy)
+    methods: List[Dict] = []
+    for name, modules in sorted(method_imports.items()):
+        needed = frozenset(modules | top_level)
+        lazy_cost = cost(needed)
+        methods.append({
+            'method': name,
+            'lazyImports': sorted(modules),
+            'firstCallImportMs': round(lazy_cost * 1000, 1),
+            # 측정 노이즈로 음수가 나오지 않도록 0 하한
+            'savedColdStartMs': round(max(eager_cost - lazy_cost, 0.0) * 1000, 1),
+        })
+
+    return {
+        'worker': worker_num,
+        'file': path.name,
+        'topLevelHeavyImports': sorted(top_level),
+        'workerLoadMs': round(measure_worker_load_time(path, repeat) * 1000, 1),
+        'eagerHeavyImportMs': round(eager_cost * 1000, 1),
+        'methods': methods,
+    }
+
+
+def print_report(report: Dict) -> None:
+    """리포트를 표 형태로 출력"""
+    print(f"\n[Worker {report['worker']}] {report['file']}")
+    print(f"  모듈 로드: {report['workerLoadMs']:.1f}ms")
+    print(f"  최상위 무거운 import: {', '.join(report['topLevelHeavyImports']) or '없음'}")
+    print(f"  전체 무거운 import (eager 기준): {report['eagerHeavyImportMs']:.1f}ms\n")
+    print(f"  {'메서드':<36} {'첫 호출 import':>14} {'절약':>10}  지연 import")
+    for row in report['methods']:
+        print(
+            f"  {row['method']:<36} {row['firstCallImportMs']:>12.1f}ms "
+            f"{row['savedColdStartMs']:>8.1f}ms  {', '.join(row['lazyImports']) or '-'}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Python Worker 메서드별 import 시간 리포트')
+    parser.add_argument('workers', nargs='*', type=int, default=[3, 4], help='Worker 번호 (기본: 3 4)')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--json', dest='json_path', help='JSON 리포트 저장 경로')
+    args = parser.parse_args()
+
+    reports = [build_report(worker_num, args.repeat) for worker_num in args.workers]
+    for report in reports:
+        print_report(report)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(reports, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f'\nJSON 저장: {args.json_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -141,8 +141,21 @@ export interface NmdsResult {
   groups: string[] | null
 }
 
+/**
+ * 순차 정지 순열 검정 진단값 (helpers.sequential_permutation_test)
+ * - early: p가 유의수준보다 명확히 커서 조기 정지 (Besag-Clifford)
+ * - completed / extended: 요청 횟수 완료 / 유의수준 근처라 연장
+ * - time-budget: 시간 예산 도달 / cancelled: 사용자 취소 (완료된 순열까지의 p-value)
+ */
+export interface PermutationTestDiagnostics {
+  mcStandardError?: number
+  stoppingRule?: 'early' | 'completed' | 'extended' | 'time-budget' | 'cancelled'
+  requestedPermutations?: number
+  cancelled?: boolean
+}
+
 /** PERMANOVA */
-export interface PermanovaResult {
+export interface PermanovaResult extends PermutationTestDiagnostics {
   pseudoF: number
   pValue: number
   rSquared: number
@@ -153,7 +166,7 @@ export interface PermanovaResult {
 }
 
 /** Mantel Test */
-export interface MantelResult {
+export interface MantelResult extends PermutationTestDiagnostics {
   r: number
   pValue: number
   permutations: number
@@ -278,7 +291,7 @@ export interface HardyWeinbergResult {
 }
 
 /** Fst (집단 분화 지수) 결과 */
-export interface FstResult {
+export interface FstResult extends PermutationTestDiagnostics {
   globalFst: number
   pairwiseFst: number[][]
   populationLabels: string[]
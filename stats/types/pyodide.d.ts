@@ -11,6 +11,8 @@ export interface PyodideInterface {
   runPythonAsync: (code: string) => Promise<any>
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   globals: any
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  pyimport: (name: string) => any
   FS: {
     writeFile(path: string, data: string | Uint8Array): void
     readFile(path: string, options?: { encoding?: string }): string | Uint8Array